@@ -0,0 +1,100 @@
+"""
+DubSync Database Benchmark
+
+Compares the portable (SQLite default) and editing (WAL) connection
+profiles on save-heavy workloads.
+
+Usage:
+    python benchmarks/bench_database.py [--cues 2000] [--edits 500]
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dubsync.models.database import (  # noqa: E402
+    Database, ConnectionProfile, EDITING_PROFILE, PORTABLE_PROFILE, init_database
+)
+from dubsync.models.cue import Cue, CueBatch  # noqa: E402
+
+
+def _make_cues(count: int) -> list:
+    return [
+        Cue(
+            cue_index=i,
+            time_in_ms=i * 2000,
+            time_out_ms=i * 2000 + 1800,
+            source_text=f"Source line number {i}",
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def run_profile(profile: ConnectionProfile, work_dir: Path, cues: int, edits: int) -> dict:
+    """
+    Run the workload with one profile.
+
+    Returns:
+        Dict with timings in seconds
+    """
+    db_path = work_dir / f"bench_{profile.journal_mode.lower()}.dubsync"
+    db = Database(db_path, profile)
+    init_database(db)
+    timings = {}
+
+    start = time.perf_counter()
+    for cue in _make_cues(cues):
+        cue.save(db)
+    timings["import (per-cue commit)"] = time.perf_counter() - start
+
+    CueBatch.delete_all(db)
+    start = time.perf_counter()
+    CueBatch.save_all(db, _make_cues(cues))
+    timings["import (batch)"] = time.perf_counter() - start
+
+    loaded = Cue.load_all(db)
+    start = time.perf_counter()
+    for i in range(edits):
+        cue = loaded[i % len(loaded)]
+        cue.translated_text = f"Fordítás {i}"
+        cue.save(db)
+    timings[f"{edits} single-cue saves"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    db.checkpoint()
+    db.close()
+    timings["checkpoint + close"] = time.perf_counter() - start
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cues", type=int, default=2000)
+    parser.add_argument("--edits", type=int, default=500)
+    parser.add_argument("--dir", type=Path, default=None,
+                        help="Directory to run in (e.g. a network share)")
+    args = parser.parse_args()
+
+    work_dir = args.dir or Path(tempfile.mkdtemp(prefix="dubsync_bench_"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        before = run_profile(PORTABLE_PROFILE, work_dir, args.cues, args.edits)
+        after = run_profile(EDITING_PROFILE, work_dir, args.cues, args.edits)
+    finally:
+        if args.dir is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"{'workload':<28}{'portable':>12}{'editing':>12}{'speedup':>10}")
+    for name, old in before.items():
+        new = after[name]
+        speedup = old / new if new > 0 else float("inf")
+        print(f"{name:<28}{old * 1000:>10.1f}ms{new * 1000:>10.1f}ms{speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+DubSync Glossary Search Benchmark
+
+Type-ahead search over a generated studio glossary: the old substring
+scan against the ranked inverted/trigram index, for every prefix of a
+few queries as they are typed (including a mistyped one).
+
+Usage:
+    python benchmarks/bench_glossary_search.py [--entries 20000] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dubsync.plugins.builtin.glossary import GlossaryData  # noqa: E402
+
+
+CONSONANTS = "bcdfghjklmnprstvz"
+VOWELS = "aeiouáéó"
+
+QUERIES = ("starship", "iron gate", "wardlihgt")  # The last one is mistyped
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(
+        rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(rng.randint(2, 4))
+    ) + rng.choice(("", "n", "r", "s", "t"))
+
+
+def _make_glossary(count: int, seed: int = 42) -> GlossaryData:
+    rng = random.Random(seed)
+    # A studio glossary reuses a limited vocabulary across many terms
+    vocabulary = [_word(rng) for _ in range(max(count // 2, 10))]
+    glossary = GlossaryData()
+    for i in range(count):
+        source = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 3)))
+        target = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 2)))
+        notes = rng.choice(vocabulary) if i % 5 == 0 else ""
+        glossary.add_entry(source, target, notes)
+    for query in QUERIES:
+        glossary.add_entry(query.replace("lihgt", "light"), "x")
+    return glossary
+
+
+def _substring_search(glossary: GlossaryData, query: str) -> list:
+    """The previous implementation of GlossaryData.search()."""
+    query_lower = query.lower()
+    return [
+        entry for entry in glossary.entries
+        if (query_lower in entry.source.lower()
+            or query_lower in entry.target.lower()
+            or query_lower in entry.notes.lower())
+    ]
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    glossary = _make_glossary(args.entries)
+    loaded = time.perf_counter()
+    glossary.search("warm-up")  # Builds the index
+    indexed = time.perf_counter()
+    print(f"{len(glossary.entries)} entries: load {(loaded - start) * 1000:.0f}ms, "
+          f"index build {(indexed - loaded) * 1000:.0f}ms")
+
+    print(f"{'query':<14}{'keys':>6}{'substring':>12}{'indexed':>12}{'worst key':>12}  top hit")
+    for query in QUERIES:
+        prefixes = [query[:n] for n in range(1, len(query) + 1)]
+        scan = _best_of(args.repeat, lambda: [_substring_search(glossary, p) for p in prefixes])
+        indexed = _best_of(args.repeat, lambda: [glossary.search(p) for p in prefixes])
+        worst = max(_best_of(args.repeat, lambda p=p: glossary.search(p)) for p in prefixes)
+        top = glossary.search(query, limit=1)
+        print(
+            f"{query:<14}{len(prefixes):>6}{scan * 1000:>10.1f}ms{indexed * 1000:>10.1f}ms"
+            f"{worst * 1000:>10.2f}ms  {top[0].source if top else '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
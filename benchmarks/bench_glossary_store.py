@@ -0,0 +1,80 @@
+"""
+DubSync Glossary Store Benchmark
+
+Compares the old single-file JSON glossary with the SQLite store on a
+generated glossary: loading it at startup and saving one edit.
+
+Usage:
+    python benchmarks/bench_glossary_store.py [--entries 20000] [--edits 50]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dubsync.plugins.builtin.glossary import GlossaryData  # noqa: E402
+from dubsync.services.glossary_store import GlossaryStore  # noqa: E402
+
+from bench_glossary_search import _make_glossary  # noqa: E402
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20000)
+    parser.add_argument("--edits", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    glossary = _make_glossary(args.entries)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "glossary.glossync"
+        glossary.save_to_file(json_path)
+        store = GlossaryStore(Path(tmp) / "glossary.db")
+        info = store.import_dict(glossary.to_dict())
+        store.close()
+
+        size_kb = json_path.stat().st_size / 1024
+        print(f"{len(glossary.entries)} entries, JSON file {size_kb:.0f} KiB\n")
+        print(f"{'operation':<22}{'JSON file':>12}{'SQLite':>12}")
+
+        json_load = _timed(lambda: GlossaryData.load_from_file(json_path))
+        store = GlossaryStore(Path(tmp) / "glossary.db")
+        loaded = {}
+        store_load = _timed(lambda: loaded.setdefault("g", GlossaryData.from_store(store, info)))
+        print(f"{'startup load':<22}{json_load * 1000:>10.1f}ms{store_load * 1000:>10.1f}ms")
+
+        # Old behaviour: every edit rewrote the whole file
+        in_memory = GlossaryData.load_from_file(json_path)
+
+        def json_edits():
+            for _ in range(args.edits):
+                entry = rng.choice(in_memory.entries)
+                in_memory.update_entry(entry, entry.source, entry.target + "!", entry.notes)
+                in_memory.save_to_file(json_path)
+
+        def store_edits():
+            stored = loaded["g"]
+            for _ in range(args.edits):
+                entry = rng.choice(stored.entries)
+                stored.update_entry(entry, entry.source, entry.target + "!", entry.notes)
+
+        json_edit = _timed(json_edits) / args.edits
+        store_edit = _timed(store_edits) / args.edits
+        print(f"{'one edit saved':<22}{json_edit * 1000:>10.2f}ms{store_edit * 1000:>10.2f}ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+DubSync Lip-Sync Engine Benchmark
+
+Compares the character-based and the syllable-based lip-sync engines
+on a generated Hungarian/English corpus: per-keystroke estimate() with
+cold and warm caches, bulk estimate_many(), and how often the two
+engines agree on the status.
+
+Usage:
+    python benchmarks/bench_lipsync.py [--cues 5000] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dubsync.models.cue import Cue  # noqa: E402
+from dubsync.services import lip_sync, syllables  # noqa: E402
+from dubsync.services.lip_sync import create_estimator  # noqa: E402
+
+
+HU_WORDS = (
+    "szia hogy vagy köszönöm jól nem tudom miért ezt mondtad nekem "
+    "gyere ide most azonnal várj egy percet igen persze hát ez őrület "
+    "árvíztűrő tükörfúrógép szépen lassan menjünk haza holnap reggel"
+).split()
+
+EN_WORDS = (
+    "hello how are you thanks fine I don't know why you said that to me "
+    "come here right now wait a minute yes of course well this is madness "
+    "beautiful table walked wanted slowly let's go home tomorrow morning"
+).split()
+
+
+def _make_cues(count: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    cues = []
+    for i in range(count):
+        length = rng.randint(2, 14)
+        source = " ".join(rng.choice(EN_WORDS) for _ in range(length))
+        translation = " ".join(rng.choice(HU_WORDS) for _ in range(length))
+        if i % 4 == 0:
+            translation = f"[sóhajt] {translation}."
+        start = i * 4000
+        cues.append(Cue(
+            time_in_ms=start,
+            time_out_ms=start + rng.randint(800, 4000),
+            source_text=source + rng.choice([".", "?", ",", ""]),
+            translated_text=translation,
+        ))
+    return cues
+
+
+def _clear_caches() -> None:
+    lip_sync._cleaned_length.cache_clear()
+    syllables._cached_count.cache_clear()
+
+
+def _best_of(repeat: int, func, cold: bool = False) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if cold:
+            _clear_caches()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cues", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cues = _make_cues(args.cues)
+    # Keystroke workload: every prefix of one long line, as typed
+    line = cues[1].translated_text * 3
+    prefixes = [line[:n] for n in range(1, len(line) + 1)]
+
+    engines = {name: create_estimator(name) for name in ("chars", "syllables")}
+
+    def keystrokes(estimator):
+        return lambda: [estimator.estimate(text, 3000, cues[1].source_text) for text in prefixes]
+
+    def per_cue(estimator):
+        return lambda: [estimator.estimate_cue(cue).ratio for cue in cues]
+
+    def bulk(estimator):
+        return lambda: list(estimator.estimate_many(cues))
+
+    workloads = {
+        f"{len(prefixes)} keystrokes": keystrokes,
+        f"{len(cues)} cues, cold": per_cue,
+        f"{len(cues)} cues, warm": per_cue,
+        f"{len(cues)} estimate_many": bulk,
+    }
+
+    print(f"{'workload':<26}{'chars':>12}{'syllables':>12}{'per call':>12}")
+    for name, make in workloads.items():
+        cold = "cold" in name or "keystrokes" in name
+        timings = [
+            _best_of(args.repeat, make(estimator), cold=cold)
+            for estimator in engines.values()
+        ]
+        calls = len(prefixes) if "keystrokes" in name else len(cues)
+        per_call_us = timings[1] / calls * 1e6
+        print(
+            f"{name:<26}{timings[0] * 1000:>10.1f}ms{timings[1] * 1000:>10.1f}ms"
+            f"{per_call_us:>10.2f}us"
+        )
+
+    chars_status = [engines["chars"].estimate_cue(cue).status for cue in cues]
+    syllable_status = [engines["syllables"].estimate_cue(cue).status for cue in cues]
+    agreed = sum(a == b for a, b in zip(chars_status, syllable_status))
+    print(f"\nstatus agreement: {agreed}/{len(cues)} ({agreed / len(cues):.0%})")
+
+
+if __name__ == "__main__":
+    main()
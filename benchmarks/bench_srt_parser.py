@@ -0,0 +1,128 @@
+"""
+DubSync SRT Parser Benchmark
+
+Compares the fused single-pattern block parser with the previous
+per-line regex path (index pattern, time pattern, two uncompiled
+timecode matches and two uncompiled cleanup substitutions per block).
+
+Usage:
+    python benchmarks/bench_srt_parser.py [--cues 10000] [--repeat 5]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dubsync.services.srt_parser import SRTEntry, SRTParser  # noqa: E402
+from dubsync.utils.time_utils import ms_to_timecode, timecode_to_ms  # noqa: E402
+
+
+# =============================================================================
+# Previous implementation, kept here as the baseline
+# =============================================================================
+
+def _legacy_timecode_to_ms(timecode: str) -> int:
+    timecode = timecode.strip().replace(",", ".")
+    match = re.match(r"^(\d{1,2}):(\d{2}):(\d{2})\.(\d{1,3})$", timecode)
+    if not match:
+        raise ValueError(timecode)
+    hours, minutes, seconds, ms = match.groups()
+    ms = ms.ljust(3, "0")
+    return int(hours) * 3600000 + int(minutes) * 60000 + int(seconds) * 1000 + int(ms)
+
+
+def _legacy_clean_text(text: str) -> str:
+    text = re.sub(r"<[^>]+>", "", text)
+    text = re.sub(r"\{[^}]+\}", "", text)
+    text = " ".join(text.split())
+    return text.strip()
+
+
+def _legacy_parse_block(lines: list, block_num: int):
+    if len(lines) < 2:
+        return None
+    index = None
+    time_line_idx = 0
+    if SRTParser.INDEX_PATTERN.match(lines[0]):
+        index = int(lines[0])
+        time_line_idx = 1
+    time_match = SRTParser.TIME_PATTERN.match(lines[time_line_idx])
+    if not time_match:
+        return None
+    time_in_ms = _legacy_timecode_to_ms(time_match.group(1))
+    time_out_ms = _legacy_timecode_to_ms(time_match.group(2))
+    text = _legacy_clean_text("\n".join(lines[time_line_idx + 1:]))
+    return SRTEntry(index if index is not None else block_num, time_in_ms, time_out_ms, text)
+
+
+# =============================================================================
+# Workloads
+# =============================================================================
+
+def _make_blocks(count: int) -> list:
+    blocks = []
+    for i in range(1, count + 1):
+        start = i * 2000
+        text = [f"Line number {i} of the dialogue"]
+        if i % 3 == 0:
+            text = [f"<i>Line number {i}</i>", "{\\an8}second line"]
+        blocks.append([
+            str(i),
+            f"{ms_to_timecode(start)} --> {ms_to_timecode(start + 1800)}",
+            *text,
+        ])
+    return blocks
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cues", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    blocks = _make_blocks(args.cues)
+    timecodes = [line for block in blocks for line in block[1].split(" --> ")]
+    srt_parser = SRTParser()
+
+    legacy_entries = [_legacy_parse_block(block, n) for n, block in enumerate(blocks, 1)]
+    entries = [srt_parser._parse_block(block, n, 1) for n, block in enumerate(blocks, 1)]
+    assert entries == legacy_entries, "parsers disagree"
+
+    workloads = {
+        f"{len(timecodes)} timecodes": (
+            lambda: [_legacy_timecode_to_ms(tc) for tc in timecodes],
+            lambda: [timecode_to_ms(tc) for tc in timecodes],
+        ),
+        f"{len(blocks)} blocks": (
+            lambda: [_legacy_parse_block(b, n) for n, b in enumerate(blocks, 1)],
+            lambda: [srt_parser._parse_block(b, n, 1) for n, b in enumerate(blocks, 1)],
+        ),
+    }
+
+    print(f"{'workload':<22}{'before':>12}{'after':>12}{'speedup':>10}")
+    for name, (before, after) in workloads.items():
+        old = _best_of(args.repeat, before)
+        new = _best_of(args.repeat, after)
+        speedup = old / new if new > 0 else float("inf")
+        print(f"{name:<22}{old * 1000:>10.1f}ms{new * 1000:>10.1f}ms{speedup:>9.1f}x")
+
+    content = "\n\n".join("\n".join(block) for block in blocks) + "\n"
+    total = _best_of(args.repeat, lambda: SRTParser().parse_content(content))
+    print(f"{'full parse_content':<22}{'':>12}{total * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,22 @@ DubSync Models
 Database models and management.
 """
 
-from dubsync.models.database import Database, init_database
+from dubsync.models.database import (
+    Database,
+    ConnectionProfile,
+    EDITING_PROFILE,
+    PORTABLE_PROFILE,
+    init_database,
+)
 from dubsync.models.project import Project
 from dubsync.models.cue import Cue
 from dubsync.models.comment import Comment
 
 __all__ = [
     "Database",
+    "ConnectionProfile",
+    "EDITING_PROFILE",
+    "PORTABLE_PROFILE",
     "init_database",
     "Project",
     "Cue",
@@ -15,6 +15,29 @@ if TYPE_CHECKING:
     from dubsync.models.database import Database
 
 
+_INSERT_SQL = """
+    INSERT INTO cues 
+    (project_id, cue_index, time_in_ms, time_out_ms, source_text,
+     translated_text, character_name, notes, sfx_notes, status, lip_sync_ratio)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_SQL = """
+    UPDATE cues SET
+        cue_index = ?,
+        time_in_ms = ?,
+        time_out_ms = ?,
+        source_text = ?,
+        translated_text = ?,
+        character_name = ?,
+        notes = ?,
+        sfx_notes = ?,
+        status = ?,
+        lip_sync_ratio = ?
+    WHERE id = ?
+"""
+
+
 @dataclass
 class Cue:
     """
@@ -167,60 +190,48 @@ class Cue:
         Save cue to the database.
         """
         if self.id == 0:
-            cursor = db.execute(
-                """
-                INSERT INTO cues 
-                (project_id, cue_index, time_in_ms, time_out_ms, source_text,
-                 translated_text, character_name, notes, sfx_notes, status, lip_sync_ratio)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    self.project_id,
-                    self.cue_index,
-                    self.time_in_ms,
-                    self.time_out_ms,
-                    self.source_text,
-                    self.translated_text,
-                    self.character_name,
-                    self.notes,
-                    self.sfx_notes,
-                    self.status.value,
-                    self.lip_sync_ratio,
-                )
-            )
+            cursor = db.execute(_INSERT_SQL, self._insert_params())
             self.id = cursor.lastrowid or 0
         else:
-            db.execute(
-                """
-                UPDATE cues SET
-                    cue_index = ?,
-                    time_in_ms = ?,
-                    time_out_ms = ?,
-                    source_text = ?,
-                    translated_text = ?,
-                    character_name = ?,
-                    notes = ?,
-                    sfx_notes = ?,
-                    status = ?,
-                    lip_sync_ratio = ?
-                WHERE id = ?
-                """,
-                (
-                    self.cue_index,
-                    self.time_in_ms,
-                    self.time_out_ms,
-                    self.source_text,
-                    self.translated_text,
-                    self.character_name,
-                    self.notes,
-                    self.sfx_notes,
-                    self.status.value,
-                    self.lip_sync_ratio,
-                    self.id,
-                )
-            )
+            db.execute(_UPDATE_SQL, self._update_params())
         db.commit()
     
+    def _insert_params(self) -> tuple:
+        """
+        Parameters for the INSERT statement.
+        """
+        return (
+            self.project_id,
+            self.cue_index,
+            self.time_in_ms,
+            self.time_out_ms,
+            self.source_text,
+            self.translated_text,
+            self.character_name,
+            self.notes,
+            self.sfx_notes,
+            self.status.value,
+            self.lip_sync_ratio,
+        )
+    
+    def _update_params(self) -> tuple:
+        """
+        Parameters for the UPDATE statement.
+        """
+        return (
+            self.cue_index,
+            self.time_in_ms,
+            self.time_out_ms,
+            self.source_text,
+            self.translated_text,
+            self.character_name,
+            self.notes,
+            self.sfx_notes,
+            self.status.value,
+            self.lip_sync_ratio,
+            self.id,
+        )
+    
     def delete(self, db: "Database") -> None:
         """
         Delete cue from the database.
@@ -302,10 +313,43 @@ class CueBatch:
     @classmethod
     def save_all(cls, db: "Database", cues: List[Cue]) -> None:
         """
-        Save multiple cues at once (batch insert).
+        Save multiple cues at once (batch insert/update).
+        
+        New cues are inserted and existing cues are updated with one
+        executemany call each, in a single transaction with one commit
+        (or as part of the caller's transaction, if one is active).
+        New cues receive their database IDs.
         """
-        for cue in cues:
-            cue.save(db)
+        new_cues = [cue for cue in cues if cue.id == 0]
+        existing_cues = [cue for cue in cues if cue.id != 0]
+        
+        try:
+            with db.transaction():
+                if new_cues:
+                    ids = db.insert_many(
+                        _INSERT_SQL, [cue._insert_params() for cue in new_cues]
+                    )
+                    for cue, cue_id in zip(new_cues, ids):
+                        cue.id = cue_id
+                if existing_cues:
+                    db.executemany(
+                        _UPDATE_SQL, [cue._update_params() for cue in existing_cues]
+                    )
+        except Exception:
+            for cue in new_cues:
+                cue.id = 0
+            raise
+    
+    @classmethod
+    def save_lip_sync_ratios(cls, db: "Database", cues: List[Cue]) -> None:
+        """
+        Write only the lip_sync_ratio of saved cues, with one executemany.
+        """
+        with db.transaction():
+            db.executemany(
+                "UPDATE cues SET lip_sync_ratio = ? WHERE id = ?",
+                [(cue.lip_sync_ratio, cue.id) for cue in cues if cue.id != 0],
+            )
     
     @classmethod
     def delete_all(cls, db: "Database", project_id: int = 1) -> None:
@@ -321,7 +365,10 @@ class CueBatch:
         Reindex cue indices.
         """
         cues = Cue.load_all(db, project_id)
+        changed = []
         for i, cue in enumerate(cues, 1):
             if cue.cue_index != i:
                 cue.cue_index = i
-                cue.save(db)
+                changed.append(cue)
+        if changed:
+            cls.save_all(db, changed)
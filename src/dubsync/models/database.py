@@ -5,14 +5,86 @@ SQLite database handler and initializer.
 """
 
 import sqlite3
+import sys
 from pathlib import Path
 from typing import Optional, List, Any, Dict
 from contextlib import contextmanager
+from dataclasses import dataclass
 import json
 
 from dubsync.utils.constants import DB_VERSION
 
 
+@dataclass(frozen=True)
+class ConnectionProfile:
+    """
+    SQLite connection tuning applied when a project file is opened.
+    
+    Values are passed straight to the matching PRAGMA statements.
+    """
+    journal_mode: str = "DELETE"
+    synchronous: str = "FULL"
+    cache_size: int = -2000         # Negative = KiB, positive = pages
+    mmap_size: int = 0              # Bytes, 0 = disabled
+    temp_store: str = "DEFAULT"
+    
+    @property
+    def uses_wal(self) -> bool:
+        """Does the profile use write-ahead logging."""
+        return self.journal_mode.upper() == "WAL"
+
+
+# SQLite defaults: rollback journal, every commit fully synced.
+PORTABLE_PROFILE = ConnectionProfile()
+
+# Tuned for editing sessions: WAL keeps commits cheap, the file is
+# checkpointed on save and switched back to a rollback journal on close.
+EDITING_PROFILE = ConnectionProfile(
+    journal_mode="WAL",
+    synchronous="NORMAL",
+    cache_size=-16384,              # 16 MiB
+    mmap_size=64 * 1024 * 1024,     # 64 MiB
+    temp_store="MEMORY",
+)
+
+
+# Filesystems whose locking / shared memory WAL cannot rely on
+_NETWORK_FILESYSTEMS = frozenset((
+    "nfs", "nfs4", "cifs", "smbfs", "smb3", "afs", "9p", "ceph",
+    "glusterfs", "fuse.sshfs", "fuse.davfs2", "davfs",
+))
+
+
+def _is_network_path(path: Path) -> bool:
+    """
+    Is the path on a network filesystem (best effort: Windows and Linux).
+    """
+    path = Path(path).absolute()
+    if sys.platform == "win32":
+        if path.drive.startswith("\\\\"):
+            return True  # UNC share
+        try:
+            import ctypes
+            DRIVE_REMOTE = 4
+            return ctypes.windll.kernel32.GetDriveTypeW(path.drive + "\\") == DRIVE_REMOTE
+        except (AttributeError, OSError):
+            return False
+    try:
+        with open("/proc/mounts", "r", encoding="utf-8") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    # The longest mount point containing the path decides
+    fs_type, best = "", ""
+    target = str(path)
+    for mount_point, mount_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        prefix = mount_point.rstrip("/") + "/"
+        if (target == mount_point or target.startswith(prefix)) and len(mount_point) > len(best):
+            fs_type, best = mount_type, mount_point
+    return fs_type in _NETWORK_FILESYSTEMS
+
+
 class Database:
     """
     SQLite database handler class.
@@ -20,15 +92,24 @@ class Database:
     The project stores all data in a single file.
     """
     
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        profile: ConnectionProfile = EDITING_PROFILE,
+    ):
         """
         Initialize the database.
         
         Args:
             db_path: Path to the database file. If None, in-memory.
+            profile: Connection profile applied on open. A WAL profile
+                falls back to PORTABLE_PROFILE on network filesystems and
+                when SQLite refuses WAL mode (see the profile attribute).
         """
         self.db_path = db_path
+        self.profile = profile
         self._connection: Optional[sqlite3.Connection] = None
+        self._transaction_depth: int = 0
         
     @property
     def connection(self) -> sqlite3.Connection:
@@ -41,8 +122,64 @@ class Database:
             self._connection.row_factory = sqlite3.Row
             # Enable foreign keys
             self._connection.execute("PRAGMA foreign_keys = ON")
+            self._apply_profile(self._connection)
         return self._connection
     
+    def _apply_profile(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply the connection profile PRAGMAs.
+        
+        WAL needs working shared memory between the connections, which
+        network filesystems don't provide: there, or if SQLite doesn't
+        switch to WAL, the portable profile is applied instead and
+        stored in self.profile.
+        """
+        if self.db_path is not None and self.profile.uses_wal and _is_network_path(self.db_path):
+            self.profile = PORTABLE_PROFILE
+        
+        profile = self.profile
+        conn.execute(f"PRAGMA synchronous = {profile.synchronous}")
+        conn.execute(f"PRAGMA cache_size = {int(profile.cache_size)}")
+        conn.execute(f"PRAGMA temp_store = {profile.temp_store}")
+        # Journal mode and memory mapping only make sense for files
+        if self.db_path is not None:
+            try:
+                mode = conn.execute(f"PRAGMA journal_mode = {profile.journal_mode}").fetchone()[0]
+            except sqlite3.OperationalError:
+                mode = ""  # Locked by another connection
+            if profile.uses_wal and str(mode).lower() != "wal":
+                self.profile = profile = PORTABLE_PROFILE
+                conn.execute(f"PRAGMA synchronous = {profile.synchronous}")
+            conn.execute(f"PRAGMA mmap_size = {int(profile.mmap_size)}")
+    
+    def checkpoint(self) -> None:
+        """
+        Write all WAL content back into the main database file.
+        
+        After this the project file is self-contained and can be copied.
+        Does nothing outside WAL mode.
+        """
+        if self._connection is None or self.db_path is None or not self.profile.uses_wal:
+            return
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    
+    def make_portable(self) -> None:
+        """
+        Checkpoint and switch the file back to a rollback journal.
+        
+        Removes the -wal/-shm side files so the project is a single file
+        again. Silently keeps WAL if another connection still uses it.
+        """
+        if self._connection is None or self.db_path is None or not self.profile.uses_wal:
+            return
+        # Don't wait for other connections; the last one out reverts
+        self._connection.execute("PRAGMA busy_timeout = 0")
+        try:
+            self.checkpoint()
+            self._connection.execute("PRAGMA journal_mode = DELETE")
+        except sqlite3.OperationalError:
+            pass
+    
     @contextmanager
     def cursor(self):
         """
@@ -51,13 +188,63 @@ class Database:
         cur = self.connection.cursor()
         try:
             yield cur
-            self.connection.commit()
+            self.commit()
         except Exception:
-            self.connection.rollback()
+            self.rollback()
             raise
         finally:
             cur.close()
     
+    @contextmanager
+    def transaction(self):
+        """
+        Unit-of-work context manager.
+        
+        While active, commit() and rollback() calls made by the models are
+        suppressed and the whole block is committed once at the end, or
+        rolled back if an exception escapes. Nested blocks use SAVEPOINTs,
+        so an inner failure only discards the inner block's changes.
+        
+        Example:
+            with db.transaction():
+                cue.save(db)
+                CueBatch.reindex(db)
+        """
+        conn = self.connection
+        depth = self._transaction_depth
+        savepoint = f"dubsync_sp_{depth}"
+        
+        if depth == 0:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+        else:
+            conn.execute(f"SAVEPOINT {savepoint}")
+        
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if depth == 0:
+                conn.rollback()
+            else:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            raise
+        else:
+            self._transaction_depth -= 1
+            if depth == 0:
+                conn.commit()
+            else:
+                conn.execute(f"RELEASE {savepoint}")
+    
+    @property
+    def in_transaction(self) -> bool:
+        """
+        Whether a transaction() block is active.
+        """
+        return self._transaction_depth > 0
+    
     def execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
         """
         Execute an SQL command.
@@ -69,26 +256,64 @@ class Database:
         Execute an SQL command with multiple parameter sets.
         """
         return self.connection.executemany(sql, params_list)
-    
+
+    def insert_many(self, sql: str, params_list: List[tuple]) -> List[int]:
+        """
+        Insert multiple rows with a single statement and return their IDs.
+
+        All rows are written inside the current transaction; the caller
+        decides when to commit. Row IDs are derived from the last inserted
+        row ID, which is safe because the tables use AUTOINCREMENT and the
+        connection is the only writer inside the transaction.
+
+        Args:
+            sql: INSERT statement with placeholders
+            params_list: Parameter tuples, one per row
+
+        Returns:
+            List of new row IDs in the order of params_list
+        """
+        if not params_list:
+            return []
+
+        self.connection.executemany(sql, params_list)
+        row = self.connection.execute("SELECT last_insert_rowid()").fetchone()
+        last_id = row[0] if row else 0
+        first_id = last_id - len(params_list) + 1
+        return list(range(first_id, last_id + 1))
+
     def commit(self):
         """
         Commit changes.
+        
+        Deferred to the end of the outermost transaction() block if one
+        is active.
         """
-        self.connection.commit()
+        if self._transaction_depth == 0:
+            self.connection.commit()
     
     def rollback(self):
         """
         Rollback changes.
+        
+        Inside a transaction() block the rollback is left to the block,
+        which undoes its changes when the exception propagates.
         """
-        self.connection.rollback()
+        if self._transaction_depth == 0:
+            self.connection.rollback()
     
     def close(self):
         """
         Close the connection.
         """
         if self._connection:
+            # Uncommitted changes are discarded, as sqlite3 would on close
+            if self._connection.in_transaction:
+                self._connection.rollback()
+            self.make_portable()
             self._connection.close()
             self._connection = None
+        self._transaction_depth = 0
     
     def fetchone(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Row]:
         """
@@ -138,6 +363,7 @@ def init_database(db: Database) -> None:
         editor TEXT DEFAULT '',
         video_path TEXT DEFAULT '',
         frame_rate REAL DEFAULT 25.0,
+        lipsync_engine TEXT DEFAULT 'chars',
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     );
@@ -219,10 +445,14 @@ def migrate_database(db: Database) -> None:
     current_version = db.get_version()
     
     if current_version < DB_VERSION:
-        # Future migrations would go here
-        # For now, just update the version
+        columns = {row["name"] for row in db.fetchall("PRAGMA table_info(project)")}
+        
+        # v2: per-project lip-sync engine
+        if "lipsync_engine" not in columns:
+            db.execute("ALTER TABLE project ADD COLUMN lipsync_engine TEXT DEFAULT 'chars'")
+        
         db.execute(
-            "UPDATE metadata SET value = ? WHERE key = 'db_version'",
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES ('db_version', ?)",
             (str(DB_VERSION),)
         )
         db.commit()
@@ -33,6 +33,7 @@ class Project:
     editor: str = ""
     video_path: str = ""
     frame_rate: float = 25.0
+    lipsync_engine: str = "chars"  # Key of services.lip_sync.LIPSYNC_ENGINES
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
@@ -45,6 +46,9 @@ class Project:
         episode_title = ""
         with contextlib.suppress(KeyError, IndexError):
             episode_title = row["episode_title"] or ""
+        lipsync_engine = "chars"
+        with contextlib.suppress(KeyError, IndexError):
+            lipsync_engine = row["lipsync_engine"] or "chars"
         return cls(
             id=row["id"],
             title=row["title"] or "",
@@ -56,6 +60,7 @@ class Project:
             editor=row["editor"] or "",
             video_path=row["video_path"] or "",
             frame_rate=row["frame_rate"] or 25.0,
+            lipsync_engine=lipsync_engine,
             created_at=row["created_at"],
             updated_at=row["updated_at"],
         )
@@ -90,8 +95,9 @@ class Project:
             cursor = db.execute(
                 """
                 INSERT INTO project 
-                (title, series_title, season, episode, episode_title, translator, editor, video_path, frame_rate)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                (title, series_title, season, episode, episode_title, translator, editor, video_path, frame_rate,
+                 lipsync_engine)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     self.title,
@@ -103,6 +109,7 @@ class Project:
                     self.editor,
                     self.video_path,
                     self.frame_rate,
+                    self.lipsync_engine,
                 )
             )
             self.id = cursor.lastrowid or 0
@@ -119,7 +126,8 @@ class Project:
                     translator = ?,
                     editor = ?,
                     video_path = ?,
-                    frame_rate = ?
+                    frame_rate = ?,
+                    lipsync_engine = ?
                 WHERE id = ?
                 """,
                 (
@@ -132,6 +140,7 @@ class Project:
                     self.editor,
                     self.video_path,
                     self.frame_rate,
+                    self.lipsync_engine,
                     self.id,
                 )
             )
@@ -10,7 +10,7 @@ import contextlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Callable, TYPE_CHECKING
 from pathlib import Path
 
 if TYPE_CHECKING:
@@ -279,6 +279,41 @@ class QAPlugin(PluginInterface):
         """
         pass
 
+    def check_cancellable(
+        self,
+        project: "Project",
+        cues: List["Cue"],
+        is_cancelled: Callable[[], bool],
+    ) -> List[QAIssue]:
+        """
+        check() that can be interrupted.
+
+        The QA runner calls this method; long checks override it and poll
+        is_cancelled, returning early (with any result) once it is True.
+        The default ignores cancellation and calls check().
+
+        Args:
+            project: Project object
+            cues: Cue list
+            is_cancelled: True once the QA run was cancelled
+        """
+        return self.check(project, cues)
+
+    def get_cue_checker(self) -> Optional[Callable[[Any, Optional[tuple]], List[Any]]]:
+        """
+        Per-cue check for the parallel QA runner.
+
+        The callable receives a cue record and its overlap with earlier
+        cues ((earlier record, overlap ms) or None) and returns QAIssue
+        or QAFinding objects. It runs in worker processes, so it must be
+        picklable: a function of an importable module, or a
+        functools.partial of one with plain-data arguments.
+
+        Returns:
+            Callable, or None to run check() in a background thread
+        """
+        return None
+
 
 class UIPlugin(PluginInterface):
     """
@@ -329,6 +364,27 @@ class UIPlugin(PluginInterface):
         """
         pass
     
+    def on_cue_saved(self, cue: "Cue") -> None:
+        """
+        Cue saved event (text, status or timing changed).
+        
+        Args:
+            cue: Saved cue
+        """
+        pass
+    
+    def on_translation_edited(self, text: str) -> None:
+        """
+        Translation text edited in the cue editor (on every keystroke).
+        
+        Called on the GUI thread while the user types: keep it cheap and
+        defer heavy work (debounce, background thread).
+        
+        Args:
+            text: Current, unsaved translation text
+        """
+        pass
+    
     def on_project_opened(self, project: "Project") -> None:
         """
         Project opened event.
@@ -698,7 +754,10 @@ class PluginManager:
     def shutdown_all(self) -> None:
         """Shutdown all plugins."""
         for plugin in self._plugins.values():
-            plugin.shutdown()
+            try:
+                plugin.shutdown()
+            except Exception as e:
+                print(f"Plugin shutdown error ({plugin.info.id}): {e}")
         
         self._plugins.clear()
         self._export_plugins.clear()
@@ -10,25 +10,55 @@ from typing import List, Optional, Dict, Any
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTreeWidget, QTreeWidgetItem, QGroupBox, QDockWidget,
-    QHeaderView, QFormLayout, QSpinBox, QDoubleSpinBox, QCheckBox
+    QHeaderView, QFormLayout, QSpinBox, QDoubleSpinBox, QCheckBox,
+    QProgressBar
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QThread
 from PySide6.QtGui import QAction, QColor
 
 from dubsync.plugins.base import (
     QAPlugin, UIPlugin, QAIssue, PluginInfo, PluginType
 )
+from dubsync.plugins.qa_engine import IncrementalQAEngine, QAFinding, format_findings
+from dubsync.plugins.qa_rules import (
+    CompiledRules, compile_rules, rules_version,
+    DEFAULT_MAX_CPS, DEFAULT_MIN_CPS, DEFAULT_MIN_DURATION_MS, DEFAULT_MAX_DURATION_MS
+)
 from dubsync.models.project import Project
 from dubsync.models.cue import Cue
-from dubsync.utils.constants import LIPSYNC_THRESHOLD_WARNING
+from dubsync.services.qa_runner import QACancelled, QARunner, merge_issues
 from dubsync.i18n import t
 
 
-# Default QA thresholds
-DEFAULT_MAX_CPS = 20.0  # Characters per second
-DEFAULT_MIN_CPS = 5.0   # Minimum CPS (too slow to read)
-DEFAULT_MIN_DURATION_MS = 500  # Minimum cue duration
-DEFAULT_MAX_DURATION_MS = 10000  # Maximum cue duration (10 seconds)
+class QARunWorker(QThread):
+    """Háttérszál a teljes projekt QA futtatásához."""
+    
+    progress = Signal(int, int)  # done, total
+    results_ready = Signal(object)  # QAIssue / QAFinding list
+    failed = Signal(str)  # error message
+    
+    def __init__(self, runner: QARunner, plugins: List[QAPlugin], project, cues: List[Cue]):
+        super().__init__()
+        self.runner = runner
+        self.plugins = plugins
+        self.project = project
+        self.cues = cues
+    
+    def run(self):
+        try:
+            results = self.runner.run(
+                self.plugins, self.project, self.cues,
+                progress=self.progress.emit,
+                is_cancelled=self.isInterruptionRequested,
+            )
+        except QACancelled:
+            return
+        except Exception as e:
+            if not self.isInterruptionRequested():
+                self.failed.emit(str(e))
+            return
+        if not self.isInterruptionRequested():
+            self.results_ready.emit(results)
 
 
 class QAResultsWidget(QWidget):
@@ -40,7 +70,10 @@ class QAResultsWidget(QWidget):
     def __init__(self, plugin: 'BasicQAPlugin', parent=None):
         super().__init__(parent)
         self.plugin = plugin
-        self._issues: List[QAIssue] = []
+        # QAFinding (incremental engine) and QAIssue items; None: no check yet
+        self._results: Optional[List[Any]] = None
+        self._worker: Optional[QARunWorker] = None
+        self._running_workers = set()  # Cancelled threads still winding down
         self._setup_ui()
     
     def _setup_ui(self):
@@ -76,6 +109,10 @@ class QAResultsWidget(QWidget):
         
         layout.addWidget(self.results_tree)
         
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        
         # Gombok
         btn_layout = QHBoxLayout()
         
@@ -83,6 +120,11 @@ class QAResultsWidget(QWidget):
         self.run_btn.clicked.connect(self._run_check)
         btn_layout.addWidget(self.run_btn)
         
+        self.cancel_btn = QPushButton(t("plugins.basic_qa.cancel"))
+        self.cancel_btn.clicked.connect(self.cancel_check)
+        self.cancel_btn.setVisible(False)
+        btn_layout.addWidget(self.cancel_btn)
+        
         self.clear_btn = QPushButton(t("plugins.basic_qa.clear"))
         self.clear_btn.clicked.connect(self._clear_results)
         btn_layout.addWidget(self.clear_btn)
@@ -99,21 +141,101 @@ class QAResultsWidget(QWidget):
             self.summary_label.setText(t("plugins.basic_qa.no_project"))
             return
         
-        project = pm.project
-        cues = pm.get_cues()
+        if self.is_running:
+            return
         
-        self._issues = self.plugin.check(project, cues)
+        # Every enabled QA plugin runs in the background; pure rules
+        # are spread over worker processes by the runner
+        manager = getattr(self.plugin._main_window, 'plugin_manager', None)
+        plugins = manager.get_qa_plugins(enabled_only=True) if manager else [self.plugin]
+        
+        worker = QARunWorker(self.plugin.runner, plugins, pm.project, pm.get_cues())
+        worker.progress.connect(self._on_progress)
+        worker.results_ready.connect(self._on_results_ready)
+        worker.failed.connect(self._on_failed)
+        worker.finished.connect(self._on_worker_finished)
+        self._worker = worker
+        self._running_workers.add(worker)
+        self._set_running(True)
+        worker.start(QThread.Priority.LowPriority)
+    
+    @property
+    def is_running(self) -> bool:
+        """Fut-e háttérellenőrzés."""
+        return self._worker is not None
+    
+    def cancel_check(self):
+        """Futó ellenőrzés megszakítása."""
+        if self._worker is not None:
+            self._worker.requestInterruption()
+            self._worker = None
+            self._set_running(False)
+    
+    def _set_running(self, running: bool):
+        self.run_btn.setEnabled(not running)
+        self.cancel_btn.setVisible(running)
+        self.progress_bar.setVisible(running)
+        if running:
+            self.progress_bar.setRange(0, 0)
+            self.summary_label.setText(t("plugins.basic_qa.running"))
+    
+    def _on_progress(self, done: int, total: int):
+        if self.sender() is self._worker:
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(done)
+    
+    def _on_results_ready(self, results: List[Any]):
+        if self.sender() is self._worker:
+            self._worker = None
+            self._set_running(False)
+            self.set_results(results)
+    
+    def _on_failed(self, message: str):
+        if self.sender() is self._worker:
+            self._worker = None
+            self._set_running(False)
+            self.summary_label.setText(t("plugins.basic_qa.failed", error=message))
+            self.summary_label.setStyleSheet("color: #f44336; font-size: 11px;")
+    
+    def shutdown(self):
+        """Ellenőrzés megszakítása és a szálak bevárása."""
+        self.cancel_check()
+        for worker in list(self._running_workers):
+            worker.wait()
+        self._running_workers.clear()
+    
+    def _on_worker_finished(self):
+        """Release a finished thread."""
+        self._running_workers.discard(self.sender())
+    
+    @property
+    def has_results(self) -> bool:
+        """Van-e megjelenített ellenőrzés."""
+        return self._results is not None
+    
+    def set_results(self, results: List[Any]):
+        """Új eredmények megjelenítése."""
+        self._results = results
         self._display_results()
     
+    def update_findings(self, findings: List[QAFinding], cues: List[Cue]):
+        """
+        Az inkrementális motor eredményeinek cseréje; a többi plugin
+        hibái a következő teljes futtatásig megmaradnak.
+        """
+        others = [r for r in self._results or [] if not isinstance(r, QAFinding)]
+        self.set_results(merge_issues(findings + others, cues))
+    
     def _display_results(self):
         """Eredmények megjelenítése."""
         self.results_tree.clear()
+        results = self._results or []
 
-        errors = sum(i.severity == "error" for i in self._issues)
-        warnings = sum(i.severity == "warning" for i in self._issues)
-        infos = sum(i.severity == "info" for i in self._issues)
+        errors = sum(r.severity == "error" for r in results)
+        warnings = sum(r.severity == "warning" for r in results)
+        infos = sum(r.severity == "info" for r in results)
 
-        if not self._issues:
+        if not results:
             self.summary_label.setText(t("plugins.basic_qa.no_issues"))
             self.summary_label.setStyleSheet("color: #4CAF50; font-size: 11px;")
             return
@@ -130,7 +252,10 @@ class QAResultsWidget(QWidget):
             "info": QColor("#2196F3"),
         }
 
-        for issue in self._issues:
+        # Messages are localized only here, for the displayed results
+        for issue in results:
+            if isinstance(issue, QAFinding):
+                issue = issue.to_issue()
             item = QTreeWidgetItem([
                 str(issue.cue_id) if issue.cue_id else "-",
                 issue.message,
@@ -147,7 +272,8 @@ class QAResultsWidget(QWidget):
     
     def _clear_results(self):
         """Eredmények törlése."""
-        self._issues = []
+        self.cancel_check()
+        self._results = None
         self.results_tree.clear()
         self.summary_label.setText(t("plugins.basic_qa.no_check"))
         self.summary_label.setStyleSheet("color: #888; font-size: 11px;")
@@ -171,6 +297,9 @@ class BasicQAPlugin(QAPlugin, UIPlugin):
     - CPS (characters per second) - too fast / too slow
     - Overlap between consecutive cues
     - Minimum/Maximum duration
+    
+    A szabályok a dubsync.plugins.qa_rules regiszterből jönnek; más
+    pluginok a @qa_rule dekorátorral adhatnak hozzá újakat.
     """
     
     def __init__(self):
@@ -192,6 +321,10 @@ class BasicQAPlugin(QAPlugin, UIPlugin):
             "check_missing_character": True,
             "check_whitespace": True,
         }
+        self._engine = IncrementalQAEngine(self._check_cue)
+        self._runner: Optional[QARunner] = None
+        self._rules: Optional[CompiledRules] = None
+        self._rules_version = -1
     
     @property
     def info(self) -> PluginInfo:
@@ -206,9 +339,24 @@ class BasicQAPlugin(QAPlugin, UIPlugin):
             readme_path="README.md"
         )
     
+    @property
+    def runner(self) -> QARunner:
+        """Teljes projekt QA futtató (a folyamatkészletet újrahasznosítja)."""
+        if self._runner is None:
+            self._runner = QARunner()
+        return self._runner
+    
+    def shutdown(self) -> None:
+        """Háttérszálak és -folyamatok leállítása."""
+        if self._widget:
+            self._widget.shutdown()  # A szálak még használják a futtatót
+        if self._runner is not None:
+            self._runner.shutdown()
+    
     def load_settings(self, settings: Dict[str, Any]) -> None:
         """Load plugin settings."""
         self._settings.update(settings)
+        self._rules = None
     
     def save_settings(self) -> Dict[str, Any]:
         """Save plugin settings."""
@@ -296,128 +444,53 @@ class BasicQAPlugin(QAPlugin, UIPlugin):
             self._settings["min_duration_ms"] = self.min_duration_spin.value()
             self._settings["max_duration_ms"] = self.max_duration_spin.value()
             self._settings["check_overlap"] = self.check_overlap_cb.isChecked()
+            self._rules = None
     
     def check(self, project: Project, cues: List[Cue]) -> List[QAIssue]:
-        """QA ellenőrzés végrehajtása."""
-        issues = []
-        
-        # Sort cues by time for overlap detection
-        sorted_cues = sorted(cues, key=lambda c: c.time_in_ms)
-        
-        for i, cue in enumerate(sorted_cues):
-            duration_ms = cue.time_out_ms - cue.time_in_ms
-            duration_s = duration_ms / 1000.0
-            text = cue.translated_text or ""
-            char_count = len(text.replace(" ", ""))  # Characters without spaces
-            
-            # ============================================
-            # NEW: CPS (Characters Per Second) check
-            # ============================================
-            if self._settings["check_cps"] and text.strip() and duration_s > 0:
-                cps = char_count / duration_s
-                
-                if cps > self._settings["max_cps"]:
-                    issues.append(QAIssue(
-                        cue_id=cue.id,
-                        severity="error",
-                        message=t("plugins.basic_qa.issues.cps_too_high", cps=f"{cps:.1f}"),
-                        suggestion=t("plugins.basic_qa.issues.cps_too_high_suggestion", 
-                                    max_cps=f"{self._settings['max_cps']:.1f}")
-                    ))
-                elif cps < self._settings["min_cps"] and char_count > 5:
-                    issues.append(QAIssue(
-                        cue_id=cue.id,
-                        severity="info",
-                        message=t("plugins.basic_qa.issues.cps_too_low", cps=f"{cps:.1f}"),
-                        suggestion=t("plugins.basic_qa.issues.cps_too_low_suggestion")
-                    ))
-            
-            # ============================================
-            # NEW: Overlap detection
-            # ============================================
-            if self._settings["check_overlap"] and i > 0:
-                prev_cue = sorted_cues[i - 1]
-                if cue.time_in_ms < prev_cue.time_out_ms:
-                    overlap_ms = prev_cue.time_out_ms - cue.time_in_ms
-                    issues.append(QAIssue(
-                        cue_id=cue.id,
-                        severity="error",
-                        message=t("plugins.basic_qa.issues.overlap", 
-                                 overlap_ms=overlap_ms, prev_id=prev_cue.id),
-                        suggestion=t("plugins.basic_qa.issues.overlap_suggestion")
-                    ))
-            
-            # ============================================
-            # NEW: Duration check (min/max)
-            # ============================================
-            if self._settings["check_duration"]:
-                if duration_ms < self._settings["min_duration_ms"]:
-                    issues.append(QAIssue(
-                        cue_id=cue.id,
-                        severity="warning",
-                        message=t("plugins.basic_qa.issues.duration_too_short", 
-                                 duration_ms=duration_ms),
-                        suggestion=t("plugins.basic_qa.issues.duration_too_short_suggestion",
-                                    min_ms=self._settings["min_duration_ms"])
-                    ))
-                elif duration_ms > self._settings["max_duration_ms"]:
-                    issues.append(QAIssue(
-                        cue_id=cue.id,
-                        severity="warning",
-                        message=t("plugins.basic_qa.issues.duration_too_long",
-                                 duration_ms=duration_ms),
-                        suggestion=t("plugins.basic_qa.issues.duration_too_long_suggestion")
-                    ))
-            
-            # ============================================
-            # Existing checks
-            # ============================================
-            
-            # Hiányzó fordítás
-            if self._settings.get("check_missing_translation", True) and (not text or not text.strip()):
-                issues.append(QAIssue(
-                    cue_id=cue.id,
-                    severity="warning",
-                    message=t("plugins.basic_qa.issues.missing_translation"),
-                    suggestion=t("plugins.basic_qa.issues.missing_translation_suggestion")
-                ))
-            
-            # Lip-sync hiba
-            if self._settings.get("check_lipsync", True) and (cue.lip_sync_ratio and cue.lip_sync_ratio > LIPSYNC_THRESHOLD_WARNING):
-                issues.append(QAIssue(
-                    cue_id=cue.id,
-                    severity="error",
-                    message=t("plugins.basic_qa.issues.lipsync_too_long", ratio=f"{cue.lip_sync_ratio:.0%}"),
-                    suggestion=t("plugins.basic_qa.issues.lipsync_suggestion")
-                ))
-            # Dupla szóközök
-            if self._settings.get("check_double_space", True) and "  " in text:
-                issues.append(QAIssue(
-                    cue_id=cue.id,
-                    severity="info",
-                    message=t("plugins.basic_qa.issues.double_space"),
-                    suggestion=t("plugins.basic_qa.issues.double_space_suggestion")
-                ))
-            
-            # Hiányzó karakter név
-            if self._settings.get("check_missing_character", True) and (text and not cue.character_name):
-                issues.append(QAIssue(
-                    cue_id=cue.id,
-                    severity="info",
-                    message=t("plugins.basic_qa.issues.missing_character"),
-                    suggestion=t("plugins.basic_qa.issues.missing_character_suggestion")
-                ))
-            
-            # Felesleges whitespace
-            if self._settings.get("check_whitespace", True) and (text and (text != text.strip())):
-                issues.append(QAIssue(
-                    cue_id=cue.id,
-                    severity="info",
-                    message=t("plugins.basic_qa.issues.extra_whitespace"),
-                    suggestion=t("plugins.basic_qa.issues.extra_whitespace_suggestion")
-                ))
-        
-        return issues
+        """
+        QA ellenőrzés végrehajtása.
+        
+        Saját motorral fut, így háttérszálból is hívható a folyamatos
+        ellenőrzés gyorsítótárának érintése nélkül.
+        """
+        engine = IncrementalQAEngine(self._compiled_rules(), self._settings["check_overlap"])
+        return format_findings(engine.run(cues))
+    
+    def run_check(self, cues: Optional[List[Cue]] = None) -> List[QAFinding]:
+        """
+        Incremental QA run.
+        
+        Only cues changed since the previous run are checked again;
+        messages stay unformatted until displayed.
+        
+        Args:
+            cues: Cue list (None: the previously checked cues)
+        """
+        self._compiled_rules()
+        self._engine.check_overlap = self._settings["check_overlap"]
+        return self._engine.run(cues)
+    
+    def _compiled_rules(self) -> CompiledRules:
+        """
+        Enabled rules compiled for the current settings.
+        
+        Recompiled (and the result cache dropped) when the settings or
+        the rule registry change.
+        """
+        if self._rules is None or self._rules_version != rules_version():
+            self._rules = compile_rules(self._settings)
+            self._rules_version = rules_version()
+            self._engine.invalidate()
+        return self._rules
+    
+    def _check_cue(self, cue: Cue, overlap) -> List[QAFinding]:
+        """Egy cue ellenőrzése (overlap: korábbi cue és átfedés ms-ban)."""
+        return self._rules(cue, overlap)
+    
+    def get_cue_checker(self) -> Optional[CompiledRules]:
+        """A lefordított szabályok a párhuzamos futtatóhoz."""
+        rules = self._compiled_rules()
+        return rules if rules.is_picklable() else None
     
     # UIPlugin interfész
     
@@ -463,6 +536,34 @@ class BasicQAPlugin(QAPlugin, UIPlugin):
         if self._widget:
             self._widget._run_check()
     
+    def on_project_opened(self, project: Project) -> None:
+        """Új projekt: a gyorsítótár ürítése."""
+        self._reset_results()
+    
+    def on_project_closed(self) -> None:
+        """Projekt bezárva."""
+        self._reset_results()
+    
+    def _reset_results(self):
+        """Gyorsítótár és megjelenített eredmények törlése."""
+        self._engine.reset()
+        if self._widget:
+            self._widget._clear_results()
+    
+    def on_cue_saved(self, cue: Cue) -> None:
+        """
+        Folyamatos QA: mentéskor csak a cue és időbeli szomszédai
+        ellenőrződnek újra, ha már van megjelenített eredmény.
+        """
+        if not (self._widget and self._widget.has_results):
+            return
+        pm = getattr(self._main_window, 'project_manager', None)
+        if pm and pm.is_open:
+            # The repository hands out the same cue objects, so unchanged
+            # cues are served from the engine's cache
+            cues = pm.get_cues()
+            self._widget.update_findings(self.run_check(cues), cues)
+    
     def _on_issue_selected(self, cue_id: int):
         """Hibára ugrás."""
         if self._main_window:
@@ -2,24 +2,31 @@
 Glossary Plugin
 
 Egyéni fordító szótár plugin a DubSync alkalmazáshoz.
-Import/export .glossync fájlokkal.
+A szótárak egy közös SQLite adatbázisban vannak, import/export
+.glossync fájlokkal.
 """
 
 import json
+import threading
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
-    QLabel, QLineEdit, QDockWidget, QListWidget, QListWidgetItem,
+    QLabel, QLineEdit, QDockWidget, QListView,
     QApplication, QGroupBox, QDialog, QDialogButtonBox,
     QFileDialog, QTreeWidget, QTreeWidgetItem, QHeaderView,
-    QMessageBox, QAbstractItemView, QCheckBox, QMenu, QInputDialog
+    QMessageBox, QAbstractItemView, QCheckBox, QMenu, QInputDialog,
+    QComboBox
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QAbstractListModel, QModelIndex, QTimer
 from PySide6.QtGui import QAction
 
-from dubsync.plugins.base import UIPlugin, PluginInfo, PluginType
+from dubsync.plugins.base import UIPlugin, QAPlugin, QAIssue, PluginInfo, PluginType
+from dubsync.services.glossary_store import GLOSSARY_DB_NAME, GlossaryInfo, GlossaryStore
+from dubsync.services.search_index import SearchIndex
+from dubsync.services.term_matcher import TermMatch, TermMatcher, fold_case
 from dubsync.i18n import t
 
 
@@ -30,6 +37,7 @@ class GlossaryEntry:
         self.source = source
         self.target = target
         self.notes = notes
+        self.id: Optional[int] = None  # Sor azonosító a szótár adatbázisban
     
     def to_dict(self) -> Dict[str, str]:
         return {
@@ -48,51 +56,210 @@ class GlossaryEntry:
 
 
 class GlossaryData:
-    """Szótár adatok kezelése."""
+    """
+    Szótár adatok kezelése.
+    
+    A forrás- és célkifejezések egy-egy Aho-Corasick illesztőbe
+    fordulnak, így egy cue összes kifejezése egyetlen bejárással
+    megtalálható; a kereséshez egy szó- és trigram index tartozik.
+    Mindkettő az első használatkor épül fel, utána bejegyzésenként
+    frissül. Az entries listát az add_entry / update_entry /
+    remove_entry metódusokon át kell módosítani, hogy az indexek
+    naprakészek maradjanak; tárolóból betöltött szótárnál ezek a
+    hívások egy-egy sort írnak az adatbázisba.
+    
+    A QA ellenőrzés (check_consistency) háttérszálon fut, miközben a
+    felületen tovább szerkeszthető a szótár; az illesztők módosítása és
+    bejárása ezért egy záron osztozik. A bejárás cue-nként veszi fel a
+    zárat, így a szerkesztés legfeljebb egy cue idejéig várakozik.
+    """
     
     def __init__(self):
         self.entries: List[GlossaryEntry] = []
         self.name: str = t("plugins.glossary.new_glossary")
         self.source_lang: str = "en"
         self.target_lang: str = "hu"
+        self.store: Optional[GlossaryStore] = None
+        self.glossary_id: Optional[int] = None
+        self._by_source: Dict[str, List[GlossaryEntry]] = {}
+        self._source_matcher: Optional[TermMatcher] = None
+        self._target_matcher: Optional[TermMatcher] = None
+        self._search_index: Optional[SearchIndex] = None
+        self._lock = threading.RLock()
+    
+    @staticmethod
+    def _search_fields(entry: GlossaryEntry):
+        # Forrás találat előrébb, mint a fordítás, a megjegyzés a végén
+        return ((entry.source, 1.0), (entry.target, 0.8), (entry.notes, 0.3))
+    
+    def _matchers(self):
+        """Forrás- és célkifejezés illesztők (első használatkor épülnek)."""
+        with self._lock:
+            if self._source_matcher is None:
+                source_matcher = TermMatcher()
+                # A fordítás toldalékolt lehet (hajó -> hajónak), ezért a
+                # célkifejezés hosszabb szó elején is illeszkedik
+                target_matcher = TermMatcher(stem_matching=True)
+                for entry in self.entries:
+                    source_matcher.add(entry.source, entry)
+                    target_matcher.add(entry.target, entry)
+                self._source_matcher, self._target_matcher = source_matcher, target_matcher
+            return self._source_matcher, self._target_matcher
+    
+    def _search(self) -> SearchIndex:
+        """Keresési index (első használatkor épül)."""
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            for entry in self.entries:
+                self._search_index.add(entry, self._search_fields(entry))
+        return self._search_index
+    
+    def build_indexes(self):
+        """Illesztők és keresési index felépítése előre."""
+        self._matchers()
+        self._search()
+    
+    def _index(self, entry: GlossaryEntry, search: bool = True):
+        with self._lock:
+            self._by_source.setdefault(fold_case(entry.source.strip()), []).append(entry)
+            if self._source_matcher is not None:
+                self._source_matcher.add(entry.source, entry)
+                self._target_matcher.add(entry.target, entry)
+        if search and self._search_index is not None:
+            self._search_index.add(entry, self._search_fields(entry))
+    
+    def _unindex(self, entry: GlossaryEntry, search: bool = True):
+        key = fold_case(entry.source.strip())
+        with self._lock:
+            same_source = self._by_source.get(key, [])
+            if entry in same_source:
+                same_source.remove(entry)
+                if not same_source:
+                    del self._by_source[key]
+            if self._source_matcher is not None:
+                self._source_matcher.remove(entry.source, entry)
+                self._target_matcher.remove(entry.target, entry)
+        if search and self._search_index is not None:
+            self._search_index.remove(entry)
+    
+    @classmethod
+    def from_store(cls, store: GlossaryStore, info: GlossaryInfo) -> 'GlossaryData':
+        """Szótár betöltése az adatbázisból (a módosítások oda íródnak)."""
+        glossary = cls()
+        glossary.name = info.name
+        glossary.source_lang = info.source_lang
+        glossary.target_lang = info.target_lang
+        for row in store.entries(info.id):
+            entry = GlossaryEntry(row.source, row.target, row.notes)
+            entry.id = row.id
+            glossary.entries.append(entry)
+            glossary._index(entry)
+        glossary.store = store
+        glossary.glossary_id = info.id
+        return glossary
+    
+    def batch(self):
+        """Több módosítás egy adatbázis tranzakcióban."""
+        return self.store.transaction() if self.store else nullcontext()
     
     def add_entry(self, source: str, target: str, notes: str = "") -> GlossaryEntry:
         """Új bejegyzés hozzáadása."""
         entry = GlossaryEntry(source, target, notes)
-        self.entries.append(entry)
+        if self.store:
+            entry.id = self.store.add_entry(self.glossary_id, source, target, notes)
+        with self._lock:
+            self.entries.append(entry)
+            self._index(entry)
         return entry
     
+    def update_entry(self, entry: GlossaryEntry, source: str, target: str, notes: str = ""):
+        """Bejegyzés módosítása (a keresési sorrendben a helyén marad)."""
+        if self.store and entry.id is not None:
+            self.store.update_entry(entry.id, source, target, notes)
+        with self._lock:
+            self._unindex(entry, search=False)
+            entry.source = source
+            entry.target = target
+            entry.notes = notes
+            self._index(entry, search=False)
+        if self._search_index is not None:
+            self._search_index.update(entry, self._search_fields(entry))
+    
     def remove_entry(self, entry: GlossaryEntry):
         """Bejegyzés törlése."""
         if entry in self.entries:
-            self.entries.remove(entry)
+            if self.store and entry.id is not None:
+                self.store.delete_entry(entry.id)
+            with self._lock:
+                self.entries.remove(entry)
+                self._unindex(entry)
+    
+    def get_entry(self, source: str) -> Optional[GlossaryEntry]:
+        """Bejegyzés a forráskifejezés alapján (kis- és nagybetű független)."""
+        with self._lock:
+            same_source = self._by_source.get(fold_case(source.strip()))
+            return same_source[0] if same_source else None
     
     def find_translation(self, text: str) -> Optional[str]:
         """Fordítás keresése a szótárban."""
-        text_lower = text.lower()
-        return next(
-            (
-                entry.target
-                for entry in self.entries
-                if entry.source.lower() == text_lower
-            ),
-            None,
-        )
+        entry = self.get_entry(text)
+        return entry.target if entry else None
     
-    def search(self, query: str) -> List[GlossaryEntry]:
-        """Bejegyzések keresése."""
-        query_lower = query.lower()
-        results = []
-        results.extend(
-            entry
-            for entry in self.entries
-            if (
-                query_lower in entry.source.lower()
-                or query_lower in entry.target.lower()
-                or query_lower in entry.notes.lower()
-            )
-        )
-        return results
+    def find_terms(self, text: str) -> List[TermMatch]:
+        """
+        Minden szótári kifejezés egy szövegben, egyetlen bejárással.
+        
+        Returns:
+            Nem átfedő találatok (value: GlossaryEntry) pozíció szerint
+        """
+        if not text:
+            return []
+        source_matcher = self._matchers()[0]
+        with self._lock:
+            return source_matcher.find_all(text)
+    
+    def check_consistency(self, cues) -> List[tuple]:
+        """
+        Szótár-konzisztencia ellenőrzés a teljes projekten.
+        
+        Egy cue akkor hibás, ha a forrásszövegében szereplő kifejezés
+        egyik szótári fordítása sem fordul elő a fordításában. Háttérszálon
+        is hívható.
+        
+        Returns:
+            (cue, GlossaryEntry) párok cue sorrendben
+        """
+        source_matcher, target_matcher = self._matchers()
+        problems = []
+        for cue in cues:
+            if not cue.source_text or not cue.translated_text:
+                continue
+            with self._lock:
+                matches = source_matcher.find_all(cue.source_text)
+                if not matches:
+                    continue
+                found_targets = {
+                    id(match.value)
+                    for match in target_matcher.iter_matches(cue.translated_text)
+                }
+                reported = set()
+                for match in matches:
+                    key = fold_case(match.term)
+                    entries = self._by_source.get(key, [match.value])
+                    if key in reported or any(id(e) in found_targets for e in entries):
+                        continue
+                    reported.add(key)
+                    problems.append((cue, match.value))
+        return problems
+    
+    def search(self, query: str, limit: Optional[int] = None) -> List[GlossaryEntry]:
+        """
+        Rangsorolt keresés (pontos, előtag, szórészlet, elgépelés).
+        
+        Returns:
+            Bejegyzések relevancia szerint csökkenő sorrendben
+        """
+        return [hit.item for hit in self._search().search(query, limit)]
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -110,7 +277,7 @@ class GlossaryData:
         glossary.target_lang = data.get("target_lang", "hu")
         for entry_data in data.get("entries", []):
             entry = GlossaryEntry.from_dict(entry_data)
-            glossary.entries.append(entry)
+            glossary.add_entry(entry.source, entry.target, entry.notes)
         return glossary
     
     def save_to_file(self, path: Path):
@@ -295,6 +462,67 @@ class ImportExportDialog(QDialog):
         self.accept()
 
 
+class GlossaryListModel(QAbstractListModel):
+    """
+    Bejegyzés lista modell lapozott betöltéssel.
+    
+    A nézet csak a látható lapokat kéri le (canFetchMore / fetchMore),
+    így egy több tízezres találati lista beállítása sem hoz létre
+    elemeket előre.
+    """
+    
+    PAGE_SIZE = 200
+    EntryRole = Qt.ItemDataRole.UserRole
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[GlossaryEntry] = []
+        self._loaded = 0
+    
+    def set_entries(self, entries: List[GlossaryEntry]):
+        """Megjelenített bejegyzések cseréje (az első lap betöltődik)."""
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._loaded = min(self.PAGE_SIZE, len(self._entries))
+        self.endResetModel()
+    
+    def total_count(self) -> int:
+        """Összes találat (a még be nem töltött lapokkal együtt)."""
+        return len(self._entries)
+    
+    def entry_at(self, row: int) -> Optional[GlossaryEntry]:
+        """Bejegyzés egy sorban."""
+        return self._entries[row] if 0 <= row < self._loaded else None
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._entries)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.PAGE_SIZE, len(self._entries) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{entry.source} → {entry.target}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return t("plugins.glossary.tooltip_notes", notes=entry.notes) if entry.notes else None
+        if role == self.EntryRole:
+            return entry
+        return None
+
+
 class GlossaryWidget(QWidget):
     """Szótár widget."""
     
@@ -304,6 +532,8 @@ class GlossaryWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.glossary = GlossaryData()
+        self._store: Optional[GlossaryStore] = None
+        self._show = ""  # A megnyitott projekt sorozata
         self._current_entry: Optional[GlossaryEntry] = None
         self._setup_ui()
         self._load_saved_glossary()
@@ -318,6 +548,19 @@ class GlossaryWidget(QWidget):
         header.setStyleSheet("font-size: 14px; font-weight: bold;")
         layout.addWidget(header)
         
+        # Szótár választó
+        glossary_layout = QHBoxLayout()
+        self.glossary_combo = QComboBox()
+        self.glossary_combo.currentIndexChanged.connect(self._on_glossary_changed)
+        glossary_layout.addWidget(self.glossary_combo, 1)
+        
+        self.new_glossary_btn = QPushButton("➕")
+        self.new_glossary_btn.setToolTip(t("plugins.glossary.new_glossary_tooltip"))
+        self.new_glossary_btn.setMaximumWidth(40)
+        self.new_glossary_btn.clicked.connect(self._new_glossary)
+        glossary_layout.addWidget(self.new_glossary_btn)
+        layout.addLayout(glossary_layout)
+        
         # Kereső
         search_layout = QHBoxLayout()
         self.search_edit = QLineEdit()
@@ -330,11 +573,14 @@ class GlossaryWidget(QWidget):
         entries_group = QGroupBox(t("plugins.glossary.entries_group"))
         entries_layout = QVBoxLayout(entries_group)
         
-        self.entries_list = QListWidget()
+        self.entries_model = GlossaryListModel(self)
+        self.entries_list = QListView()
+        self.entries_list.setModel(self.entries_model)
+        self.entries_list.setUniformItemSizes(True)
         self.entries_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.entries_list.customContextMenuRequested.connect(self._show_context_menu)
-        self.entries_list.itemDoubleClicked.connect(self._edit_entry)
-        self.entries_list.currentItemChanged.connect(self._on_selection_changed)
+        self.entries_list.doubleClicked.connect(self._edit_entry)
+        self.entries_list.selectionModel().currentChanged.connect(self._on_selection_changed)
         entries_layout.addWidget(self.entries_list)
         
         # Akció gombok
@@ -385,6 +631,12 @@ class GlossaryWidget(QWidget):
         
         layout.addLayout(io_layout)
         
+        # Az aktuális cue szótári kifejezései
+        self.cue_terms_label = QLabel()
+        self.cue_terms_label.setWordWrap(True)
+        self.cue_terms_label.setVisible(False)
+        layout.addWidget(self.cue_terms_label)
+        
         # Státusz
         self.status_label = QLabel(t("plugins.glossary.status_entries", count=0))
         self.status_label.setStyleSheet("color: #888; font-size: 11px;")
@@ -393,27 +645,20 @@ class GlossaryWidget(QWidget):
         layout.addStretch()
     
     def _update_list(self):
-        """Lista frissítése."""
-        self.entries_list.clear()
-        
+        """Lista frissítése (rangsorolt keresés, lapozott megjelenítés)."""
         search = self.search_edit.text().strip()
         entries = self.glossary.search(search) if search else self.glossary.entries
-        
-        for entry in entries:
-            item = QListWidgetItem(f"{entry.source} → {entry.target}")
-            item.setData(Qt.ItemDataRole.UserRole, entry)
-            if entry.notes:
-                item.setToolTip(t("plugins.glossary.tooltip_notes", notes=entry.notes))
-            self.entries_list.addItem(item)
-        
+        self.entries_model.set_entries(entries)
+        # A modell törlése nem jelez kiválasztás-változást
+        self._on_selection_changed(QModelIndex(), None)
         self._update_status()
     
     def _update_status(self):
         """Státusz frissítése."""
         total = len(self.glossary.entries)
-        shown = self.entries_list.count()
+        shown = self.entries_model.total_count()
         if shown < total:
-            self.status_label.setText(t("plugins.glossary.status_filtered", shown=shown, total=total))
+            self.status_label.setText(t("plugins.glossary.status_filtered", count=shown, shown=shown, total=total))
         else:
             self.status_label.setText(t("plugins.glossary.status_entries", count=total))
     
@@ -423,20 +668,15 @@ class GlossaryWidget(QWidget):
     
     def _on_selection_changed(self, current, previous):
         """Kiválasztás változott."""
-        has_selection = current is not None
+        self._current_entry = current.data(GlossaryListModel.EntryRole) if current.isValid() else None
+        has_selection = self._current_entry is not None
         self.edit_btn.setEnabled(has_selection)
         self.delete_btn.setEnabled(has_selection)
         self.insert_btn.setEnabled(has_selection)
-        
-        if current:
-            self._current_entry = current.data(Qt.ItemDataRole.UserRole)
-        else:
-            self._current_entry = None
     
     def _show_context_menu(self, pos):
         """Jobb-klikk menü."""
-        item = self.entries_list.itemAt(pos)
-        if not item:
+        if not self.entries_list.indexAt(pos).isValid():
             return
         
         menu = QMenu(self)
@@ -463,33 +703,27 @@ class GlossaryWidget(QWidget):
             if entry.source and entry.target:
                 self.glossary.add_entry(entry.source, entry.target, entry.notes)
                 self._update_list()
-                self._save_glossary()
     
     @Slot()
     def _edit_entry(self):
         """Bejegyzés szerkesztése."""
-        item = self.entries_list.currentItem()
-        if not item:
+        entry = self._current_entry
+        if not entry:
             return
         
-        entry = item.data(Qt.ItemDataRole.UserRole)
         dialog = AddEditEntryDialog(entry, parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             new_entry = dialog.get_entry()
-            entry.source = new_entry.source
-            entry.target = new_entry.target
-            entry.notes = new_entry.notes
+            self.glossary.update_entry(entry, new_entry.source, new_entry.target, new_entry.notes)
             self._update_list()
-            self._save_glossary()
     
     @Slot()
     def _delete_entry(self):
         """Bejegyzés törlése."""
-        item = self.entries_list.currentItem()
-        if not item:
+        entry = self._current_entry
+        if not entry:
             return
         
-        entry = item.data(Qt.ItemDataRole.UserRole)
         reply = QMessageBox.question(
             self, t("plugins.glossary.delete_confirm_title"),
             t("plugins.glossary.delete_confirm_message", source=entry.source, target=entry.target),
@@ -498,7 +732,6 @@ class GlossaryWidget(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             self.glossary.remove_entry(entry)
             self._update_list()
-            self._save_glossary()
     
     @Slot()
     def _insert_translation(self):
@@ -527,24 +760,17 @@ class GlossaryWidget(QWidget):
             dialog = ImportExportDialog(imported.entries, is_import=True, parent=self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 added = 0
-                for entry in dialog.selected_entries:
-                    # Ellenőrizzük, nincs-e már ilyen
-                    existing = None
-                    for e in self.glossary.entries:
-                        if e.source.lower() == entry.source.lower():
-                            existing = e
-                            break
-                    
-                    if existing:
-                        # Frissítjük a meglévőt
-                        existing.target = entry.target
-                        existing.notes = entry.notes
-                    else:
-                        self.glossary.entries.append(entry)
-                    added += 1
+                with self.glossary.batch():
+                    for entry in dialog.selected_entries:
+                        # Ellenőrizzük, nincs-e már ilyen
+                        if existing := self.glossary.get_entry(entry.source):
+                            # Frissítjük a meglévőt
+                            self.glossary.update_entry(existing, existing.source, entry.target, entry.notes)
+                        else:
+                            self.glossary.add_entry(entry.source, entry.target, entry.notes)
+                        added += 1
                 
                 self._update_list()
-                self._save_glossary()
                 QMessageBox.information(
                     self, t("plugins.glossary.import_success_title"),
                     t("plugins.glossary.import_success_message", count=added)
@@ -579,7 +805,8 @@ class GlossaryWidget(QWidget):
             export_data.name = self.glossary.name
             export_data.source_lang = self.glossary.source_lang
             export_data.target_lang = self.glossary.target_lang
-            export_data.entries = dialog.selected_entries
+            for entry in dialog.selected_entries:
+                export_data.add_entry(entry.source, entry.target, entry.notes)
             export_data.save_to_file(Path(file_path))
             
             QMessageBox.information(
@@ -589,31 +816,104 @@ class GlossaryWidget(QWidget):
         except Exception as e:
             QMessageBox.critical(self, t("plugins.glossary.export_error_title"), t("plugins.glossary.export_error_message", error=e))
     
-    def _get_glossary_path(self) -> Path:
-        """Szótár mentési útvonal."""
+    def _get_data_dir(self) -> Path:
+        """Adatkönyvtár (szótár adatbázis helye)."""
         from dubsync.services.settings_manager import SettingsManager
         settings = SettingsManager()
         data_dir = Path(settings.get("data_dir", str(Path.home() / ".dubsync")))
         data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir / "glossary.glossync"
-    
-    def _save_glossary(self):
-        """Szótár mentése."""
-        try:
-            self.glossary.save_to_file(self._get_glossary_path())
-        except Exception as e:
-            print(f"Glossary save error: {e}")
+        return data_dir
     
     def _load_saved_glossary(self):
-        """Mentett szótár betöltése."""
+        """Szótár adatbázis megnyitása, az aktív szótár betöltése."""
         try:
-            path = self._get_glossary_path()
-            if path.exists():
-                self.glossary = GlossaryData.load_from_file(path)
-                self._update_list()
+            data_dir = self._get_data_dir()
+            self._store = GlossaryStore(data_dir / GLOSSARY_DB_NAME)
+            if not self._store.list_glossaries():
+                self._migrate_legacy_glossary(data_dir / "glossary.glossync")
+            if not self._store.list_glossaries():
+                self._store.create_glossary(t("plugins.glossary.default_glossary"))
+            active = self._store.get_meta("active_glossary")
+            self._reload_glossary_combo(int(active) if active else None)
         except Exception as e:
             print(f"Glossary load error: {e}")
     
+    def _migrate_legacy_glossary(self, path: Path):
+        """A korábbi egyfájlos JSON szótár átvétele (a fájl megmarad)."""
+        if path.exists():
+            self._store.import_file(path)
+    
+    def _reload_glossary_combo(self, select_id: Optional[int] = None):
+        """Szótár lista frissítése, a megadott szótár kiválasztása."""
+        glossaries = self._store.list_glossaries()
+        self.glossary_combo.blockSignals(True)
+        self.glossary_combo.clear()
+        for info in glossaries:
+            label = f"{info.name} ({info.show})" if info.show else info.name
+            self.glossary_combo.addItem(label, info.id)
+        self.glossary_combo.blockSignals(False)
+        index = self.glossary_combo.findData(select_id) if select_id is not None else -1
+        self.glossary_combo.setCurrentIndex(max(index, 0))
+        self._on_glossary_changed(self.glossary_combo.currentIndex())
+    
+    @Slot(int)
+    def _on_glossary_changed(self, index: int):
+        """Másik szótár betöltése."""
+        glossary_id = self.glossary_combo.itemData(index)
+        if self._store is None or glossary_id is None or glossary_id == self.glossary.glossary_id:
+            return
+        info = self._store.get_glossary(glossary_id)
+        if info is None:
+            return
+        self.glossary = GlossaryData.from_store(self._store, info)
+        self._store.set_meta("active_glossary", str(info.id))
+        self._update_list()
+        # Az indexek az ablak megjelenése után épülnek, nem az első leütéskor
+        QTimer.singleShot(0, self.glossary.build_indexes)
+    
+    @Slot()
+    def _new_glossary(self):
+        """Új, üres szótár létrehozása (az aktuális sorozathoz)."""
+        if self._store is None:
+            return
+        name, ok = QInputDialog.getText(
+            self, t("plugins.glossary.new_glossary_title"), t("plugins.glossary.new_glossary_label")
+        )
+        if not ok or not name.strip():
+            return
+        try:
+            info = self._store.create_glossary(name, show=self._show)
+        except ValueError:
+            QMessageBox.warning(
+                self, t("plugins.glossary.new_glossary_title"),
+                t("plugins.glossary.glossary_exists", name=name.strip())
+            )
+            return
+        self._reload_glossary_combo(info.id)
+    
+    def set_show(self, show: str):
+        """
+        Megnyitott projekt sorozata.
+        
+        Ha van ehhez a sorozathoz szótár, az lesz az aktív.
+        """
+        self._show = show or ""
+        if self._store is None or not self._show:
+            return
+        if self.glossary.glossary_id is not None:
+            current = self._store.get_glossary(self.glossary.glossary_id)
+            if current and current.show == self._show:
+                return
+        if glossaries := self._store.list_glossaries(show=self._show):
+            self._reload_glossary_combo(glossaries[0].id)
+    
+    def close_store(self):
+        """Szótár adatbázis lezárása."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+            self.glossary.store = None
+    
     def find_translation(self, text: str) -> Optional[str]:
         """Fordítás keresése a szótárban."""
         return self.glossary.find_translation(text)
@@ -621,10 +921,23 @@ class GlossaryWidget(QWidget):
     def highlight_source_text(self, text: str):
         """Kiemeli ha van találat a szótárban."""
         self.search_edit.setText(text)
+    
+    def show_cue_terms(self, text: str):
+        """A szövegben talált szótári kifejezések megjelenítése."""
+        seen = set()
+        terms = []
+        for match in self.glossary.find_terms(text):
+            if id(match.value) not in seen:
+                seen.add(id(match.value))
+                terms.append(f"{match.value.source} → {match.value.target}")
+        self.cue_terms_label.setText(
+            t("plugins.glossary.cue_terms", terms=", ".join(terms)) if terms else ""
+        )
+        self.cue_terms_label.setVisible(bool(terms))
 
 
-class GlossaryPlugin(UIPlugin):
-    """Szótár plugin."""
+class GlossaryPlugin(UIPlugin, QAPlugin):
+    """Szótár plugin (a QA panelen szótár-konzisztencia ellenőrzéssel)."""
     
     def __init__(self):
         super().__init__()
@@ -686,8 +999,36 @@ class GlossaryPlugin(UIPlugin):
         if self._dock:
             self._dock.setVisible(checked)
     
+    def on_project_opened(self, project) -> None:
+        """Projekt megnyitás: a sorozat szótárának kiválasztása."""
+        if self._widget:
+            self._widget.set_show(getattr(project, "series_title", "") or "")
+    
+    def shutdown(self) -> None:
+        """Szótár adatbázis lezárása."""
+        if self._widget:
+            self._widget.close_store()
+    
     def on_cue_selected(self, cue) -> None:
-        """Cue kiválasztás esemény."""
+        """Cue kiválasztás esemény: a forrásszöveg szótári kifejezései."""
+        if self._widget:
+            self._widget.show_cue_terms(cue.source_text if cue else "")
+    
+    def check(self, project, cues) -> List[QAIssue]:
+        """Szótári kifejezések következetes fordításának ellenőrzése."""
+        if not self._widget:
+            return []
+        return [
+            QAIssue(
+                cue_id=cue.id,
+                severity="warning",
+                message=t("plugins.glossary.qa_inconsistent",
+                          source=entry.source, target=entry.target),
+                suggestion=t("plugins.glossary.qa_inconsistent_suggestion",
+                             target=entry.target),
+            )
+            for cue, entry in self._widget.glossary.check_consistency(cues)
+        ]
     
     def get_widget(self) -> Optional[GlossaryWidget]:
         """Widget visszaadása."""
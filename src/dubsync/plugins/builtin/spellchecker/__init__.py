@@ -2,14 +2,18 @@
 Spellchecker Plugin
 
 Magyar helyesírás-ellenőrző plugin a DubSync alkalmazáshoz.
+
+A szótár betöltése, az ellenőrzés és a javaslatok egy háttérszálban
+futnak, így a helyesírás-ellenőrzés soha nem blokkolja a gépelést.
 """
 
 
 import contextlib
-import re
 import json
+import threading
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Set
+from typing import Callable, Iterable, Optional, List, Dict, Any, Set, Tuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
@@ -17,57 +21,152 @@ from PySide6.QtWidgets import (
     QApplication, QGroupBox, QMessageBox, QMenu, QInputDialog,
     QSplitter, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal, Slot, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QThread
 from PySide6.QtGui import QAction, QTextCursor, QTextCharFormat, QColor
 
-from dubsync.plugins.base import UIPlugin, PluginInfo, PluginType, PluginDependency
+from dubsync.plugins.base import (
+    UIPlugin, QAPlugin, QAIssue, PluginInfo, PluginType, PluginDependency
+)
+from dubsync.services.qa_runner import default_worker_count
+from dubsync.services.dictionary_snapshot import dictionary_fingerprint, load_dictionary
+from dubsync.services.spellcheck_batch import (
+    PARALLEL_SPELLCHECK_MIN_WORDS, WORD_PATTERN, LookupPool, VerdictCache,
+    collect_words
+)
 from dubsync.i18n import t
 
+# Gyorsítótár méretek (szó -> eredmény)
+LOOKUP_CACHE_SIZE = 20000
+SUGGEST_CACHE_SIZE = 500
+
+# Gépelés közben ennyi szünet után indul az ellenőrzés
+CHECK_DEBOUNCE_MS = 300
+
+
+# Előfordított szótárak az adatkönyvtárban
+SNAPSHOT_DIR_NAME = "spellcheck"
+
+# A pluginnal szállított szótárak (és előre épített pillanatképeik)
+BUNDLED_DICTIONARY_DIR = Path(__file__).parent / "dictionaries"
+
+
+def _get_data_dir() -> Path:
+    """Adatkönyvtár (beállításokból)."""
+    from dubsync.services.settings_manager import SettingsManager
+    settings = SettingsManager()
+    data_dir = Path(settings.get("data_dir", str(Path.home() / ".dubsync")))
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+
+class _LRUCache:
+    """Korlátos méretű, szálbiztos LRU gyorsítótár."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
 
 class SpellcheckerEngine:
-    """Helyesírás-ellenőrző motor."""
+    """
+    Helyesírás-ellenőrző motor.
     
-    def __init__(self):
+    A Hunspell lekérdezések és javaslatok eredménye LRU gyorsítótárba
+    kerül. A motor nem Qt objektum; a widget egy háttérszálból hívja,
+    a szótár első használatkor töltődik be.
+    """
+    
+    def __init__(self, snapshot_dir: Optional[Path] = None):
+        """
+        Args:
+            snapshot_dir: Előfordított szótár pillanatképek könyvtára
+                (None: a szótár minden induláskor feldolgozódik)
+        """
+        self._snapshot_dir = snapshot_dir
         self._dictionary: Any = None
+        self._dictionary_path: Optional[Path] = None  # Kiterjesztés nélkül
+        self._fingerprint: Optional[str] = None
         self._available = False
         self._error_message = ""
         self._custom_words: Set[str] = set()
         self._ignored_words: Set[str] = set()
         self._initialized = False
+        self._load_lock = threading.Lock()
+        self._lookup_cache = _LRUCache(LOOKUP_CACHE_SIZE)
+        self._suggest_cache = _LRUCache(SUGGEST_CACHE_SIZE)
+        self._lookup_pool: Optional[LookupPool] = None  # Futások között megmarad
         # Lazy loading - don't load dictionary until actually needed
     
     def _ensure_loaded(self):
         """Lazy loading - load dictionary when first needed."""
         if self._initialized:
             return
-        self._initialized = True
-        self._load_dictionary()
+        with self._load_lock:
+            if not self._initialized:
+                self._load_dictionary()
+                self._lookup_cache.clear()
+                self._suggest_cache.clear()
+                self._initialized = True
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Betöltődött-e már a szótár (betöltés indítása nélkül)."""
+        return self._initialized
     
     def _load_dictionary(self):
-        """Magyar szótár betöltése."""
+        """Magyar szótár betöltése (pillanatképből, ha van)."""
         try:
-            from spylls.hunspell import Dictionary # type: ignore
-            
-            # Próbáljuk betölteni a magyar szótárt
-            # A spylls automatikusan megkeresi a rendszer szótárakat
-            try:
-                self._dictionary = Dictionary.from_files('hu_HU')
-                self._available = True
-            except Exception:
-                # Próbáljuk a plugin könyvtárából
-                plugin_dir = Path(__file__).parent
-                dict_path = plugin_dir / "dictionaries" / "hu_HU"
-                
-                if (dict_path.with_suffix('.dic')).exists():
-                    self._dictionary = Dictionary.from_files(str(dict_path))
-                    self._available = True
-                else:
-                    self._error_message = "Magyar szótár nem található"
-                    self._available = False
-                    
+            import spylls.hunspell  # type: ignore # noqa: F401
         except ImportError:
             self._error_message = "spylls csomag nincs telepítve (pip install spylls)"
             self._available = False
+            return
+        
+        # Előbb a munkakönyvtárban, aztán a plugin könyvtárában
+        candidates = [
+            Path('hu_HU').absolute(),
+            BUNDLED_DICTIONARY_DIR / "hu_HU",
+        ]
+        dict_path = next(
+            (path for path in candidates
+             if path.with_suffix('.dic').exists() and path.with_suffix('.aff').exists()),
+            None
+        )
+        if dict_path is None:
+            self._error_message = "Magyar szótár nem található"
+            self._available = False
+            return
+        
+        try:
+            self._fingerprint = dictionary_fingerprint(dict_path)
+            # Pillanatkép csak az adatkönyvtárból és a plugin saját
+            # könyvtárából töltődik (a betöltés kódot futtathat)
+            self._dictionary = load_dictionary(dict_path, self._snapshot_dir, self._fingerprint,
+                                               prebuilt_dirs=[BUNDLED_DICTIONARY_DIR])
+            self._dictionary_path = dict_path
+            self._available = True
         except Exception as e:
             self._error_message = str(e)
             self._available = False
@@ -82,12 +181,19 @@ class SpellcheckerEngine:
         self._ensure_loaded()
         return self._error_message
     
-    def check_word(self, word: str) -> bool:
-        """Szó ellenőrzése."""
+    @property
+    def fingerprint(self) -> str:
+        """A betöltött szótár fájljainak hash-e ("" ha nincs szótár)."""
         self._ensure_loaded()
-        if not self._available:
-            return True
-        
+        if self._fingerprint is None:
+            self._fingerprint = ""
+            if self._dictionary_path is not None:
+                with contextlib.suppress(OSError):
+                    self._fingerprint = dictionary_fingerprint(self._dictionary_path)
+        return self._fingerprint
+    
+    def _is_accepted(self, word: str) -> bool:
+        """Szótár nélkül elfogadott szó (egyéni, kihagyott, szám)."""
         # Normalizálás
         clean_word = word.strip().lower()
         
@@ -100,23 +206,143 @@ class SpellcheckerEngine:
             return True
         
         # Számok és speciális karakterek
-        if not clean_word or clean_word.isdigit():
+        return not clean_word or clean_word.isdigit()
+    
+    def check_word(self, word: str) -> bool:
+        """Szó ellenőrzése."""
+        self._ensure_loaded()
+        if not self._available:
             return True
         
-        # Hunspell ellenőrzés
-        return self._dictionary.lookup(word)
+        if self._is_accepted(word):
+            return True
+        
+        # Hunspell ellenőrzés (gyorsítótárazva)
+        verdict = self._lookup_cache.get(word)
+        if verdict is None:
+            verdict = bool(self._dictionary.lookup(word))
+            self._lookup_cache.put(word, verdict)
+        return verdict
+    
+    def check_words(
+        self,
+        words: Iterable[str],
+        cache: Optional[VerdictCache] = None,
+        max_workers: int = 0,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Set[str]:
+        """
+        Sok egyedi szó ellenőrzése (projekt szintű ellenőrzéshez).
+        
+        Minden szó legfeljebb egyszer kerül a szótárhoz: előbb a memória,
+        majd a tartós gyorsítótárból jön az eredmény.
+        
+        Args:
+            words: Ellenőrizendő szavak
+            cache: Tartós szó -> eredmény gyorsítótár (a szótárhoz kötve)
+            max_workers: Folyamatok száma sok új szóhoz (0: nincs folyamatkészlet)
+            is_cancelled: Szavanként lekérdezve; True esetén megszakít
+        
+        Returns:
+            A hibás szavak
+        """
+        self._ensure_loaded()
+        if not self._available:
+            return set()
+        
+        verdicts: Dict[str, bool] = {}
+        unknown: List[str] = []
+        for word in dict.fromkeys(words):
+            if self._is_accepted(word):
+                continue
+            verdict = self._lookup_cache.get(word)
+            if verdict is None and cache is not None:
+                verdict = cache.get(word)
+            if verdict is None:
+                unknown.append(word)
+            else:
+                verdicts[word] = verdict
+        
+        if unknown:
+            if (max_workers > 0 and len(unknown) >= PARALLEL_SPELLCHECK_MIN_WORDS
+                    and self._dictionary_path is not None):
+                found = self._get_lookup_pool(max_workers).check(unknown, is_cancelled=is_cancelled)
+            else:
+                found = {}
+                for word in unknown:
+                    if is_cancelled and is_cancelled():
+                        break
+                    found[word] = bool(self._dictionary.lookup(word))
+            if cache is not None:
+                cache.put_many(found)
+            verdicts.update(found)
+        
+        for word, verdict in verdicts.items():
+            self._lookup_cache.put(word, verdict)
+        return {word for word, verdict in verdicts.items() if not verdict}
+    
+    def _get_lookup_pool(self, max_workers: int) -> LookupPool:
+        """Folyamatkészlet (az első nagy ellenőrzéskor indul, utána megmarad)."""
+        pool = self._lookup_pool
+        if pool is None or pool.max_workers != max_workers:
+            self.shutdown()
+            pool = self._lookup_pool = LookupPool(self._dictionary_path, max_workers, self._snapshot_dir)
+        return pool
+    
+    def shutdown(self) -> None:
+        """Folyamatkészlet leállítása."""
+        if self._lookup_pool is not None:
+            self._lookup_pool.shutdown()
+            self._lookup_pool = None
+    
+    def find_errors(
+        self,
+        text: str,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[Tuple[str, int]]:
+        """
+        Hibás szavak egy szövegben (javaslatok nélkül).
+        
+        Args:
+            text: Ellenőrizendő szöveg
+            is_cancelled: Szavanként lekérdezve; True esetén megszakít
+        
+        Returns:
+            (szó, pozíció) párok; megszakításkor az addigi találatok
+        """
+        errors = []
+        for match in WORD_PATTERN.finditer(text):
+            if is_cancelled and is_cancelled():
+                break
+            word = match.group(1)
+            if not self.check_word(word):
+                errors.append((word, match.start()))
+        return errors
     
     def suggest(self, word: str) -> List[str]:
-        """Javaslatok hibás szóhoz."""
+        """Javaslatok hibás szóhoz (lassú, gyorsítótárazva)."""
         self._ensure_loaded()
         if not self._available:
             return []
         
+        cached = self._suggest_cache.get(word)
+        if cached is not None:
+            return list(cached)
         try:
-            suggestions = list(self._dictionary.suggest(word))
-            return suggestions[:5]  # Max 5 javaslat
+            suggestions = []
+            for suggestion in self._dictionary.suggest(word):
+                suggestions.append(suggestion)
+                if len(suggestions) == 5:  # Max 5 javaslat
+                    break
         except Exception:
             return []
+        self._suggest_cache.put(word, tuple(suggestions))
+        return suggestions
+    
+    def cached_suggestions(self, word: str) -> Optional[List[str]]:
+        """Javaslatok, ha már ki vannak számolva (különben None)."""
+        cached = self._suggest_cache.get(word)
+        return list(cached) if cached is not None else None
     
     def add_to_ignore(self, word: str):
         """Szó hozzáadása a figyelmen kívül hagyott listához."""
@@ -166,10 +392,75 @@ class SpellcheckerEngine:
 class SpellingError:
     """Helyesírási hiba."""
     
-    def __init__(self, word: str, position: int, suggestions: List[str]):
+    def __init__(self, word: str, position: int, suggestions: Optional[List[str]] = None):
         self.word = word
         self.position = position
-        self.suggestions = suggestions
+        self.suggestions = suggestions  # None: még nincs kiszámolva
+
+
+class SpellcheckWorker(QThread):
+    """
+    Hosszan futó háttérszál a helyesírás-ellenőrző motorhoz.
+    
+    Betölti a szótárt, majd kérésekre vár. Ellenőrzésből mindig csak a
+    legfrissebb kérés fut (egy újabb kérés a régit szavanként
+    megszakítja); a javaslatkérések az ellenőrzések után, sorban futnak.
+    """
+    
+    loaded = Signal(bool, str)  # available, error message
+    checked = Signal(int, str, object)  # request id, text, [(word, position)]
+    suggestions_ready = Signal(str, object)  # word, [suggestion]
+    
+    def __init__(self, engine: SpellcheckerEngine):
+        super().__init__()
+        self.engine = engine
+        self._condition = threading.Condition()
+        self._pending_check: Optional[Tuple[int, str]] = None
+        self._pending_suggest: deque = deque()
+    
+    def request_check(self, request_id: int, text: str):
+        """Szöveg ellenőrzése (a korábbi függő kérést lecseréli)."""
+        with self._condition:
+            self._pending_check = (request_id, text)
+            self._condition.notify()
+    
+    def request_suggestions(self, word: str):
+        """Javaslatok kiszámolása egy szóhoz."""
+        with self._condition:
+            if word not in self._pending_suggest:
+                self._pending_suggest.append(word)
+            self._condition.notify()
+    
+    def stop(self):
+        """Leállítás (a futó szótár-lekérdezés után áll meg)."""
+        self.requestInterruption()
+        with self._condition:
+            self._condition.notify()
+    
+    def _check_superseded(self) -> bool:
+        return self._pending_check is not None or self.isInterruptionRequested()
+    
+    def run(self):
+        available = self.engine.is_available  # Szótár betöltése
+        self.loaded.emit(available, self.engine.error_message)
+        
+        while True:
+            with self._condition:
+                while (not self.isInterruptionRequested()
+                       and self._pending_check is None and not self._pending_suggest):
+                    self._condition.wait()
+                if self.isInterruptionRequested():
+                    return
+                check, self._pending_check = self._pending_check, None
+                word = None if check else self._pending_suggest.popleft()
+            
+            if check:
+                request_id, text = check
+                errors = self.engine.find_errors(text, self._check_superseded)
+                if not self._check_superseded():
+                    self.checked.emit(request_id, text, errors)
+            else:
+                self.suggestions_ready.emit(word, self.engine.suggest(word))
 
 
 class SpellcheckerWidget(QWidget):
@@ -180,11 +471,26 @@ class SpellcheckerWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.engine = SpellcheckerEngine()
+        self.engine = SpellcheckerEngine(_get_data_dir() / SNAPSHOT_DIR_NAME)
         self._errors: List[SpellingError] = []
         self._current_text = ""
+        self._request_id = 0
+        self._pending_text = ""
+        
+        # Gépelés közbeni ellenőrzés késleltetése
+        self._check_timer = QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(CHECK_DEBOUNCE_MS)
+        self._check_timer.timeout.connect(lambda: self.check_text(self._pending_text))
+        
         self._setup_ui()
         self._load_saved_words()
+        
+        self._worker = SpellcheckWorker(self.engine)
+        self._worker.loaded.connect(self._on_engine_loaded)
+        self._worker.checked.connect(self._on_checked)
+        self._worker.suggestions_ready.connect(self._on_suggestions_ready)
+        self._worker.start()
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -196,13 +502,9 @@ class SpellcheckerWidget(QWidget):
         header.setStyleSheet("font-size: 14px; font-weight: bold;")
         layout.addWidget(header)
         
-        # Státusz
-        if self.engine.is_available:
-            self.status_label = QLabel(t("plugins.spellchecker.status_ok"))
-            self.status_label.setStyleSheet("color: #4CAF50; font-size: 11px;")
-        else:
-            self.status_label = QLabel(t("plugins.spellchecker.status_error", error=self.engine.error_message))
-            self.status_label.setStyleSheet("color: #f44336; font-size: 11px;")
+        # Státusz (a szótár a háttérszálban töltődik be)
+        self.status_label = QLabel(t("plugins.spellchecker.status_loading"))
+        self.status_label.setStyleSheet("color: #888; font-size: 11px;")
         layout.addWidget(self.status_label)
         
         # Splitter a hibák és kivételek között
@@ -328,8 +630,15 @@ class SpellcheckerWidget(QWidget):
 
         menu = QMenu(self)
 
-        # Javaslatok
-        if error.suggestions:
+        # Javaslatok: csak most, a menü megnyitásakor számolódnak (háttérben)
+        if error.suggestions is None:
+            error.suggestions = self.engine.cached_suggestions(error.word)
+        if error.suggestions is None:
+            self._worker.request_suggestions(error.word)
+            loading = menu.addAction(t("plugins.spellchecker.suggestions_loading"))
+            loading.setEnabled(False)
+            menu.addSeparator()
+        elif error.suggestions:
             for suggestion in error.suggestions:
                 action = menu.addAction(f"➡️ {suggestion}")
                 action.setData(("replace", suggestion))
@@ -434,32 +743,58 @@ class SpellcheckerWidget(QWidget):
         # Ez a signal-on keresztül fog működni a main window-val
         pass
     
-    def check_text(self, text: str) -> List[SpellingError]:
-        """Szöveg ellenőrzése."""
-        self._current_text = text
-        self._errors = []
-        self.errors_list.clear()
+    def check_text(self, text: str):
+        """
+        Szöveg ellenőrzése a háttérszálban.
         
-        if not self.engine.is_available:
-            return []
+        Az eredmény a _on_checked slotba érkezik; egy újabb kérés a
+        korábbit érvényteleníti.
+        """
+        self._check_timer.stop()
+        self._current_text = text
+        self._request_id += 1
+        self._worker.request_check(self._request_id, text)
+    
+    def schedule_check(self, text: str):
+        """Ellenőrzés gépelés közben: csak a gépelés szünetében indul."""
+        self._pending_text = text
+        self._check_timer.start()
+    
+    @Slot(bool, str)
+    def _on_engine_loaded(self, available: bool, error: str):
+        """A szótár betöltődött (vagy nem érhető el)."""
+        if available:
+            self.status_label.setText(t("plugins.spellchecker.status_ok"))
+            self.status_label.setStyleSheet("color: #4CAF50; font-size: 11px;")
+        else:
+            self.status_label.setText(t("plugins.spellchecker.status_error", error=error))
+            self.status_label.setStyleSheet("color: #f44336; font-size: 11px;")
+    
+    @staticmethod
+    def _error_item_text(error: SpellingError) -> str:
+        item_text = error.word
+        if error.suggestions:
+            item_text += f" → {', '.join(error.suggestions[:3])}"
+        return f"❌ {item_text}"
+    
+    @Slot(int, str, object)
+    def _on_checked(self, request_id: int, text: str, errors: List[Tuple[str, int]]):
+        """Ellenőrzés eredménye a háttérszálból."""
+        if request_id != self._request_id:
+            return  # Elavult kérés
         
-        # Szavak kinyerése
-        word_pattern = re.compile(r'\b([a-záéíóöőúüű]+)\b', re.IGNORECASE)
+        self._errors = [
+            SpellingError(word, position, self.engine.cached_suggestions(word))
+            for word, position in errors
+        ]
+        self.errors_list.clear()
+        for error in self._errors:
+            item = QListWidgetItem(self._error_item_text(error))
+            item.setData(Qt.ItemDataRole.UserRole, error)
+            self.errors_list.addItem(item)
         
-        for match in word_pattern.finditer(text):
-            word = match.group(1)
-            if not self.engine.check_word(word):
-                suggestions = self.engine.suggest(word)
-                error = SpellingError(word, match.start(), suggestions)
-                self._errors.append(error)
-                
-                # Lista elemhez
-                item_text = word
-                if suggestions:
-                    item_text += f" → {', '.join(suggestions[:3])}"
-                item = QListWidgetItem(f"❌ {item_text}")
-                item.setData(Qt.ItemDataRole.UserRole, error)
-                self.errors_list.addItem(item)
+        if not self.engine.is_loaded or not self.engine.is_available:
+            return
         
         # Státusz frissítése
         if self._errors:
@@ -468,8 +803,27 @@ class SpellcheckerWidget(QWidget):
         else:
             self.status_label.setText("✅ Nincs helyesírási hiba")
             self.status_label.setStyleSheet("color: #4CAF50; font-size: 11px;")
+    
+    @Slot(str, object)
+    def _on_suggestions_ready(self, word: str, suggestions: List[str]):
+        """Egy szó javaslatai elkészültek: a lista elemek frissítése."""
+        for row in range(self.errors_list.count()):
+            item = self.errors_list.item(row)
+            error = item.data(Qt.ItemDataRole.UserRole)
+            if error and error.word == word:
+                error.suggestions = list(suggestions)
+                item.setText(self._error_item_text(error))
+    
+    def shutdown(self):
+        """
+        Háttérszál leállítása.
         
-        return self._errors
+        A szótár betöltése és a javaslatkeresés nem szakítható meg, ezért
+        a szál végéig várunk (különben a QThread futás közben semmisülne meg).
+        """
+        self._check_timer.stop()
+        self._worker.stop()
+        self._worker.wait()
     
     def _recheck_current(self):
         """Újraellenőrzés."""
@@ -482,11 +836,7 @@ class SpellcheckerWidget(QWidget):
     
     def _get_words_path(self) -> Path:
         """Szavak mentési útvonal."""
-        from dubsync.services.settings_manager import SettingsManager
-        settings = SettingsManager()
-        data_dir = Path(settings.get("data_dir", str(Path.home() / ".dubsync")))
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir / "spellcheck_words.json"
+        return _get_data_dir() / "spellcheck_words.json"
     
     def _save_words(self):
         """Szavak mentése."""
@@ -538,13 +888,15 @@ class SpellcheckerWidget(QWidget):
             QMessageBox.critical(self, t("plugins.spellchecker.export_error_title"), t("plugins.spellchecker.export_error_message", error=str(e)))
 
 
-class SpellcheckerPlugin(UIPlugin):
-    """Helyesírás-ellenőrző plugin."""
+class SpellcheckerPlugin(UIPlugin, QAPlugin):
+    """Helyesírás-ellenőrző plugin (projekt szintű QA ellenőrzéssel)."""
     
     def __init__(self):
         super().__init__()
         self._dock: Optional[QDockWidget] = None
         self._widget: Optional[SpellcheckerWidget] = None
+        self._engine: Optional[SpellcheckerEngine] = None  # Panel nélküli ellenőrzéshez
+        self._verdict_cache: Optional[VerdictCache] = None
         self._plugin_dir = Path(__file__).parent
     
     @property
@@ -605,17 +957,93 @@ class SpellcheckerPlugin(UIPlugin):
     def on_cue_selected(self, cue) -> None:
         """Cue kiválasztás esemény - ellenőrzés."""
         if self._widget and cue:
-            if target_text := getattr(cue, 'target_text', None):
-                self._widget.check_text(target_text)
+            self._widget.check_text(cue.translated_text or "")
+    
+    def on_translation_edited(self, text: str) -> None:
+        """Gépelés közben: késleltetett ellenőrzés a háttérszálban."""
+        if self._widget:
+            self._widget.schedule_check(text)
+    
+    def shutdown(self) -> None:
+        """Háttérszál és folyamatkészlet leállítása."""
+        if self._widget:
+            self._widget.shutdown()
+            self._widget.engine.shutdown()
+        if self._engine is not None:
+            self._engine.shutdown()
+        super().shutdown()
             
     def get_widget(self) -> Optional[SpellcheckerWidget]:
         """Widget visszaadása."""
         return self._widget
     
-    # sourcery skip: merge-nested-ifs
+    def _get_engine(self) -> SpellcheckerEngine:
+        """A panel motorja (ha van), különben egy saját motor."""
+        if self._widget:
+            return self._widget.engine
+        if self._engine is None:
+            self._engine = SpellcheckerEngine(_get_data_dir() / SNAPSHOT_DIR_NAME)
+        return self._engine
+    
+    def _get_verdict_cache(self, engine: SpellcheckerEngine) -> VerdictCache:
+        """Tartós szó -> eredmény gyorsítótár az aktuális szótárhoz."""
+        fingerprint = engine.fingerprint
+        if self._verdict_cache is None or self._verdict_cache.fingerprint != fingerprint:
+            path = _get_data_dir() / "spellcheck_verdicts.json" if fingerprint else None
+            self._verdict_cache = VerdictCache(path, fingerprint)
+        return self._verdict_cache
+    
+    def check(self, project, cues) -> List[QAIssue]:
+        """Az egész projekt helyesírás-ellenőrzése."""
+        return self.check_cancellable(project, cues, lambda: False)
+    
+    def check_cancellable(self, project, cues, is_cancelled) -> List[QAIssue]:
+        """
+        Az egész projekt helyesírás-ellenőrzése, megszakíthatóan.
+        
+        A szavak a projekt szintjén egyedivé válnak, így minden szó
+        egyszer kerül a szótárhoz; a hibás szavak cue-nként jelennek meg.
+        Megszakításkor a már eldöntött szavak a gyorsítótárba kerülnek.
+        """
+        engine = self._get_engine()
+        occurrences = collect_words((cue, cue.translated_text) for cue in cues)
+        cache = self._get_verdict_cache(engine)
+        misspelled = engine.check_words(occurrences, cache, max_workers=default_worker_count(),
+                                        is_cancelled=is_cancelled)
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"Spellcheck cache save error: {e}")
+        
+        # cue id -> {hibás szó: első előfordulás}
+        by_cue: Dict[int, Dict[str, int]] = {}
+        for word in misspelled:
+            for cue, position in occurrences[word]:
+                by_cue.setdefault(cue.id, {}).setdefault(word, position)
+        
+        issues = []
+        for cue in cues:
+            if positions := by_cue.get(cue.id):
+                words = sorted(positions, key=positions.get)  # Szövegbeli sorrend
+                issues.append(QAIssue(
+                    cue_id=cue.id,
+                    severity="warning",
+                    message=t("plugins.spellchecker.qa_misspelled", words=", ".join(words)),
+                    suggestion=t("plugins.spellchecker.qa_misspelled_suggestion"),
+                ))
+        return issues
+    
     def check_text(self, text: str) -> List[SpellingError]:
-        """Szöveg ellenőrzése."""
-        return self._widget.check_text(text) if self._widget else []
+        """
+        Szöveg szinkron ellenőrzése (a panel nélkül is).
+        
+        A javaslatok nem számolódnak ki (None), csak ha már a cache-ben vannak.
+        """
+        engine = self._get_engine()
+        return [
+            SpellingError(word, position, engine.cached_suggestions(word))
+            for word, position in engine.find_errors(text)
+        ]
 
 
 # Plugin exportálása
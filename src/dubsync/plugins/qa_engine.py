@@ -0,0 +1,244 @@
+"""
+DubSync Incremental QA Engine
+
+Per-cue QA result cache for QA plugins.
+
+A QA run re-checks only the cues whose content or overlap situation
+changed since the previous run. Sorting and overlap detection are one
+cheap integer pass over the cues; the rules themselves and the
+localization of the messages are the expensive part, so those run only
+for changed cues, and messages are formatted only when displayed.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from dubsync.models.cue import Cue
+from dubsync.plugins.base import QAIssue
+from dubsync.services.cue_time_index import CueTimeIndex
+from dubsync.i18n import t
+
+
+# (earlier cue, overlap in milliseconds) or None
+Overlap = Optional[Tuple[Cue, int]]
+
+
+@dataclass(frozen=True)
+class QAFinding:
+    """
+    QA issue with unformatted, localizable message.
+    """
+    cue_id: int                 # Affected cue ID
+    severity: str               # "error", "warning", "info"
+    message_key: str            # Translation key of the message
+    params: Dict[str, Any] = field(default_factory=dict)       # Message parameters
+    suggestion_key: str = ""    # Translation key of the suggestion
+    suggestion_params: Dict[str, Any] = field(default_factory=dict)
+
+    def to_issue(self) -> QAIssue:
+        """Localize into a displayable QAIssue."""
+        return QAIssue(
+            cue_id=self.cue_id,
+            severity=self.severity,
+            message=t(self.message_key, **self.params),
+            suggestion=(
+                t(self.suggestion_key, **self.suggestion_params)
+                if self.suggestion_key else ""
+            ),
+        )
+
+
+def format_findings(findings: Iterable[QAFinding]) -> List[QAIssue]:
+    """Localize findings for display."""
+    return [finding.to_issue() for finding in findings]
+
+
+def cue_content_key(cue: Cue, overlap: Overlap) -> tuple:
+    """
+    Everything a per-cue check may depend on.
+
+    Rules see the whole cue (CueFacts.cue), so every cue field is part
+    of the key. The overlap is too, so moving a neighbour re-checks the
+    cues it starts or stops overlapping.
+    """
+    return (
+        cue.id,
+        cue.project_id,
+        cue.cue_index,
+        cue.time_in_ms,
+        cue.time_out_ms,
+        cue.source_text,
+        cue.translated_text,
+        cue.character_name,
+        cue.notes,
+        cue.sfx_notes,
+        cue.status,
+        cue.lip_sync_ratio,
+        cue.created_at,
+        cue.updated_at,
+        (overlap[0].id, overlap[1]) if overlap else None,
+    )
+
+
+class IncrementalQAEngine:
+    """
+    QA runner that caches findings per cue.
+
+    Cues are tracked by object identity (the cue repository hands out
+    one object per cue), and each cached result is keyed by the cue's
+    content, so cues edited in place are detected as well.
+    """
+
+    def __init__(
+        self,
+        check_cue: Callable[[Cue, Overlap], List[QAFinding]],
+        check_overlap: bool = True,
+    ):
+        """
+        Initialization.
+
+        Args:
+            check_cue: Checks one cue, given its overlap with earlier cues
+            check_overlap: Detect overlaps (otherwise None is passed)
+        """
+        self._check_cue = check_cue
+        self.check_overlap = check_overlap
+        self._cues: List[Cue] = []
+        self._index: Optional[CueTimeIndex] = None  # Time index of the last run
+        self._cache: Dict[int, Tuple[tuple, List[QAFinding]]] = {}
+        self._findings: List[QAFinding] = []
+        self.rechecked = 0  # Cues checked by the last run
+
+    @property
+    def findings(self) -> List[QAFinding]:
+        """Findings of the last run, in time order."""
+        return list(self._findings)
+
+    def reset(self, cues: Iterable[Cue] = ()) -> None:
+        """Forget cached results and track a new cue set."""
+        self._cues = list(cues)
+        self._index = None
+        self._cache.clear()
+        self._findings = []
+
+    def invalidate(self) -> None:
+        """Drop cached results, e.g. after a settings change."""
+        self._index = None
+        self._cache.clear()
+
+    def run(self, cues: Optional[Iterable[Cue]] = None) -> List[QAFinding]:
+        """
+        Check the tracked cues.
+
+        Args:
+            cues: New cue set to track (None: keep the current one)
+
+        Returns:
+            Findings in time order
+        """
+        if cues is not None:
+            self._cues = list(cues)
+
+        time_index = CueTimeIndex(self._cues)
+        overlaps: Dict[int, Tuple[Cue, int]] = {}
+        if self.check_overlap:
+            overlaps = {
+                id(cue): (earlier, overlap_ms)
+                for cue, earlier, overlap_ms in time_index.overlaps()
+            }
+
+        old_cache = self._cache
+        cache: Dict[int, Tuple[tuple, List[QAFinding]]] = {}
+        findings: List[QAFinding] = []
+        rechecked = 0
+        for cue in time_index.cues:
+            overlap = overlaps.get(id(cue))
+            key = cue_content_key(cue, overlap)
+            cached = old_cache.get(id(cue))
+            if cached is not None and cached[0] == key:
+                cue_findings = cached[1]
+            else:
+                cue_findings = self._check_cue(cue, overlap)
+                rechecked += 1
+            cache[id(cue)] = (key, cue_findings)
+            findings.extend(cue_findings)
+
+        # Only the current cues are kept, so deleted cues do not linger
+        self._index = time_index
+        self._cache = cache
+        self._findings = findings
+        self.rechecked = rechecked
+        return self.findings
+
+    def update_cue(self, cue: Cue) -> List[QAFinding]:
+        """
+        Re-check after a cue was saved.
+
+        The time index is updated in place, and only the cue and the
+        cues intersecting its old or new time range (the only ones
+        whose overlap can change) get a new content key; of those, the
+        ones whose key changed are checked again. Without a previous
+        run, or for a cue without an ID, all cues are run.
+
+        Args:
+            cue: Saved cue (tracked or new)
+        """
+        replaced = None
+        if not any(tracked is cue for tracked in self._cues):
+            replaced = next((c for c in self._cues if cue.id and c.id == cue.id), None)
+            self._cues = [c for c in self._cues if c is not replaced]
+            self._cues.append(cue)
+
+        index = self._index
+        if index is None or not cue.id:
+            return self.run()
+
+        # Cues that overlapped the cue where it was, then where it is now
+        old_times = index.times_of(cue.id)
+        affected = index.find_in_range(*old_times) if old_times else []
+        index.update(cue)
+        affected += index.find_in_range(cue.time_in_ms, cue.time_out_ms)
+        affected.append(cue)
+
+        if replaced is not None:
+            self._cache.pop(id(replaced), None)
+        rechecked = 0
+        for affected_cue in {id(c): c for c in affected}.values():
+            if affected_cue is replaced:
+                continue
+            overlap = self._overlap_of(index, affected_cue) if self.check_overlap else None
+            key = cue_content_key(affected_cue, overlap)
+            cached = self._cache.get(id(affected_cue))
+            if cached is None or cached[0] != key:
+                self._cache[id(affected_cue)] = (key, self._check_cue(affected_cue, overlap))
+                rechecked += 1
+
+        self._findings = [
+            finding for indexed in index.cues for finding in self._cache[id(indexed)][1]
+        ]
+        self.rechecked = rechecked
+        return self.findings
+
+    @staticmethod
+    def _overlap_of(index: CueTimeIndex, cue: Cue) -> Overlap:
+        """
+        Overlap of one indexed cue, as CueTimeIndex.overlaps() reports it.
+
+        The earlier cue reaching furthest (the first one on a tie) is
+        among the earlier cues containing the cue's start.
+        """
+        order = (cue.time_in_ms, cue.time_out_ms, cue.id)
+        furthest: Optional[Cue] = None
+        for earlier in index.find_all_at(cue.time_in_ms):
+            if (earlier.time_in_ms, earlier.time_out_ms, earlier.id) >= order:
+                break
+            if furthest is None or earlier.time_out_ms > furthest.time_out_ms:
+                furthest = earlier
+        if furthest is not None and cue.time_in_ms < furthest.time_out_ms:
+            return furthest, furthest.time_out_ms - cue.time_in_ms
+        return None
+
+    def remove_cue(self, cue_id: int) -> List[QAFinding]:
+        """Re-check after a cue was deleted."""
+        self._cues = [cue for cue in self._cues if cue.id != cue_id]
+        return self.run()
@@ -0,0 +1,355 @@
+"""
+DubSync QA Rules
+
+Declarative QA rule registry.
+
+Each rule declares the per-cue inputs it reads (text, duration, CPS,
+overlap with earlier cues), the setting that enables it and the default
+thresholds it uses. compile_rules() turns the enabled rules into one
+callable that derives the shared inputs once per cue and then runs every
+rule on them, so adding a rule never adds another pass over the cues.
+
+Rules are registered with the @qa_rule decorator or register_rule();
+plugins can add their own rules the same way. Rule functions defined in
+an importable module can also run in the worker processes of the
+parallel QA runner.
+"""
+
+import importlib.machinery
+import pickle
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from dubsync.plugins.qa_engine import QAFinding
+from dubsync.utils.constants import LIPSYNC_THRESHOLD_WARNING
+
+
+# Default QA thresholds
+DEFAULT_MAX_CPS = 20.0  # Characters per second
+DEFAULT_MIN_CPS = 5.0   # Minimum CPS (too slow to read)
+DEFAULT_MIN_DURATION_MS = 500  # Minimum cue duration
+DEFAULT_MAX_DURATION_MS = 10000  # Maximum cue duration (10 seconds)
+
+# Inputs a rule can declare
+INPUT_TEXT = "text"             # facts.text, facts.stripped
+INPUT_DURATION = "duration"     # facts.duration_ms
+INPUT_CPS = "cps"               # facts.char_count, facts.cps (implies text and duration)
+INPUT_OVERLAP = "overlap"       # facts.overlap
+RULE_INPUTS = frozenset({INPUT_TEXT, INPUT_DURATION, INPUT_CPS, INPUT_OVERLAP})
+
+_ISSUES = "plugins.basic_qa.issues."
+
+
+class CueFacts:
+    """
+    Inputs of the rules for one cue, derived once per cue.
+
+    Only the inputs some enabled rule declared are filled in; the cue
+    itself is always available for plain attributes.
+    """
+    __slots__ = ("cue", "overlap", "text", "stripped", "duration_ms", "char_count", "cps")
+
+    def __init__(self, cue, overlap: Optional[Tuple[Any, int]], inputs: FrozenSet[str]):
+        self.cue = cue
+        self.overlap = overlap
+        if INPUT_TEXT in inputs:
+            self.text = cue.translated_text or ""
+            self.stripped = self.text.strip()
+        if INPUT_DURATION in inputs:
+            self.duration_ms = cue.time_out_ms - cue.time_in_ms
+        if INPUT_CPS in inputs:
+            self.char_count = len(self.text.replace(" ", ""))  # Characters without spaces
+            duration_s = self.duration_ms / 1000.0
+            self.cps = self.char_count / duration_s if duration_s > 0 else None
+
+
+# Returns the message parameters if the cue violates the rule, else None
+RuleCheck = Callable[[CueFacts, Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class QARule:
+    """
+    Declarative QA rule.
+    """
+    id: str                         # Unique rule identifier
+    severity: str                   # "error", "warning", "info"
+    check: RuleCheck                # Per-cue test
+    message_key: str                # Translation key of the message
+    suggestion_key: str = ""        # Translation key of the suggestion
+    inputs: FrozenSet[str] = frozenset()    # Declared inputs (RULE_INPUTS)
+    setting: str = ""               # Boolean setting that enables the rule ("" = always)
+    defaults: Dict[str, Any] = field(default_factory=dict)  # Default thresholds
+
+
+_RULES: Dict[str, QARule] = {}
+_registry_version = 0
+
+
+def register_rule(rule: QARule) -> None:
+    """
+    Register a QA rule (replaces a rule with the same id).
+
+    Raises:
+        ValueError: If the rule declares an unknown input
+    """
+    global _registry_version
+    if unknown := rule.inputs - RULE_INPUTS:
+        raise ValueError(f"Unknown QA rule inputs: {', '.join(sorted(unknown))}")
+    _RULES[rule.id] = rule
+    _registry_version += 1
+
+
+def unregister_rule(rule_id: str) -> None:
+    """Remove a registered rule."""
+    global _registry_version
+    if _RULES.pop(rule_id, None) is not None:
+        _registry_version += 1
+
+
+def get_rules() -> List[QARule]:
+    """Registered rules in registration order."""
+    return list(_RULES.values())
+
+
+def rules_version() -> int:
+    """Changes whenever the registry changes (for recompiling)."""
+    return _registry_version
+
+
+def qa_rule(
+    rule_id: str,
+    severity: str,
+    message: str,
+    suggestion: str = "",
+    inputs: Iterable[str] = (),
+    setting: str = "",
+    defaults: Optional[Dict[str, Any]] = None,
+) -> Callable[[RuleCheck], RuleCheck]:
+    """
+    Decorator registering a function as a QA rule.
+
+    Example:
+        @qa_rule("no_dots", "info", "plugins.my_plugin.no_dots", inputs=["text"])
+        def no_dots(facts, settings):
+            return {} if "..." in facts.text else None
+    """
+    def decorator(func: RuleCheck) -> RuleCheck:
+        register_rule(QARule(
+            id=rule_id,
+            severity=severity,
+            check=func,
+            message_key=message,
+            suggestion_key=suggestion,
+            inputs=frozenset(inputs),
+            setting=setting,
+            defaults=dict(defaults or {}),
+        ))
+        return func
+    return decorator
+
+
+def _is_importable(func: Any) -> bool:
+    """Whether a fresh process can import the module defining func."""
+    func = getattr(func, "func", func)  # functools.partial
+    module = getattr(func, "__module__", None)
+    if not module or module == "__main__":
+        return False
+    top_level = module.partition(".")[0]
+    if top_level in sys.builtin_module_names:
+        return True
+    # Searches sys.path only: modules registered in sys.modules by hand
+    # (plugin files) are not found
+    return importlib.machinery.PathFinder.find_spec(top_level) is not None
+
+
+class CompiledRules:
+    """
+    Enabled rules bound to settings, run in one pass per cue.
+
+    Instances are callables with the per-cue checker signature of
+    IncrementalQAEngine and QAPlugin.get_cue_checker().
+    """
+
+    def __init__(self, rules: Iterable[QARule], settings: Dict[str, Any]):
+        """
+        Initialization.
+
+        Args:
+            rules: Candidate rules
+            settings: Enable flags and thresholds (rule defaults fill gaps)
+        """
+        rules = list(rules)
+        merged: Dict[str, Any] = {}
+        for rule in rules:
+            merged.update(rule.defaults)
+        merged.update(settings)
+        self.settings = merged
+        self.rules: Tuple[QARule, ...] = tuple(
+            rule for rule in rules
+            if not rule.setting or merged.get(rule.setting, True)
+        )
+        inputs = set()
+        for rule in self.rules:
+            inputs |= rule.inputs
+        if INPUT_CPS in inputs:
+            inputs |= {INPUT_TEXT, INPUT_DURATION}
+        self.inputs = frozenset(inputs)
+
+    def __call__(self, cue, overlap: Optional[Tuple[Any, int]]) -> List[QAFinding]:
+        facts = CueFacts(cue, overlap, self.inputs)
+        settings = self.settings
+        findings = []
+        for rule in self.rules:
+            params = rule.check(facts, settings)
+            if params is not None:
+                findings.append(QAFinding(
+                    cue.id, rule.severity, rule.message_key, params,
+                    rule.suggestion_key, params
+                ))
+        return findings
+
+    def is_picklable(self) -> bool:
+        """
+        Whether the rules can be sent to worker processes.
+
+        Pickling only records where a function lives; a worker started
+        with "spawn" (Windows) must import that module by name, so rules
+        of plugin files (loaded under synthetic module names) are not
+        sent.
+        """
+        if not all(_is_importable(rule.check) for rule in self.rules):
+            return False
+        try:
+            pickle.dumps(self)
+        except Exception:
+            return False
+        return True
+
+
+def compile_rules(
+    settings: Dict[str, Any],
+    rules: Optional[Iterable[QARule]] = None,
+) -> CompiledRules:
+    """
+    Compile the enabled rules.
+
+    Args:
+        settings: Enable flags and thresholds
+        rules: Rules to compile (None: all registered rules)
+    """
+    return CompiledRules(get_rules() if rules is None else rules, settings)
+
+
+# =============================================================================
+# Built-in rules (registration order is the display order per cue)
+# =============================================================================
+
+@qa_rule(
+    "cps_too_high", "error",
+    _ISSUES + "cps_too_high", _ISSUES + "cps_too_high_suggestion",
+    inputs=[INPUT_CPS], setting="check_cps", defaults={"max_cps": DEFAULT_MAX_CPS},
+)
+def _cps_too_high(facts: CueFacts, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if facts.stripped and facts.cps is not None and facts.cps > settings["max_cps"]:
+        return {"cps": f"{facts.cps:.1f}", "max_cps": f"{settings['max_cps']:.1f}"}
+    return None
+
+
+@qa_rule(
+    "cps_too_low", "info",
+    _ISSUES + "cps_too_low", _ISSUES + "cps_too_low_suggestion",
+    inputs=[INPUT_CPS], setting="check_cps", defaults={"min_cps": DEFAULT_MIN_CPS},
+)
+def _cps_too_low(facts: CueFacts, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if (facts.stripped and facts.cps is not None and facts.char_count > 5
+            and facts.cps < settings["min_cps"]
+            and facts.cps <= settings.get("max_cps", DEFAULT_MAX_CPS)):
+        return {"cps": f"{facts.cps:.1f}"}
+    return None
+
+
+@qa_rule(
+    "overlap", "error",
+    _ISSUES + "overlap", _ISSUES + "overlap_suggestion",
+    inputs=[INPUT_OVERLAP], setting="check_overlap",
+)
+def _overlap(facts: CueFacts, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if facts.overlap is not None:
+        prev_cue, overlap_ms = facts.overlap
+        return {"overlap_ms": overlap_ms, "prev_id": prev_cue.id}
+    return None
+
+
+@qa_rule(
+    "duration_too_short", "warning",
+    _ISSUES + "duration_too_short", _ISSUES + "duration_too_short_suggestion",
+    inputs=[INPUT_DURATION], setting="check_duration",
+    defaults={"min_duration_ms": DEFAULT_MIN_DURATION_MS},
+)
+def _duration_too_short(facts: CueFacts, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if facts.duration_ms < settings["min_duration_ms"]:
+        return {"duration_ms": facts.duration_ms, "min_ms": settings["min_duration_ms"]}
+    return None
+
+
+@qa_rule(
+    "duration_too_long", "warning",
+    _ISSUES + "duration_too_long", _ISSUES + "duration_too_long_suggestion",
+    inputs=[INPUT_DURATION], setting="check_duration",
+    defaults={"max_duration_ms": DEFAULT_MAX_DURATION_MS},
+)
+def _duration_too_long(facts: CueFacts, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if (facts.duration_ms > settings["max_duration_ms"]
+            and facts.duration_ms >= settings.get("min_duration_ms", 0)):
+        return {"duration_ms": facts.duration_ms}
+    return None
+
+
+@qa_rule(
+    "missing_translation", "warning",
+    _ISSUES + "missing_translation", _ISSUES + "missing_translation_suggestion",
+    inputs=[INPUT_TEXT], setting="check_missing_translation",
+)
+def _missing_translation(facts: CueFacts, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return None if facts.stripped else {}
+
+
+@qa_rule(
+    "lipsync_too_long", "error",
+    _ISSUES + "lipsync_too_long", _ISSUES + "lipsync_suggestion",
+    setting="check_lipsync",
+)
+def _lipsync_too_long(facts: CueFacts, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    ratio = facts.cue.lip_sync_ratio
+    if ratio and ratio > LIPSYNC_THRESHOLD_WARNING:
+        return {"ratio": f"{ratio:.0%}"}
+    return None
+
+
+@qa_rule(
+    "double_space", "info",
+    _ISSUES + "double_space", _ISSUES + "double_space_suggestion",
+    inputs=[INPUT_TEXT], setting="check_double_space",
+)
+def _double_space(facts: CueFacts, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return {} if "  " in facts.text else None
+
+
+@qa_rule(
+    "missing_character", "info",
+    _ISSUES + "missing_character", _ISSUES + "missing_character_suggestion",
+    inputs=[INPUT_TEXT], setting="check_missing_character",
+)
+def _missing_character(facts: CueFacts, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return {} if facts.text and not facts.cue.character_name else None
+
+
+@qa_rule(
+    "extra_whitespace", "info",
+    _ISSUES + "extra_whitespace", _ISSUES + "extra_whitespace_suggestion",
+    inputs=[INPUT_TEXT], setting="check_whitespace",
+)
+def _extra_whitespace(facts: CueFacts, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return {} if facts.text and facts.text != facts.stripped else None
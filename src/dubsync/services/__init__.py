@@ -5,14 +5,35 @@ Service and business logic.
 """
 
 from dubsync.services.srt_parser import SRTParser, parse_srt_file
+from dubsync.services.subtitle_import import (
+    SubtitleImporter, create_importer, get_importers, register_importer
+)
 from dubsync.services.lip_sync import LipSyncEstimator
 from dubsync.services.pdf_export import PDFExporter
 from dubsync.services.project_manager import ProjectManager
+from dubsync.services.cue_repository import CueRepository
+from dubsync.services.cue_time_index import CueTimeIndex
+from dubsync.services.qa_runner import QARunner
+from dubsync.services.glossary_store import GlossaryStore
+from dubsync.services.search_index import SearchIndex
+from dubsync.services.spellcheck_batch import VerdictCache
+from dubsync.services.term_matcher import TermMatcher
 
 __all__ = [
     "SRTParser",
     "parse_srt_file",
+    "SubtitleImporter",
+    "create_importer",
+    "get_importers",
+    "register_importer",
     "LipSyncEstimator",
     "PDFExporter",
     "ProjectManager",
+    "CueRepository",
+    "CueTimeIndex",
+    "QARunner",
+    "GlossaryStore",
+    "SearchIndex",
+    "VerdictCache",
+    "TermMatcher",
 ]
@@ -0,0 +1,185 @@
+"""
+DubSync Cue Repository
+
+In-memory cue cache with an identity map for the open project.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from dubsync.models.cue import Cue
+from dubsync.services.cue_time_index import CueTimeIndex
+
+if TYPE_CHECKING:
+    from dubsync.models.database import Database
+
+
+class CueRepository:
+    """
+    Cached cue repository.
+
+    Loads the project's cues once and keeps them indexed by id and
+    cue_index. Every caller gets the same Cue object for a given id, so
+    the UI and plugins see a consistent view. Writes go through the
+    models as before; the repository is then patched (or invalidated for
+    bulk structural changes) instead of re-reading the table.
+    """
+
+    def __init__(self, db: "Database", project_id: int = 1):
+        """
+        Initialization.
+
+        Args:
+            db: Database connection
+            project_id: Project identifier
+        """
+        self._db = db
+        self._project_id = project_id
+        self._cues: Optional[List[Cue]] = None     # Sorted by (cue_index, id)
+        self._keys: List[tuple] = []                # Parallel sort keys
+        self._by_id: Dict[int, Cue] = {}
+        self._by_index: Dict[int, Cue] = {}
+        self._index_of: Dict[int, int] = {}         # id -> cue_index at last sync
+        self._time_index: Optional[CueTimeIndex] = None
+        self._times: Dict[int, tuple] = {}          # id -> (in, out) at last index build
+
+    @property
+    def is_loaded(self) -> bool:
+        """Are the cues cached."""
+        return self._cues is not None
+
+    def _ensure_loaded(self) -> List[Cue]:
+        """Load cues from the database on first use."""
+        if self._cues is None:
+            cues = Cue.load_all(self._db, self._project_id)
+            cues.sort(key=self._sort_key)
+            self._cues = cues
+            self._by_id = {cue.id: cue for cue in cues}
+            self._rebuild_indexes()
+        return self._cues
+
+    @staticmethod
+    def _sort_key(cue: Cue) -> tuple:
+        return (cue.cue_index, cue.id)
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the lookup tables from the sorted list."""
+        cues = self._cues or []
+        self._keys = [self._sort_key(cue) for cue in cues]
+        self._by_index = {}
+        for cue in cues:
+            self._by_index.setdefault(cue.cue_index, cue)
+        self._index_of = {cue.id: cue.cue_index for cue in cues}
+
+    def invalidate(self) -> None:
+        """Drop the cache; the next access reloads from the database."""
+        self._cues = None
+        self._keys = []
+        self._by_id = {}
+        self._by_index = {}
+        self._index_of = {}
+        self._time_index = None
+        self._times = {}
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def all(self) -> List[Cue]:
+        """
+        All cues ordered by cue_index.
+
+        Returns a new list; the Cue objects themselves are shared.
+        """
+        return list(self._ensure_loaded())
+
+    def count(self) -> int:
+        """Number of cues."""
+        return len(self._ensure_loaded())
+
+    def get(self, cue_id: int) -> Optional[Cue]:
+        """Cue by database id."""
+        self._ensure_loaded()
+        return self._by_id.get(cue_id)
+
+    def get_by_index(self, cue_index: int) -> Optional[Cue]:
+        """Cue by its 1-based cue_index."""
+        self._ensure_loaded()
+        return self._by_index.get(cue_index)
+
+    def next_after(self, cue_index: int) -> Optional[Cue]:
+        """First cue with a cue_index greater than the given one."""
+        cues = self._ensure_loaded()
+        pos = bisect_right(self._keys, (cue_index, float("inf")))
+        return cues[pos] if pos < len(cues) else None
+
+    def previous_before(self, cue_index: int) -> Optional[Cue]:
+        """Last cue with a cue_index smaller than the given one."""
+        cues = self._ensure_loaded()
+        pos = bisect_left(self._keys, (cue_index, float("-inf")))
+        return cues[pos - 1] if pos > 0 else None
+
+    def time_index(self) -> CueTimeIndex:
+        """
+        Interval index over the cached cues.
+
+        Rebuilt lazily after cue times change.
+        """
+        cues = self._ensure_loaded()
+        if self._time_index is None:
+            self._time_index = CueTimeIndex(cues)
+            self._times = {cue.id: (cue.time_in_ms, cue.time_out_ms) for cue in cues}
+        return self._time_index
+
+    def find_at_time(self, time_ms: int) -> Optional[Cue]:
+        """Earliest-starting cue containing the given time."""
+        return self.time_index().find_at(time_ms)
+
+    # =========================================================================
+    # Write notifications
+    # =========================================================================
+
+    def update(self, cue: Cue) -> None:
+        """Register a saved (inserted or updated) cue."""
+        self.update_many([cue])
+
+    def update_many(self, cues: Iterable[Cue]) -> None:
+        """
+        Register saved cues.
+
+        Cues whose position is unchanged are patched in place; new cues
+        or changed cue indices trigger a re-sort of the cached list.
+        """
+        if self._cues is None:
+            return
+
+        resort = False
+        for cue in cues:
+            if cue.id == 0:
+                continue
+            if self._times.get(cue.id) != (cue.time_in_ms, cue.time_out_ms):
+                self._time_index = None
+            cached = self._by_id.get(cue.id)
+            if cached is None or self._index_of.get(cue.id) != cue.cue_index:
+                resort = True
+                self._by_id[cue.id] = cue
+            elif cached is not cue:
+                self._time_index = None
+                pos = bisect_left(self._keys, self._sort_key(cue))
+                self._cues[pos] = cue
+                self._by_id[cue.id] = cue
+                self._by_index[cue.cue_index] = cue
+
+        if resort:
+            self._time_index = None
+            self._cues = sorted(self._by_id.values(), key=self._sort_key)
+            self._rebuild_indexes()
+
+    def remove(self, cue_id: int) -> None:
+        """Forget a deleted cue."""
+        if self._cues is None or cue_id not in self._by_id:
+            return
+        del self._by_id[cue_id]
+        self._time_index = None
+        self._cues = [cue for cue in self._cues if cue.id != cue_id]
+        self._rebuild_indexes()
@@ -0,0 +1,181 @@
+"""
+DubSync Cue Time Index
+
+In-memory interval index for time-to-cue lookups.
+
+Cues are kept in sorted start/end arrays together with a running
+maximum of end times, so every lookup is a binary search and overlapping
+cues are handled correctly.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dubsync.models.cue import Cue
+
+
+class CueTimeIndex:
+    """
+    Interval index over cue time ranges.
+
+    Intervals are closed: a cue contains every time between time_in_ms
+    and time_out_ms, both ends included.
+    """
+
+    def __init__(self, cues: Iterable[Cue] = ()):
+        """
+        Initialization.
+
+        Args:
+            cues: Cues to index
+        """
+        self._cues: List[Cue] = []
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._max_ends: List[int] = []  # max(ends[0..i])
+        self._times: Dict[int, Tuple[int, int]] = {}  # id -> indexed (in, out)
+        self.rebuild(cues)
+
+    def rebuild(self, cues: Iterable[Cue]) -> None:
+        """
+        Rebuild the index from scratch.
+
+        Args:
+            cues: Cues to index
+        """
+        self._cues = sorted(cues, key=lambda c: (c.time_in_ms, c.time_out_ms, c.id))
+        self._starts = [cue.time_in_ms for cue in self._cues]
+        self._ends = [cue.time_out_ms for cue in self._cues]
+        self._times = {cue.id: (cue.time_in_ms, cue.time_out_ms) for cue in self._cues}
+        self._max_ends = []
+        running = None
+        for end in self._ends:
+            running = end if running is None or end > running else running
+            self._max_ends.append(running)
+
+    def update(self, cue: Cue) -> None:
+        """
+        Re-position one cue after its times changed.
+
+        Cheaper than rebuild() for a single cue (e.g. while it is dragged
+        on the timeline): the entry is moved with two binary searches and
+        only the running maximum between its old and new position (and
+        after it, until unchanged) is recomputed. The cue may be a new
+        object with the id of an indexed one; an unknown cue is added.
+
+        Args:
+            cue: Cue with its new times
+        """
+        old = self._times.get(cue.id)
+        removed = self._position(old[0], old[1], cue.id) if old is not None else None
+        if removed is not None:
+            del self._cues[removed], self._starts[removed], self._ends[removed], self._max_ends[removed]
+
+        pos = self._insert_position(cue.time_in_ms, cue.time_out_ms, cue.id)
+        self._cues.insert(pos, cue)
+        self._starts.insert(pos, cue.time_in_ms)
+        self._ends.insert(pos, cue.time_out_ms)
+        self._max_ends.insert(pos, cue.time_out_ms)
+        self._times[cue.id] = (cue.time_in_ms, cue.time_out_ms)
+
+        # Prefixes past both positions hold the same cues as before, so
+        # their running max only changes until it first matches again
+        start = pos if removed is None else min(pos, removed)
+        last_moved = pos if removed is None else max(pos, removed)
+        running = self._max_ends[start - 1] if start > 0 else None
+        for i in range(start, len(self._cues)):
+            end = self._ends[i]
+            running = end if running is None or end > running else running
+            if i > last_moved and self._max_ends[i] == running:
+                break
+            self._max_ends[i] = running
+
+    def _position(self, time_in: int, time_out: int, cue_id: int) -> Optional[int]:
+        """Position of an indexed entry, or None."""
+        i = bisect_left(self._starts, time_in)
+        while i < len(self._cues) and self._starts[i] == time_in:
+            if self._cues[i].id == cue_id and self._ends[i] == time_out:
+                return i
+            i += 1
+        return None
+
+    def _insert_position(self, time_in: int, time_out: int, cue_id: int) -> int:
+        """Position keeping the (start, end, id) order."""
+        i = bisect_left(self._starts, time_in)
+        while (i < len(self._cues) and self._starts[i] == time_in
+               and (self._ends[i], self._cues[i].id) < (time_out, cue_id)):
+            i += 1
+        return i
+
+    def __len__(self) -> int:
+        return len(self._cues)
+
+    def times_of(self, cue_id: int) -> Optional[Tuple[int, int]]:
+        """Indexed (time_in_ms, time_out_ms) of a cue, or None."""
+        return self._times.get(cue_id)
+
+    @property
+    def cues(self) -> List[Cue]:
+        """Indexed cues ordered by start time."""
+        return list(self._cues)
+
+    def _candidate_range(self, start_ms: int, end_ms: int) -> Tuple[int, int]:
+        """
+        Slice of the sorted arrays that may intersect [start_ms, end_ms].
+
+        Every cue before the first position whose running max end reaches
+        start_ms ends too early; every cue from the first start beyond
+        end_ms starts too late.
+        """
+        lo = bisect_left(self._max_ends, start_ms)
+        hi = bisect_right(self._starts, end_ms)
+        return lo, hi
+
+    def find_at(self, time_ms: int) -> Optional[Cue]:
+        """
+        Earliest-starting cue that contains the given time.
+
+        Args:
+            time_ms: Time in milliseconds
+
+        Returns:
+            Cue or None
+        """
+        lo, hi = self._candidate_range(time_ms, time_ms)
+        # The running max first reaches time_ms at lo, so cue lo itself
+        # ends at or after time_ms.
+        return self._cues[lo] if lo < hi else None
+
+    def find_all_at(self, time_ms: int) -> List[Cue]:
+        """
+        All cues that contain the given time, ordered by start.
+        """
+        return self.find_in_range(time_ms, time_ms)
+
+    def find_in_range(self, start_ms: int, end_ms: int) -> List[Cue]:
+        """
+        All cues that intersect [start_ms, end_ms], ordered by start.
+        """
+        lo, hi = self._candidate_range(start_ms, end_ms)
+        ends = self._ends
+        return [self._cues[i] for i in range(lo, hi) if ends[i] >= start_ms]
+
+    def overlaps(self) -> List[Tuple[Cue, Cue, int]]:
+        """
+        Cues that start before an earlier cue has ended.
+
+        For each such cue, the earlier cue reaching furthest into it is
+        reported, so a long cue overlapping several later ones is caught
+        even when they are not adjacent.
+
+        Returns:
+            List of (cue, earlier_cue, overlap_ms) in start order
+        """
+        result = []
+        furthest: Optional[Cue] = None
+        for cue in self._cues:
+            if furthest is not None and cue.time_in_ms < furthest.time_out_ms:
+                result.append((cue, furthest, furthest.time_out_ms - cue.time_in_ms))
+            if furthest is None or cue.time_out_ms > furthest.time_out_ms:
+                furthest = cue
+        return result
@@ -0,0 +1,250 @@
+"""
+DubSync Dictionary Snapshot
+
+Precompiled Hunspell dictionaries for fast spellchecker startup.
+
+Parsing a Hunspell dictionary with spylls is slow for languages with
+large affix tables (hu_HU: seconds), mostly spent compiling one regular
+expression per affix rule and building the word index. A snapshot is
+the parsed spylls Dictionary pickled once, with the affix conditions
+replaced by patterns that are compiled on first use; loading it skips
+the parsing and only compiles the few conditions a lookup touches.
+
+Snapshots are cache files named after a hash of the .aff/.dic files,
+so editing or replacing the dictionary builds a new one. Build them
+ahead of time with:
+
+    python -m dubsync.services.dictionary_snapshot <dictionary> [cache dir]
+
+Loading a snapshot unpickles it, which can run arbitrary code: snapshots
+are only read from directories the caller trusts (the application's
+cache directory and explicitly given prebuilt directories), never from
+wherever the dictionary files happen to be.
+"""
+
+import gc
+import hashlib
+import pickle
+import re
+import sys
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from dubsync.services.logger import get_logger
+
+
+SNAPSHOT_SUFFIX = ".dicsnap"
+
+_SNAPSHOT_VERSION = 1
+
+
+def dictionary_fingerprint(base_path: Path) -> str:
+    """
+    Content hash of a Hunspell dictionary (.aff and .dic files).
+
+    Args:
+        base_path: Dictionary path without suffix (e.g. .../hu_HU)
+    """
+    digest = hashlib.sha256()
+    for suffix in (".aff", ".dic"):
+        digest.update(Path(base_path).with_suffix(suffix).read_bytes())
+    return digest.hexdigest()
+
+
+def _spylls_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("spylls")
+    except Exception:
+        return ""
+
+
+class LazyPattern:
+    """
+    Regular expression compiled on first use.
+
+    Stands in for the re.Pattern attributes of spylls affixes; only the
+    pattern text is pickled.
+    """
+    __slots__ = ("pattern", "_compiled")
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._compiled: Optional[re.Pattern] = None
+
+    def _get(self) -> re.Pattern:
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern)
+        return self._compiled
+
+    def search(self, string: str, *args):
+        return self._get().search(string, *args)
+
+    def sub(self, repl, string: str, count: int = 0):
+        return self._get().sub(repl, string, count)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+    def __getstate__(self):
+        return self.pattern
+
+    def __setstate__(self, state):
+        self.pattern = state
+        self._compiled = None
+
+
+def _make_lazy(dictionary: Any) -> None:
+    """Replace the compiled affix patterns with LazyPatterns."""
+    aff = dictionary.aff
+    for table in (aff.PFX, aff.SFX):
+        for affixes in table.values():
+            for affix in affixes:
+                affix.cond_regexp = LazyPattern(affix.cond_regexp.pattern)
+                affix.replace_regexp = LazyPattern(affix.replace_regexp.pattern)
+
+
+def snapshot_path(base_path: Path, cache_dir: Path, fingerprint: Optional[str] = None) -> Path:
+    """
+    Snapshot file of a dictionary.
+
+    Args:
+        base_path: Dictionary path without suffix
+        cache_dir: Directory of the snapshots
+        fingerprint: dictionary_fingerprint() result, if already known
+    """
+    fingerprint = fingerprint or dictionary_fingerprint(base_path)
+    return Path(cache_dir) / f"{Path(base_path).name}-{fingerprint[:16]}{SNAPSHOT_SUFFIX}"
+
+
+def build_snapshot(base_path: Path, cache_dir: Path, dictionary: Any = None) -> Path:
+    """
+    Write the snapshot of a dictionary.
+
+    Args:
+        base_path: Dictionary path without suffix
+        cache_dir: Directory of the snapshots
+        dictionary: Already parsed spylls Dictionary of base_path (parsed
+            here if None; its affix patterns become lazy)
+
+    Returns:
+        Path of the snapshot file
+    """
+    fingerprint = dictionary_fingerprint(base_path)
+    if dictionary is None:
+        from spylls.hunspell import Dictionary  # type: ignore
+        dictionary = Dictionary.from_files(str(base_path))
+    _make_lazy(dictionary)
+
+    path = snapshot_path(base_path, cache_dir, fingerprint)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump({
+            "version": _SNAPSHOT_VERSION,
+            "spylls": _spylls_version(),
+            "fingerprint": fingerprint,
+        }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(dictionary, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(path)
+
+    # Snapshots of earlier versions of this dictionary are stale
+    for old in path.parent.glob(f"{Path(base_path).name}-*{SNAPSHOT_SUFFIX}"):
+        if old != path:
+            old.unlink(missing_ok=True)
+    return path
+
+
+def load_snapshot(base_path: Path, cache_dir: Path, fingerprint: Optional[str] = None) -> Any:
+    """
+    Load the snapshot of a dictionary.
+
+    Args:
+        base_path: Dictionary path without suffix
+        cache_dir: Directory of the snapshots
+        fingerprint: dictionary_fingerprint() result, if already known
+
+    Returns:
+        spylls Dictionary, or None if there is no valid snapshot
+    """
+    fingerprint = fingerprint or dictionary_fingerprint(base_path)
+    path = snapshot_path(base_path, cache_dir, fingerprint)
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if (header.get("version") != _SNAPSHOT_VERSION
+                    or header.get("spylls") != _spylls_version()
+                    or header.get("fingerprint") != fingerprint):
+                return None
+            # Hundreds of thousands of objects: pausing the cyclic
+            # collector during the load halves its time
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                return pickle.load(f)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+    except Exception as e:
+        get_logger("spellcheck").warning(f"Dictionary snapshot unreadable ({path.name}): {e}")
+        return None
+
+
+def load_dictionary(
+    base_path: Path,
+    cache_dir: Optional[Path],
+    fingerprint: Optional[str] = None,
+    prebuilt_dirs: Sequence[Path] = (),
+) -> Any:
+    """
+    Load a dictionary from its snapshot, building the snapshot if needed.
+
+    A snapshot in one of prebuilt_dirs (e.g. shipped with the
+    application) is used first; otherwise the snapshot in cache_dir is
+    loaded or built.
+
+    Args:
+        base_path: Dictionary path without suffix
+        cache_dir: Directory of the snapshots (None: parse without snapshot)
+        fingerprint: dictionary_fingerprint() result, if already known
+        prebuilt_dirs: Trusted directories of prebuilt snapshots
+
+    Returns:
+        spylls Dictionary
+    """
+    from spylls.hunspell import Dictionary  # type: ignore
+
+    if cache_dir is None:
+        return Dictionary.from_files(str(base_path))
+
+    fingerprint = fingerprint or dictionary_fingerprint(base_path)
+    for directory in dict.fromkeys([*map(Path, prebuilt_dirs), Path(cache_dir)]):
+        dictionary = load_snapshot(base_path, directory, fingerprint)
+        if dictionary is not None:
+            return dictionary
+
+    dictionary = Dictionary.from_files(str(base_path))
+    try:
+        build_snapshot(base_path, cache_dir, dictionary)
+    except Exception as e:
+        get_logger("spellcheck").warning(f"Dictionary snapshot not saved: {e}")
+    return dictionary
+
+
+def main(argv=None) -> int:
+    """Build a snapshot from the command line."""
+    args = sys.argv[1:] if argv is None else argv
+    if not args:
+        print("Usage: python -m dubsync.services.dictionary_snapshot <dictionary> [cache dir]")
+        return 2
+    base_path = Path(args[0])
+    base_path = base_path.with_suffix("") if base_path.suffix in (".aff", ".dic") else base_path
+    cache_dir = Path(args[1]) if len(args) > 1 else base_path.parent
+    print(build_snapshot(base_path, cache_dir))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,417 @@
+"""
+DubSync Glossary Store
+
+SQLite storage for translation glossaries, shared by all projects.
+
+One database file holds any number of named glossaries (optionally tied
+to a show). Entries are written one row at a time, so an edit costs a
+single statement instead of rewriting the whole glossary file, and an
+FTS5 index (kept in sync by triggers) searches across glossaries
+without loading them. The .glossync JSON format remains the exchange
+format for import and export.
+"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from dubsync.models.database import Database
+from dubsync.services.search_index import tokenize
+
+
+GLOSSARY_DB_VERSION = 1
+
+# Default file name of the store inside the data directory
+GLOSSARY_DB_NAME = "glossary.db"
+
+# bm25() column weights: source, target, notes
+_FTS_WEIGHTS = (10.0, 5.0, 1.0)
+
+
+class GlossaryInfo(NamedTuple):
+    """A named glossary."""
+    id: int
+    name: str
+    show: str           # Series title the glossary belongs to ("" = any)
+    source_lang: str
+    target_lang: str
+
+
+class GlossaryRow(NamedTuple):
+    """A stored glossary entry."""
+    id: int
+    glossary_id: int
+    source: str
+    target: str
+    notes: str
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS glossaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    show TEXT NOT NULL DEFAULT '',
+    source_lang TEXT NOT NULL DEFAULT 'en',
+    target_lang TEXT NOT NULL DEFAULT 'hu',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    glossary_id INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    notes TEXT NOT NULL DEFAULT '',
+    FOREIGN KEY (glossary_id) REFERENCES glossaries(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_entries_glossary ON entries(glossary_id);
+CREATE INDEX IF NOT EXISTS idx_glossaries_show ON glossaries(show);
+"""
+
+# External-content FTS5 table over entries, synced by triggers
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    source, target, notes,
+    content='entries', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 0'
+);
+
+CREATE TRIGGER IF NOT EXISTS entries_fts_insert AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, source, target, notes)
+    VALUES (new.id, new.source, new.target, new.notes);
+END;
+
+CREATE TRIGGER IF NOT EXISTS entries_fts_delete AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, source, target, notes)
+    VALUES ('delete', old.id, old.source, old.target, old.notes);
+END;
+
+CREATE TRIGGER IF NOT EXISTS entries_fts_update AFTER UPDATE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, source, target, notes)
+    VALUES ('delete', old.id, old.source, old.target, old.notes);
+    INSERT INTO entries_fts(rowid, source, target, notes)
+    VALUES (new.id, new.source, new.target, new.notes);
+END;
+"""
+
+
+def _fts5_available(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp._fts5_probe")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+class GlossaryStore:
+    """
+    Glossary database.
+
+    Without FTS5 support in the SQLite build, search() falls back to
+    LIKE matching.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            db_path: Database file. If None, in-memory.
+        """
+        self.db = Database(db_path)
+        conn = self.db.connection
+        conn.executescript(_SCHEMA)
+        self.has_fts = _fts5_available(conn)
+        if self.has_fts:
+            conn.executescript(_FTS_SCHEMA)
+        self.set_meta("db_version", str(GLOSSARY_DB_VERSION))
+
+    def close(self) -> None:
+        """Close the database."""
+        self.db.close()
+
+    @contextmanager
+    def transaction(self):
+        """Group several writes into one commit (see Database.transaction)."""
+        with self.db.transaction():
+            yield self
+
+    # =========================================================================
+    # Metadata
+    # =========================================================================
+
+    def get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Stored setting value."""
+        row = self.db.fetchone("SELECT value FROM metadata WHERE key = ?", (key,))
+        return row["value"] if row else default
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Store a setting value."""
+        self.db.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)", (key, value)
+        )
+        self.db.commit()
+
+    # =========================================================================
+    # Glossaries
+    # =========================================================================
+
+    @staticmethod
+    def _info(row: sqlite3.Row) -> GlossaryInfo:
+        return GlossaryInfo(row["id"], row["name"], row["show"],
+                            row["source_lang"], row["target_lang"])
+
+    def list_glossaries(self, show: Optional[str] = None) -> List[GlossaryInfo]:
+        """
+        Glossaries by name.
+
+        Args:
+            show: Only the glossaries of this show (None: all)
+        """
+        if show is None:
+            rows = self.db.fetchall("SELECT * FROM glossaries ORDER BY name COLLATE NOCASE")
+        else:
+            rows = self.db.fetchall(
+                "SELECT * FROM glossaries WHERE show = ? ORDER BY name COLLATE NOCASE", (show,)
+            )
+        return [self._info(row) for row in rows]
+
+    def get_glossary(self, glossary_id: int) -> Optional[GlossaryInfo]:
+        """Glossary by id."""
+        row = self.db.fetchone("SELECT * FROM glossaries WHERE id = ?", (glossary_id,))
+        return self._info(row) if row else None
+
+    def find_glossary(self, name: str) -> Optional[GlossaryInfo]:
+        """Glossary by name."""
+        row = self.db.fetchone("SELECT * FROM glossaries WHERE name = ?", (name,))
+        return self._info(row) if row else None
+
+    def create_glossary(
+        self,
+        name: str,
+        show: str = "",
+        source_lang: str = "en",
+        target_lang: str = "hu",
+    ) -> GlossaryInfo:
+        """
+        Create an empty glossary.
+
+        Raises:
+            ValueError: If the name is empty or already used
+        """
+        name = name.strip()
+        if not name:
+            raise ValueError("Glossary name must not be empty")
+        if self.find_glossary(name) is not None:
+            raise ValueError(f"Glossary already exists: {name}")
+        cursor = self.db.execute(
+            "INSERT INTO glossaries (name, show, source_lang, target_lang) VALUES (?, ?, ?, ?)",
+            (name, show, source_lang, target_lang)
+        )
+        self.db.commit()
+        return GlossaryInfo(cursor.lastrowid, name, show, source_lang, target_lang)
+
+    def unique_name(self, name: str) -> str:
+        """The name, or "name (2)", "name (3)", ... if it is taken."""
+        candidate = name.strip() or "Glossary"
+        base, number = candidate, 2
+        while self.find_glossary(candidate) is not None:
+            candidate = f"{base} ({number})"
+            number += 1
+        return candidate
+
+    def update_glossary(self, glossary_id: int, **fields: str) -> None:
+        """
+        Change name, show or languages of a glossary.
+
+        Raises:
+            ValueError: On an unknown field
+        """
+        allowed = {"name", "show", "source_lang", "target_lang"}
+        if unknown := set(fields) - allowed:
+            raise ValueError(f"Unknown glossary fields: {', '.join(sorted(unknown))}")
+        if not fields:
+            return
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        self.db.execute(
+            f"UPDATE glossaries SET {assignments} WHERE id = ?",
+            (*fields.values(), glossary_id)
+        )
+        self.db.commit()
+
+    def delete_glossary(self, glossary_id: int) -> None:
+        """Delete a glossary with all its entries."""
+        with self.db.transaction():
+            # Row-level delete keeps the FTS triggers in the loop
+            self.db.execute("DELETE FROM entries WHERE glossary_id = ?", (glossary_id,))
+            self.db.execute("DELETE FROM glossaries WHERE id = ?", (glossary_id,))
+
+    # =========================================================================
+    # Entries
+    # =========================================================================
+
+    def entries(self, glossary_id: int) -> List[GlossaryRow]:
+        """All entries of a glossary in insertion order."""
+        cursor = self.db.connection.cursor()
+        cursor.row_factory = None  # Plain tuples: no per-row sqlite3.Row objects
+        cursor.execute(
+            "SELECT id, glossary_id, source, target, notes FROM entries "
+            "WHERE glossary_id = ? ORDER BY id",
+            (glossary_id,)
+        )
+        return list(map(GlossaryRow._make, cursor.fetchall()))
+
+    def count_entries(self, glossary_id: int) -> int:
+        """Number of entries in a glossary."""
+        row = self.db.fetchone(
+            "SELECT COUNT(*) AS count FROM entries WHERE glossary_id = ?", (glossary_id,)
+        )
+        return row["count"] if row else 0
+
+    def add_entry(self, glossary_id: int, source: str, target: str, notes: str = "") -> int:
+        """
+        Insert an entry.
+
+        Returns:
+            New entry id
+        """
+        cursor = self.db.execute(
+            "INSERT INTO entries (glossary_id, source, target, notes) VALUES (?, ?, ?, ?)",
+            (glossary_id, source, target, notes or "")
+        )
+        self.db.commit()
+        return cursor.lastrowid
+
+    def add_entries(self, glossary_id: int, entries: Iterable[Tuple[str, str, str]]) -> List[int]:
+        """
+        Insert many (source, target, notes) entries in one transaction.
+
+        Returns:
+            New entry ids in input order
+        """
+        params = [(glossary_id, source, target, notes or "") for source, target, notes in entries]
+        with self.db.transaction():
+            return self.db.insert_many(
+                "INSERT INTO entries (glossary_id, source, target, notes) VALUES (?, ?, ?, ?)",
+                params
+            )
+
+    def update_entry(self, entry_id: int, source: str, target: str, notes: str = "") -> None:
+        """Change an entry."""
+        self.db.execute(
+            "UPDATE entries SET source = ?, target = ?, notes = ? WHERE id = ?",
+            (source, target, notes or "", entry_id)
+        )
+        self.db.commit()
+
+    def delete_entry(self, entry_id: int) -> None:
+        """Delete an entry."""
+        self.db.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
+        self.db.commit()
+
+    def search(
+        self,
+        query: str,
+        glossary_id: Optional[int] = None,
+        limit: int = 100,
+    ) -> List[GlossaryRow]:
+        """
+        Full-text search (every query word as a prefix).
+
+        Args:
+            query: Search text
+            glossary_id: Only this glossary (None: all glossaries)
+            limit: Maximum number of results
+
+        Returns:
+            Entries by relevance (source matches first)
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+        scope = "" if glossary_id is None else "AND e.glossary_id = ? "
+        scope_params: Tuple[Any, ...] = () if glossary_id is None else (glossary_id,)
+
+        if self.has_fts:
+            match = " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+            rows = self.db.connection.execute(
+                "SELECT e.id, e.glossary_id, e.source, e.target, e.notes "
+                "FROM entries_fts JOIN entries e ON e.id = entries_fts.rowid "
+                f"WHERE entries_fts MATCH ? {scope}"
+                f"ORDER BY bm25(entries_fts, {', '.join(map(str, _FTS_WEIGHTS))}) LIMIT ?",
+                (match, *scope_params, limit)
+            ).fetchall()
+        else:
+            conditions = " AND ".join(
+                "(e.source LIKE ? OR e.target LIKE ? OR e.notes LIKE ?)" for _ in words
+            )
+            params: List[Any] = []
+            for word in words:
+                params += [f"%{word}%"] * 3
+            rows = self.db.connection.execute(
+                "SELECT e.id, e.glossary_id, e.source, e.target, e.notes FROM entries e "
+                f"WHERE {conditions} {scope}ORDER BY e.id LIMIT ?",
+                (*params, *scope_params, limit)
+            ).fetchall()
+        return [GlossaryRow(*row) for row in rows]
+
+    # =========================================================================
+    # JSON (.glossync) exchange
+    # =========================================================================
+
+    def import_dict(self, data: Dict[str, Any], name: Optional[str] = None, show: str = "") -> GlossaryInfo:
+        """
+        Import a glossary in .glossync format as a new glossary.
+
+        Args:
+            data: Parsed .glossync content
+            name: Glossary name (default: the name in the data); made
+                unique if already taken
+            show: Show the glossary belongs to
+        """
+        with self.db.transaction():
+            info = self.create_glossary(
+                self.unique_name(name or data.get("name", "")),
+                show=show,
+                source_lang=data.get("source_lang", "en"),
+                target_lang=data.get("target_lang", "hu"),
+            )
+            self.add_entries(info.id, (
+                (entry.get("source", ""), entry.get("target", ""), entry.get("notes", ""))
+                for entry in data.get("entries", [])
+            ))
+        return info
+
+    def export_dict(self, glossary_id: int) -> Dict[str, Any]:
+        """A glossary in .glossync format."""
+        info = self.get_glossary(glossary_id)
+        if info is None:
+            raise ValueError(f"Unknown glossary: {glossary_id}")
+        return {
+            "name": info.name,
+            "source_lang": info.source_lang,
+            "target_lang": info.target_lang,
+            "entries": [
+                {"source": row.source, "target": row.target, "notes": row.notes}
+                for row in self.entries(glossary_id)
+            ],
+        }
+
+    def import_file(self, path: Path, name: Optional[str] = None, show: str = "") -> GlossaryInfo:
+        """Import a .glossync file as a new glossary."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return self.import_dict(json.load(f), name=name, show=show)
+
+    def export_file(self, glossary_id: int, path: Path) -> None:
+        """Export a glossary to a .glossync file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.export_dict(glossary_id), f, ensure_ascii=False, indent=2)
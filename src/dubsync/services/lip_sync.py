@@ -13,10 +13,18 @@ The system uses time-based estimation, not phonetic analysis:
 """
 
 import re
-from typing import Optional, Tuple
+from array import array
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; estimate_many falls back to plain Python
+    np = None
+
 from dubsync.models.cue import Cue
+from dubsync.services.syllables import get_syllable_counter
 from dubsync.utils.constants import (
     CHARS_PER_SECOND_NORMAL,
     CHARS_PER_SECOND_SLOW,
@@ -29,6 +37,9 @@ from dubsync.utils.constants import (
 # English speech rate (generally faster than Hungarian)
 CHARS_PER_SECOND_ENGLISH: float = 15.0
 
+# Distinct texts whose cleaned length is remembered
+CLEANED_LENGTH_CACHE_SIZE = 4096
+
 
 @dataclass
 class LipSyncResult:
@@ -118,38 +129,37 @@ class LipSyncEstimator:
             LipSyncResult with the estimation result
         """
         # Clean and measure text
-        cleaned_text = self._prepare_text(text)
-        text_length = len(cleaned_text)
+        text_length = self.cleaned_length(text)
+        units = self._speech_units(text)
         
         # Calculate estimated speaking time for translation
-        if text_length == 0:
+        if units == 0:
             estimated_ms = 0
         else:
-            estimated_seconds = text_length / self.chars_per_second
+            estimated_seconds = units / self.units_per_second
             estimated_ms = int(estimated_seconds * 1000)
         
         # If we have source text, adjust based on original speaking speed
         # This handles cases where the original was spoken quickly
         effective_duration = duration_ms
         if source_text:
-            cleaned_source = self._prepare_text(source_text)
-            source_length = len(cleaned_source)
-            if source_length > 0:
+            source_units = self._source_speech_units(source_text)
+            if source_units > 0 and duration_ms > 0:
                 # Calculate how fast the original was spoken
-                source_speed = (source_length / duration_ms) * 1000  # chars per second
+                source_speed = (source_units / duration_ms) * 1000  # units per second
                 
                 # If the original was spoken faster than average English speed,
                 # adjust the available time proportionally
-                if source_speed > self.source_chars_per_second:
+                if source_speed > self.source_units_per_second:
                     # The original was fast - give more leeway to translation
-                    speed_ratio = source_speed / self.source_chars_per_second
+                    speed_ratio = source_speed / self.source_units_per_second
                     effective_duration = int(duration_ms * speed_ratio)
         
         # Calculate ratio using effective duration
         if effective_duration > 0:
             ratio = estimated_ms / effective_duration
         else:
-            ratio = float('inf') if text_length > 0 else 0.0
+            ratio = float('inf') if units > 0 else 0.0
         
         # Determine status
         status = self._get_status(ratio)
@@ -193,6 +203,115 @@ class LipSyncEstimator:
         cue.lip_sync_ratio = result.ratio
         return result.ratio
     
+    def estimate_many(self, cues: Sequence[Cue]):
+        """
+        Lip-sync ratios for many cues at once.
+        
+        Gives the same ratios as estimate_cue(), but only the text
+        measuring runs per cue; the timing arithmetic runs on whole
+        arrays (NumPy when installed) and no result objects are built.
+        
+        Args:
+            cues: Cues to estimate
+            
+        Returns:
+            Ratios in cue order (numpy.ndarray of float64, or array('d'))
+        """
+        lengths = []
+        source_lengths = []
+        durations = []
+        for cue in cues:
+            if cue.translated_text:
+                lengths.append(self._speech_units(cue.translated_text))
+                source_lengths.append(self._source_speech_units(cue.source_text))
+            else:
+                lengths.append(self._speech_units(cue.source_text))
+                source_lengths.append(0)
+            durations.append(cue.duration_ms)
+        
+        if np is None:
+            return array("d", map(self._ratio, lengths, source_lengths, durations))
+        
+        length = np.array(lengths, dtype=np.float64)
+        source_length = np.array(source_lengths, dtype=np.float64)
+        duration = np.array(durations, dtype=np.int64)
+        
+        estimated_ms = (length / self.units_per_second * 1000).astype(np.int64)
+        
+        # Fast originals give the translation more time (see estimate())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            source_speed = source_length / duration * 1000
+            speed_ratio = source_speed / self.source_units_per_second
+            stretched = (duration * speed_ratio).astype(np.int64)
+            fast = (source_length > 0) & (duration > 0) & (source_speed > self.source_units_per_second)
+            effective = np.where(fast, stretched, duration)
+            
+            ratios = estimated_ms / effective
+        ratios[effective <= 0] = 0.0
+        ratios[(effective <= 0) & (length > 0)] = np.inf
+        return ratios
+    
+    def update_ratios(self, cues: Sequence[Cue]):
+        """
+        Update lip_sync_ratio of many cues.
+        
+        Args:
+            cues: Cue objects (will be modified)
+            
+        Returns:
+            Ratios in cue order, as returned by estimate_many()
+        """
+        ratios = self.estimate_many(cues)
+        for cue, ratio in zip(cues, ratios.tolist()):
+            cue.lip_sync_ratio = ratio
+        return ratios
+    
+    def _ratio(self, units: float, source_units: float, duration_ms: int) -> float:
+        """
+        Ratio from measured units, the same arithmetic as estimate().
+        """
+        estimated_ms = int(units / self.units_per_second * 1000)
+        effective_duration = duration_ms
+        if source_units > 0 and duration_ms > 0:
+            source_speed = (source_units / duration_ms) * 1000
+            if source_speed > self.source_units_per_second:
+                effective_duration = int(duration_ms * (source_speed / self.source_units_per_second))
+        if effective_duration > 0:
+            return estimated_ms / effective_duration
+        return float('inf') if units > 0 else 0.0
+    
+    @property
+    def units_per_second(self) -> float:
+        """Speech rate of the target language in _speech_units() units."""
+        return self.chars_per_second
+    
+    @property
+    def source_units_per_second(self) -> float:
+        """Speech rate of the source language in _source_speech_units() units."""
+        return self.source_chars_per_second
+    
+    def _speech_units(self, text: str) -> float:
+        """
+        Amount of speech in a text; this engine counts characters.
+        """
+        return self.cleaned_length(text)
+    
+    def _source_speech_units(self, text: str) -> float:
+        """
+        Amount of speech in a source-language text.
+        """
+        return self._speech_units(text)
+    
+    def cleaned_length(self, text: str) -> int:
+        """
+        Length of the text as counted for estimation.
+        
+        Same as len(self._prepare_text(text)). Results are kept in a
+        bounded LRU cache, so unchanged texts (e.g. the source side
+        while the translation is being typed) are cleaned only once.
+        """
+        return _cleaned_length(text, self.BRACKET_PATTERN) if text else 0
+    
     def _prepare_text(self, text: str) -> str:
         """
         Prepare text for estimation.
@@ -249,14 +368,101 @@ class LipSyncEstimator:
         Returns:
             Minimum duration in milliseconds
         """
-        cleaned = self._prepare_text(text)
-        if not cleaned:
+        units = self._speech_units(text)
+        if not units:
             return 0
         
-        seconds = len(cleaned) / self.chars_per_second
+        seconds = units / self.units_per_second
         return int(seconds * 1000)
 
 
+class SyllableLipSyncEstimator(LipSyncEstimator):
+    """
+    Syllable-based lip-sync estimator.
+    
+    Speaking time comes from weighted syllable counts (long vowels,
+    numbers and pauses included) instead of characters, which is closer
+    to real speech for short lines and for Hungarian vowel length.
+    Character counts are still reported for the editor display.
+    """
+    
+    def __init__(
+        self,
+        chars_per_second: float = CHARS_PER_SECOND_NORMAL,
+        source_chars_per_second: float = CHARS_PER_SECOND_ENGLISH,
+        language: str = "hu",
+        source_language: str = "en",
+    ):
+        """
+        Initialization.
+        
+        Args:
+            chars_per_second: Characters per second (only for calculate_max_chars)
+            source_chars_per_second: Characters per second for source language
+            language: Target language code (rules in services.syllables)
+            source_language: Source language code
+        """
+        super().__init__(chars_per_second, source_chars_per_second)
+        self._counter = get_syllable_counter(language)
+        self._source_counter = get_syllable_counter(source_language)
+    
+    @property
+    def units_per_second(self) -> float:
+        return self._counter.rules.syllables_per_second
+    
+    @property
+    def source_units_per_second(self) -> float:
+        return self._source_counter.rules.syllables_per_second
+    
+    def _speech_units(self, text: str) -> float:
+        return self._count(text, self._counter)
+    
+    def _source_speech_units(self, text: str) -> float:
+        return self._count(text, self._source_counter)
+    
+    def _count(self, text: str, counter) -> float:
+        """Syllables of a text without bracketed instructions."""
+        if not text:
+            return 0
+        if "[" in text:
+            text = self.BRACKET_PATTERN.sub('', text)
+        return counter.count(text)
+
+
+# Lip-sync engines selectable per project
+LIPSYNC_ENGINES = {
+    "chars": LipSyncEstimator,
+    "syllables": SyllableLipSyncEstimator,
+}
+
+DEFAULT_LIPSYNC_ENGINE = "chars"
+
+
+def create_estimator(
+    engine: str = DEFAULT_LIPSYNC_ENGINE,
+    chars_per_second: float = CHARS_PER_SECOND_NORMAL,
+) -> LipSyncEstimator:
+    """
+    Create the estimator of a lip-sync engine.
+    
+    Unknown engine names fall back to the default engine.
+    
+    Args:
+        engine: Key of LIPSYNC_ENGINES
+        chars_per_second: Characters per second for the target language
+    """
+    estimator_cls = LIPSYNC_ENGINES.get(engine, LIPSYNC_ENGINES[DEFAULT_LIPSYNC_ENGINE])
+    return estimator_cls(chars_per_second)
+
+
+@lru_cache(maxsize=CLEANED_LENGTH_CACHE_SIZE)
+def _cleaned_length(text: str, bracket_pattern: "re.Pattern") -> int:
+    """Cached body of LipSyncEstimator.cleaned_length()."""
+    if "[" in text:
+        text = bracket_pattern.sub('', text)
+    return len(" ".join(text.split()))
+
+
 def get_lipsync_color(status: LipSyncStatus) -> str:
     """
     Get color associated with lip-sync status.
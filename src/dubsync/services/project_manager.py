@@ -5,15 +5,22 @@ Project management service.
 Project creation, opening, saving, import operations.
 """
 
+from dataclasses import fields
 from pathlib import Path
 from typing import Optional, List, Tuple
+from itertools import chain, islice
 import sqlite3
 
-from dubsync.models.database import Database, init_database
+from dubsync.models.database import (
+    Database, ConnectionProfile, EDITING_PROFILE, init_database, migrate_database
+)
 from dubsync.models.project import Project
 from dubsync.models.cue import Cue, CueBatch
-from dubsync.services.srt_parser import parse_srt_file
-from dubsync.services.lip_sync import LipSyncEstimator
+from dubsync.services.subtitle_import import create_importer, get_importers
+from dubsync.services.cue_repository import CueRepository
+from dubsync.services.lip_sync import (
+    DEFAULT_LIPSYNC_ENGINE, LipSyncEstimator, create_estimator
+)
 from dubsync.services.settings_manager import SettingsManager
 from dubsync.utils.constants import PROJECT_EXTENSION
 
@@ -25,13 +32,21 @@ class ProjectManager:
     Manages project files and database connection.
     """
     
-    def __init__(self):
+    # Cues written per executemany call while importing
+    IMPORT_BATCH_SIZE = 1000
+    
+    def __init__(self, connection_profile: ConnectionProfile = EDITING_PROFILE):
         """
         Initialization.
+        
+        Args:
+            connection_profile: SQLite tuning used for opened project files
         """
+        self.connection_profile = connection_profile
         self.db: Optional[Database] = None
         self.project_path: Optional[Path] = None
         self.project: Optional[Project] = None
+        self._cue_repo: Optional[CueRepository] = None
         self._dirty: bool = False
     
     @property
@@ -64,6 +79,22 @@ class ProjectManager:
             raise ValueError("No open project")
         return self.project
     
+    def _get_cue_repo(self) -> CueRepository:
+        """Get the cue cache of the open project."""
+        if self._cue_repo is None:
+            self._cue_repo = CueRepository(self._get_db(), self._get_project().id)
+        return self._cue_repo
+    
+    def invalidate_cues(self) -> None:
+        """
+        Drop cached cues.
+        
+        Call after writing cues to the database directly, bypassing
+        the ProjectManager.
+        """
+        if self._cue_repo is not None:
+            self._cue_repo.invalidate()
+    
     def new_project(self, project_path: Optional[Path] = None) -> Project:
         """
         Create a new project.
@@ -79,7 +110,7 @@ class ProjectManager:
         
         # Create database
         self.project_path = project_path
-        self.db = Database(project_path)
+        self.db = Database(project_path, self.connection_profile)
         init_database(self.db)
         
         # Load project
@@ -120,7 +151,8 @@ class ProjectManager:
         
         # Open database
         self.project_path = project_path
-        self.db = Database(project_path)
+        self.db = Database(project_path, self.connection_profile)
+        migrate_database(self.db)
         
         # Load project
         self.project = Project.load(self.db, 1)
@@ -158,6 +190,7 @@ class ProjectManager:
         # Save project data first
         proj.save(db)
         db.commit()
+        db.checkpoint()
 
         # If the database is in memory or we're saving to a new location
         if db.db_path is None or (project_path is not None and project_path != self.project_path):
@@ -172,13 +205,16 @@ class ProjectManager:
 
         # Copy all data from current connection to new file
         db.connection.backup(new_conn)
+        # The backup copies the WAL flag; store the copy as a single file
+        new_conn.execute("PRAGMA journal_mode = DELETE")
         new_conn.close()
 
         # Close old connection and reopen from file
         db.close()
-        self.db = Database(target_path)
+        self.db = Database(target_path, self.connection_profile)
         self.project = Project.load(self.db, 1)
         self.project_path = target_path
+        self._cue_repo = None
     
     def close(self):
         """
@@ -190,6 +226,7 @@ class ProjectManager:
         self.db = None
         self.project_path = None
         self.project = None
+        self._cue_repo = None
         self._dirty = False
     
     def import_srt(
@@ -212,57 +249,156 @@ class ProjectManager:
         Raises:
             ValueError: If there is no open project
         """
+        return self.import_subtitles(srt_path, clear_existing, calculate_lipsync, "srt")
+    
+    def import_subtitles(
+        self,
+        file_path: Path,
+        clear_existing: bool = True,
+        calculate_lipsync: bool = True,
+        format_id: Optional[str] = None,
+    ) -> Tuple[int, List[str]]:
+        """
+        Import a subtitle file (SRT, ASS/SSA, WebVTT, EBU-STL) into project.
+        
+        Args:
+            file_path: Subtitle file path
+            clear_existing: Clear existing cues
+            calculate_lipsync: Lip-sync calculation
+            format_id: Importer format (None = detect from the file)
+            
+        Returns:
+            Tuple (number of imported cues, list of errors)
+            
+        Raises:
+            ValueError: If there is no open project or the format is unknown
+        """
         if not self.is_open:
             raise ValueError("No open project")
         
         db = self._get_db()
         proj = self._get_project()
         
-        # Parse SRT
-        cues, errors = parse_srt_file(srt_path, proj.id)
-        
-        if not cues:
-            return 0, errors or ["No subtitles found in the file"]
-        
-        # Clear existing cues if requested
-        if clear_existing:
-            CueBatch.delete_all(db, proj.id)
-        
-        # Calculate lip-sync if requested
-        if calculate_lipsync:
-            estimator = LipSyncEstimator()
-            for cue in cues:
-                estimator.update_cue_ratio(cue)
-        
-        # Save cues
-        CueBatch.save_all(db, cues)
-        
+        # Parse lazily; cues are written in batches as they are read
+        importer = create_importer(format_id)
+        entries = importer.iter_file(file_path)
+        first = next(entries, None)
+        if first is None:
+            return 0, importer.errors or ["No subtitles found in the file"]
+        cues = (entry.to_cue(proj.id) for entry in chain([first], entries))
+        
+        estimator = self.lipsync_estimator() if calculate_lipsync else None
+        count = 0
+        with db.transaction():
+            # Clear existing cues if requested
+            if clear_existing:
+                CueBatch.delete_all(db, proj.id)
+            
+            while batch := list(islice(cues, self.IMPORT_BATCH_SIZE)):
+                # Calculate lip-sync if requested
+                if estimator is not None:
+                    estimator.update_ratios(batch)
+                CueBatch.save_all(db, batch)
+                count += len(batch)
+        
+        self.invalidate_cues()
         self.mark_dirty()
-        return len(cues), errors
+        return count, importer.errors
     
     def get_cues(self) -> List[Cue]:
         """
         Get all cues from the project.
         
+        Cues come from an in-memory cache; repeated calls return the
+        same Cue objects without querying the database.
+        
         Returns:
             List of cues
         """
-        return Cue.load_all(self._get_db(), self._get_project().id) if self.is_open else []
+        return self._get_cue_repo().all() if self.is_open else []
     
     def get_cue(self, cue_id: int) -> Optional[Cue]:
         """
         Get a single cue by ID.
         """
-        return Cue.load_by_id(self._get_db(), cue_id) if self.is_open else None
+        return self._get_cue_repo().get(cue_id) if self.is_open else None
+    
+    def get_cue_by_index(self, cue_index: int) -> Optional[Cue]:
+        """
+        Get a single cue by its cue index.
+        """
+        return self._get_cue_repo().get_by_index(cue_index) if self.is_open else None
+    
+    def get_next_cue(self, cue_index: int) -> Optional[Cue]:
+        """
+        Get the first cue after the given cue index.
+        """
+        return self._get_cue_repo().next_after(cue_index) if self.is_open else None
+    
+    def get_previous_cue(self, cue_index: int) -> Optional[Cue]:
+        """
+        Get the last cue before the given cue index.
+        """
+        return self._get_cue_repo().previous_before(cue_index) if self.is_open else None
     
-    def save_cue(self, cue: Cue) -> None:
+    def find_cue_at_time(self, time_ms: int) -> Optional[Cue]:
+        """
+        Get the cue playing at a given time.
+        
+        Served from an in-memory interval index, never from SQLite.
+        """
+        return self._get_cue_repo().find_at_time(time_ms) if self.is_open else None
+    
+    def save_cue(self, cue: Cue) -> Cue:
         """
         Save a cue.
+        
+        The cue may be an edited copy of a cached cue: its values are
+        copied into the cached object only after the database write
+        succeeded. If the write fails, the cache is dropped, so cached
+        cues changed in place before the save are reloaded from the
+        database.
+        
+        Returns:
+            The cached cue holding the saved values
+        """
+        if not self.is_open:
+            raise ValueError("No open project")
+        
+        db = self._get_db()
+        try:
+            with db.transaction():
+                cue.save(db)
+        except Exception:
+            self.invalidate_cues()
+            raise
+        
+        repo = self._get_cue_repo()
+        cached = repo.get(cue.id)
+        if cached is not None and cached is not cue:
+            for f in fields(Cue):
+                setattr(cached, f.name, getattr(cue, f.name))
+            cue = cached
+        repo.update(cue)
+        self.mark_dirty()
+        return cue
+    
+    def save_cues(self, cues: List[Cue]) -> None:
+        """
+        Save multiple cues in a single transaction.
+        
+        Args:
+            cues: Cues to insert or update
         """
         if not self.is_open:
             raise ValueError("No open project")
         
-        cue.save(self._get_db())
+        try:
+            CueBatch.save_all(self._get_db(), cues)
+        except Exception:
+            self.invalidate_cues()
+            raise
+        self._get_cue_repo().update_many(cues)
         self.mark_dirty()
     
     def delete_cue(self, cue_id: int) -> None:
@@ -278,9 +414,11 @@ class ProjectManager:
         db = self._get_db()
         proj = self._get_project()
         
-        if cue := Cue.load_by_id(db, cue_id):
-            cue.delete(db)
-            CueBatch.reindex(db, proj.id)
+        if cue := self.get_cue(cue_id):
+            with db.transaction():
+                cue.delete(db)
+                CueBatch.reindex(db, proj.id)
+            self.invalidate_cues()
             self.mark_dirty()
     
     def add_new_cue(self, time_in_ms: Optional[int] = None) -> Cue:
@@ -332,6 +470,7 @@ class ProjectManager:
         
         cue = self._create_cue(proj.id, next_index, time_in, time_out)
         cue.save(db)
+        self._get_cue_repo().update(cue)
         self.mark_dirty()
         return cue
         
@@ -371,10 +510,9 @@ class ProjectManager:
         cues = self.get_cues()
         
         # Shift indices
-        for cue in cues:
-            if cue.cue_index >= index:
-                cue.cue_index += 1
-                cue.save(db)
+        shifted = [cue for cue in cues if cue.cue_index >= index]
+        for cue in shifted:
+            cue.cue_index += 1
         
         # Calculate time based on adjacent cues
         prev_cue = None
@@ -401,7 +539,14 @@ class ProjectManager:
             time_out = 2000
         
         cue = self._create_cue(proj.id, index, time_in, time_out)
-        cue.save(db)
+        try:
+            with db.transaction():
+                CueBatch.save_all(db, shifted)
+                cue.save(db)
+        except Exception:
+            self.invalidate_cues()
+            raise
+        self._get_cue_repo().update_many(shifted + [cue])
         self.mark_dirty()
         return cue
     
@@ -425,25 +570,37 @@ class ProjectManager:
         proj.save(db)
         self.mark_dirty()
     
+    def lipsync_estimator(self) -> LipSyncEstimator:
+        """
+        Lip-sync estimator of the project's engine, using the speech
+        rate from the settings.
+        """
+        engine = self.project.lipsync_engine if self.project else DEFAULT_LIPSYNC_ENGINE
+        return create_estimator(engine, SettingsManager().lipsync_chars_per_second)
+    
     def recalculate_all_lipsync(self) -> int:
         """
         Recalculate lip-sync for all cues.
         
+        Ratios are computed in bulk and written back with a single
+        executemany.
+        
         Returns:
             Number of updated cues
         """
         if not self.is_open:
             return 0
         
-        db = self._get_db()
         cues = self.get_cues()
-        estimator = LipSyncEstimator()
-        
-        for cue in cues:
-            estimator.update_cue_ratio(cue)
-            cue.save(db)
-        
+        self.lipsync_estimator().update_ratios(cues)
+        try:
+            CueBatch.save_lip_sync_ratios(self._get_db(), cues)
+        except Exception:
+            # The cached cues hold ratios that were never written
+            self.invalidate_cues()
+            raise
         self.mark_dirty()
+        
         return len(cues)
     
     def get_statistics(self) -> dict:
@@ -456,11 +613,10 @@ class ProjectManager:
         if not self.is_open:
             return {}
         
-        db = self._get_db()
-        proj = self._get_project()
-        
         cues = self.get_cues()
-        status_counts = Cue.count_by_status(db, proj.id)
+        status_counts: dict = {}
+        for cue in cues:
+            status_counts[cue.status] = status_counts.get(cue.status, 0) + 1
         
         total = len(cues)
         translated = sum(c.has_translation() for c in cues)
@@ -493,6 +649,18 @@ def get_srt_filter() -> str:
     return "SRT subtitle (*.srt);;All files (*.*)"
 
 
+def get_subtitle_filter() -> str:
+    """
+    Subtitle file filter for dialogs, built from the registered importers.
+    """
+    importers = get_importers()
+    patterns = " ".join(f"*{ext}" for imp in importers for ext in imp.extensions)
+    formats = ";;".join(
+        f"{imp.name} ({' '.join(f'*{ext}' for ext in imp.extensions)})" for imp in importers
+    )
+    return f"Subtitle files ({patterns});;{formats};;All files (*.*)"
+
+
 def get_video_filter() -> str:
     """
     Video file filter for dialogs.
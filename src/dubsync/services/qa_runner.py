@@ -0,0 +1,289 @@
+"""
+DubSync QA Runner
+
+Runs the enabled QA plugins over a whole project off the GUI thread.
+
+Plugins that provide a picklable per-cue checker (QAPlugin.
+get_cue_checker) are run over chunks of lightweight cue records in a
+process pool; the others run their check() in the calling (background)
+thread. Results of all plugins are merged in cue time order.
+
+A plugin that raises is logged and skipped, like a failing check() of
+any QA plugin; if the process pool breaks, it is discarded and the
+per-cue checkers run in the calling thread instead.
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from dubsync.models.cue import Cue
+from dubsync.plugins.base import QAPlugin
+from dubsync.services.cue_time_index import CueTimeIndex
+from dubsync.services.logger import get_logger
+
+
+# Cues per process pool task
+QA_CHUNK_SIZE = 500
+
+# Below this many cues a process pool costs more than it saves
+PARALLEL_QA_MIN_CUES = 2000
+
+# How often (seconds) a waiting run looks at the cancel flag
+_CANCEL_POLL_S = 0.1
+
+
+class CueRecord(NamedTuple):
+    """
+    Picklable snapshot of the cue fields QA rules read.
+    """
+    id: int
+    cue_index: int
+    time_in_ms: int
+    time_out_ms: int
+    source_text: str
+    translated_text: str
+    character_name: str
+    notes: str
+    lip_sync_ratio: Optional[float]
+
+    @classmethod
+    def from_cue(cls, cue: Cue) -> "CueRecord":
+        return cls(
+            cue.id, cue.cue_index, cue.time_in_ms, cue.time_out_ms,
+            cue.source_text or "", cue.translated_text or "",
+            cue.character_name or "", cue.notes or "", cue.lip_sync_ratio,
+        )
+
+
+class QACancelled(Exception):
+    """The QA run was cancelled."""
+
+
+# (earlier record, overlap ms) or None, per record
+RecordOverlap = Optional[Tuple[CueRecord, int]]
+
+
+def check_records(
+    checker: Callable[[Any, RecordOverlap], List[Any]],
+    records: List[CueRecord],
+    overlaps: List[RecordOverlap],
+) -> List[Any]:
+    """
+    Run a per-cue checker over a chunk (executed in worker processes).
+    """
+    issues: List[Any] = []
+    for record, overlap in zip(records, overlaps):
+        issues.extend(checker(record, overlap))
+    return issues
+
+
+def merge_issues(issues: Iterable[Any], cues: Iterable[Cue]) -> List[Any]:
+    """
+    Order issues by the time order of their cues.
+
+    The sort is stable, so issues of one cue keep their plugin and rule
+    order; issues without a known cue go last.
+    """
+    order = {cue.id: i for i, cue in enumerate(CueTimeIndex(cues).cues)}
+    last = len(order)
+    return sorted(issues, key=lambda issue: order.get(issue.cue_id, last))
+
+
+def default_worker_count() -> int:
+    """Worker processes for the pool (one core is left for the GUI)."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+class QARunner:
+    """
+    Whole-project QA run over several QA plugins.
+
+    The process pool is created on first use and reused by later runs;
+    call shutdown() when it is no longer needed.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = QA_CHUNK_SIZE,
+        parallel_min_cues: int = PARALLEL_QA_MIN_CUES,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialization.
+
+        Args:
+            chunk_size: Cues per process pool task
+            parallel_min_cues: Smaller projects are checked in-thread
+            max_workers: Worker processes (None: default_worker_count())
+        """
+        self.chunk_size = chunk_size
+        self.parallel_min_cues = parallel_min_cues
+        self.max_workers = max_workers or default_worker_count()
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._discard_executor()
+
+    def _discard_executor(self) -> None:
+        """Drop the pool (a broken pool is recreated on next use)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def run(
+        self,
+        plugins: List[QAPlugin],
+        project: Any,
+        cues: List[Cue],
+        progress: Optional[Callable[[int, int], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[Any]:
+        """
+        Check a project with the given plugins.
+
+        Args:
+            plugins: Enabled QA plugins
+            project: Project object (passed to check())
+            cues: All cues of the project
+            progress: Called with (done, total) work units
+            is_cancelled: Polled between work units
+
+        Returns:
+            QAIssue / QAFinding objects in cue time order
+
+        Raises:
+            QACancelled: If is_cancelled() returned True
+        """
+        is_cancelled = is_cancelled or (lambda: False)
+        checkers = [plugin.get_cue_checker() for plugin in plugins]
+        parallel = [(p, c) for p, c in zip(plugins, checkers) if c is not None]
+        serial = [p for p, c in zip(plugins, checkers) if c is None]
+
+        chunks: List[Tuple[List[CueRecord], List[RecordOverlap]]] = []
+        if parallel:
+            chunks = self._make_chunks(cues)
+        total = len(parallel) * len(chunks) + len(serial)
+        done = 0
+        issues: List[Any] = []
+
+        def advance(count: int = 1) -> None:
+            nonlocal done
+            done += count
+            if progress:
+                progress(done, total)
+
+        if progress:
+            progress(0, total)
+
+        if parallel:
+            if len(cues) >= self.parallel_min_cues:
+                try:
+                    issues.extend(self._run_pool(parallel, chunks, advance, is_cancelled))
+                    parallel = []
+                except BrokenProcessPool as e:
+                    get_logger("qa").warning(f"QA process pool failed, checking in-thread: {e}")
+                    self._discard_executor()
+                    done = 0  # The pool's work is redone below
+            for plugin, checker in parallel:
+                issues.extend(self._run_in_thread(plugin, checker, chunks, advance, is_cancelled))
+
+        for plugin in serial:
+            if is_cancelled():
+                raise QACancelled()
+            try:
+                issues.extend(plugin.check_cancellable(project, cues, is_cancelled))
+            except Exception as e:
+                get_logger("qa").warning(f"QA plugin failed ({plugin.info.id}): {e}")
+            if is_cancelled():
+                raise QACancelled()
+            advance()
+
+        return merge_issues(issues, cues)
+
+    def _make_chunks(self, cues: List[Cue]) -> List[Tuple[List[CueRecord], List[RecordOverlap]]]:
+        """Time-ordered record chunks with overlaps resolved across chunk borders."""
+        time_index = CueTimeIndex(cues)
+        ordered = time_index.cues
+        records = {id(cue): CueRecord.from_cue(cue) for cue in ordered}
+        overlaps = {
+            id(cue): (records[id(earlier)], overlap_ms)
+            for cue, earlier, overlap_ms in time_index.overlaps()
+        }
+        chunks = []
+        for start in range(0, len(ordered), self.chunk_size):
+            part = ordered[start:start + self.chunk_size]
+            chunks.append((
+                [records[id(cue)] for cue in part],
+                [overlaps.get(id(cue)) for cue in part],
+            ))
+        return chunks
+
+    @staticmethod
+    def _run_in_thread(plugin, checker, chunks, advance, is_cancelled) -> List[Any]:
+        """Run one per-cue checker over the chunks in the calling thread."""
+        issues: List[Any] = []
+        for i, (records, overlaps) in enumerate(chunks):
+            if is_cancelled():
+                raise QACancelled()
+            try:
+                issues.extend(check_records(checker, records, overlaps))
+            except Exception as e:
+                get_logger("qa").warning(f"QA plugin failed ({plugin.info.id}): {e}")
+                advance(len(chunks) - i)
+                return []
+            advance()
+        return issues
+
+    def _run_pool(self, checkers, chunks, advance, is_cancelled) -> List[Any]:
+        """
+        Run chunk tasks in the process pool, collecting in submit order.
+
+        Raises:
+            BrokenProcessPool: If a worker process died
+        """
+        executor = self._get_executor()
+        futures = [
+            (plugin, executor.submit(check_records, checker, records, overlaps))
+            for plugin, checker in checkers
+            for records, overlaps in chunks
+        ]
+        pending = {future for _, future in futures}
+        try:
+            while pending:
+                if is_cancelled():
+                    raise QACancelled()
+                finished, pending = wait(pending, timeout=_CANCEL_POLL_S,
+                                         return_when=FIRST_COMPLETED)
+                if finished:
+                    advance(len(finished))
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+        collected = []
+        failed = set()
+        for plugin, future in futures:
+            if plugin.info.id in failed:
+                continue
+            try:
+                collected.append((plugin.info.id, future.result()))
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                get_logger("qa").warning(f"QA plugin failed ({plugin.info.id}): {e}")
+                failed.add(plugin.info.id)
+        # A failed plugin's partial results are dropped
+        return [
+            issue
+            for plugin_id, chunk_issues in collected if plugin_id not in failed
+            for issue in chunk_issues
+        ]
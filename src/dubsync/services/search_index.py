@@ -0,0 +1,257 @@
+"""
+DubSync Search Index
+
+Ranked, typo-tolerant type-ahead search over short texts (glossary
+entries).
+
+Items are indexed by the words of their weighted fields. An inverted
+index (word -> items) answers exact and prefix lookups; a trigram index
+over the vocabulary finds words containing the query (infix) and words
+similar to a mistyped query (fuzzy). Each query word is scored by its
+best match kind and field weight, and an item must match every query
+word. The index is updated per item, so edits never trigger a rebuild.
+"""
+
+import bisect
+import re
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from dubsync.services.term_matcher import fold_case
+
+
+# Score of a query word by match kind (multiplied by the field weight)
+SCORE_EXACT = 1.0
+SCORE_PREFIX = 0.7   # Up to +0.2 as the query covers more of the word
+SCORE_INFIX = 0.5
+SCORE_FUZZY = 0.4   # Scaled by the trigram similarity
+
+# Bonus when a whole field equals / starts with the whole query
+BONUS_FIELD_EXACT = 2.0
+BONUS_FIELD_PREFIX = 0.5
+
+# Minimum trigram (Dice) similarity of a fuzzy match
+DEFAULT_FUZZY_THRESHOLD = 0.4
+
+# Query words shorter than this only match exactly or as a prefix
+_MIN_INFIX_LEN = 3
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Case-folded words of a text."""
+    return _WORD_RE.findall(fold_case(text))
+
+
+def trigrams(word: str) -> Set[str]:
+    """Trigrams of a word padded at both ends ("$ab", "abc", "bc$")."""
+    padded = f"${word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchHit(NamedTuple):
+    """A ranked search result."""
+    item: Any
+    score: float
+
+
+class _Indexed(NamedTuple):
+    item: Any
+    order: int                          # Insertion order (tie breaker)
+    fields: Tuple[Tuple[str, float], ...]   # (folded words joined, weight)
+    words: Dict[str, float]             # word -> best field weight
+
+
+class SearchIndex:
+    """
+    Incremental inverted + trigram index with ranked queries.
+
+    Items are compared by identity, so mutable objects can be indexed;
+    call update() after changing an indexed item's texts.
+    """
+
+    def __init__(self, fuzzy_threshold: float = DEFAULT_FUZZY_THRESHOLD):
+        """
+        Initialization.
+
+        Args:
+            fuzzy_threshold: Minimum trigram similarity of a fuzzy match
+        """
+        self.fuzzy_threshold = fuzzy_threshold
+        self._items: Dict[int, _Indexed] = {}
+        self._postings: Dict[str, Dict[int, float]] = {}  # word -> {item key: weight}
+        self._trigram_words: Dict[str, Set[str]] = {}      # trigram -> words
+        self._trigram_count: Dict[str, int] = {}           # word -> number of trigrams
+        self._sorted_words: Optional[List[str]] = None     # For prefix bisect (lazy)
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return id(item) in self._items
+
+    def add(self, item: Any, fields: Sequence[Tuple[str, float]]) -> None:
+        """
+        Index an item.
+
+        Args:
+            item: Result object
+            fields: (text, weight) pairs searched for this item
+        """
+        key = id(item)
+        if key in self._items:
+            self.remove(item)
+        folded = tuple((" ".join(tokenize(text or "")), weight) for text, weight in fields)
+        words: Dict[str, float] = {}
+        for text, weight in folded:
+            for word in text.split():
+                if weight > words.get(word, 0.0):
+                    words[word] = weight
+        self._items[key] = _Indexed(item, self._next_order, folded, words)
+        self._next_order += 1
+        for word, weight in words.items():
+            posting = self._postings.get(word)
+            if posting is None:
+                posting = self._postings[word] = {}
+                self._add_word(word)
+            posting[key] = weight
+
+    def update(self, item: Any, fields: Sequence[Tuple[str, float]]) -> None:
+        """Re-index an item whose texts changed (keeps its order)."""
+        old = self._items.get(id(item))
+        self.add(item, fields)
+        if old is not None:
+            self._items[id(item)] = self._items[id(item)]._replace(order=old.order)
+
+    def remove(self, item: Any) -> bool:
+        """
+        Remove an item.
+
+        Returns:
+            True if the item was indexed
+        """
+        key = id(item)
+        indexed = self._items.pop(key, None)
+        if indexed is None:
+            return False
+        for word in indexed.words:
+            posting = self._postings[word]
+            del posting[key]
+            if not posting:
+                del self._postings[word]
+                self._remove_word(word)
+        return True
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self._items.clear()
+        self._postings.clear()
+        self._trigram_words.clear()
+        self._trigram_count.clear()
+        self._sorted_words = None
+
+    def _add_word(self, word: str) -> None:
+        grams = trigrams(word)
+        for gram in grams:
+            self._trigram_words.setdefault(gram, set()).add(word)
+        self._trigram_count[word] = len(grams)
+        if self._sorted_words is not None:
+            bisect.insort(self._sorted_words, word)
+
+    def _remove_word(self, word: str) -> None:
+        for gram in trigrams(word):
+            words = self._trigram_words.get(gram)
+            if words is not None:
+                words.discard(word)
+                if not words:
+                    del self._trigram_words[gram]
+        del self._trigram_count[word]
+        if self._sorted_words is not None:
+            del self._sorted_words[bisect.bisect_left(self._sorted_words, word)]
+
+    def _word_matches(self, query_word: str) -> Dict[str, float]:
+        """Vocabulary words matching one query word, with match scores."""
+        matches: Dict[str, float] = {}
+        if query_word in self._postings:
+            matches[query_word] = SCORE_EXACT
+
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self._postings)
+        words = self._sorted_words
+        i = bisect.bisect_left(words, query_word)
+        while i < len(words) and words[i].startswith(query_word):
+            matches.setdefault(words[i], SCORE_PREFIX + 0.2 * len(query_word) / len(words[i]))
+            i += 1
+
+        if len(query_word) < _MIN_INFIX_LEN:
+            return matches
+
+        grams = trigrams(query_word)
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._trigram_words.get(gram, ()))
+        for word, count in shared.items():
+            if word in matches:
+                continue
+            if query_word in word:
+                matches[word] = SCORE_INFIX
+                continue
+            similarity = 2.0 * count / (len(grams) + self._trigram_count[word])
+            if similarity >= self.fuzzy_threshold:
+                matches[word] = SCORE_FUZZY * similarity
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        Ranked search.
+
+        Args:
+            query: Search text (words are matched independently)
+            limit: Maximum number of hits (None: all)
+
+        Returns:
+            Hits by descending score; ties by shorter first field,
+            then insertion order
+        """
+        query_words = tokenize(query)
+        if not query_words:
+            return []
+
+        scores: Optional[Dict[int, float]] = None
+        for query_word in dict.fromkeys(query_words):
+            word_scores: Dict[int, float] = {}
+            for word, score in self._word_matches(query_word).items():
+                for key, weight in self._postings[word].items():
+                    value = score * weight
+                    if value > word_scores.get(key, 0.0):
+                        word_scores[key] = value
+            if scores is None:
+                scores = word_scores
+            else:
+                # Every query word must match
+                scores = {
+                    key: total + word_scores[key]
+                    for key, total in scores.items() if key in word_scores
+                }
+            if not scores:
+                return []
+
+        folded_query = " ".join(query_words)
+        hits = []
+        for key, score in scores.items():
+            indexed = self._items[key]
+            for text, weight in indexed.fields:
+                if text == folded_query:
+                    score += BONUS_FIELD_EXACT * weight
+                    break
+                if text.startswith(folded_query):
+                    score += BONUS_FIELD_PREFIX * weight
+                    break
+            hits.append((-score, len(indexed.fields[0][0]) if indexed.fields else 0,
+                         indexed.order, indexed.item))
+        hits.sort(key=lambda hit: hit[:3])
+        if limit is not None:
+            hits = hits[:limit]
+        return [SearchHit(item, -neg_score) for neg_score, _, _, item in hits]
@@ -0,0 +1,216 @@
+"""
+DubSync Batch Spellcheck
+
+Project-wide spellchecking helpers.
+
+Dialogue is highly repetitive, so a project is checked by word, not by
+cue: collect_words() gathers every unique word with its occurrences,
+each unique word is looked up once, and the verdicts are mapped back to
+the cues. Dictionary verdicts are kept in a persistent VerdictCache
+keyed by a fingerprint of the dictionary files, so unchanged words are
+never looked up again across runs. Large sets of new words can be
+checked in a process pool (LookupPool, kept alive between runs).
+"""
+
+import json
+import re
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from dubsync.services.logger import get_logger
+
+
+# Words checked by the spellchecker (Hungarian letters)
+WORD_PATTERN = re.compile(r'\b([a-záéíóöőúüű]+)\b', re.IGNORECASE)
+
+# Words per process pool task
+SPELLCHECK_CHUNK_SIZE = 2000
+
+# Below this many new words loading the dictionary in every worker
+# process costs more than it saves
+PARALLEL_SPELLCHECK_MIN_WORDS = 20000
+
+_CACHE_VERSION = 1
+
+
+def collect_words(texts: Iterable[Tuple[Any, str]]) -> Dict[str, List[Tuple[Any, int]]]:
+    """
+    Unique words of many texts.
+
+    Args:
+        texts: (key, text) pairs, e.g. (cue, translated text)
+
+    Returns:
+        word -> [(key, position)] in text order
+    """
+    words: Dict[str, List[Tuple[Any, int]]] = {}
+    for key, text in texts:
+        if not text:
+            continue
+        for match in WORD_PATTERN.finditer(text):
+            words.setdefault(match.group(1), []).append((key, match.start()))
+    return words
+
+
+class VerdictCache:
+    """
+    Persistent word -> dictionary verdict cache.
+
+    Verdicts are only valid for the dictionary they came from: a cache
+    file written with another fingerprint is discarded on load.
+    Custom and ignored words are not stored; callers apply them on top
+    of the verdicts, so editing them needs no invalidation.
+    """
+
+    def __init__(self, path: Optional[Path], fingerprint: str):
+        """
+        Initialization (loads the file if it matches the fingerprint).
+
+        Args:
+            path: Cache file (None: in-memory only)
+            fingerprint: Fingerprint of the current dictionary
+        """
+        self.path = Path(path) if path else None
+        self.fingerprint = fingerprint
+        self._verdicts: Dict[str, bool] = {}
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            get_logger("spellcheck").warning(f"Spellcheck cache unreadable: {e}")
+            return
+        if data.get("version") != _CACHE_VERSION or data.get("fingerprint") != self.fingerprint:
+            self._dirty = True  # Stale: rewritten on the next save()
+            return
+        self._verdicts = dict.fromkeys(data.get("correct", []), True)
+        self._verdicts.update(dict.fromkeys(data.get("incorrect", []), False))
+
+    def get(self, word: str) -> Optional[bool]:
+        """Cached verdict (None: unknown word)."""
+        return self._verdicts.get(word)
+
+    def put_many(self, verdicts: Dict[str, bool]) -> None:
+        """Store verdicts."""
+        if verdicts:
+            self._verdicts.update(verdicts)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache file if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        data = {
+            "version": _CACHE_VERSION,
+            "fingerprint": self.fingerprint,
+            "correct": sorted(w for w, ok in self._verdicts.items() if ok),
+            "incorrect": sorted(w for w, ok in self._verdicts.items() if not ok),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+
+# Dictionary of a worker process (loaded once by the pool initializer)
+_worker_dictionary: Any = None
+
+
+def _init_worker(base_path: str, snapshot_dir: Optional[str]) -> None:
+    global _worker_dictionary
+    from dubsync.services.dictionary_snapshot import load_snapshot
+    if snapshot_dir:
+        _worker_dictionary = load_snapshot(Path(base_path), Path(snapshot_dir))
+    if _worker_dictionary is None:
+        from spylls.hunspell import Dictionary  # type: ignore
+        _worker_dictionary = Dictionary.from_files(base_path)
+
+
+def lookup_words(words: Sequence[str]) -> List[bool]:
+    """Dictionary verdicts of a chunk (executed in worker processes)."""
+    return [bool(_worker_dictionary.lookup(word)) for word in words]
+
+
+class LookupPool:
+    """
+    Process pool of dictionary lookups.
+
+    Every worker loads the dictionary once (from its snapshot when there
+    is one), so this only pays off for large word sets (see
+    PARALLEL_SPELLCHECK_MIN_WORDS). The pool is started on first use and
+    reused by later runs; call shutdown() when it is no longer needed.
+    """
+
+    def __init__(self, base_path: Path, max_workers: int, snapshot_dir: Optional[Path] = None):
+        """
+        Initialization.
+
+        Args:
+            base_path: Dictionary path without suffix
+            max_workers: Worker processes
+            snapshot_dir: Directory of dictionary snapshots (see dictionary_snapshot)
+        """
+        self.base_path = Path(base_path)
+        self.max_workers = max_workers
+        self.snapshot_dir = snapshot_dir
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_worker,
+                initargs=(str(self.base_path), str(self.snapshot_dir) if self.snapshot_dir else None))
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def check(
+        self,
+        words: Sequence[str],
+        chunk_size: int = SPELLCHECK_CHUNK_SIZE,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, bool]:
+        """
+        Look up words.
+
+        Args:
+            words: Unique words to look up
+            chunk_size: Words per task
+            is_cancelled: Polled while waiting; True cancels the pending tasks
+
+        Returns:
+            word -> verdict (only the finished chunks if cancelled)
+        """
+        executor = self._get_executor()
+        pending = {
+            executor.submit(lookup_words, words[i:i + chunk_size]): words[i:i + chunk_size]
+            for i in range(0, len(words), chunk_size)
+        }
+        verdicts: Dict[str, bool] = {}
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    verdicts.update(zip(pending.pop(future), future.result()))
+                if is_cancelled and is_cancelled():
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+        return verdicts
+
@@ -4,25 +4,84 @@ DubSync SRT Parser
 SRT files reading and processing.
 """
 
+import codecs
+import io
 import re
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 from dubsync.models.cue import Cue
-from dubsync.utils.time_utils import timecode_to_ms
+from dubsync.utils.time_utils import TIMECODE_PATTERN, timecode_parts_to_ms
 from dubsync.i18n import t
 
 
+# Bytes read for encoding detection
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Letters that ISO-8859-2 has in 0xA1-0xBF where CP1250 has symbols
+# (Ą Ś Š Ť Ź Ž ą ś š ť ź ž ...)
+_ISO_8859_2_LETTERS = frozenset(b"\xa1\xa6\xa9\xab\xac\xae\xb1\xb6\xb9\xbb\xbc\xbe")
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    Guess the text encoding of a subtitle file from its first bytes.
+    
+    Checks, in order: byte order mark, UTF-8 validity, then Central
+    European single-byte heuristics. Bytes 0x80-0x9F are control codes
+    in ISO-8859-2 but letters and punctuation in CP1250, so their
+    presence means CP1250; without them, ISO-8859-2-only letters next
+    to ASCII letters point to ISO-8859-2.
+    
+    Args:
+        sample: Beginning of the file
+        
+    Returns:
+        Python codec name
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    
+    try:
+        # A multi-byte character may be cut at the end of the sample
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    
+    if any(0x80 <= b <= 0x9F for b in sample):
+        try:
+            sample.decode("cp1250")
+            return "cp1250"
+        except UnicodeDecodeError:
+            return "cp1252"
+    
+    for i, b in enumerate(sample):
+        if b in _ISO_8859_2_LETTERS:
+            before = sample[i - 1:i]
+            after = sample[i + 1:i + 2]
+            if before.isalpha() or after.isalpha():
+                return "iso-8859-2"
+    return "cp1250"
+
+
 @dataclass
 class SRTEntry:
     """
-    Raw SRT entry after parsing.
+    Raw subtitle entry after parsing.
+    
+    Also produced by the other format importers, which may fill in the
+    speaker and notes.
     """
     index: int
     time_in_ms: int
     time_out_ms: int
     text: str
+    character_name: str = ""
+    notes: str = ""
     
     def to_cue(self, project_id: int = 1) -> Cue:
         """
@@ -34,6 +93,8 @@ class SRTEntry:
             time_in_ms=self.time_in_ms,
             time_out_ms=self.time_out_ms,
             source_text=self.text,
+            character_name=self.character_name,
+            notes=self.notes,
         )
 
 
@@ -43,9 +104,13 @@ class SRTParser:
     
     Supports:
     - Standard SRT format
-    - UTF-8 encoding (with and without BOM)
+    - UTF-8/UTF-16 with BOM, UTF-8, CP1250, ISO-8859-2, CP1252
     - Multi-line text blocks
-    - Various line ending formats (\n, \r\n)
+    - Various line ending formats (\n, \r\n, \r)
+    - Concatenated files (repeated BOM, missing blank lines)
+    
+    Files are read line by line; iter_file() yields entries as they are
+    parsed, so memory use does not grow with the file size.
     """
     
     # SRT index pattern (number line)
@@ -56,6 +121,17 @@ class SRTParser:
         r"^(\d{1,2}:\d{2}:\d{2}[,\.]\d{1,3})\s*-->\s*(\d{1,2}:\d{2}:\d{2}[,\.]\d{1,3})"
     )
     
+    # Whole block in one match: optional index line, time line (trailing
+    # position data ignored), then the text. Groups: index, 4 time-in
+    # parts, 4 time-out parts, text.
+    BLOCK_PATTERN = re.compile(
+        rf"(?:(\d+)\n)?{TIMECODE_PATTERN}[^\S\n]*-->[^\S\n]*{TIMECODE_PATTERN}[^\n]*\n?(.*)",
+        re.DOTALL,
+    )
+    
+    # HTML tags (<i>, <b>, ...) and ASS style codes ({\\an8}, ...)
+    MARKUP_PATTERN = re.compile(r"<[^>]+>|\{[^}]+\}")
+    
     def __init__(self):
         self.entries: List[SRTEntry] = []
         self.errors: List[str] = []
@@ -72,29 +148,34 @@ class SRTParser:
             
         Raises:
             FileNotFoundError: If the file is not found
-            UnicodeDecodeError: If the encoding is incorrect
         """
-        self.entries = []
-        self.errors = []
-        
-        # Try UTF-8 first, then fallback to other encodings
-        encodings = ["utf-8-sig", "utf-8", "cp1250", "iso-8859-2", "cp1252"]
-        content = None
+        self.entries = list(self.iter_file(file_path))
+        return self.entries
+    
+    def iter_file(self, file_path: Path) -> Iterator[SRTEntry]:
+        """
+        Parse an SRT file lazily.
         
-        for encoding in encodings:
-            try:
-                content = file_path.read_text(encoding=encoding)
-                break
-            except (UnicodeDecodeError, LookupError):
-                continue
+        The encoding is detected once from the beginning of the file;
+        undecodable bytes are replaced instead of aborting the import.
+        Errors are collected in self.errors while iterating.
         
-        if content is None:
-            raise UnicodeDecodeError(
-                "utf-8", b"", 0, 1, 
-                t("services.srt.failed_to_read", path=str(file_path))
-            )
+        Args:
+            file_path: Path to the SRT file
+            
+        Yields:
+            SRTEntry objects in file order
+            
+        Raises:
+            FileNotFoundError: If the file is not found
+        """
+        self.errors = []
+        with open(file_path, "rb") as raw:
+            encoding = detect_encoding(raw.read(ENCODING_SAMPLE_SIZE))
         
-        return self.parse_content(content)
+        # newline=None translates \r\n and \r while reading
+        with open(file_path, "r", encoding=encoding, errors="replace", newline=None) as f:
+            yield from self._iter_entries(f)
     
     def parse_content(self, content: str) -> List[SRTEntry]:
         """
@@ -106,79 +187,83 @@ class SRTParser:
         Returns:
             List of SRTEntry objects
         """
-        self.entries = []
         self.errors = []
-
-        # Normalize line endings
-        content = content.replace("\r\n", "\n").replace("\r", "\n")
-
-        # Split into blocks (empty line separates entries)
-        blocks = re.split(r"\n\n+", content.strip())
-
-        for block_num, block in enumerate(blocks, 1):
-            if entry := self._parse_block(block, block_num):
-                self.entries.append(entry)
-
+        self.entries = list(self._iter_entries(io.StringIO(content, newline=None)))
         return self.entries
     
-    def _parse_block(self, block: str, block_num: int) -> Optional[SRTEntry]:
+    def _iter_entries(self, lines: Iterable[str]) -> Iterator[SRTEntry]:
+        """
+        Split a line stream into blocks and parse them.
+        
+        Blocks end at blank lines, or where a new index + time line
+        starts right after text (concatenated or sloppy files).
+        """
+        block: List[str] = []
+        block_start = 0
+        block_num = 0
+        has_time = False
+        
+        for line_no, line in enumerate(lines, 1):
+            line = line.rstrip("\n").lstrip("\ufeff")
+            stripped = line.strip()
+            
+            if not stripped:
+                if block:
+                    block_num += 1
+                    if entry := self._parse_block(block, block_num, block_start):
+                        yield entry
+                    block = []
+                    has_time = False
+                continue
+            
+            if "-->" in stripped and self.TIME_PATTERN.match(stripped):
+                if has_time and len(block) >= 3 and self.INDEX_PATTERN.match(block[-1]):
+                    # Previous block ran into this one without a blank line
+                    index_line = block.pop()
+                    block_num += 1
+                    if entry := self._parse_block(block, block_num, block_start):
+                        yield entry
+                    block = [index_line]
+                    block_start = line_no - 1
+                has_time = True
+            
+            if not block:
+                block_start = line_no
+            block.append(stripped)
+        
+        if block:
+            block_num += 1
+            if entry := self._parse_block(block, block_num, block_start):
+                yield entry
+    
+    def _parse_block(self, lines: List[str], block_num: int, line_no: int) -> Optional[SRTEntry]:
         """
         Process a single SRT block.
         
         Args:
-            block: SRT block string
-            block_num: Block number (for error handling)
+            lines: Stripped, non-empty lines of the block
+            block_num: Block number (default index)
+            line_no: Line number of the block's first line (for errors)
             
         Returns:
             SRTEntry or None if an error occurred
         """
-        lines = block.strip().split("\n")
-        
         if len(lines) < 2:
             return None
         
-        # Find index line
-        index = None
-        time_line_idx = 0
-        
-        # First line might be index
-        if self.INDEX_PATTERN.match(lines[0].strip()):
-            index = int(lines[0].strip())
-            time_line_idx = 1
-        
-        if time_line_idx >= len(lines):
-            self.errors.append(t("services.srt.missing_time_line", block=block_num))
-            return None
-        
-        # Parse time line
-        time_match = self.TIME_PATTERN.match(lines[time_line_idx].strip())
-        if not time_match:
-            self.errors.append(t("services.srt.invalid_time_format", block=block_num))
+        match = self.BLOCK_PATTERN.match("\n".join(lines))
+        if not match:
+            time_line_idx = 1 if self.INDEX_PATTERN.match(lines[0]) else 0
+            self.errors.append(t("services.srt.invalid_time_format", line=line_no + time_line_idx))
             return None
         
-        try:
-            time_in_ms = timecode_to_ms(time_match.group(1))
-            time_out_ms = timecode_to_ms(time_match.group(2))
-        except ValueError as e:
-            self.errors.append(t("services.srt.block_error", block=block_num, error=str(e)))
-            return None
-        
-        # Remaining lines are text
-        text_lines = lines[time_line_idx + 1:]
-        text = "\n".join(line.strip() for line in text_lines if line.strip())
-        
-        # Clean up common SRT artifacts
-        text = self._clean_text(text)
-        
-        # Use block number as index if not found
-        if index is None:
-            index = block_num
-        
+        index, *times, text = match.groups()
         return SRTEntry(
-            index=index,
-            time_in_ms=time_in_ms,
-            time_out_ms=time_out_ms,
-            text=text
+            # Use block number as index if not found
+            index=int(index) if index is not None else block_num,
+            time_in_ms=timecode_parts_to_ms(*times[:4]),
+            time_out_ms=timecode_parts_to_ms(*times[4:]),
+            text=self._clean_text(text),
         )
     
     def _clean_text(self, text: str) -> str:
@@ -190,16 +275,9 @@ class SRTParser:
         - ASS style codes ({\\an8}, etc.)
         - Excessive whitespace
         """
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
-        
-        # Remove ASS style codes
-        text = re.sub(r"\{[^}]+\}", "", text)
-        
-        # Clean up whitespace
-        text = " ".join(text.split())
-        
-        return text.strip()
+        if "<" in text or "{" in text:
+            text = self.MARKUP_PATTERN.sub("", text)
+        return " ".join(text.split())
     
     def get_cues(self, project_id: int = 1) -> List[Cue]:
         """
@@ -0,0 +1,537 @@
+"""
+DubSync Subtitle Import
+
+Pluggable subtitle importers (SRT, ASS/SSA, WebVTT, EBU-STL).
+
+Every importer streams SRTEntry objects from an open file, so all
+formats share the batched insert path of ProjectManager.import_subtitles.
+Format detection looks at the buffered beginning of the file and hands
+the same stream to the chosen importer; the file is read only once.
+"""
+
+import html
+import io
+import re
+import unicodedata
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from dubsync.services.srt_parser import (
+    ENCODING_SAMPLE_SIZE, SRTEntry, SRTParser, detect_encoding
+)
+from dubsync.utils.time_utils import timecode_parts_to_ms
+from dubsync.i18n import t
+
+
+# =============================================================================
+# Base class and registry
+# =============================================================================
+
+class SubtitleImporter:
+    """
+    Base class for subtitle format importers.
+
+    Text formats implement iter_lines(); binary formats override
+    iter_stream(). Errors are collected in self.errors while iterating.
+    """
+
+    # Registry key, display name and file extensions (with dot)
+    format_id: str = ""
+    name: str = ""
+    extensions: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self.errors: List[str] = []
+
+    @classmethod
+    def sniff(cls, sample: bytes, head: str) -> bool:
+        """
+        Does the file look like this format.
+
+        Args:
+            sample: Raw beginning of the file
+            head: The same bytes decoded as text
+        """
+        return False
+
+    def iter_file(self, file_path: Path) -> Iterator[SRTEntry]:
+        """
+        Parse a subtitle file lazily.
+
+        Args:
+            file_path: Path to the file
+
+        Yields:
+            SRTEntry objects in file order
+        """
+        self.errors = []
+        with open_subtitle_file(file_path) as raw:
+            yield from self.iter_stream(raw)
+
+    def iter_stream(self, raw: BinaryIO) -> Iterator[SRTEntry]:
+        """
+        Parse an open binary stream.
+
+        The default decodes text with the encoding detected from the
+        buffered beginning of the stream.
+        """
+        encoding = detect_encoding(peek_sample(raw))
+        # newline=None translates \r\n and \r while reading
+        with io.TextIOWrapper(raw, encoding=encoding, errors="replace", newline=None) as text:
+            yield from self.iter_lines(text)
+
+    def iter_lines(self, lines: Iterable[str]) -> Iterator[SRTEntry]:
+        """
+        Parse decoded lines.
+        """
+        raise NotImplementedError
+
+
+_IMPORTERS: Dict[str, Type[SubtitleImporter]] = {}
+
+
+def register_importer(importer_cls: Type[SubtitleImporter]) -> Type[SubtitleImporter]:
+    """
+    Register an importer class (usable as a decorator).
+
+    Detection asks importers in registration order, so register more
+    specific formats before permissive ones.
+    """
+    _IMPORTERS[importer_cls.format_id] = importer_cls
+    return importer_cls
+
+
+def get_importers() -> List[Type[SubtitleImporter]]:
+    """
+    Registered importer classes in registration order.
+    """
+    return list(_IMPORTERS.values())
+
+
+def create_importer(format_id: Optional[str] = None) -> SubtitleImporter:
+    """
+    Create an importer.
+
+    Args:
+        format_id: Registered format, or None to detect it from the file
+
+    Raises:
+        ValueError: If the format is not registered
+    """
+    if format_id is None:
+        return AutoImporter()
+    if format_id not in _IMPORTERS:
+        raise ValueError(f"Unknown subtitle format: {format_id}")
+    return _IMPORTERS[format_id]()
+
+
+def detect_importer(sample: bytes, suffix: str = "") -> SubtitleImporter:
+    """
+    Choose an importer from the beginning of a file.
+
+    Content signatures win; the file extension is the fallback, then SRT.
+
+    Args:
+        sample: Raw beginning of the file
+        suffix: File extension (with dot)
+    """
+    head = sample.decode(detect_encoding(sample), errors="replace")
+    for importer_cls in _IMPORTERS.values():
+        if importer_cls.sniff(sample, head):
+            return importer_cls()
+    suffix = suffix.lower()
+    for importer_cls in _IMPORTERS.values():
+        if suffix in importer_cls.extensions:
+            return importer_cls()
+    return SRTImporter()
+
+
+def open_subtitle_file(file_path: Path) -> io.BufferedReader:
+    """
+    Open a file for importing.
+
+    The buffer holds a whole detection sample, so peek_sample() does not
+    consume or re-read anything.
+    """
+    return open(file_path, "rb", buffering=ENCODING_SAMPLE_SIZE)
+
+
+def peek_sample(raw: BinaryIO) -> bytes:
+    """
+    Beginning of a stream opened with open_subtitle_file, without consuming it.
+    """
+    return raw.peek(ENCODING_SAMPLE_SIZE)[:ENCODING_SAMPLE_SIZE]
+
+
+class AutoImporter(SubtitleImporter):
+    """
+    Importer that detects the format from the file itself.
+
+    After iteration has started, self.detected holds the importer used.
+    """
+
+    format_id = "auto"
+
+    def __init__(self):
+        super().__init__()
+        self.detected: Optional[SubtitleImporter] = None
+        self._suffix = ""
+
+    def iter_file(self, file_path: Path) -> Iterator[SRTEntry]:
+        self._suffix = Path(file_path).suffix
+        yield from super().iter_file(file_path)
+
+    def iter_stream(self, raw: BinaryIO) -> Iterator[SRTEntry]:
+        self.detected = detect_importer(peek_sample(raw), self._suffix)
+        self.detected.errors = self.errors
+        yield from self.detected.iter_stream(raw)
+
+
+# =============================================================================
+# Formats
+# =============================================================================
+
+def _clean_text(text: str) -> str:
+    """Collapse whitespace and line breaks into single spaces."""
+    return " ".join(text.split())
+
+
+class SRTImporter(SubtitleImporter):
+    """
+    SubRip importer, backed by SRTParser.
+    """
+
+    format_id = "srt"
+    name = "SubRip"
+    extensions = (".srt",)
+
+    @classmethod
+    def sniff(cls, sample: bytes, head: str) -> bool:
+        return "-->" in head
+
+    def iter_lines(self, lines: Iterable[str]) -> Iterator[SRTEntry]:
+        parser = SRTParser()
+        parser.errors = self.errors
+        yield from parser._iter_entries(lines)
+
+
+class ASSImporter(SubtitleImporter):
+    """
+    Advanced SubStation Alpha / SubStation Alpha importer.
+
+    Dialogue lines of the [Events] section become entries. The speaker
+    (Name/Actor field) goes to character_name; override blocks such as
+    {\\an8} or {\\i1} are kept in notes so positioning and styling hints
+    are not lost.
+    """
+
+    format_id = "ass"
+    name = "Advanced SubStation Alpha"
+    extensions = (".ass", ".ssa")
+
+    # Field order when the [Events] section has no Format line
+    DEFAULT_FIELDS = (
+        "layer", "start", "end", "style", "name",
+        "marginl", "marginr", "marginv", "effect", "text",
+    )
+
+    # H:MM:SS.cc
+    TIME_PATTERN = re.compile(r"(\d+):(\d{2}):(\d{2})[.:](\d{1,3})")
+    OVERRIDE_PATTERN = re.compile(r"\{[^}]*\}")
+
+    @classmethod
+    def sniff(cls, sample: bytes, head: str) -> bool:
+        lowered = head.lower()
+        return "[script info]" in lowered or "[events]" in lowered
+
+    def iter_lines(self, lines: Iterable[str]) -> Iterator[SRTEntry]:
+        section = ""
+        fields = self.DEFAULT_FIELDS
+        count = 0
+
+        for line_no, line in enumerate(lines, 1):
+            line = line.strip().lstrip("\ufeff")
+            if not line or line.startswith(";"):
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                section = line[1:-1].strip().lower()
+                continue
+            if section != "events":
+                continue
+
+            key, sep, value = line.partition(":")
+            key = key.strip().lower()
+            if not sep:
+                continue
+            if key == "format":
+                fields = tuple(field.strip().lower() for field in value.split(","))
+            elif key == "dialogue":
+                count += 1
+                if entry := self._parse_dialogue(value, fields, count, line_no):
+                    yield entry
+
+    def _parse_dialogue(
+        self, value: str, fields: Tuple[str, ...], index: int, line_no: int
+    ) -> Optional[SRTEntry]:
+        """
+        Process a single Dialogue line.
+
+        Args:
+            value: Line content after "Dialogue:"
+            fields: Field names from the Format line
+            index: Entry index
+            line_no: Line number (for errors)
+        """
+        values = value.lstrip().split(",", len(fields) - 1)
+        if len(values) < len(fields):
+            self.errors.append(t("services.import.invalid_line", line=line_no))
+            return None
+        record = dict(zip(fields, values))
+
+        start = self.TIME_PATTERN.fullmatch(record.get("start", "").strip())
+        end = self.TIME_PATTERN.fullmatch(record.get("end", "").strip())
+        if not start or not end:
+            self.errors.append(t("services.srt.invalid_time_format", line=line_no))
+            return None
+
+        text = record.get("text", "")
+        overrides = [tag for tag in self.OVERRIDE_PATTERN.findall(text) if tag != "{}"]
+        text = self.OVERRIDE_PATTERN.sub("", text)
+        text = text.replace("\\N", "\n").replace("\\n", "\n").replace("\\h", " ")
+
+        return SRTEntry(
+            index=index,
+            time_in_ms=timecode_parts_to_ms(*start.groups()),
+            time_out_ms=timecode_parts_to_ms(*end.groups()),
+            text=_clean_text(text),
+            character_name=(record.get("name") or record.get("actor") or "").strip(),
+            notes=" ".join(overrides),
+        )
+
+
+class VTTImporter(SubtitleImporter):
+    """
+    WebVTT importer.
+
+    The first voice span (<v Speaker>) goes to character_name; other
+    tags and inline timestamps are removed.
+    """
+
+    format_id = "vtt"
+    name = "WebVTT"
+    extensions = (".vtt",)
+
+    # [hh:]mm:ss.ttt --> [hh:]mm:ss.ttt [settings]
+    TIMING_PATTERN = re.compile(
+        r"(?:(\d+):)?(\d{2}):(\d{2})\.(\d{3})\s+-->\s+(?:(\d+):)?(\d{2}):(\d{2})\.(\d{3})"
+    )
+    VOICE_PATTERN = re.compile(r"<v(?:\.[^\s>]*)?\s+([^>]+)>")
+    TAG_PATTERN = re.compile(r"<[^>]+>")
+
+    # Blocks that carry no cue
+    SKIPPED_BLOCKS = ("WEBVTT", "NOTE", "STYLE", "REGION")
+
+    @classmethod
+    def sniff(cls, sample: bytes, head: str) -> bool:
+        return head.lstrip("\ufeff").startswith("WEBVTT")
+
+    def iter_lines(self, lines: Iterable[str]) -> Iterator[SRTEntry]:
+        block: List[str] = []
+        block_start = 0
+        count = 0
+
+        for line_no, line in enumerate(lines, 1):
+            line = line.rstrip("\n").lstrip("\ufeff")
+            if line.strip():
+                if not block:
+                    block_start = line_no
+                block.append(line.strip())
+                continue
+            if block:
+                # Only cue blocks are counted (not the header, NOTE, STYLE...)
+                if entry := self._parse_block(block, count + 1, block_start):
+                    count += 1
+                    yield entry
+                block = []
+
+        if block:
+            if entry := self._parse_block(block, count + 1, block_start):
+                yield entry
+
+    def _parse_block(self, lines: List[str], count: int, line_no: int) -> Optional[SRTEntry]:
+        """
+        Process a single cue block.
+
+        Args:
+            lines: Stripped, non-empty lines of the block
+            count: Cue number (default index)
+            line_no: Line number of the block's first line (for errors)
+        """
+        if lines[0].split(" ", 1)[0].split("\t", 1)[0] in self.SKIPPED_BLOCKS:
+            return None
+
+        timing_idx = 0 if "-->" in lines[0] else 1
+        timing = self.TIMING_PATTERN.match(lines[timing_idx]) if timing_idx < len(lines) else None
+        if not timing:
+            self.errors.append(t("services.srt.invalid_time_format", line=line_no + timing_idx))
+            return None
+
+        times = [part or "0" for part in timing.groups()]
+        text = "\n".join(lines[timing_idx + 1:])
+        voice = self.VOICE_PATTERN.search(text)
+        text = html.unescape(self.TAG_PATTERN.sub("", text))
+
+        identifier = lines[0] if timing_idx == 1 else ""
+        return SRTEntry(
+            index=int(identifier) if identifier.isdigit() else count,
+            time_in_ms=timecode_parts_to_ms(*times[:4]),
+            time_out_ms=timecode_parts_to_ms(*times[4:]),
+            text=_clean_text(text),
+            character_name=voice.group(1).strip() if voice else "",
+        )
+
+
+# ISO 6937 non-spacing diacritics (0xC1-0xCF) and their combining marks
+_ISO6937_DIACRITICS = {
+    0xC1: "\u0300", 0xC2: "\u0301", 0xC3: "\u0302", 0xC4: "\u0303",
+    0xC5: "\u0304", 0xC6: "\u0306", 0xC7: "\u0307", 0xC8: "\u0308",
+    0xCA: "\u030a", 0xCB: "\u0327", 0xCD: "\u030b", 0xCE: "\u0328",
+    0xCF: "\u030c",
+}
+
+# ISO 6937 spacing characters above 0x7F
+_ISO6937_CHARS = {
+    0xA0: "\u00a0", 0xA1: "¡", 0xA2: "¢", 0xA3: "£", 0xA5: "¥", 0xA7: "§",
+    0xA8: "¤", 0xA9: "‘", 0xAA: "“", 0xAB: "«", 0xB0: "°", 0xB1: "±",
+    0xB2: "²", 0xB3: "³", 0xB4: "×", 0xB5: "µ", 0xB6: "¶", 0xB7: "·",
+    0xB8: "÷", 0xB9: "’", 0xBA: "”", 0xBB: "»", 0xBC: "¼", 0xBD: "½",
+    0xBE: "¾", 0xBF: "¿", 0xD0: "―", 0xD1: "¹", 0xD2: "®", 0xD3: "©",
+    0xD4: "™", 0xD5: "♪", 0xE1: "Æ", 0xE2: "Đ", 0xE3: "ª", 0xE4: "Ħ",
+    0xE6: "Ĳ", 0xE7: "Ŀ", 0xE8: "Ł", 0xE9: "Ø", 0xEA: "Œ", 0xEB: "º",
+    0xEC: "Þ", 0xED: "Ŧ", 0xEE: "Ŋ", 0xEF: "ŉ", 0xF0: "ĸ", 0xF1: "æ",
+    0xF2: "đ", 0xF3: "ð", 0xF4: "ħ", 0xF5: "ı", 0xF6: "ĳ", 0xF7: "ŀ",
+    0xF8: "ł", 0xF9: "ø", 0xFA: "œ", 0xFB: "ß", 0xFC: "þ", 0xFD: "ŧ",
+    0xFE: "ŋ",
+}
+
+
+def _decode_iso6937(data: bytes) -> str:
+    """
+    Decode ISO 6937 (the EBU-STL Latin character table).
+
+    Diacritics precede their base letter and are composed with it.
+    """
+    chars = []
+    mark = ""
+    for byte in data:
+        if byte in _ISO6937_DIACRITICS:
+            mark = _ISO6937_DIACRITICS[byte]
+            continue
+        if 0x20 <= byte < 0x7F:
+            char = chr(byte)
+        else:
+            char = _ISO6937_CHARS.get(byte, "")
+        if mark:
+            char = unicodedata.normalize("NFC", char + mark) if char else ""
+            mark = ""
+        chars.append(char)
+    return "".join(chars)
+
+
+class STLImporter(SubtitleImporter):
+    """
+    EBU-STL (EBU Tech 3264) importer.
+
+    Reads the 1024-byte GSI header, then 128-byte TTI blocks. Extension
+    blocks of a subtitle are joined, comment and user data blocks are
+    skipped. Times are made relative to the programme start timecode
+    of the header.
+    """
+
+    format_id = "stl"
+    name = "EBU-STL"
+    extensions = (".stl",)
+
+    GSI_SIZE = 1024
+    TTI_SIZE = 128
+
+    # Text field filler after the last character
+    UNUSED_SPACE = 0x8F
+
+    # Character code table (GSI bytes 12-13) -> decoder
+    CHARACTER_TABLES = {
+        b"00": _decode_iso6937,
+        b"01": lambda data: data.decode("iso-8859-5", errors="replace"),
+        b"02": lambda data: data.decode("iso-8859-6", errors="replace"),
+        b"03": lambda data: data.decode("iso-8859-7", errors="replace"),
+        b"04": lambda data: data.decode("iso-8859-8", errors="replace"),
+    }
+
+    @classmethod
+    def sniff(cls, sample: bytes, head: str) -> bool:
+        # Disk format code, e.g. "STL25.01"
+        dfc = sample[3:11]
+        return len(dfc) == 8 and dfc.startswith(b"STL") and dfc[3:5].isdigit() and dfc[5:] == b".01"
+
+    def iter_stream(self, raw: BinaryIO) -> Iterator[SRTEntry]:
+        gsi = raw.read(self.GSI_SIZE)
+        if len(gsi) < self.GSI_SIZE or not self.sniff(gsi, ""):
+            self.errors.append(t("services.import.invalid_header", format=self.name))
+            return
+
+        fps = int(gsi[6:8]) or 25
+        decode = self.CHARACTER_TABLES.get(gsi[12:14], _decode_iso6937)
+        offset_ms = self._programme_start(gsi[256:264], fps)
+
+        count = 0
+        parts: List[bytes] = []
+        while len(block := raw.read(self.TTI_SIZE)) == self.TTI_SIZE:
+            extension = block[3]
+            if 0xF0 <= extension <= 0xFE or block[15]:
+                # User data or comment
+                continue
+            parts.append(block[16:])
+            if extension != 0xFF:
+                continue
+
+            count += 1
+            yield SRTEntry(
+                index=count,
+                time_in_ms=max(0, self._timecode(block[5:9], fps) - offset_ms),
+                time_out_ms=max(0, self._timecode(block[9:13], fps) - offset_ms),
+                text=_clean_text(decode(self._text_bytes(b"".join(parts)))),
+            )
+            parts = []
+
+    def _text_bytes(self, field: bytes) -> bytes:
+        """Text field with control codes replaced by spaces."""
+        text = bytearray()
+        for byte in field:
+            if byte == self.UNUSED_SPACE:
+                break
+            if byte < 0x20 or 0x80 <= byte <= 0x9F:
+                # Teletext attributes, styling and line breaks
+                byte = 0x20
+            text.append(byte)
+        return bytes(text)
+
+    @staticmethod
+    def _timecode(data: bytes, fps: int) -> int:
+        """Binary hours, minutes, seconds, frames -> ms."""
+        hours, minutes, seconds, frames = data
+        return ((hours * 60 + minutes) * 60 + seconds) * 1000 + frames * 1000 // fps
+
+    @staticmethod
+    def _programme_start(data: bytes, fps: int) -> int:
+        """ASCII HHMMSSFF -> ms (0 if missing)."""
+        if not data.isdigit():
+            return 0
+        values = bytes(int(data[i:i + 2]) for i in range(0, 8, 2))
+        return STLImporter._timecode(values, fps)
+
+
+# Detection order: binary signature first, permissive SRT last
+register_importer(STLImporter)
+register_importer(VTTImporter)
+register_importer(ASSImporter)
+register_importer(SRTImporter)
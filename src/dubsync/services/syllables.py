@@ -0,0 +1,171 @@
+"""
+DubSync Syllables
+
+Rule-based syllable counting for lip-sync estimation.
+
+Each language is described by a SyllableRules table. The table is
+compiled once into a str.translate() map that turns a text into a
+string of class markers (vowel, long vowel, digit, pause), so counting
+is a handful of C-level str.count() calls instead of per-character
+Python code.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Tuple
+
+
+# Class markers produced by the translate table. Control characters do
+# not occur in subtitle text, so they cannot be confused with letters.
+_VOWEL = "\x01"
+_LONG_VOWEL = "\x02"
+_DIGIT = "\x03"
+_SHORT_PAUSE = "\x04"
+_LONG_PAUSE = "\x05"
+
+_SHORT_PAUSE_CHARS = ",;:–—"
+_LONG_PAUSE_CHARS = ".!?…"
+
+# Distinct texts whose syllable weight is remembered
+SYLLABLE_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class SyllableRules:
+    """
+    Syllable counting rules of a language.
+    """
+    language: str                       # Language code
+    syllables_per_second: float         # Average speech rate
+    vowels: str                         # Short vowels (lowercase)
+    long_vowels: str = ""               # Long vowels, counted with extra weight
+    long_vowel_weight: float = 0.0      # Extra syllables per long vowel
+    merge_vowel_groups: bool = False    # Adjacent vowels form one syllable
+    silent_endings: Tuple[str, ...] = ()  # Regexes of word endings that add no syllable
+    digit_weight: float = 1.0           # Syllables per digit (numbers are read out)
+    short_pause_weight: float = 0.5     # Syllables per comma-like pause
+    long_pause_weight: float = 1.0      # Syllables per sentence-end pause
+
+
+HUNGARIAN_RULES = SyllableRules(
+    language="hu",
+    syllables_per_second=6.5,
+    vowels="aeiouöü",
+    long_vowels="áéíóőúű",
+    long_vowel_weight=0.3,
+)
+
+ENGLISH_RULES = SyllableRules(
+    language="en",
+    syllables_per_second=5.5,
+    vowels="aeiouy",
+    merge_vowel_groups=True,
+    silent_endings=(
+        # Final silent e after a consonant ("make", "here"), but not "-le" ("table")
+        r"(?<=[aeiouy])[^\W\daeiouy]*[^\W\daeiouyl]e\b",
+        # "-ed" that is not pronounced ("walked"), but not "-ted"/"-ded"
+        r"(?<=[aeiouy])[^\W\daeiouy]*[^\W\daeiouytd]ed\b",
+    ),
+)
+
+
+class SyllableCounter:
+    """
+    Compiled form of a SyllableRules table.
+    """
+
+    def __init__(self, rules: SyllableRules):
+        """
+        Initialization.
+
+        Args:
+            rules: Language rules to compile
+        """
+        self.rules = rules
+        classes: Dict[int, str] = {}
+        for chars, marker in (
+            (rules.vowels, _VOWEL),
+            (rules.long_vowels, _LONG_VOWEL),
+            ("0123456789", _DIGIT),
+            (_SHORT_PAUSE_CHARS, _SHORT_PAUSE),
+            (_LONG_PAUSE_CHARS, _LONG_PAUSE),
+        ):
+            for char in chars:
+                classes[ord(char)] = marker
+                classes[ord(char.upper())] = marker
+        # Strip stray control characters so they cannot pose as markers
+        for code in range(1, 6):
+            classes.setdefault(code, None)
+        self._table = str.maketrans(classes)
+        self._vowel_groups = re.compile(f"[{_VOWEL}{_LONG_VOWEL}]+")
+        self._silent = (
+            re.compile("|".join(rules.silent_endings), re.IGNORECASE)
+            if rules.silent_endings else None
+        )
+
+    def count(self, text: str) -> float:
+        """
+        Weighted syllable count of a text.
+
+        Long vowels, digits and pauses add their configured weights.
+
+        Args:
+            text: Text (instructions already removed)
+
+        Returns:
+            Syllable count (float because of the weights)
+        """
+        return _cached_count(text, self)
+
+    def _count(self, text: str) -> float:
+        rules = self.rules
+        classes = text.translate(self._table)
+        long_vowels = classes.count(_LONG_VOWEL)
+
+        if rules.merge_vowel_groups:
+            syllables = len(self._vowel_groups.findall(classes))
+        else:
+            syllables = classes.count(_VOWEL) + long_vowels
+        if self._silent is not None:
+            syllables -= len(self._silent.findall(text))
+
+        return (
+            syllables
+            + long_vowels * rules.long_vowel_weight
+            + classes.count(_DIGIT) * rules.digit_weight
+            + classes.count(_SHORT_PAUSE) * rules.short_pause_weight
+            + classes.count(_LONG_PAUSE) * rules.long_pause_weight
+        )
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def _cached_count(text: str, counter: SyllableCounter) -> float:
+    """Cached body of SyllableCounter.count()."""
+    return counter._count(text)
+
+
+# Compiled once at import
+SYLLABLE_COUNTERS: Dict[str, SyllableCounter] = {
+    rules.language: SyllableCounter(rules)
+    for rules in (HUNGARIAN_RULES, ENGLISH_RULES)
+}
+
+
+def get_syllable_counter(language: str) -> SyllableCounter:
+    """
+    Compiled counter of a language.
+
+    Raises:
+        ValueError: If there are no rules for the language
+    """
+    if language not in SYLLABLE_COUNTERS:
+        raise ValueError(f"No syllable rules for language: {language}")
+    return SYLLABLE_COUNTERS[language]
+
+
+def count_syllables(text: str, language: str = "hu") -> float:
+    """
+    Weighted syllable count of a text.
+    """
+    return get_syllable_counter(language).count(text)
@@ -0,0 +1,204 @@
+"""
+DubSync Term Matcher
+
+Aho-Corasick multi-pattern matcher for glossary terms.
+
+All terms are compiled into one trie with failure links, so finding
+every term in a text is a single pass over the text regardless of the
+number of terms. Matching is case-insensitive and respects word
+boundaries; with stem matching a term also matches at the start of a
+longer word (ship -> ships, hajó -> hajónak), which covers most
+inflected forms without a lemmatizer.
+
+Adding or removing a term updates the trie in place; the failure links
+are recomputed lazily, once, before the next search.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+
+def fold_case(text: str) -> str:
+    """
+    Case-fold a text without changing its length.
+
+    Characters whose case folding expands (ß -> ss) are kept as they
+    are, so match positions stay valid in the original text.
+    """
+    folded = text.casefold()
+    if len(folded) == len(text):
+        return folded
+    return "".join(
+        low if len(low := char.casefold()) == 1 else char
+        for char in text
+    )
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class TermMatch(NamedTuple):
+    """A term found in a text."""
+    start: int      # Start offset in the text
+    end: int        # End offset (exclusive)
+    term: str       # Matched term (as added)
+    value: Any      # Value registered with the term
+
+
+class TermMatcher:
+    """
+    Compiled set of terms with attached values.
+
+    The same term may be added with several values (e.g. glossary
+    entries sharing a source term); every value is reported.
+    """
+
+    def __init__(self, stem_matching: bool = False):
+        """
+        Initialization.
+
+        Args:
+            stem_matching: Terms may be followed by more word characters
+        """
+        self.stem_matching = stem_matching
+        self._reset()
+
+    def _reset(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._depth: List[int] = [0]
+        self._outputs: Dict[int, List[tuple]] = {}  # node -> (term, value) ending there
+        # Filled by _build_links()
+        self._fail: List[int] = []
+        self._output_link: List[int] = []  # Nearest suffix node with outputs
+        self._links_valid = False
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, term: str, value: Any = None) -> None:
+        """Add a term (empty or whitespace-only terms are ignored)."""
+        key = fold_case(term.strip())
+        if not key:
+            return
+        goto, depth = self._goto, self._depth
+        node = 0
+        for char in key:
+            nxt = goto[node].get(char)
+            if nxt is None:
+                nxt = len(goto)
+                goto[node][char] = nxt
+                goto.append({})
+                depth.append(depth[node] + 1)
+            node = nxt
+        self._outputs.setdefault(node, []).append((term.strip(), value))
+        self._count += 1
+        self._links_valid = False
+
+    def remove(self, term: str, value: Any = None) -> bool:
+        """
+        Remove a term added with the given value.
+
+        Trie nodes are kept; they only cost memory until the next
+        clear().
+
+        Returns:
+            True if the term was found
+        """
+        node = self._find_node(fold_case(term.strip()))
+        if node is None:
+            return False
+        outputs = self._outputs.get(node, [])
+        for i, (_, stored) in enumerate(outputs):
+            if stored is value:
+                del outputs[i]
+                if not outputs:
+                    del self._outputs[node]
+                self._count -= 1
+                self._links_valid = False
+                return True
+        return False
+
+    def clear(self) -> None:
+        """Remove every term."""
+        self._reset()
+
+    def _find_node(self, key: str):
+        node = 0
+        for char in key:
+            node = self._goto[node].get(char)
+            if node is None:
+                return None
+        return node if key else None
+
+    def _build_links(self) -> None:
+        """Breadth-first computation of failure and output links."""
+        goto, outputs = self._goto, self._outputs
+        fail = self._fail = [0] * len(goto)
+        output_link = self._output_link = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(char, 0)
+                fail[child] = target if target != child else 0
+                output_link[child] = target if target in outputs else output_link[target]
+                queue.append(child)
+        self._links_valid = True
+
+    def iter_matches(self, text: str) -> Iterator[TermMatch]:
+        """
+        Every term occurrence in a text, including overlapping ones.
+
+        Matches are reported in order of their end offset.
+        """
+        if not self._links_valid:
+            self._build_links()
+        goto, fail, outputs, output_link, depth = (
+            self._goto, self._fail, self._outputs, self._output_link, self._depth
+        )
+        folded = fold_case(text)
+        length = len(folded)
+        stem = self.stem_matching
+        node = 0
+        for i, char in enumerate(folded):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if not node:
+                continue
+            hit = node if node in outputs else output_link[node]
+            if not hit:
+                continue
+            end = i + 1
+            if not stem and end < length and _is_word_char(folded[end]) and _is_word_char(folded[i]):
+                continue
+            while hit:
+                start = end - depth[hit]
+                if start == 0 or not _is_word_char(folded[start - 1]) or not _is_word_char(folded[start]):
+                    for term, value in outputs[hit]:
+                        yield TermMatch(start, end, term, value)
+                hit = output_link[hit]
+
+    def find_all(self, text: str) -> List[TermMatch]:
+        """
+        Leftmost-longest, non-overlapping term occurrences.
+
+        All values of the chosen occurrence are returned.
+        """
+        matches = sorted(self.iter_matches(text), key=lambda m: (m.start, -m.end))
+        result: List[TermMatch] = []
+        covered = 0
+        chosen = None
+        for match in matches:
+            if chosen is not None and (match.start, match.end) == chosen:
+                result.append(match)
+            elif match.start >= covered:
+                chosen = (match.start, match.end)
+                covered = match.end
+                result.append(match)
+        return result
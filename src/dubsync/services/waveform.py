@@ -0,0 +1,420 @@
+"""
+DubSync Waveform
+
+Audio peak extraction for the timeline waveform lane.
+
+Audio is decoded once into a min/max peak pyramid: level 0 holds one
+(min, max) pair per few milliseconds, every further level halves the
+resolution. The timeline reads only the level matching its zoom, so
+zooming and scrolling never touch the audio again. The pyramid is cached
+in a small file next to the project.
+"""
+
+import shutil
+import struct
+import subprocess
+import sys
+import wave
+from array import array
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from dubsync.services.logger import get_logger
+
+
+# Target duration of a level 0 bucket
+BASE_BUCKET_MS = 4
+
+# Sample rate requested from ffmpeg; plenty for a visual envelope
+DECODE_SAMPLE_RATE = 8000
+
+PEAKS_SUFFIX = ".peaks"
+
+_MAGIC = b"DSPK"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHIIqqI")  # magic, version, rate, bucket, size, mtime, levels
+_LEVEL_HEADER = struct.Struct("<I")
+
+_CHUNK_BYTES = 64 * 1024
+_FLIP_SIGN = bytes(b ^ 0x80 for b in range(256))
+
+
+class WaveformError(Exception):
+    """Audio could not be decoded."""
+    pass
+
+
+def _to_little_endian(samples: array) -> array:
+    """Swap byte order on big-endian hosts (cache files are little-endian)."""
+    if sys.byteorder == "big":
+        samples = array(samples.typecode, samples)
+        samples.byteswap()
+    return samples
+
+
+def _pcm16(raw: bytes, sample_width: int) -> array:
+    """
+    Convert little-endian PCM of any common width to 16-bit samples.
+
+    Only the most significant 16 bits are kept; that is plenty for
+    drawing.
+    """
+    if sample_width == 2:
+        data = raw
+    elif sample_width == 1:
+        # Unsigned 8-bit: flip the sign bit and use it as the high byte
+        out = bytearray(2 * len(raw))
+        out[1::2] = raw.translate(_FLIP_SIGN)
+        data = bytes(out)
+    elif sample_width in (3, 4):
+        out = bytearray(2 * (len(raw) // sample_width))
+        out[0::2] = raw[sample_width - 2::sample_width]
+        out[1::2] = raw[sample_width - 1::sample_width]
+        data = bytes(out)
+    else:
+        raise WaveformError(f"Unsupported sample width: {sample_width}")
+
+    samples = array("h")
+    samples.frombytes(data)
+    return _to_little_endian(samples)
+
+
+class PeakPyramid:
+    """
+    Multi-resolution min/max envelope of an audio track.
+
+    Level 0 buckets span bucket_frames audio frames (all channels
+    merged); level n buckets span bucket_frames * 2**n frames.
+    """
+
+    def __init__(self, sample_rate: int, bucket_frames: int,
+                 levels: List[Tuple[array, array]]):
+        """
+        Initialization.
+
+        Args:
+            sample_rate: Audio sample rate
+            bucket_frames: Frames per level 0 bucket
+            levels: (mins, maxs) arrays per level, finest first
+        """
+        self.sample_rate = sample_rate
+        self.bucket_frames = bucket_frames
+        self.levels = levels
+
+    @property
+    def duration_ms(self) -> float:
+        """Approximate audio duration."""
+        if not self.levels:
+            return 0.0
+        return len(self.levels[0][0]) * self.bucket_ms(0)
+
+    def bucket_ms(self, level: int) -> float:
+        """Duration of one bucket on a level."""
+        return self.bucket_frames * (1 << level) * 1000.0 / self.sample_rate
+
+    def select_level(self, ms_per_pixel: float) -> int:
+        """
+        Coarsest level whose buckets are not wider than a pixel.
+
+        Falls back to level 0 when zoomed in beyond its resolution.
+        """
+        level = 0
+        while level + 1 < len(self.levels) and self.bucket_ms(level + 1) <= ms_per_pixel:
+            level += 1
+        return level
+
+    def column_peaks(self, start_ms: float, ms_per_pixel: float,
+                     count: int) -> List[Optional[Tuple[int, int]]]:
+        """
+        Min/max per pixel column.
+
+        Args:
+            start_ms: Time at the left edge of the first column
+            ms_per_pixel: Column width in milliseconds
+            count: Number of columns
+
+        Returns:
+            (min, max) per column, None past the end of the audio
+        """
+        if not self.levels:
+            return [None] * count
+
+        level = self.select_level(ms_per_pixel)
+        mins, maxs = self.levels[level]
+        bucket_ms = self.bucket_ms(level)
+        total = len(mins)
+
+        result: List[Optional[Tuple[int, int]]] = []
+        for column in range(count):
+            t0 = start_ms + column * ms_per_pixel
+            first = int(t0 / bucket_ms) if t0 > 0 else 0
+            last = max(first + 1, int((t0 + ms_per_pixel) / bucket_ms))
+            if first >= total:
+                result.append(None)
+                continue
+            last = min(last, total)
+            result.append((min(mins[first:last]), max(maxs[first:last])))
+        return result
+
+    # =========================================================================
+    # Cache file
+    # =========================================================================
+
+    def save(self, path: Path, source_key: Tuple[int, int]) -> None:
+        """
+        Write the pyramid to a cache file.
+
+        Args:
+            path: Cache file path
+            source_key: (size, mtime_ns) of the decoded media file
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(
+                _MAGIC, _VERSION, self.sample_rate, self.bucket_frames,
+                source_key[0], source_key[1], len(self.levels)
+            ))
+            for mins, maxs in self.levels:
+                f.write(_LEVEL_HEADER.pack(len(mins)))
+                f.write(_to_little_endian(mins).tobytes())
+                f.write(_to_little_endian(maxs).tobytes())
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, source_key: Tuple[int, int]) -> Optional["PeakPyramid"]:
+        """
+        Read a cache file.
+
+        Returns:
+            PeakPyramid, or None if the file is missing, damaged or was
+            built from a different version of the media file
+        """
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            magic, version, rate, bucket, size, mtime, count = _HEADER.unpack_from(data, 0)
+            if magic != _MAGIC or version != _VERSION or (size, mtime) != tuple(source_key):
+                return None
+
+            offset = _HEADER.size
+            levels = []
+            for _ in range(count):
+                (length,) = _LEVEL_HEADER.unpack_from(data, offset)
+                offset += _LEVEL_HEADER.size
+                arrays = []
+                for _ in range(2):
+                    values = array("h")
+                    values.frombytes(data[offset:offset + 2 * length])
+                    if len(values) != length:
+                        return None
+                    arrays.append(_to_little_endian(values))
+                    offset += 2 * length
+                levels.append((arrays[0], arrays[1]))
+        except struct.error:
+            return None
+
+        return cls(rate, bucket, levels)
+
+
+class PeakPyramidBuilder:
+    """
+    Incremental pyramid builder.
+
+    Feed interleaved 16-bit sample chunks of any size with add(), then
+    call finish().
+    """
+
+    def __init__(self, sample_rate: int, channels: int = 1,
+                 bucket_frames: Optional[int] = None):
+        """
+        Initialization.
+
+        Args:
+            sample_rate: Audio sample rate
+            channels: Interleaved channel count
+            bucket_frames: Frames per level 0 bucket (default: ~4 ms)
+        """
+        if sample_rate <= 0 or channels <= 0:
+            raise WaveformError("Invalid audio format")
+        self.sample_rate = sample_rate
+        self.bucket_frames = bucket_frames or max(1, sample_rate * BASE_BUCKET_MS // 1000)
+        self._bucket_samples = self.bucket_frames * channels
+        self._carry = array("h")
+        self._mins = array("h")
+        self._maxs = array("h")
+
+    def add(self, samples: array) -> None:
+        """Add interleaved 16-bit samples."""
+        if self._carry:
+            samples = self._carry + samples
+        n = self._bucket_samples
+        full = len(samples) - len(samples) % n
+        mins, maxs = self._mins, self._maxs
+        for i in range(0, full, n):
+            bucket = samples[i:i + n]
+            mins.append(min(bucket))
+            maxs.append(max(bucket))
+        self._carry = samples[full:]
+
+    def finish(self) -> PeakPyramid:
+        """Flush the last partial bucket and build the coarser levels."""
+        if self._carry:
+            self._mins.append(min(self._carry))
+            self._maxs.append(max(self._carry))
+            self._carry = array("h")
+
+        levels = [(self._mins, self._maxs)]
+        mins, maxs = self._mins, self._maxs
+        while len(mins) > 1:
+            next_mins = array("h", map(min, mins[0::2], mins[1::2]))
+            next_maxs = array("h", map(max, maxs[0::2], maxs[1::2]))
+            if len(mins) % 2:
+                next_mins.append(mins[-1])
+                next_maxs.append(maxs[-1])
+            mins, maxs = next_mins, next_maxs
+            levels.append((mins, maxs))
+
+        return PeakPyramid(self.sample_rate, self.bucket_frames, levels)
+
+
+# =============================================================================
+# Decoding
+# =============================================================================
+
+def _read_wav(path: Path, should_cancel: Callable[[], bool]) -> Tuple[int, int, Iterator[array]]:
+    """Open a WAV file as a stream of 16-bit sample chunks."""
+    try:
+        wav = wave.open(str(path), "rb")
+    except (wave.Error, EOFError) as e:
+        raise WaveformError(str(e)) from e
+
+    sample_width = wav.getsampwidth()
+    channels = wav.getnchannels()
+    frames_per_chunk = max(1, _CHUNK_BYTES // (sample_width * channels))
+
+    def chunks() -> Iterator[array]:
+        with wav:
+            while not should_cancel():
+                raw = wav.readframes(frames_per_chunk)
+                if not raw:
+                    break
+                yield _pcm16(raw, sample_width)
+
+    return wav.getframerate(), channels, chunks()
+
+
+def _read_ffmpeg(path: Path, should_cancel: Callable[[], bool]) -> Tuple[int, int, Iterator[array]]:
+    """Decode any media file's audio through ffmpeg as mono 16-bit PCM."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise WaveformError("ffmpeg not found; only WAV audio can be decoded")
+
+    process = subprocess.Popen(
+        [ffmpeg, "-v", "error", "-nostdin", "-i", str(path), "-vn",
+         "-ac", "1", "-ar", str(DECODE_SAMPLE_RATE), "-f", "s16le", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+
+    def chunks() -> Iterator[array]:
+        pending = b""
+        try:
+            while not should_cancel():
+                raw = process.stdout.read(_CHUNK_BYTES)
+                if not raw:
+                    break
+                raw = pending + raw
+                usable = len(raw) - len(raw) % 2
+                pending = raw[usable:]
+                yield _pcm16(raw[:usable], 2)
+        finally:
+            if process.poll() is None:
+                process.kill()
+            _, stderr = process.communicate()
+        if process.returncode not in (0, None) and not should_cancel():
+            raise WaveformError(stderr.decode("utf-8", "replace").strip() or "ffmpeg failed")
+
+    return DECODE_SAMPLE_RATE, 1, chunks()
+
+
+def build_peaks(media_path: Path,
+                should_cancel: Optional[Callable[[], bool]] = None) -> Optional[PeakPyramid]:
+    """
+    Decode a media file into a peak pyramid.
+
+    WAV files are read directly; everything else goes through ffmpeg.
+
+    Args:
+        media_path: Audio or video file
+        should_cancel: Polled between chunks; returning True aborts
+
+    Returns:
+        PeakPyramid, or None if cancelled
+
+    Raises:
+        WaveformError: If the audio cannot be decoded
+    """
+    should_cancel = should_cancel or (lambda: False)
+    try:
+        if media_path.suffix.lower() == ".wav":
+            sample_rate, channels, chunks = _read_wav(media_path, should_cancel)
+        else:
+            sample_rate, channels, chunks = _read_ffmpeg(media_path, should_cancel)
+
+        builder = PeakPyramidBuilder(sample_rate, channels)
+        for chunk in chunks:
+            builder.add(chunk)
+    except OSError as e:
+        # Unreadable file, ffmpeg failing to start, read errors mid-stream
+        raise WaveformError(str(e)) from e
+    if should_cancel():
+        return None
+    return builder.finish()
+
+
+def peaks_cache_path(project_path: Path) -> Path:
+    """Cache file stored next to a project file."""
+    return project_path.with_name(project_path.name + PEAKS_SUFFIX)
+
+
+def media_key(media_path: Path) -> Tuple[int, int]:
+    """(size, mtime_ns) identifying a version of a media file."""
+    stat = media_path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def load_or_build_peaks(media_path: Path, cache_path: Optional[Path] = None,
+                        should_cancel: Optional[Callable[[], bool]] = None
+                        ) -> Optional[PeakPyramid]:
+    """
+    Load cached peaks or decode the media file once and cache them.
+
+    Args:
+        media_path: Audio or video file
+        cache_path: Cache file, or None to skip caching
+        should_cancel: Polled while decoding
+
+    Returns:
+        PeakPyramid, or None if cancelled
+
+    Raises:
+        WaveformError: If the audio cannot be decoded
+    """
+    try:
+        key = media_key(media_path)
+    except OSError as e:
+        raise WaveformError(str(e)) from e
+
+    if cache_path is not None:
+        if pyramid := PeakPyramid.load(cache_path, key):
+            return pyramid
+
+    pyramid = build_peaks(media_path, should_cancel)
+    if pyramid is not None and cache_path is not None:
+        try:
+            pyramid.save(cache_path, key)
+        except OSError as e:
+            get_logger("waveform").warning(f"Could not write peak cache {cache_path}: {e}")
+    return pyramid
@@ -4,6 +4,7 @@ DubSync Cue Editor Widget
 Cue editor panel for translation and editing.
 """
 
+import copy
 from typing import Optional
 
 from PySide6.QtWidgets import (
@@ -12,7 +13,7 @@ from PySide6.QtWidgets import (
     QFrame, QSizePolicy, QDialog, QDialogButtonBox, QSpinBox,
     QSplitter, QToolButton
 )
-from PySide6.QtCore import Qt, Signal, Slot, QSize
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QTimer
 from PySide6.QtGui import QColor, QPalette
 
 from dubsync.models.cue import Cue
@@ -151,14 +152,25 @@ class CueEditorWidget(QWidget):
     cue_saved = Signal()
     status_changed = Signal()
     timing_changed = Signal()
+    translation_edited = Signal(str)  # Typed translation text (not emitted by set_cue)
+    
+    # Keystrokes within this delay share one lip-sync update
+    LIPSYNC_UPDATE_DELAY_MS = 150
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
-        self._cue: Optional[Cue] = None
+        self._cue: Optional[Cue] = None          # Working copy, edited freely
+        self._saved_cue: Optional[Cue] = None    # Shared cached cue, restored by reset
+        self._setting_cue = False
         self._lip_sync_estimator = LipSyncEstimator()
         self._is_dirty = False
         
+        self._lipsync_timer = QTimer(self)
+        self._lipsync_timer.setSingleShot(True)
+        self._lipsync_timer.setInterval(self.LIPSYNC_UPDATE_DELAY_MS)
+        self._lipsync_timer.timeout.connect(self._update_lipsync)
+        
         self._setup_ui()
         self._connect_signals()
         self._update_ui_state()
@@ -596,6 +608,13 @@ class CueEditorWidget(QWidget):
         self.source_text.setReadOnly(locked)
         self._update_source_text_style()
     
+    def set_lip_sync_estimator(self, estimator: LipSyncEstimator):
+        """
+        Replace the lip-sync estimator (e.g. after a speech rate change).
+        """
+        self._lip_sync_estimator = estimator
+        self._update_lipsync()
+    
     def apply_theme(self):
         """Apply theme - call on theme change."""
         self._update_source_text_style()
@@ -619,10 +638,12 @@ class CueEditorWidget(QWidget):
         Set cue for editing.
         
         Args:
-            cue: Cue object
+            cue: Cue object (never modified; edits go to a copy)
         """
-        self._cue = cue
+        self._saved_cue = cue
+        self._cue = copy.copy(cue)
         self._is_dirty = False
+        self._setting_cue = True
         
         # Update header
         self.index_label.setText(f"#{cue.cue_index}")
@@ -637,14 +658,16 @@ class CueEditorWidget(QWidget):
         self.translated_text.setPlainText(cue.translated_text)
         self.notes_edit.setPlainText(cue.notes)
         self.sfx_edit.setPlainText(cue.sfx_notes)
+        self._setting_cue = False
         
         # Update status
         index = self.status_combo.findData(cue.status.value)
         if index >= 0:
             self.status_combo.setCurrentIndex(index)
         
-        # Update lip-sync
+        # Update lip-sync now; the edits above need no deferred update
         self._update_lipsync()
+        self._lipsync_timer.stop()
         
         self._update_ui_state()
     
@@ -652,26 +675,30 @@ class CueEditorWidget(QWidget):
         """
         Get edited cue.
         
+        The cue given to set_cue() is left untouched; the caller saves
+        the returned copy and updates the cache once the save succeeded.
+        
         Returns:
-            Cue object with current values
+            Copy of the cue with current values
         """
         if self._cue is None:
             return None
         
-        self._cue.character_name = self.character_edit.text()
-        self._cue.source_text = self.source_text.toPlainText()  # Allow editing if unlocked
-        self._cue.translated_text = self.translated_text.toPlainText()
-        self._cue.notes = self.notes_edit.toPlainText()
-        self._cue.sfx_notes = self.sfx_edit.toPlainText()
+        cue = self._cue
+        cue.character_name = self.character_edit.text()
+        cue.source_text = self.source_text.toPlainText()  # Allow editing if unlocked
+        cue.translated_text = self.translated_text.toPlainText()
+        cue.notes = self.notes_edit.toPlainText()
+        cue.sfx_notes = self.sfx_edit.toPlainText()
         
         status_value = self.status_combo.currentData()
-        self._cue.status = CueStatus(status_value)
+        cue.status = CueStatus(status_value)
         
         # Update lip-sync ratio
-        if self._cue.translated_text:
-            self._lip_sync_estimator.update_cue_ratio(self._cue)
+        if cue.translated_text:
+            self._lip_sync_estimator.update_cue_ratio(cue)
         
-        return self._cue
+        return copy.copy(cue)
     
     def _update_lipsync(self):
         """Update lip-sync indicator with visual progress bar."""
@@ -692,7 +719,7 @@ class CueEditorWidget(QWidget):
         
         result = self._lip_sync_estimator.estimate(text, self._cue.duration_ms, source_for_calc)
         
-        # Update cue's lip_sync_ratio for synchronization with cue_list
+        # Only the working copy changes; the cue list sees it after saving
         self._cue.lip_sync_ratio = result.ratio
         
         # Update indicator color and text using same thresholds as cue_list
@@ -752,7 +779,10 @@ class CueEditorWidget(QWidget):
     def _on_text_changed(self):
         """Text changed."""
         self._mark_dirty()
-        self._update_lipsync()
+        # Restarting the timer coalesces fast typing into one update
+        self._lipsync_timer.start()
+        if not self._setting_cue:
+            self.translation_edited.emit(self.translated_text.toPlainText())
     
     @Slot()
     def _on_status_changed(self):
@@ -778,8 +808,8 @@ class CueEditorWidget(QWidget):
     @Slot()
     def _on_reset(self):
         """Reset."""
-        if self._cue:
-            self.set_cue(self._cue)
+        if self._saved_cue:
+            self.set_cue(self._saved_cue)
     
     @Slot()
     def _on_approve(self):
@@ -808,7 +838,9 @@ class CueEditorWidget(QWidget):
     def clear(self):
         """Clear editor."""
         self._cue = None
+        self._saved_cue = None
         self._is_dirty = False
+        self._lipsync_timer.stop()
         
         self.index_label.setText(t("cue_editor.index"))
         self.time_label.setText("00:00:00 → 00:00:00")
@@ -835,7 +867,8 @@ class CueEditorWidget(QWidget):
         Show timing editor dialog.
         
         Args:
-            cue: Cue to edit
+            cue: Cue to edit (never modified; the new times go to the
+                editor's copy, read back with get_cue())
         """
         dialog = TimingEditorDialog(cue, self)
         if dialog.exec():
@@ -843,18 +876,16 @@ class CueEditorWidget(QWidget):
             time_out = dialog.get_time_out_ms()
             
             if time_out > time_in:
-                cue.time_in_ms = time_in
-                cue.time_out_ms = time_out
+                if self._cue is None or self._cue.id != cue.id:
+                    self.set_cue(cue)
                 
-                # Update the current cue reference if it's the same
-                if self._cue and self._cue.id == cue.id:
-                    self._cue.time_in_ms = time_in
-                    self._cue.time_out_ms = time_out
-                    self.time_label.setText(
-                        f"{cue.time_in_timecode[:8]} → {cue.time_out_timecode[:8]}"
-                    )
-                    self.duration_label.setText(f"({format_duration(cue.duration_ms)})")
-                    self._update_lipsync()
+                self._cue.time_in_ms = time_in
+                self._cue.time_out_ms = time_out
+                self.time_label.setText(
+                    f"{self._cue.time_in_timecode[:8]} → {self._cue.time_out_timecode[:8]}"
+                )
+                self.duration_label.setText(f"({format_duration(self._cue.duration_ms)})")
+                self._update_lipsync()
                 
-                # Emit signal with the modified cue
+                # Emit signal; the new times are read back with get_cue()
                 self.timing_changed.emit()
@@ -4,19 +4,22 @@ DubSync Cue List Widget
 Cue list display and management.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QHeaderView, QAbstractItemView, QLineEdit, QComboBox, QLabel,
-    QPushButton, QMenu
+    QMenu
+)
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel, QItemSelection
 )
-from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QColor, QBrush, QAction
 
 from dubsync.models.cue import Cue
 from dubsync.utils.constants import (
-    CueStatus, LipSyncStatus,
+    CueStatus,
     COLOR_LIPSYNC_GOOD, COLOR_LIPSYNC_WARNING, COLOR_LIPSYNC_TOO_LONG,
     COLOR_STATUS_NEW, COLOR_STATUS_TRANSLATED, COLOR_STATUS_NEEDS_REVISION, COLOR_STATUS_APPROVED,
     LIPSYNC_THRESHOLD_GOOD, LIPSYNC_THRESHOLD_WARNING
@@ -26,6 +29,236 @@ from dubsync.i18n import t
 from dubsync.resources.icon_manager import get_icon_manager
 
 
+class CueTableModel(QAbstractTableModel):
+    """
+    Table model over the project's cues.
+    
+    Cells are rendered on demand in data(). The model keeps an id -> row
+    map next to the row list (rebuilt by set_cues(), which also handles
+    inserts and deletes), so every lookup by cue id is a dict access and
+    single-cue changes repaint one row.
+    """
+    
+    # Column indices
+    COL_INDEX = 0
+    COL_TIME_IN = 1
+    COL_TIME_OUT = 2
+    COL_CHARACTER = 3
+    COL_TEXT = 4
+    COL_STATUS = 5
+    COL_LIPSYNC = 6
+    COLUMN_COUNT = 7
+    
+    CueRole = Qt.ItemDataRole.UserRole + 1
+    
+    _CENTERED = frozenset((COL_INDEX, COL_TIME_IN, COL_TIME_OUT, COL_STATUS, COL_LIPSYNC))
+    _UNTRANSLATED_BRUSH = QBrush(QColor("#999999"))
+    _STATUS_TEXT_BRUSH = QBrush(QColor("#FFFFFF"))
+    _HIGHLIGHT_BRUSH = QBrush(QColor("#FFFACD"))  # Light yellow
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cues: List[Cue] = []
+        self._row_of: Dict[int, int] = {}  # cue_id -> row
+        self._highlighted_cue_id: Optional[int] = None
+        self._highlighted_row: int = -1
+        self._headers = [
+            t("cue_list.columns.index"),
+            t("cue_list.columns.time_in"),
+            t("cue_list.columns.time_out"),
+            t("cue_list.columns.character"),
+            t("cue_list.columns.text"),
+            t("cue_list.columns.status"),
+            t("cue_list.columns.lipsync"),
+        ]
+        self._status_display = {
+            CueStatus.NEW: (t("status.new"), QBrush(QColor(COLOR_STATUS_NEW))),
+            CueStatus.TRANSLATED: (t("status.translated"), QBrush(QColor(COLOR_STATUS_TRANSLATED))),
+            CueStatus.NEEDS_REVISION: (t("status.needs_revision"), QBrush(QColor(COLOR_STATUS_NEEDS_REVISION))),
+            CueStatus.APPROVED: (t("status.approved"), QBrush(QColor(COLOR_STATUS_APPROVED))),
+        }
+        self._unknown_status = ("?", QBrush(QColor("#999999")))
+        self._lipsync_display = {
+            None: ("?", QBrush(QColor("#CCCCCC"))),
+            "good": ("✓", QBrush(QColor(COLOR_LIPSYNC_GOOD))),
+            "warning": ("!", QBrush(QColor(COLOR_LIPSYNC_WARNING))),
+            "too_long": ("✗", QBrush(QColor(COLOR_LIPSYNC_TOO_LONG))),
+        }
+    
+    def set_cues(self, cues: List[Cue]) -> None:
+        """Replace the whole cue list."""
+        self.beginResetModel()
+        self._cues = list(cues)
+        self._row_of = {cue.id: row for row, cue in enumerate(self._cues)}
+        self._highlighted_row = self._row_of.get(self._highlighted_cue_id, -1)
+        self.endResetModel()
+    
+    def cue_at(self, row: int) -> Optional[Cue]:
+        """Cue in a source row."""
+        return self._cues[row] if 0 <= row < len(self._cues) else None
+    
+    def row_of(self, cue_id: int) -> int:
+        """Source row of a cue, or -1."""
+        return self._row_of.get(cue_id, -1)
+    
+    def update_cue(self, cue: Cue) -> None:
+        """
+        Refresh one cue's row.
+        
+        The given object replaces the stored one if they differ.
+        """
+        row = self._row_of.get(cue.id)
+        if row is None:
+            return
+        self._cues[row] = cue
+        self._emit_row_changed(row)
+    
+    def set_highlighted_cue(self, cue_id: Optional[int]) -> None:
+        """Highlight the cue under the playhead."""
+        if cue_id == self._highlighted_cue_id:
+            return
+        old_row = self._highlighted_row
+        self._highlighted_cue_id = cue_id
+        self._highlighted_row = self._row_of.get(cue_id, -1)
+        if old_row >= 0:
+            self._emit_row_changed(old_row)
+        if self._highlighted_row >= 0:
+            self._emit_row_changed(self._highlighted_row)
+    
+    def _emit_row_changed(self, row: int) -> None:
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.COLUMN_COUNT - 1)
+        )
+    
+    # =========================================================================
+    # QAbstractTableModel interface
+    # =========================================================================
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cues)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+    
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < self.COLUMN_COUNT):
+            return self._headers[section]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        cue = self._cues[index.row()]
+        col = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(cue, col)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter if col in self._CENTERED else None
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if col == self.COL_STATUS:
+                return self._status_display.get(cue.status, self._unknown_status)[1]
+            if col == self.COL_LIPSYNC:
+                return self._lipsync_display[self._lipsync_key(cue)][1]
+            if index.row() == self._highlighted_row:
+                return self._HIGHLIGHT_BRUSH
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if col == self.COL_STATUS:
+                return self._STATUS_TEXT_BRUSH
+            if col == self.COL_TEXT and not cue.translated_text:
+                return self._UNTRANSLATED_BRUSH
+            return None
+        if role == self.CueRole:
+            return cue
+        return None
+    
+    def _display_text(self, cue: Cue, col: int) -> str:
+        """Cell text for a column."""
+        if col == self.COL_INDEX:
+            return str(cue.cue_index)
+        if col == self.COL_TIME_IN:
+            return ms_to_timecode(cue.time_in_ms)[:8]
+        if col == self.COL_TIME_OUT:
+            return ms_to_timecode(cue.time_out_ms)[:8]
+        if col == self.COL_CHARACTER:
+            return cue.character_name or "-"
+        if col == self.COL_TEXT:
+            # Show translated if available, else source
+            text = cue.translated_text or cue.source_text
+            # Truncate long text
+            if len(text) > 50:
+                text = f"{text[:47]}..."
+            return text.replace("\n", " ")
+        if col == self.COL_STATUS:
+            return self._status_display.get(cue.status, self._unknown_status)[0]
+        if col == self.COL_LIPSYNC:
+            return self._lipsync_display[self._lipsync_key(cue)][0]
+        return ""
+    
+    @staticmethod
+    def _lipsync_key(cue: Cue) -> Optional[str]:
+        """Lip-sync display category."""
+        if cue.lip_sync_ratio is None:
+            return None
+        if cue.lip_sync_ratio <= LIPSYNC_THRESHOLD_GOOD:
+            return "good"
+        elif cue.lip_sync_ratio <= LIPSYNC_THRESHOLD_WARNING:
+            return "warning"
+        return "too_long"
+
+
+class CueFilterProxyModel(QSortFilterProxyModel):
+    """
+    Search and status filter over a CueTableModel.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search_text = ""
+        self._status_value: Optional[str] = None
+    
+    def set_filter(self, search_text: str, status_value: Optional[str]) -> None:
+        """
+        Set filter criteria.
+        
+        Args:
+            search_text: Case-insensitive text to search for
+            status_value: CueStatus value or None for all
+        """
+        search_text = search_text.lower()
+        if search_text == self._search_text and status_value == self._status_value:
+            return
+        self._search_text = search_text
+        self._status_value = status_value
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        model = self.sourceModel()
+        cue = model.cue_at(source_row) if model is not None else None
+        if cue is None:
+            return False
+        
+        # Status filter
+        if self._status_value is not None and cue.status.value != self._status_value:
+            return False
+        
+        # Text search
+        if self._search_text:
+            searchable = (
+                cue.source_text.lower() +
+                cue.translated_text.lower() +
+                cue.character_name.lower()
+            )
+            if self._search_text not in searchable:
+                return False
+        
+        return True
+
+
 class CueListWidget(QWidget):
     """
     Cue list widget.
@@ -40,21 +273,21 @@ class CueListWidget(QWidget):
     delete_cue_requested = Signal(int)  # cue_id
     
     # Column indices
-    COL_INDEX = 0
-    COL_TIME_IN = 1
-    COL_TIME_OUT = 2
-    COL_CHARACTER = 3
-    COL_TEXT = 4
-    COL_STATUS = 5
-    COL_LIPSYNC = 6
+    COL_INDEX = CueTableModel.COL_INDEX
+    COL_TIME_IN = CueTableModel.COL_TIME_IN
+    COL_TIME_OUT = CueTableModel.COL_TIME_OUT
+    COL_CHARACTER = CueTableModel.COL_CHARACTER
+    COL_TEXT = CueTableModel.COL_TEXT
+    COL_STATUS = CueTableModel.COL_STATUS
+    COL_LIPSYNC = CueTableModel.COL_LIPSYNC
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
-        self._cues: List[Cue] = []
-        self._cue_id_map: dict = {}  # row -> cue_id
-        self._highlighted_cue_id: Optional[int] = None
         self._delete_mode: bool = False
+        self.model = CueTableModel(self)
+        self.proxy = CueFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
         
         self._setup_ui()
         self._connect_signals()
@@ -83,17 +316,8 @@ class CueListWidget(QWidget):
         layout.addLayout(filter_layout)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            t("cue_list.columns.index"),
-            t("cue_list.columns.time_in"),
-            t("cue_list.columns.time_out"),
-            t("cue_list.columns.character"),
-            t("cue_list.columns.text"),
-            t("cue_list.columns.status"),
-            t("cue_list.columns.lipsync")
-        ])
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         
         # Table settings
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -102,6 +326,8 @@ class CueListWidget(QWidget):
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setSortingEnabled(False)
         self.table.verticalHeader().setVisible(False)
+        # Uniform rows: the view never measures row contents
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         
         # Column widths
         header = self.table.horizontalHeader()
@@ -128,8 +354,8 @@ class CueListWidget(QWidget):
     
     def _connect_signals(self):
         """Connect signals."""
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
-        self.table.itemDoubleClicked.connect(self._on_double_clicked)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.table.doubleClicked.connect(self._on_double_clicked)
         self.search_edit.textChanged.connect(self._apply_filter)
         self.status_filter.currentIndexChanged.connect(self._apply_filter)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -142,133 +368,64 @@ class CueListWidget(QWidget):
         Args:
             cues: List of Cue objects
         """
-        self._cues = cues
-        self._refresh_table()
-    
-    def _refresh_table(self):
-        """Refresh table."""
-        self.table.setRowCount(0)
-        self._cue_id_map.clear()
-        
-        search_text = self.search_edit.text().lower()
-        status_filter = self.status_filter.currentData()
-        
-        filtered_cues = []
-        for cue in self._cues:
-            # Status filter
-            if status_filter is not None and cue.status.value != status_filter:
-                continue
-            
-            # Text search
-            if search_text:
-                searchable = (
-                    cue.source_text.lower() +
-                    cue.translated_text.lower() +
-                    cue.character_name.lower()
-                )
-                if search_text not in searchable:
-                    continue
-            
-            filtered_cues.append(cue)
-        
-        self.table.setRowCount(len(filtered_cues))
-        
-        for row, cue in enumerate(filtered_cues):
-            self._cue_id_map[row] = cue.id
-            self._populate_row(row, cue)
+        self.model.set_cues(cues)
+        self._update_info()
+    
+    def update_cue(self, cue: Cue):
+        """
+        Refresh a single cue after it was saved.
+        
+        Only the cue's row is repainted; the filter is re-evaluated for
+        that row alone.
         
+        Args:
+            cue: Saved cue
+        """
+        self.model.update_cue(cue)
+        self._update_info()
+    
+    def _update_info(self):
+        """Update the filtered/total counter."""
         self.info_label.setText(
-            t("cue_list.info", filtered=len(filtered_cues), total=len(self._cues))
+            t("cue_list.info", filtered=self.proxy.rowCount(), total=self.model.rowCount())
         )
     
-    def _populate_row(self, row: int, cue: Cue):
-        """Populate row with cue data."""
-        # Index
-        item = QTableWidgetItem(str(cue.cue_index))
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.table.setItem(row, self.COL_INDEX, item)
-
-        # Time in
-        item = QTableWidgetItem(ms_to_timecode(cue.time_in_ms)[:8])
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.table.setItem(row, self.COL_TIME_IN, item)
-
-        # Time out
-        item = QTableWidgetItem(ms_to_timecode(cue.time_out_ms)[:8])
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.table.setItem(row, self.COL_TIME_OUT, item)
-
-        # Character
-        item = QTableWidgetItem(cue.character_name or "-")
-        self.table.setItem(row, self.COL_CHARACTER, item)
-
-        # Text (show translated if available, else source)
-        text = cue.translated_text or cue.source_text
-        # Truncate long text
-        if len(text) > 50:
-            text = f"{text[:47]}..."
-        text = text.replace("\n", " ")
-        item = QTableWidgetItem(text)
-        if not cue.translated_text:
-            item.setForeground(QBrush(QColor("#999999")))
-        self.table.setItem(row, self.COL_TEXT, item)
-
-        # Status
-        status_text, status_color = self._get_status_display(cue.status)
-        item = QTableWidgetItem(status_text)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        item.setBackground(QBrush(QColor(status_color)))
-        item.setForeground(QBrush(QColor("#FFFFFF")))
-        self.table.setItem(row, self.COL_STATUS, item)
-
-        # Lip-sync indicator
-        ls_text, ls_color = self._get_lipsync_display(cue)
-        item = QTableWidgetItem(ls_text)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        item.setBackground(QBrush(QColor(ls_color)))
-        self.table.setItem(row, self.COL_LIPSYNC, item)
-    
-    def _get_status_display(self, status: CueStatus) -> tuple:
-        """Status display data."""
-        status_map = {
-            CueStatus.NEW: (t("status.new"), COLOR_STATUS_NEW),
-            CueStatus.TRANSLATED: (t("status.translated"), COLOR_STATUS_TRANSLATED),
-            CueStatus.NEEDS_REVISION: (t("status.needs_revision"), COLOR_STATUS_NEEDS_REVISION),
-            CueStatus.APPROVED: (t("status.approved"), COLOR_STATUS_APPROVED),
-        }
-        return status_map.get(status, ("?", "#999999"))
+    def _cue_at_view_row(self, row: int) -> Optional[Cue]:
+        """Cue shown in a view (proxy) row."""
+        source = self.proxy.mapToSource(self.proxy.index(row, 0))
+        return self.model.cue_at(source.row()) if source.isValid() else None
     
-    def _get_lipsync_display(self, cue: Cue) -> tuple:
-        """Lip-sync display data."""
-        if cue.lip_sync_ratio is None:
-            return ("?", "#CCCCCC")
-        
-        if cue.lip_sync_ratio <= LIPSYNC_THRESHOLD_GOOD:
-            return ("✓", COLOR_LIPSYNC_GOOD)
-        elif cue.lip_sync_ratio <= LIPSYNC_THRESHOLD_WARNING:
-            return ("!", COLOR_LIPSYNC_WARNING)
-        else:
-            return ("✗", COLOR_LIPSYNC_TOO_LONG)
+    def _view_row_of(self, cue_id: int) -> int:
+        """View (proxy) row of a cue, or -1 if unknown or filtered out."""
+        row = self.model.row_of(cue_id)
+        if row < 0:
+            return -1
+        # The proxy keeps its own source <-> proxy row mapping
+        return self.proxy.mapFromSource(self.model.index(row, 0)).row()
+    
+    def _current_cue(self) -> Optional[Cue]:
+        """Cue in the selected row."""
+        if rows := self.table.selectionModel().selectedRows():
+            return self._cue_at_view_row(rows[0].row())
+        return None
     
     @Slot()
     def _apply_filter(self):
         """Apply filter."""
-        self._refresh_table()
+        self.proxy.set_filter(self.search_edit.text(), self.status_filter.currentData())
+        self._update_info()
     
-    @Slot()
-    def _on_selection_changed(self):
+    @Slot(QItemSelection, QItemSelection)
+    def _on_selection_changed(self, selected=None, deselected=None):
         """Selection changed."""
-        if selected := self.table.selectedItems():
-            row = selected[0].row()
-            if cue_id := self._cue_id_map.get(row):
-                self.cue_selected.emit(cue_id)
+        if cue := self._current_cue():
+            self.cue_selected.emit(cue.id)
     
-    @Slot(QTableWidgetItem)
-    def _on_double_clicked(self, item: QTableWidgetItem):
+    @Slot(QModelIndex)
+    def _on_double_clicked(self, index: QModelIndex):
         """Double click."""
-        row = item.row()
-        if cue_id := self._cue_id_map.get(row):
-            self.cue_double_clicked.emit(cue_id)
+        if cue := self._cue_at_view_row(index.row()):
+            self.cue_double_clicked.emit(cue.id)
     
     def get_current_index(self) -> int:
         """
@@ -277,13 +434,8 @@ class CueListWidget(QWidget):
         Returns:
             Cue index or 0
         """
-        if selected := self.table.selectedItems():
-            row = selected[0].row()
-            cue_id = self._cue_id_map.get(row)
-            for cue in self._cues:
-                if cue.id == cue_id:
-                    return cue.cue_index
-        return 0
+        cue = self._current_cue()
+        return cue.cue_index if cue else 0
     
     def select_cue(self, cue_id: int):
         """
@@ -292,12 +444,19 @@ class CueListWidget(QWidget):
         Args:
             cue_id: Cue ID
         """
-        for row, mapped_id in self._cue_id_map.items():
-            if mapped_id == cue_id:
-                self.table.selectRow(row)
-                if item := self.table.item(row, 0):
-                    self.table.scrollToItem(item)
-                break
+        row = self._view_row_of(cue_id)
+        if row >= 0:
+            self.table.selectRow(row)
+            self.table.scrollTo(self.proxy.index(row, 0))
+    
+    def select_by_cue_id(self, cue_id: int):
+        """
+        Select cue by ID (used by the QA panel).
+        
+        Args:
+            cue_id: Cue ID
+        """
+        self.select_cue(cue_id)
     
     def highlight_cue(self, cue_id: int):
         """
@@ -306,26 +465,7 @@ class CueListWidget(QWidget):
         Args:
             cue_id: Cue ID
         """
-        # Remove previous highlight
-        if self._highlighted_cue_id:
-            for row, mapped_id in self._cue_id_map.items():
-                if mapped_id == self._highlighted_cue_id:
-                    # Reset background
-                    for col in range(self.table.columnCount()):
-                        item = self.table.item(row, col)
-                        if item and col not in (self.COL_STATUS, self.COL_LIPSYNC):
-                            item.setBackground(QBrush())
-                    break
-        
-        # Set new highlight
-        self._highlighted_cue_id = cue_id
-        for row, mapped_id in self._cue_id_map.items():
-            if mapped_id == cue_id:
-                for col in range(self.table.columnCount()):
-                    item = self.table.item(row, col)
-                    if item and col not in (self.COL_STATUS, self.COL_LIPSYNC):
-                        item.setBackground(QBrush(QColor("#FFFACD")))  # Light yellow
-                break
+        self.model.set_highlighted_cue(cue_id)
     
     def set_delete_mode(self, enabled: bool):
         """
@@ -338,7 +478,7 @@ class CueListWidget(QWidget):
         
         if enabled:
             self.table.setStyleSheet("""
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background-color: #ffcccc;
                     color: #cc0000;
                 }
@@ -353,41 +493,37 @@ class CueListWidget(QWidget):
         Returns:
             Cue ID or None
         """
-        if selected := self.table.selectedItems():
-            row = selected[0].row()
-            return self._cue_id_map.get(row)
-        return None
+        cue = self._current_cue()
+        return cue.id if cue else None
     
     @Slot()
     def _on_context_menu(self, pos):
         """Show context menu."""
-        item = self.table.itemAt(pos)
-        if not item:
+        index = self.table.indexAt(pos)
+        if not index.isValid():
             return
+        row = index.row()
         
         icon_mgr = get_icon_manager()
         menu = QMenu(self)
         
         insert_action = QAction(icon_mgr.get_icon("cue_add"), t("cue_list.context_menu.insert"), self)
-        insert_action.triggered.connect(lambda: self._request_insert(item.row()))
+        insert_action.triggered.connect(lambda: self._request_insert(row))
         menu.addAction(insert_action)
         
         if self._delete_mode:
             delete_action = QAction(icon_mgr.get_icon("cue_delete"), t("cue_list.context_menu.delete"), self)
-            delete_action.triggered.connect(lambda: self._request_delete(item.row()))
+            delete_action.triggered.connect(lambda: self._request_delete(row))
             menu.addAction(delete_action)
         
         menu.exec(self.table.viewport().mapToGlobal(pos))
     
     def _request_insert(self, row: int):
         """Request insert."""
-        if cue_id := self._cue_id_map.get(row):
-            for cue in self._cues:
-                if cue.id == cue_id:
-                    self.insert_cue_requested.emit(cue.cue_index)
-                    break
+        if cue := self._cue_at_view_row(row):
+            self.insert_cue_requested.emit(cue.cue_index)
     
     def _request_delete(self, row: int):
         """Request delete."""
-        if cue_id := self._cue_id_map.get(row):
-            self.delete_cue_requested.emit(cue_id)
+        if cue := self._cue_at_view_row(row):
+            self.delete_cue_requested.emit(cue.id)
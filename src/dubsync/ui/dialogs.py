@@ -10,12 +10,13 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QDoubleSpinBox, QDialogButtonBox,
     QLabel, QPushButton, QGroupBox, QTextBrowser,
-    QSpinBox, QCheckBox, QRadioButton, QButtonGroup
+    QSpinBox, QCheckBox, QRadioButton, QButtonGroup, QComboBox
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
 
 from dubsync.models.project import Project
+from dubsync.services.lip_sync import LIPSYNC_ENGINES
 from dubsync.utils.constants import APP_NAME, APP_VERSION
 from dubsync.i18n import t
 
@@ -94,6 +95,13 @@ class ProjectSettingsDialog(QDialog):
         self.framerate_spin.setSuffix(" fps")
         tech_layout.addRow(t("dialogs.project_settings.framerate"), self.framerate_spin)
 
+        self.lipsync_engine_combo = QComboBox()
+        for engine in LIPSYNC_ENGINES:
+            self.lipsync_engine_combo.addItem(
+                t(f"dialogs.project_settings.lipsync_engine_{engine}"), engine
+            )
+        tech_layout.addRow(t("dialogs.project_settings.lipsync_engine"), self.lipsync_engine_combo)
+
         layout.addLayout(form)
         layout.addWidget(tech_group)
 
@@ -134,6 +142,8 @@ class ProjectSettingsDialog(QDialog):
         self.translator_edit.setText(self.project.translator)
         self.editor_edit.setText(self.project.editor)
         self.framerate_spin.setValue(self.project.frame_rate)
+        index = self.lipsync_engine_combo.findData(self.project.lipsync_engine)
+        self.lipsync_engine_combo.setCurrentIndex(max(index, 0))
 
 
 class AboutDialog(QDialog):
@@ -18,10 +18,12 @@ from PySide6.QtGui import QAction, QKeySequence, QCloseEvent, QUndoStack, QUndoC
 
 from dubsync.utils.constants import APP_NAME, APP_VERSION, PROJECT_EXTENSION
 from dubsync.i18n import t
+from dubsync.models.cue import Cue
 from dubsync.services.project_manager import (
-    ProjectManager, get_project_filter, get_srt_filter, get_video_filter
+    ProjectManager, get_project_filter, get_srt_filter, get_subtitle_filter, get_video_filter
 )
 from dubsync.services.pdf_export import PDFExporter
+from dubsync.services.waveform import peaks_cache_path
 from dubsync.services.settings_manager import SettingsManager
 from dubsync.services.crash_handler import log_activity, get_crash_handler
 from dubsync.ui.cue_list import CueListWidget
@@ -82,13 +84,14 @@ class DeleteCueCommand(QUndoCommand):
             lip_sync_ratio=self._cue_data.get('lip_sync_ratio'),
         )
         
-        cue.save(pm.db)
+        with pm.db.transaction():
+            cue.save(pm.db)
+            # Reindex cues to ensure correct order
+            CueBatch.reindex(pm.db, pm.project.id)
+        pm.invalidate_cues()
         self._cue_id = cue.id  # Update for next redo
         self._cue_data['id'] = cue.id
         
-        # Reindex cues to ensure correct order
-        CueBatch.reindex(pm.db, pm.project.id)
-        
         self._main_window._refresh_cue_list()
         self._main_window._update_title()
         self._main_window._update_statistics()
@@ -312,6 +315,7 @@ class MainWindow(QMainWindow):
         # Cue editor at bottom
         self.cue_editor = CueEditorWidget()
         self.cue_editor.setMinimumHeight(120)
+        self.cue_editor.set_lip_sync_estimator(self.project_manager.lipsync_estimator())
         right_splitter.addWidget(self.cue_editor)
         
         # Set initial sizes: video 60%, editor 40%
@@ -599,6 +603,7 @@ class MainWindow(QMainWindow):
         self.cue_editor.cue_saved.connect(self._on_cue_saved)
         self.cue_editor.status_changed.connect(self._on_cue_status_changed)
         self.cue_editor.timing_changed.connect(self._on_timing_changed)
+        self.cue_editor.translation_edited.connect(self._notify_plugins_translation_edited)
         
         self.video_player.position_changed.connect(self._on_video_position_changed)
         
@@ -744,6 +749,22 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 print(f"Plugin cue_selected error ({plugin.info.name}): {e}")
     
+    def _notify_plugins_cue_saved(self, cue):
+        """Notify plugins of a saved cue."""
+        for plugin in self.plugin_manager.get_ui_plugins(enabled_only=True):
+            try:
+                plugin.on_cue_saved(cue)
+            except Exception as e:
+                print(f"Plugin cue_saved error ({plugin.info.name}): {e}")
+    
+    def _notify_plugins_translation_edited(self, text):
+        """Notify plugins of the translation being typed."""
+        for plugin in self.plugin_manager.get_ui_plugins(enabled_only=True):
+            try:
+                plugin.on_translation_edited(text)
+            except Exception as e:
+                print(f"Plugin translation_edited error ({plugin.info.name}): {e}")
+    
     def _notify_plugins_project_opened(self, project):
         """Notify plugins of project opened."""
         for plugin in self.plugin_manager.get_ui_plugins(enabled_only=True):
@@ -926,6 +947,19 @@ class MainWindow(QMainWindow):
             # Also update timeline
             self.timeline_widget.set_cues(cues)
     
+    def _load_waveform(self, video_path: Path):
+        """Start loading the timeline waveform for the project's video."""
+        project_path = self.project_manager.project_path
+        cache_path = peaks_cache_path(project_path) if project_path else None
+        self.timeline_widget.load_waveform(video_path, cache_path)
+    
+    def _refresh_cue(self, cue: Cue):
+        """Refresh a single saved cue without rebuilding the cue list."""
+        if self.project_manager.is_open:
+            self.cue_list.update_cue(cue)
+            self.timeline_widget.update_cue(cue)
+            self._notify_plugins_cue_saved(cue)
+    
     def _check_save_changes(self) -> bool:
         """Check for unsaved changes."""
         if not self.project_manager.is_dirty:
@@ -950,6 +984,9 @@ class MainWindow(QMainWindow):
         """Close window."""
         if self._check_save_changes():
             self._save_settings()
+            # Background threads must finish before the window goes away
+            self.timeline_widget.shutdown()
+            self.plugin_manager.shutdown_all()
             self.project_manager.close()
             event.accept()
         else:
@@ -963,6 +1000,8 @@ class MainWindow(QMainWindow):
         if not self._check_save_changes():
             return
         self.project_manager.new_project()
+        self.cue_editor.set_lip_sync_estimator(self.project_manager.lipsync_estimator())
+        self.timeline_widget.clear_waveform()
         self._refresh_cue_list()
         self._update_title()
         self._update_ui_state()
@@ -997,6 +1036,8 @@ class MainWindow(QMainWindow):
             # sourcery skip: merge-nested-ifs
             self.project_manager.open_project(Path(file_path))
             get_crash_handler().set_current_project(file_path)
+            self.cue_editor.set_lip_sync_estimator(self.project_manager.lipsync_estimator())
+            self.timeline_widget.clear_waveform()
             self._refresh_cue_list()
             
             project = self.project_manager.project
@@ -1004,6 +1045,7 @@ class MainWindow(QMainWindow):
                 video_path = Path(project.video_path)
                 if video_path.exists():
                     self.video_player.load_video(video_path)
+                    self._load_waveform(video_path)
                 else:
                     # Video not found - detach and warn
                     self.project_manager.update_project(video_path="")
@@ -1101,12 +1143,12 @@ class MainWindow(QMainWindow):
         # Starting directory from settings
         start_dir = self.settings_manager.default_save_path or ""
         
-        file_path, _ = QFileDialog.getOpenFileName(self, t("menu.file.import_srt").replace("...", ""), start_dir, get_srt_filter())
+        file_path, _ = QFileDialog.getOpenFileName(self, t("menu.file.import_srt").replace("...", ""), start_dir, get_subtitle_filter())
         
         if file_path:
             try:
-                log_activity("Importing SRT", file_path)
-                count, errors = self.project_manager.import_srt(Path(file_path))
+                log_activity("Importing subtitles", file_path)
+                count, errors = self.project_manager.import_subtitles(Path(file_path))
                 self._refresh_cue_list()
                 self._update_statistics()
                 
@@ -1140,6 +1182,7 @@ class MainWindow(QMainWindow):
                 log_activity("Loading video", file_path)
                 self.video_player.load_video(Path(file_path))
                 self.project_manager.update_project(video_path=file_path)
+                self._load_waveform(Path(file_path))
                 self._update_title()
                 log_activity("Video loaded successfully")
                 self.statusBar().showMessage(t("messages.video_loaded", name=Path(file_path).name), 3000)
@@ -1239,6 +1282,7 @@ class MainWindow(QMainWindow):
         
         dialog = ProjectSettingsDialog(self.project_manager.project, self)
         if dialog.exec():
+            engine = self.project_manager.project.lipsync_engine
             self.project_manager.update_project(
                 title=dialog.title_edit.text(),
                 series_title=dialog.series_edit.text(),
@@ -1248,8 +1292,11 @@ class MainWindow(QMainWindow):
                 translator=dialog.translator_edit.text(),
                 editor=dialog.editor_edit.text(),
                 frame_rate=dialog.framerate_spin.value(),
+                lipsync_engine=dialog.lipsync_engine_combo.currentData(),
             )
             self._update_title()
+            if self.project_manager.project.lipsync_engine != engine:
+                self._on_lipsync_model_changed()
     
     @Slot()
     def _on_theme_settings(self):
@@ -1280,10 +1327,13 @@ class MainWindow(QMainWindow):
         
         dialog = SettingsDialog(parent=self, plugin_manager=self.plugin_manager)
         dialog.theme_changed.connect(self._apply_theme)
+        chars_per_second = self.settings_manager.lipsync_chars_per_second
         
         if dialog.exec():
             # Settings saved
             self.statusBar().showMessage(t("messages.settings_saved"), 3000)
+            if self.settings_manager.lipsync_chars_per_second != chars_per_second:
+                self._on_lipsync_model_changed()
     
     @Slot()
     def _on_toggle_delete_mode(self):
@@ -1497,7 +1547,6 @@ class MainWindow(QMainWindow):
             return
         
         # Apply offset
-        modified_count = 0
         for cue in cues_to_modify:
             # Ensure times don't go negative
             new_time_in = max(0, cue.time_in_ms + offset_ms)
@@ -1505,9 +1554,9 @@ class MainWindow(QMainWindow):
             
             cue.time_in_ms = new_time_in
             cue.time_out_ms = new_time_out
-            
-            self.project_manager.save_cue(cue)
-            modified_count += 1
+        
+        self.project_manager.save_cues(cues_to_modify)
+        modified_count = len(cues_to_modify)
         
         # Refresh UI
         self._refresh_cue_list()
@@ -1540,6 +1589,11 @@ class MainWindow(QMainWindow):
         self._update_statistics()
         self.statusBar().showMessage(t("messages.lipsync_recalculated", count=count), 3000)
     
+    def _on_lipsync_model_changed(self):
+        """Apply a new lip-sync engine or speech rate to the editor and all cues."""
+        self.cue_editor.set_lip_sync_estimator(self.project_manager.lipsync_estimator())
+        self._on_recalculate_lipsync()
+    
     @Slot()
     def _on_goto_next_empty(self):
         if not self.project_manager.is_open or self.project_manager.db is None or self.project_manager.project is None:
@@ -1631,11 +1685,10 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_cue_saved(self):
         if cue := self.cue_editor.get_cue():
-            # Save the current cue index BEFORE refreshing (refresh loses selection)
             current_cue_index = cue.cue_index
             
-            self.project_manager.save_cue(cue)
-            self._refresh_cue_list()
+            cue = self.project_manager.save_cue(cue)
+            self._refresh_cue(cue)
             self._update_title()
             self._update_statistics()
             
@@ -1648,11 +1701,8 @@ class MainWindow(QMainWindow):
     
     @Slot(int)
     def _on_video_position_changed(self, position_ms: int):
-        from dubsync.models.cue import Cue
-        if self.project_manager.is_open and self.project_manager.db is not None and self.project_manager.project is not None:
-            if cue := Cue.find_at_time(
-                self.project_manager.db, position_ms, self.project_manager.project.id
-            ):
+        if self.project_manager.is_open:
+            if cue := self.project_manager.find_cue_at_time(position_ms):
                 self.cue_list.highlight_cue(cue.id)
             # Update timeline playhead
             self.timeline_widget.set_playhead_position(position_ms)
@@ -1677,8 +1727,8 @@ class MainWindow(QMainWindow):
         if cue:
             cue.time_in_ms = new_time_in
             cue.time_out_ms = new_time_out
-            cue.save(self.project_manager.db)
-            self._refresh_cue_list()
+            self.project_manager.save_cue(cue)
+            self._refresh_cue(cue)
             self._update_statistics()
             self._update_title()
     
@@ -1692,12 +1742,10 @@ class MainWindow(QMainWindow):
         if cue:
             cue.time_in_ms = new_time_in
             cue.time_out_ms = new_time_out
-            # Recalculate lip-sync ratio using LipSyncEstimator
-            from dubsync.services.lip_sync import LipSyncEstimator
-            estimator = LipSyncEstimator()
-            estimator.update_cue_ratio(cue)
-            cue.save(self.project_manager.db)
-            self._refresh_cue_list()
+            # Recalculate lip-sync ratio
+            self.project_manager.lipsync_estimator().update_cue_ratio(cue)
+            self.project_manager.save_cue(cue)
+            self._refresh_cue(cue)
             self._update_statistics()
             self._update_title()
             # Update editor if this cue is selected
@@ -1728,13 +1776,9 @@ class MainWindow(QMainWindow):
         if not self.project_manager.is_open:
             return
         
-        cues = self.project_manager.get_cues()
-        
-        # Search for the next cue
-        for cue in cues:
-            if cue.cue_index > current_index:
-                self.cue_list.select_cue(cue.id)
-                return
+        if cue := self.project_manager.get_next_cue(current_index):
+            self.cue_list.select_cue(cue.id)
+            return
         
         # If there are no more, stay on the last one
         self.statusBar().showMessage(t("messages.last_cue"), 2000)
@@ -1751,17 +1795,8 @@ class MainWindow(QMainWindow):
             return
         
         current_index = self.cue_list.get_current_index()
-        cues = self.project_manager.get_cues()
-        
-        # Search for the previous cue (backwards)
-        prev_cue = None
-        for cue in cues:
-            if cue.cue_index < current_index:
-                prev_cue = cue
-            else:
-                break
         
-        if prev_cue:
+        if prev_cue := self.project_manager.get_previous_cue(current_index):
             self.cue_list.select_cue(prev_cue.id)
         else:
             self.statusBar().showMessage(t("messages.first_cue"), 2000)
@@ -304,7 +304,7 @@ QSplitter::handle:vertical {{
 }}
 
 /* === TABLE WIDGET === */
-QTableWidget {{
+QTableView {{
     background-color: {colors.background_alt};
     alternate-background-color: {colors.surface};
     gridline-color: {colors.border};
@@ -312,11 +312,11 @@ QTableWidget {{
     border-radius: 4px;
 }}
 
-QTableWidget::item {{
+QTableView::item {{
     padding: 4px 8px;
 }}
 
-QTableWidget::item:selected {{
+QTableView::item:selected {{
     background-color: {colors.surface_selected};
 }}
 
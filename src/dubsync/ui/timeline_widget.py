@@ -5,7 +5,9 @@ Visual timeline for viewing and editing cues.
 Shows cues as colored blocks on a time axis.
 """
 
+from pathlib import Path
 from typing import Optional, List, Dict, Any
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, auto
 
@@ -15,15 +17,18 @@ from PySide6.QtWidgets import (
     QScrollBar, QSizePolicy
 )
 from PySide6.QtCore import (
-    Qt, Signal, Slot, QRect, QRectF, QPointF, QSize, QTimer
+    Qt, Signal, Slot, QRect, QRectF, QPointF, QSize, QTimer, QThread
 )
 from PySide6.QtGui import (
     QPainter, QPen, QBrush, QColor, QFont, QFontMetrics,
     QPainterPath, QLinearGradient, QMouseEvent, QWheelEvent,
-    QPaintEvent, QResizeEvent, QCursor
+    QPaintEvent, QResizeEvent, QCursor, QPixmap
 )
 
 from dubsync.models.cue import Cue
+from dubsync.services.cue_time_index import CueTimeIndex
+from dubsync.services.waveform import PeakPyramid, WaveformError, load_or_build_peaks
+from dubsync.services.logger import get_logger
 from dubsync.utils.constants import (
     CueStatus, LipSyncStatus,
     COLOR_STATUS_NEW, COLOR_STATUS_TRANSLATED, 
@@ -51,6 +56,28 @@ class CueBlock:
     selected: bool = False
 
 
+class WaveformWorker(QThread):
+    """Background thread decoding audio into a peak pyramid."""
+    
+    peaks_ready = Signal(object)  # PeakPyramid
+    error_occurred = Signal(str)
+    
+    def __init__(self, media_path: Path, cache_path: Optional[Path] = None):
+        super().__init__()
+        self.media_path = media_path
+        self.cache_path = cache_path
+    
+    def run(self):
+        try:
+            pyramid = load_or_build_peaks(
+                self.media_path, self.cache_path, self.isInterruptionRequested
+            )
+            if pyramid is not None and not self.isInterruptionRequested():
+                self.peaks_ready.emit(pyramid)
+        except WaveformError as e:
+            self.error_occurred.emit(str(e))
+
+
 class TimelineCanvas(QWidget):
     """
     Canvas widget for drawing the timeline.
@@ -62,6 +89,10 @@ class TimelineCanvas(QWidget):
     - Selection and editing
     - Drag & drop cue moving
     - Edge drag for cue resizing
+    
+    Painting is limited to the exposed rect. The grid and unselected
+    blocks are rendered into cached tiles; the selected and hovered
+    blocks and the playhead are drawn on top every frame.
     """
     
     # Signals
@@ -79,6 +110,11 @@ class TimelineCanvas(QWidget):
     DEFAULT_PIXELS_PER_SECOND = 50
     RESIZE_HANDLE_WIDTH = 8  # Width of resize handles on edges
     MIN_CUE_DURATION_MS = 100  # Minimum cue duration
+    MIN_BLOCK_WIDTH = 10  # Minimum block width in pixels
+    TILE_WIDTH = 512  # Width of a cached static layer tile
+    MAX_CACHED_TILES = 64
+    PLAYHEAD_MARGIN = 6  # Extra pixels repainted around the playhead
+    WAVEFORM_HEIGHT = 40
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -86,6 +122,9 @@ class TimelineCanvas(QWidget):
         # Data
         self._cues: List[Cue] = []
         self._cue_blocks: List[CueBlock] = []
+        self._block_by_id: Dict[int, CueBlock] = {}
+        self._time_index = CueTimeIndex()
+        self._max_time_out_ms = 0
         self._selected_cue_id: Optional[int] = None
         
         # View state
@@ -94,6 +133,10 @@ class TimelineCanvas(QWidget):
         self._total_duration_ms = 0
         self._playhead_position_ms = 0
         self._center_playhead = True  # Keep playhead centered
+        self._waveform: Optional[PeakPyramid] = None
+        
+        # Static layer cache: tile index -> pixmap
+        self._tile_cache: "OrderedDict[int, QPixmap]" = OrderedDict()
         
         # Interaction state
         self._drag_mode = DragMode.NONE
@@ -118,6 +161,7 @@ class TimelineCanvas(QWidget):
         self._playhead_color = QColor("#ff5722")
         self._selection_color = QColor("#2196F3")
         self._resize_handle_color = QColor("#ffffff")
+        self._waveform_color = QColor("#4fc3f7")
     
     def set_cues(self, cues: List[Cue]) -> None:
         """Set cues to display."""
@@ -125,12 +169,31 @@ class TimelineCanvas(QWidget):
         self._recalculate_blocks()
         self.update()
     
+    def set_waveform(self, waveform: Optional[PeakPyramid]) -> None:
+        """Set (or clear) the audio waveform shown under the cue track."""
+        self._waveform = waveform
+        extra = self.WAVEFORM_HEIGHT if waveform is not None else 0
+        self.setMinimumHeight(self.TRACK_HEIGHT + self.HEADER_HEIGHT + 10 + extra)
+        self._tile_cache.clear()
+        self.update()
+    
+    def update_cue(self, cue: Cue) -> None:
+        """
+        Refresh a single cue after it was saved.
+        
+        Only the cue's block is laid out again.
+        """
+        block = self._block_by_id.get(cue.id)
+        if block is None:
+            return
+        old_rect = QRectF(block.rect)
+        old_time_out = block.cue.time_out_ms
+        block.cue = cue
+        self._move_block(block, old_rect, old_time_out)
+    
     def set_selected_cue(self, cue_id: Optional[int]) -> None:
         """Set currently selected cue."""
-        self._selected_cue_id = cue_id
-        for block in self._cue_blocks:
-            block.selected = block.cue.id == cue_id
-        self.update()
+        self._select_block(cue_id)
         
         # Center on selected cue
         if cue_id:
@@ -138,10 +201,13 @@ class TimelineCanvas(QWidget):
     
     def set_playhead_position(self, position_ms: int) -> None:
         """Set playhead position and center it in view."""
+        old_position_ms = self._playhead_position_ms
         self._playhead_position_ms = position_ms
         if self._center_playhead:
             self._center_on_playhead()
-        self.update()
+        # Only the strips under the old and new playhead change
+        self.update(self._playhead_rect(old_position_ms))
+        self.update(self._playhead_rect(position_ms))
     
     def set_center_playhead(self, center: bool) -> None:
         """Enable/disable automatic playhead centering."""
@@ -171,29 +237,30 @@ class TimelineCanvas(QWidget):
     
     def _center_on_cue(self, cue_id: int) -> None:
         """Center the view on a specific cue."""
-        for block in self._cue_blocks:
-            if block.cue.id == cue_id:
-                parent = self.parent()
-                if parent is None:
-                    return
-                
-                scrollbar = getattr(parent, 'horizontalScrollBar', lambda: None)()
-                if scrollbar is None:
-                    return
-                
-                viewport = getattr(parent, 'viewport', lambda: None)()
-                if viewport is None:
-                    return
-                
-                # Center of the cue block
-                cue_center_x = block.rect.center().x()
-                viewport_width = viewport.width()
-                
-                # Center cue in viewport
-                target_scroll = int(cue_center_x - viewport_width / 2)
-                target_scroll = max(0, min(target_scroll, scrollbar.maximum()))
-                scrollbar.setValue(target_scroll)
-                break
+        block = self._block_by_id.get(cue_id)
+        if block is None:
+            return
+        
+        parent = self.parent()
+        if parent is None:
+            return
+        
+        scrollbar = getattr(parent, 'horizontalScrollBar', lambda: None)()
+        if scrollbar is None:
+            return
+        
+        viewport = getattr(parent, 'viewport', lambda: None)()
+        if viewport is None:
+            return
+        
+        # Center of the cue block
+        cue_center_x = block.rect.center().x()
+        viewport_width = viewport.width()
+        
+        # Center cue in viewport
+        target_scroll = int(cue_center_x - viewport_width / 2)
+        target_scroll = max(0, min(target_scroll, scrollbar.maximum()))
+        scrollbar.setValue(target_scroll)
     
     def _scroll_to_playhead(self) -> None:
         """Auto-scroll to keep playhead visible (fallback for edge cases)."""
@@ -206,47 +273,94 @@ class TimelineCanvas(QWidget):
             self.MIN_PIXELS_PER_SECOND,
             min(self.MAX_PIXELS_PER_SECOND, pixels_per_second)
         )
-        self._recalculate_blocks()
+        self._rescale_blocks()
         self.update()
     
     def get_zoom(self) -> float:
         """Get current zoom level."""
         return self._pixels_per_second
     
+    def _select_block(self, cue_id: Optional[int]) -> None:
+        """Move the selection, repainting only the two affected blocks."""
+        old_block = self._block_by_id.get(self._selected_cue_id)
+        new_block = self._block_by_id.get(cue_id)
+        self._selected_cue_id = cue_id
+        if old_block is not None:
+            old_block.selected = False
+        if new_block is not None:
+            new_block.selected = True
+        for block in (old_block, new_block):
+            if block is not None:
+                # The selected block lives outside the static layer
+                self._invalidate_tiles(block.rect)
+                self.update(self._block_update_rect(block))
+    
     def _recalculate_blocks(self) -> None:
-        """Recalculate cue block positions."""
+        """Rebuild all cue blocks from the cue list."""
+        self._tile_cache.clear()
         self._cue_blocks.clear()
+        self._block_by_id.clear()
+        self._time_index.rebuild(self._cues)
         
         if not self._cues:
             self._total_duration_ms = 60000  # Default 1 minute
             return
         
-        # Calculate total duration
-        self._total_duration_ms = max(
-            cue.time_out_ms for cue in self._cues
-        ) if self._cues else 60000
-        
-        # Add some padding
-        self._total_duration_ms = int(self._total_duration_ms * 1.1)
-        
-        # Calculate blocks
-        y = self.HEADER_HEIGHT + 5
-        height = self.TRACK_HEIGHT - 10
-        
         for cue in self._cues:
-            x = self._ms_to_x(cue.time_in_ms)
-            width = self._ms_to_x(cue.time_out_ms) - x
-            width = max(width, 10)  # Minimum width
-            
-            rect = QRectF(x, y, width, height)
             block = CueBlock(
                 cue=cue,
-                rect=rect,
+                rect=QRectF(),
                 selected=cue.id == self._selected_cue_id
             )
+            self._place_block(block)
             self._cue_blocks.append(block)
+            self._block_by_id[cue.id] = block
+        
+        self._max_time_out_ms = max(cue.time_out_ms for cue in self._cues)
+        self._update_extent()
+    
+    def _rescale_blocks(self) -> None:
+        """Zoom change: recompute block coordinates in place."""
+        self._tile_cache.clear()
+        for block in self._cue_blocks:
+            self._place_block(block)
+        if self._cue_blocks:
+            self._update_extent()
+    
+    def _place_block(self, block: CueBlock) -> None:
+        """Set a block's rect from its cue's times."""
+        cue = block.cue
+        x = self._ms_to_x(cue.time_in_ms)
+        width = max(self._ms_to_x(cue.time_out_ms) - x, self.MIN_BLOCK_WIDTH)
+        block.rect.setRect(x, self.HEADER_HEIGHT + 5, width, self.TRACK_HEIGHT - 10)
+    
+    def _move_block(self, block: CueBlock, old_rect: QRectF, old_time_out: int) -> None:
+        """Lay out one block again after its cue's times changed."""
+        self._place_block(block)
+        self._time_index.update(block.cue)
+        
+        # The selected block is not part of the static layer
+        if block.cue.id != self._selected_cue_id:
+            self._invalidate_tiles(old_rect)
+            self._invalidate_tiles(block.rect)
+        self.update(old_rect.toAlignedRect().adjusted(-2, -2, 2, 2))
+        self.update(self._block_update_rect(block))
         
-        # Update widget width
+        time_out = block.cue.time_out_ms
+        if time_out > self._max_time_out_ms:
+            self._max_time_out_ms = time_out
+        elif old_time_out == self._max_time_out_ms and time_out < old_time_out:
+            self._max_time_out_ms = max(b.cue.time_out_ms for b in self._cue_blocks)
+        else:
+            return
+        self._tile_cache.clear()
+        self._update_extent()
+        self.update()
+    
+    def _update_extent(self) -> None:
+        """Update total duration and widget width from the last cue end."""
+        # Add some padding
+        self._total_duration_ms = int(self._max_time_out_ms * 1.1)
         total_width = self._ms_to_x(self._total_duration_ms)
         self.setMinimumWidth(int(total_width) + 50)
     
@@ -258,6 +372,59 @@ class TimelineCanvas(QWidget):
         """Convert x coordinate to milliseconds."""
         return int((x / self._pixels_per_second) * 1000)
     
+    def _blocks_between(self, left_x: float, right_x: float) -> List[CueBlock]:
+        """
+        Blocks that may intersect a horizontal pixel range.
+        
+        Uses the time index, so the cost depends on the number of
+        visible blocks, not on the project size.
+        """
+        # Blocks are at least MIN_BLOCK_WIDTH wide, so look back that far
+        start_ms = self._x_to_ms(left_x - self.MIN_BLOCK_WIDTH) - 1
+        end_ms = self._x_to_ms(right_x) + 1
+        blocks = []
+        for cue in self._time_index.find_in_range(start_ms, end_ms):
+            block = self._block_by_id.get(cue.id)
+            if block is not None:
+                blocks.append(block)
+        return blocks
+    
+    def _block_at(self, pos: QPointF) -> Optional[CueBlock]:
+        """Find the cue block under a position."""
+        top = self.HEADER_HEIGHT + 5
+        if not top <= pos.y() <= top + self.TRACK_HEIGHT - 10:
+            return None
+        
+        # Prefer what is painted on top: the selected block, then the
+        # latest-starting one
+        selected = self._block_by_id.get(self._selected_cue_id)
+        if selected is not None and selected.rect.contains(pos):
+            return selected
+        for block in reversed(self._blocks_between(pos.x(), pos.x())):
+            if block.rect.contains(pos):
+                return block
+        return None
+    
+    def _block_update_rect(self, block: CueBlock) -> QRect:
+        """Widget area covered by a block including its border."""
+        return block.rect.toAlignedRect().adjusted(-2, -2, 2, 2)
+    
+    def _playhead_rect(self, position_ms: int) -> QRect:
+        """Widget area covered by the playhead line and triangle."""
+        x = int(self._ms_to_x(position_ms))
+        margin = self.PLAYHEAD_MARGIN
+        return QRect(x - margin, 0, 2 * margin + 1, self.height())
+    
+    def _invalidate_tiles(self, rect: Optional[QRectF] = None) -> None:
+        """Drop cached static tiles intersecting rect (all if None)."""
+        if rect is None:
+            self._tile_cache.clear()
+            return
+        first = int(rect.left() - 2) // self.TILE_WIDTH
+        last = int(rect.right() + 2) // self.TILE_WIDTH
+        for tile in range(first, last + 1):
+            self._tile_cache.pop(tile, None)
+    
     def _get_edge_at_pos(self, block: CueBlock, pos: QPointF) -> Optional[str]:
         """Check if position is on a resize handle edge."""
         if not block.rect.contains(pos):
@@ -272,29 +439,66 @@ class TimelineCanvas(QWidget):
             return "right"
         return None
     
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        if event.size().height() != event.oldSize().height():
+            self._tile_cache.clear()
+        super().resizeEvent(event)
+    
     def paintEvent(self, event: QPaintEvent) -> None:
-        """Paint the timeline."""
+        """Paint the exposed part of the timeline."""
+        exposed = event.rect()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Background
-        painter.fillRect(self.rect(), self._bg_color)
+        # Static layer: grid and unselected blocks from cached tiles
+        first = max(0, exposed.left()) // self.TILE_WIDTH
+        last = max(0, exposed.right()) // self.TILE_WIDTH
+        for tile in range(first, last + 1):
+            painter.drawPixmap(tile * self.TILE_WIDTH, 0, self._tile_pixmap(tile))
         
-        # Draw time grid
-        self._draw_time_grid(painter)
-        
-        # Draw cue blocks
-        self._draw_cue_blocks(painter)
+        # Interactive layer
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        exposed_f = QRectF(exposed)
+        selected = self._block_by_id.get(self._selected_cue_id)
+        for block in (selected, self._hovered_block):
+            if block is not None and block.rect.intersects(exposed_f):
+                self._draw_block(painter, block)
         
         # Draw playhead
         self._draw_playhead(painter)
         
         painter.end()
     
-    def _draw_time_grid(self, painter: QPainter) -> None:
-        """Draw time axis and grid lines."""
+    def _tile_pixmap(self, tile: int) -> QPixmap:
+        """Get (or render) a cached static layer tile."""
+        pixmap = self._tile_cache.get(tile)
+        if pixmap is not None:
+            self._tile_cache.move_to_end(tile)
+            return pixmap
+        
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.TILE_WIDTH * dpr), int(max(1, self.height()) * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        
+        left = tile * self.TILE_WIDTH
+        rect = QRect(left, 0, self.TILE_WIDTH, self.height())
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(-left, 0)
+        painter.fillRect(rect, self._bg_color)
+        self._draw_time_grid(painter, rect)
+        self._draw_waveform(painter, rect)
+        self._draw_cue_blocks(painter, rect)
+        painter.end()
+        
+        self._tile_cache[tile] = pixmap
+        while len(self._tile_cache) > self.MAX_CACHED_TILES:
+            self._tile_cache.popitem(last=False)
+        return pixmap
+    
+    def _draw_time_grid(self, painter: QPainter, rect: QRect) -> None:
+        """Draw time axis and grid lines within rect."""
         # Header background
-        header_rect = QRect(0, 0, self.width(), self.HEADER_HEIGHT)
+        header_rect = QRect(rect.left(), 0, rect.width(), self.HEADER_HEIGHT)
         painter.fillRect(header_rect, self._header_color)
 
         # Calculate grid interval based on zoom
@@ -311,9 +515,12 @@ class TimelineCanvas(QWidget):
         painter.setPen(QPen(self._grid_color, 1))
         self._extracted_from__draw_block_19(9, painter)
         total_seconds = self._total_duration_ms / 1000
-        current_sec = 0
+        # Start one label width early: labels extend right of their line
+        first_sec = self._x_to_ms(rect.left() - 60) / 1000
+        current_sec = max(0, int(first_sec // interval_sec) * interval_sec)
+        last_sec = min(total_seconds, self._x_to_ms(rect.right() + 1) / 1000)
 
-        while current_sec <= total_seconds:
+        while current_sec <= last_sec:
             x = self._ms_to_x(current_sec * 1000)
 
             # Grid line
@@ -327,20 +534,53 @@ class TimelineCanvas(QWidget):
 
             current_sec += interval_sec
     
+    def _draw_waveform(self, painter: QPainter, rect: QRect) -> None:
+        """Draw the audio envelope lane within rect."""
+        if self._waveform is None:
+            return
+        
+        top = self.HEADER_HEIGHT + self.TRACK_HEIGHT
+        height = self.height() - top - 2
+        if height < 4:
+            return
+        center = top + height / 2
+        scale = (height / 2) / 32768.0
+        
+        ms_per_pixel = 1000.0 / self._pixels_per_second
+        peaks = self._waveform.column_peaks(
+            rect.left() * ms_per_pixel, ms_per_pixel, rect.width()
+        )
+        
+        painter.setPen(QPen(self._waveform_color, 1))
+        x = rect.left()
+        for peak in peaks:
+            if peak is None:
+                break
+            low, high = peak
+            painter.drawLine(x, int(center - high * scale), x, int(center - low * scale))
+            x += 1
+    
     def _format_time(self, seconds: float) -> str:
         """Format seconds to time string."""
         minutes, secs = divmod(int(seconds), 60)
         return f"{minutes}:{secs:02d}" if minutes > 0 else f"{secs}s"
     
-    def _draw_cue_blocks(self, painter: QPainter) -> None:
-        """Draw cue blocks."""
-        for block in self._cue_blocks:
-            self._draw_block(painter, block)
+    def _draw_cue_blocks(self, painter: QPainter, rect: QRect) -> None:
+        """Draw the unselected cue blocks within rect."""
+        for block in self._blocks_between(rect.left() - 2, rect.right() + 2):
+            if block.cue.id != self._selected_cue_id:
+                self._draw_block(painter, block, decorated=False)
     
-    def _draw_block(self, painter: QPainter, block: CueBlock) -> None:
-        """Draw a single cue block."""
+    def _draw_block(self, painter: QPainter, block: CueBlock, decorated: bool = True) -> None:
+        """
+        Draw a single cue block.
+        
+        Undecorated blocks (static layer) ignore selection and hover.
+        """
         cue = block.cue
         rect = block.rect
+        selected = decorated and block.selected
+        hovered = decorated and block == self._hovered_block
 
         # Get status color
         status_colors = {
@@ -360,9 +600,9 @@ class TimelineCanvas(QWidget):
         painter.setBrush(QBrush(gradient))
 
         # Border
-        if block.selected:
+        if selected:
             painter.setPen(QPen(self._selection_color, 2))
-        elif block == self._hovered_block:
+        elif hovered:
             painter.setPen(QPen(base_color.lighter(150), 2))
         else:
             painter.setPen(QPen(base_color.darker(130), 1))
@@ -371,7 +611,7 @@ class TimelineCanvas(QWidget):
         painter.drawRoundedRect(rect, 4, 4)
         
         # Draw resize handles when hovered or selected
-        if block.selected or block == self._hovered_block:
+        if selected or hovered:
             self._draw_resize_handles(painter, block)
 
         # Draw text if block is wide enough
@@ -493,50 +733,43 @@ class TimelineCanvas(QWidget):
         pos = event.position()
 
         # Check if clicked on a block
-        for block in self._cue_blocks:
-            if block.rect.contains(pos):
-                # Check for resize edge
-                edge = self._get_edge_at_pos(block, pos)
-                
-                self._selected_cue_id = block.cue.id
-                for b in self._cue_blocks:
-                    b.selected = b.cue.id == self._selected_cue_id
-                self.cue_selected.emit(block.cue.id)
-                
-                # Start drag operation
-                self._dragging_block = block
-                self._drag_start_pos = pos
-                self._drag_start_time_in = block.cue.time_in_ms
-                self._drag_start_time_out = block.cue.time_out_ms
-                
-                if edge == "left":
-                    self._drag_mode = DragMode.RESIZE_LEFT
-                    self.setCursor(Qt.CursorShape.SizeHorCursor)
-                elif edge == "right":
-                    self._drag_mode = DragMode.RESIZE_RIGHT
-                    self.setCursor(Qt.CursorShape.SizeHorCursor)
-                else:
-                    self._drag_mode = DragMode.MOVE
-                    self.setCursor(Qt.CursorShape.ClosedHandCursor)
-                
-                self.update()
-                return
+        if block := self._block_at(pos):
+            # Check for resize edge
+            edge = self._get_edge_at_pos(block, pos)
+            
+            self._select_block(block.cue.id)
+            self.cue_selected.emit(block.cue.id)
+            
+            # Start drag operation
+            self._dragging_block = block
+            self._drag_start_pos = pos
+            self._drag_start_time_in = block.cue.time_in_ms
+            self._drag_start_time_out = block.cue.time_out_ms
+            
+            if edge == "left":
+                self._drag_mode = DragMode.RESIZE_LEFT
+                self.setCursor(Qt.CursorShape.SizeHorCursor)
+            elif edge == "right":
+                self._drag_mode = DragMode.RESIZE_RIGHT
+                self.setCursor(Qt.CursorShape.SizeHorCursor)
+            else:
+                self._drag_mode = DragMode.MOVE
+                self.setCursor(Qt.CursorShape.ClosedHandCursor)
+            
+            return
 
         # Clicked on header or empty space - move playhead
-        new_pos = self._x_to_ms(pos.x())
-        self._playhead_position_ms = max(0, new_pos)
+        old_position_ms = self._playhead_position_ms
+        self._playhead_position_ms = max(0, self._x_to_ms(pos.x()))
         self.playhead_moved.emit(self._playhead_position_ms)
-        self.update()
+        self.update(self._playhead_rect(old_position_ms))
+        self.update(self._playhead_rect(self._playhead_position_ms))
     
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         """Handle double click."""
         if event.button() == Qt.MouseButton.LeftButton:
-            pos = event.position()
-            
-            for block in self._cue_blocks:
-                if block.rect.contains(pos):
-                    self.cue_double_clicked.emit(block.cue.id)
-                    return
+            if block := self._block_at(event.position()):
+                self.cue_double_clicked.emit(block.cue.id)
     
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Handle mouse release - complete drag operations."""
@@ -571,28 +804,28 @@ class TimelineCanvas(QWidget):
         self._hovered_block = None
         self._hover_edge = None
 
-        for block in self._cue_blocks:
-            if block.rect.contains(pos):
-                self._hovered_block = block
-                self._hover_edge = self._get_edge_at_pos(block, pos)
-                
-                # Update cursor based on hover position
-                if self._hover_edge in ("left", "right"):
-                    self.setCursor(Qt.CursorShape.SizeHorCursor)
-                else:
-                    self.setCursor(Qt.CursorShape.OpenHandCursor)
+        if block := self._block_at(pos):
+            self._hovered_block = block
+            self._hover_edge = self._get_edge_at_pos(block, pos)
+            
+            # Update cursor based on hover position
+            if self._hover_edge in ("left", "right"):
+                self.setCursor(Qt.CursorShape.SizeHorCursor)
+            else:
+                self.setCursor(Qt.CursorShape.OpenHandCursor)
 
-                # Show tooltip
-                cue = block.cue
-                tooltip = f"#{cue.cue_index} - {cue.character_name or 'N/A'}\n{ms_to_timecode(cue.time_in_ms)} → {ms_to_timecode(cue.time_out_ms)}\n{t(f'status.{cue.status.name.lower()}')}"
-                QToolTip.showText(event.globalPosition().toPoint(), tooltip, self)
-                break
+            # Show tooltip
+            cue = block.cue
+            tooltip = f"#{cue.cue_index} - {cue.character_name or 'N/A'}\n{ms_to_timecode(cue.time_in_ms)} → {ms_to_timecode(cue.time_out_ms)}\n{t(f'status.{cue.status.name.lower()}')}"
+            QToolTip.showText(event.globalPosition().toPoint(), tooltip, self)
         else:
             # Not hovering over any block
             self.setCursor(Qt.CursorShape.ArrowCursor)
 
         if old_hovered != self._hovered_block or old_edge != self._hover_edge:
-            self.update()
+            for block in (old_hovered, self._hovered_block):
+                if block is not None:
+                    self.update(self._block_update_rect(block))
     
     def _handle_drag(self, pos: QPointF) -> None:
         """Handle drag movement for cue moving/resizing."""
@@ -602,7 +835,10 @@ class TimelineCanvas(QWidget):
         delta_x = pos.x() - self._drag_start_pos.x()
         delta_ms = self._x_to_ms(delta_x) - self._x_to_ms(0)
         
-        cue = self._dragging_block.cue
+        block = self._dragging_block
+        cue = block.cue
+        old_rect = QRectF(block.rect)
+        old_time_out = cue.time_out_ms
         
         if self._drag_mode == DragMode.MOVE:
             # Move the entire cue
@@ -628,9 +864,7 @@ class TimelineCanvas(QWidget):
             new_time_out = max(self._drag_start_time_in + self.MIN_CUE_DURATION_MS, new_time_out)
             cue.time_out_ms = new_time_out
         
-        # Recalculate block positions
-        self._recalculate_blocks()
-        self.update()
+        self._move_block(block, old_rect, old_time_out)
     
     def wheelEvent(self, event: QWheelEvent) -> None:
         """Handle mouse wheel for zooming."""
@@ -668,6 +902,9 @@ class TimelineWidget(QWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
+        self._waveform_worker: Optional[WaveformWorker] = None
+        self._running_workers: set = set()  # Keeps cancelled threads alive until done
+        
         self._setup_ui()
         self._connect_signals()
     
@@ -771,6 +1008,58 @@ class TimelineWidget(QWidget):
         """Set cues to display."""
         self.canvas.set_cues(cues)
     
+    def update_cue(self, cue: Cue) -> None:
+        """Refresh a single saved cue."""
+        self.canvas.update_cue(cue)
+    
+    def load_waveform(self, media_path: Path, cache_path: Optional[Path] = None) -> None:
+        """
+        Show the waveform of a media file's audio.
+        
+        Decoding runs in a background thread; cached peaks are reused.
+        
+        Args:
+            media_path: Video or audio file
+            cache_path: Peak cache file, or None for no caching
+        """
+        self.clear_waveform()
+        worker = WaveformWorker(media_path, cache_path)
+        worker.peaks_ready.connect(self._on_waveform_ready)
+        worker.error_occurred.connect(self._on_waveform_error)
+        worker.finished.connect(self._on_waveform_worker_finished)
+        self._waveform_worker = worker
+        self._running_workers.add(worker)
+        worker.start(QThread.Priority.LowPriority)
+    
+    def clear_waveform(self) -> None:
+        """Remove the waveform and stop a running decode."""
+        if self._waveform_worker is not None:
+            self._waveform_worker.requestInterruption()
+            self._waveform_worker = None
+        self.canvas.set_waveform(None)
+    
+    def shutdown(self) -> None:
+        """Stop decoding and wait for the decode threads (before closing)."""
+        self.clear_waveform()
+        for worker in list(self._running_workers):
+            worker.requestInterruption()
+            worker.wait()
+        self._running_workers.clear()
+    
+    def _on_waveform_ready(self, pyramid: PeakPyramid) -> None:
+        """Decoding finished."""
+        if self.sender() is self._waveform_worker:
+            self.canvas.set_waveform(pyramid)
+    
+    def _on_waveform_worker_finished(self) -> None:
+        """Release a finished decode thread."""
+        self._running_workers.discard(self.sender())
+    
+    def _on_waveform_error(self, message: str) -> None:
+        """Decoding failed; the timeline simply stays without a waveform."""
+        if self.sender() is self._waveform_worker:
+            get_logger("waveform").warning(f"Waveform unavailable: {message}")
+    
     def set_selected_cue(self, cue_id: Optional[int]) -> None:
         """Set selected cue."""
         self.canvas.set_selected_cue(cue_id)
@@ -19,7 +19,7 @@ SUPPORTED_VIDEO_EXTENSIONS: Final[tuple] = (".mp4", ".mkv", ".avi", ".mov", ".we
 
 # Database
 DB_FILENAME: Final[str] = "project.db"
-DB_VERSION: Final[int] = 1
+DB_VERSION: Final[int] = 2
 
 # Lip-sync estimation constants
 # Átlagos magyar beszédsebesség: ~12-15 karakter/másodperc
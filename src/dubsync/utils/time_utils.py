@@ -8,6 +8,17 @@ import re
 from typing import Optional, Tuple
 
 
+# Időkód minta: óra, perc, másodperc, ezredmásodperc csoportokkal.
+# Más minták is beágyazhatják (pl. az SRT blokk minta).
+TIMECODE_PATTERN = r"(\d{1,2}):(\d{2}):(\d{2})[,.](\d{1,3})"
+
+_TIMECODE_RE = re.compile(rf"\s*{TIMECODE_PATTERN}\s*")
+_TIME_RANGE_RE = re.compile(rf"\s*{TIMECODE_PATTERN}\s*-->\s*{TIMECODE_PATTERN}\s*")
+
+# Ezredmásodperc szorzó a tört rész hossza szerint ("5" -> 500)
+_FRACTION_SCALE = (0, 100, 10, 1)
+
+
 def ms_to_timecode(milliseconds: int, use_comma: bool = True) -> str:
     """
     Milliszekundumot SRT formátumú időkóddá alakít.
@@ -50,25 +61,33 @@ def timecode_to_ms(timecode: str) -> int:
         >>> timecode_to_ms("01:01:01,500")
         3661500
     """
-    # Support both comma and dot as millisecond separator
-    timecode = timecode.strip().replace(",", ".")
-
-    pattern = r"^(\d{1,2}):(\d{2}):(\d{2})\.(\d{1,3})$"
-    match = re.match(pattern, timecode)
-
+    match = _TIMECODE_RE.fullmatch(timecode)
     if not match:
-        raise ValueError(f"Érvénytelen időkód formátum: {timecode}")
-
-    hours, minutes, seconds, ms = match.groups()
+        raise ValueError(f"Érvénytelen időkód formátum: {timecode.strip()}")
+    return timecode_parts_to_ms(*match.groups())
 
-    # Pad milliseconds if needed (e.g., "5" -> "500")
-    ms = ms.ljust(3, "0")
 
+def timecode_parts_to_ms(hours: str, minutes: str, seconds: str, fraction: str) -> int:
+    """
+    Előre illesztett időkód csoportokat milliszekundummá alakít.
+    
+    A TIMECODE_PATTERN csoportjait várja, így a hívónak nem kell
+    újra illesztenie az időkódot.
+    
+    Args:
+        hours: Óra
+        minutes: Perc
+        seconds: Másodperc
+        fraction: Tört másodperc (1-3 számjegy)
+        
+    Returns:
+        Idő milliszekundumban
+    """
     return (
         int(hours) * 3600000
         + int(minutes) * 60000
         + int(seconds) * 1000
-        + int(ms)
+        + int(fraction) * _FRACTION_SCALE[len(fraction)]
     )
 
 
@@ -118,15 +137,12 @@ def parse_srt_time_range(time_line: str) -> Tuple[int, int]:
     Raises:
         ValueError: Ha a formátum nem megfelelő
     """
-    parts = time_line.strip().split("-->")
-    
-    if len(parts) != 2:
+    match = _TIME_RANGE_RE.fullmatch(time_line)
+    if not match:
         raise ValueError(f"Érvénytelen SRT idősor: {time_line}")
     
-    time_in = timecode_to_ms(parts[0].strip())
-    time_out = timecode_to_ms(parts[1].strip())
-    
-    return time_in, time_out
+    groups = match.groups()
+    return timecode_parts_to_ms(*groups[:4]), timecode_parts_to_ms(*groups[4:])
 
 
 def frames_to_ms(frames: int, fps: float = 25.0) -> int:
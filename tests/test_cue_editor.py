@@ -0,0 +1,47 @@
+"""
+DubSync Cue Editor Tests
+
+Cue szerkesztő panel tesztjei.
+"""
+
+from dubsync.models.cue import Cue
+from dubsync.ui.cue_editor import CueEditorWidget
+from dubsync.utils.constants import CueStatus
+
+
+def _cue():
+    return Cue(id=1, cue_index=1, time_in_ms=0, time_out_ms=2000,
+               source_text="Hello there", translated_text="Szia", lip_sync_ratio=0.5)
+
+
+class TestCueEditor:
+    """Szerkesztés másolaton."""
+
+    def test_unsaved_edits_keep_cue(self, qapp):
+        """Mentés nélkül a megosztott cue nem változik."""
+        cue = _cue()
+        editor = CueEditorWidget()
+        editor.set_cue(cue)
+
+        editor.translated_text.setPlainText("Szia, hogy vagy ma, kedves barátom?")
+        editor._update_lipsync()
+        editor.clear()
+
+        assert cue.translated_text == "Szia"
+        assert cue.lip_sync_ratio == 0.5
+
+    def test_get_cue_returns_copy(self, qapp):
+        """get_cue() másolatot ad, a megosztott cue csak mentéskor változik."""
+        cue = _cue()
+        editor = CueEditorWidget()
+        editor.set_cue(cue)
+
+        editor.translated_text.setPlainText("Szia, hogy vagy?")
+        edited = editor.get_cue()
+
+        assert edited is not cue
+        assert edited.translated_text == "Szia, hogy vagy?"
+        assert edited.status == CueStatus.NEW
+        assert edited.lip_sync_ratio != 0.5
+        assert cue.translated_text == "Szia"
+        assert cue.lip_sync_ratio == 0.5
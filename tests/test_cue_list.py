@@ -0,0 +1,205 @@
+"""
+DubSync Cue List Tests
+
+Cue lista modell és szűrő tesztjei.
+"""
+
+import pytest
+from PySide6.QtCore import Qt
+
+from dubsync.models.cue import Cue
+from dubsync.ui.cue_list import CueFilterProxyModel, CueListWidget, CueTableModel
+from dubsync.utils.constants import CueStatus
+
+
+def _cues():
+    return [
+        Cue(id=10, cue_index=1, time_in_ms=1000, time_out_ms=2000,
+            source_text="Hello", translated_text="Szia", character_name="Anna",
+            status=CueStatus.TRANSLATED, lip_sync_ratio=0.5),
+        Cue(id=20, cue_index=2, time_in_ms=3000, time_out_ms=4000,
+            source_text="Goodbye", character_name="Béla"),
+        Cue(id=30, cue_index=3, time_in_ms=5000, time_out_ms=6000,
+            source_text="See you", translated_text="Viszlát",
+            status=CueStatus.APPROVED),
+    ]
+
+
+@pytest.fixture
+def model(qapp):
+    """Modell három cue-val."""
+    model = CueTableModel()
+    model.set_cues(_cues())
+    return model
+
+
+class TestCueTableModel:
+    """Táblamodell tesztek."""
+
+    def test_counts(self, model):
+        """Sorok és oszlopok száma."""
+        assert model.rowCount() == 3
+        assert model.columnCount() == CueTableModel.COLUMN_COUNT
+        assert model.rowCount(model.index(0, 0)) == 0
+
+    def test_display(self, model):
+        """Cellaszövegek."""
+        def text(row, col):
+            return model.data(model.index(row, col), Qt.ItemDataRole.DisplayRole)
+
+        assert text(0, CueTableModel.COL_INDEX) == "1"
+        assert text(0, CueTableModel.COL_TIME_IN) == "00:00:01"
+        assert text(0, CueTableModel.COL_CHARACTER) == "Anna"
+        assert text(0, CueTableModel.COL_TEXT) == "Szia"
+        assert text(1, CueTableModel.COL_CHARACTER) == "Béla"
+        assert text(1, CueTableModel.COL_TEXT) == "Goodbye"  # Nincs fordítás
+        assert text(0, CueTableModel.COL_LIPSYNC) == "✓"
+        assert text(1, CueTableModel.COL_LIPSYNC) == "?"
+
+    def test_roles(self, model):
+        """Cue, igazítás és színek."""
+        index = model.index(1, CueTableModel.COL_TEXT)
+
+        assert model.data(index, CueTableModel.CueRole).id == 20
+        assert model.data(index, Qt.ItemDataRole.ForegroundRole) is not None  # Fordítatlan
+        assert model.data(model.index(0, CueTableModel.COL_TEXT),
+                          Qt.ItemDataRole.ForegroundRole) is None
+        assert model.data(model.index(0, CueTableModel.COL_STATUS),
+                          Qt.ItemDataRole.TextAlignmentRole) == Qt.AlignmentFlag.AlignCenter
+        assert model.data(index, Qt.ItemDataRole.BackgroundRole) is None
+
+    def test_update_cue_emits_one_row(self, model):
+        """Egy cue frissítése csak a saját sorát jelzi változottnak."""
+        changes = []
+        model.dataChanged.connect(
+            lambda top, bottom, roles=None: changes.append((top.row(), bottom.row(), bottom.column())))
+        cue = model.cue_at(1)
+        cue.translated_text = "Viszontlátásra"
+
+        model.update_cue(cue)
+
+        assert changes == [(1, 1, CueTableModel.COLUMN_COUNT - 1)]
+        assert model.data(model.index(1, CueTableModel.COL_TEXT)) == "Viszontlátásra"
+
+    def test_update_unknown_cue_ignored(self, model):
+        """Ismeretlen cue frissítése nem jelez."""
+        changes = []
+        model.dataChanged.connect(lambda *args: changes.append(args))
+
+        model.update_cue(Cue(id=99))
+
+        assert changes == []
+
+
+class TestCueFilterProxyModel:
+    """Szűrő tesztek."""
+
+    @pytest.fixture
+    def proxy(self, model):
+        proxy = CueFilterProxyModel()
+        proxy.setSourceModel(model)
+        return proxy
+
+    def _ids(self, proxy):
+        return [proxy.data(proxy.index(row, 0), CueTableModel.CueRole).id
+                for row in range(proxy.rowCount())]
+
+    def test_status_filter(self, proxy):
+        """Státusz szerinti szűrés."""
+        proxy.set_filter("", CueStatus.APPROVED.value)
+        assert self._ids(proxy) == [30]
+
+        proxy.set_filter("", None)
+        assert self._ids(proxy) == [10, 20, 30]
+
+    def test_search(self, proxy):
+        """Kis- és nagybetű független keresés forrásban, fordításban, névben."""
+        proxy.set_filter("SZIA", None)
+        assert self._ids(proxy) == [10]
+
+        proxy.set_filter("béla", None)
+        assert self._ids(proxy) == [20]
+
+        proxy.set_filter("see", CueStatus.NEW.value)
+        assert self._ids(proxy) == []
+
+    def test_updated_cue_refiltered(self, proxy, model):
+        """Mentés után a módosított sor újra szűrődik."""
+        proxy.set_filter("", CueStatus.NEW.value)
+        cue = model.cue_at(1)
+        cue.status = CueStatus.TRANSLATED
+
+        model.update_cue(cue)
+
+        assert self._ids(proxy) == []
+
+
+class TestCueListWidget:
+    """Kijelölés és kiemelés cue id alapján."""
+
+    @pytest.fixture
+    def widget(self, qapp):
+        widget = CueListWidget()
+        widget.set_cues(_cues())
+        return widget
+
+    def _highlighted_ids(self, widget):
+        model = widget.model
+        return [
+            model.cue_at(row).id for row in range(model.rowCount())
+            if model.data(model.index(row, CueTableModel.COL_TEXT),
+                          Qt.ItemDataRole.BackgroundRole) is not None
+        ]
+
+    def test_select_and_highlight(self, widget):
+        """Kijelölés és kiemelés id alapján."""
+        widget.select_cue(20)
+        widget.highlight_cue(30)
+
+        assert widget.get_selected_cue_id() == 20
+        assert self._highlighted_ids(widget) == [30]
+
+    def test_after_set_cues(self, widget):
+        """Új (átrendezett, bővített) lista után is a jó sor."""
+        widget.highlight_cue(30)
+        cues = _cues()
+        cues.insert(0, Cue(id=40, cue_index=0, source_text="Új"))
+        del cues[2]  # id 20 törölve
+
+        widget.set_cues(cues)
+
+        assert widget.model.row_of(30) == 2
+        assert widget.model.row_of(20) == -1
+        assert self._highlighted_ids(widget) == [30]
+        widget.select_cue(30)
+        assert widget.get_selected_cue_id() == 30
+        widget.select_cue(20)
+        assert widget.get_selected_cue_id() == 30
+
+    def test_after_filter_change(self, widget):
+        """Szűrés után a látható sorok közül választ, a rejtettet kihagyja."""
+        widget.status_filter.setCurrentIndex(widget.status_filter.findData(CueStatus.APPROVED.value))
+
+        assert widget._view_row_of(30) == 0
+        assert widget._view_row_of(10) == -1
+        widget.select_cue(30)
+        assert widget.get_selected_cue_id() == 30
+        widget.select_cue(10)
+        assert widget.get_selected_cue_id() == 30
+
+        widget.status_filter.setCurrentIndex(0)
+        widget.select_cue(10)
+        assert widget.get_selected_cue_id() == 10
+
+    def test_after_update(self, widget):
+        """Egy cue cseréje után az id továbbra is a sorára mutat."""
+        widget.highlight_cue(20)
+        replacement = Cue(id=20, cue_index=2, source_text="Goodbye",
+                          translated_text="Viszlát", status=CueStatus.TRANSLATED)
+
+        widget.update_cue(replacement)
+        widget.select_cue(20)
+
+        assert widget.model.cue_at(1) is replacement
+        assert widget.get_selected_cue_id() == 20
+        assert self._highlighted_ids(widget) == [20]
@@ -0,0 +1,93 @@
+"""
+DubSync Cue Repository Tests
+
+Cue gyorsítótár (identity map) tesztjei.
+"""
+
+import pytest
+
+from dubsync.models.cue import Cue
+from dubsync.services.cue_repository import CueRepository
+
+
+class TestCueRepository:
+    """CueRepository tesztek."""
+    
+    @pytest.fixture
+    def repo(self, memory_db, sample_cues):
+        return CueRepository(memory_db, sample_cues[0].project_id)
+    
+    def test_all_ordered(self, repo):
+        """Cue-k index szerint rendezve."""
+        assert [c.cue_index for c in repo.all()] == [1, 2, 3]
+    
+    def test_identity_map(self, repo):
+        """Ugyanaz az objektum minden lekérésnél."""
+        first = repo.all()[0]
+        assert repo.get(first.id) is first
+        assert repo.get_by_index(1) is first
+        assert repo.all()[0] is first
+    
+    def test_no_query_after_load(self, repo, memory_db, monkeypatch):
+        """Betöltés után nincs több adatbázis lekérdezés."""
+        repo.all()
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("unexpected query")
+        
+        monkeypatch.setattr(memory_db, "fetchall", fail)
+        monkeypatch.setattr(memory_db, "fetchone", fail)
+        repo.all()
+        repo.next_after(1)
+        repo.previous_before(3)
+    
+    def test_next_and_previous(self, repo):
+        """Következő és előző cue."""
+        assert repo.next_after(1).cue_index == 2
+        assert repo.next_after(0).cue_index == 1
+        assert repo.next_after(3) is None
+        assert repo.previous_before(3).cue_index == 2
+        assert repo.previous_before(1) is None
+    
+    def test_update_patches_changed_object(self, repo, memory_db):
+        """Külső objektum mentése lecseréli a gyorsítótárazottat."""
+        cached = repo.get_by_index(2)
+        fresh = Cue.load_by_id(memory_db, cached.id)
+        fresh.translated_text = "Új szöveg"
+        fresh.save(memory_db)
+        
+        repo.update(fresh)
+        
+        assert repo.get(fresh.id) is fresh
+        assert repo.get_by_index(2) is fresh
+        assert repo.all()[1] is fresh
+    
+    def test_update_resorts_on_index_change(self, repo, memory_db, sample_project):
+        """Index változás és új cue után újrarendez."""
+        repo.all()
+        new_cue = Cue(project_id=sample_project.id, cue_index=0, source_text="First")
+        new_cue.save(memory_db)
+        
+        repo.update(new_cue)
+        
+        assert repo.all()[0] is new_cue
+        assert repo.count() == 4
+        assert repo.next_after(0).cue_index == 1
+    
+    def test_remove(self, repo):
+        """Törölt cue eltávolítása."""
+        cue = repo.get_by_index(2)
+        repo.remove(cue.id)
+        
+        assert repo.get(cue.id) is None
+        assert [c.cue_index for c in repo.all()] == [1, 3]
+    
+    def test_invalidate_reloads(self, repo, memory_db):
+        """Érvénytelenítés után újratölt."""
+        first = repo.all()[0]
+        repo.invalidate()
+        
+        assert not repo.is_loaded
+        reloaded = repo.all()[0]
+        assert reloaded is not first
+        assert reloaded.id == first.id
@@ -0,0 +1,102 @@
+"""
+DubSync Cue Time Index Tests
+
+Időintervallum index tesztjei.
+"""
+
+from dubsync.models.cue import Cue
+from dubsync.services.cue_repository import CueRepository
+from dubsync.services.cue_time_index import CueTimeIndex
+
+
+def _cue(cue_id: int, time_in: int, time_out: int) -> Cue:
+    return Cue(id=cue_id, cue_index=cue_id, time_in_ms=time_in, time_out_ms=time_out)
+
+
+class TestCueTimeIndex:
+    """CueTimeIndex tesztek."""
+    
+    def test_find_at(self):
+        """Időpont keresés, zárt intervallumokkal."""
+        index = CueTimeIndex([_cue(1, 0, 1000), _cue(2, 2000, 3000)])
+        assert index.find_at(0).id == 1
+        assert index.find_at(1000).id == 1
+        assert index.find_at(1500) is None
+        assert index.find_at(2500).id == 2
+        assert index.find_at(3001) is None
+    
+    def test_find_at_overlapping(self):
+        """Átfedésnél a korábban kezdődő cue nyer."""
+        long_cue = _cue(1, 0, 10000)
+        index = CueTimeIndex([_cue(2, 1000, 2000), long_cue, _cue(3, 5000, 6000)])
+        assert index.find_at(1500) is long_cue
+        assert index.find_at(8000) is long_cue
+        assert [c.id for c in index.find_all_at(5500)] == [1, 3]
+    
+    def test_find_in_range(self):
+        """Tartományba eső cue-k."""
+        index = CueTimeIndex([_cue(1, 0, 1000), _cue(2, 2000, 3000), _cue(3, 4000, 5000)])
+        assert [c.id for c in index.find_in_range(900, 2100)] == [1, 2]
+        assert index.find_in_range(3100, 3900) == []
+    
+    def test_overlaps_non_adjacent(self):
+        """Nem szomszédos átfedés is kiderül."""
+        long_cue = _cue(1, 0, 10000)
+        index = CueTimeIndex([long_cue, _cue(2, 1000, 2000), _cue(3, 5000, 6000)])
+        result = [(c.id, prev.id, ms) for c, prev, ms in index.overlaps()]
+        assert result == [(2, 1, 9000), (3, 1, 5000)]
+    
+    def test_empty(self):
+        """Üres index."""
+        index = CueTimeIndex()
+        assert len(index) == 0
+        assert index.find_at(0) is None
+        assert index.overlaps() == []
+    
+    def test_update_moved_cue(self):
+        """Egy cue mozgatása után az index egyezik az újraépítettel."""
+        long_cue = _cue(1, 0, 10000)
+        moved = _cue(2, 1000, 2000)
+        cues = [long_cue, moved, _cue(3, 5000, 6000), _cue(4, 12000, 13000)]
+        index = CueTimeIndex(cues)
+        
+        for time_in, time_out in [(20000, 21000), (11000, 30000), (500, 600)]:
+            moved.time_in_ms, moved.time_out_ms = time_in, time_out
+            index.update(moved)
+            rebuilt = CueTimeIndex(cues)
+            assert index.cues == rebuilt.cues
+            assert index._max_ends == rebuilt._max_ends
+        
+        assert index.find_at(550) is long_cue
+        assert [c.id for c in index.find_all_at(550)] == [1, 2]
+    
+    def test_update_replaced_object(self):
+        """Azonos id-jú új objektum a régi helyére kerül."""
+        index = CueTimeIndex([_cue(1, 0, 1000), _cue(2, 2000, 3000)])
+        replacement = _cue(1, 4000, 5000)
+        
+        index.update(replacement)
+        
+        assert len(index) == 2
+        assert index.find_at(500) is None
+        assert index.find_at(4500) is replacement
+        assert index.times_of(1) == (4000, 5000)
+        assert index.times_of(5) is None
+
+
+class TestRepositoryTimeIndex:
+    """Időindex a cue gyorsítótárban."""
+    
+    def test_find_at_time_follows_edits(self, memory_db, sample_cues):
+        """Időzítés mentése után az index frissül."""
+        repo = CueRepository(memory_db, sample_cues[0].project_id)
+        cue = repo.find_at_time(3000)
+        assert cue.cue_index == 2
+        
+        cue.time_in_ms = 20000
+        cue.time_out_ms = 21000
+        cue.save(memory_db)
+        repo.update(cue)
+        
+        assert repo.find_at_time(3000) is None
+        assert repo.find_at_time(20500) is cue
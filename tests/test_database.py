@@ -8,7 +8,11 @@ import pytest
 import sqlite3
 from pathlib import Path
 
-from dubsync.models.database import Database, init_database
+from dubsync.models import database
+from dubsync.models.database import (
+    Database, init_database, migrate_database, EDITING_PROFILE, PORTABLE_PROFILE
+)
+from dubsync.utils.constants import DB_VERSION
 
 
 class TestDatabase:
@@ -107,12 +111,159 @@ class TestDatabase:
             )
             memory_db.commit()
     
+    def test_insert_many(self, memory_db):
+        """Több sor beszúrása azonosítókkal."""
+        ids = memory_db.insert_many(
+            "INSERT INTO cues (project_id, cue_index, time_in_ms, time_out_ms) "
+            "VALUES (?, ?, ?, ?)",
+            [(1, i, i * 1000, i * 1000 + 500) for i in range(1, 4)]
+        )
+        memory_db.commit()
+        
+        assert len(ids) == 3
+        for i, cue_id in enumerate(ids, 1):
+            row = memory_db.fetchone("SELECT cue_index FROM cues WHERE id = ?", (cue_id,))
+            assert row["cue_index"] == i
+    
+    def test_insert_many_empty(self, memory_db):
+        """Üres lista beszúrása."""
+        assert memory_db.insert_many("INSERT INTO cues (cue_index) VALUES (?)", []) == []
+    
     def test_get_version(self, memory_db):
         """Verzió lekérése."""
         version = memory_db.get_version()
         assert version is not None
         assert isinstance(version, int)
 
+    def test_migrate_lipsync_engine(self, memory_db):
+        """v1 adatbázis frissítése a lip-sync motor oszlopra."""
+        memory_db.execute("ALTER TABLE project DROP COLUMN lipsync_engine")
+        memory_db.execute("UPDATE metadata SET value = '1' WHERE key = 'db_version'")
+
+        migrate_database(memory_db)
+
+        assert memory_db.get_version() == DB_VERSION
+        row = memory_db.fetchone("SELECT lipsync_engine FROM project WHERE id = 1")
+        assert row["lipsync_engine"] == "chars"
+
+
+class TestDatabaseTransaction:
+    """Unit-of-work tranzakció tesztek."""
+    
+    def _title(self, db):
+        return db.fetchone("SELECT title FROM project WHERE id = 1")["title"]
+    
+    def test_transaction_commits_once(self, file_db, temp_dir):
+        """A blokk végén egyszer commitol."""
+        with file_db.transaction():
+            file_db.execute("UPDATE project SET title = 'A' WHERE id = 1")
+            file_db.commit()  # Suppressed inside the block
+            assert file_db.in_transaction
+            
+            # Another connection must not see uncommitted changes yet
+            other = Database(temp_dir / "test_project.dubsync")
+            assert self._title(other) != "A"
+            other.close()
+        
+        assert not file_db.in_transaction
+        other = Database(temp_dir / "test_project.dubsync")
+        assert self._title(other) == "A"
+        other.close()
+    
+    def test_transaction_rollback_on_error(self, memory_db):
+        """Hiba esetén visszagörget."""
+        initial = self._title(memory_db)
+        
+        with pytest.raises(RuntimeError):
+            with memory_db.transaction():
+                memory_db.execute("UPDATE project SET title = 'B' WHERE id = 1")
+                memory_db.commit()
+                raise RuntimeError("boom")
+        
+        assert self._title(memory_db) == initial
+        assert not memory_db.in_transaction
+    
+    def test_nested_savepoint_rollback(self, memory_db):
+        """Beágyazott blokk hibája csak a saját módosításait vonja vissza."""
+        with memory_db.transaction():
+            memory_db.execute("UPDATE project SET title = 'Outer' WHERE id = 1")
+            with pytest.raises(ValueError):
+                with memory_db.transaction():
+                    memory_db.execute("UPDATE project SET title = 'Inner' WHERE id = 1")
+                    raise ValueError("inner")
+            assert self._title(memory_db) == "Outer"
+        
+        assert self._title(memory_db) == "Outer"
+    
+    def test_nested_commit(self, memory_db):
+        """Beágyazott blokk sikeres lezárása."""
+        with memory_db.transaction():
+            with memory_db.transaction():
+                memory_db.execute("UPDATE project SET title = 'Nested' WHERE id = 1")
+        
+        memory_db.rollback()
+        assert self._title(memory_db) == "Nested"
+
+
+class TestConnectionProfile:
+    """Kapcsolat profil tesztek."""
+    
+    def test_editing_profile_uses_wal(self, file_db):
+        """Szerkesztés közben WAL mód."""
+        mode = file_db.fetchone("PRAGMA journal_mode")[0]
+        assert mode == "wal"
+        assert file_db.fetchone("PRAGMA synchronous")[0] == 1  # NORMAL
+    
+    def test_portable_profile(self, temp_dir):
+        """Alapértelmezett SQLite beállítások."""
+        db = Database(temp_dir / "portable.dubsync", PORTABLE_PROFILE)
+        init_database(db)
+        assert db.fetchone("PRAGMA journal_mode")[0] == "delete"
+        db.close()
+    
+    def test_network_path_falls_back(self, temp_dir, monkeypatch):
+        """Hálózati meghajtón WAL helyett hordozható profil."""
+        monkeypatch.setattr(database, "_is_network_path", lambda path: True)
+        db = Database(temp_dir / "network.dubsync", EDITING_PROFILE)
+        init_database(db)
+        
+        assert db.fetchone("PRAGMA journal_mode")[0] == "delete"
+        assert db.profile == PORTABLE_PROFILE
+        db.close()
+    
+    def test_local_path_not_network(self, temp_dir):
+        """Helyi ideiglenes könyvtár nem hálózati."""
+        assert not database._is_network_path(temp_dir / "local.dubsync")
+    
+    def test_memory_db_ignores_journal_mode(self, memory_db):
+        """Memória adatbázis nem vált WAL módra."""
+        assert memory_db.fetchone("PRAGMA journal_mode")[0] == "memory"
+    
+    def test_close_restores_single_file(self, temp_dir):
+        """Bezáráskor egyetlen fájl marad."""
+        db_path = temp_dir / "single.dubsync"
+        db = Database(db_path, EDITING_PROFILE)
+        init_database(db)
+        db.execute("UPDATE project SET title = 'WAL' WHERE id = 1")
+        db.commit()
+        db.close()
+        
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["single.dubsync"]
+        
+        reopened = Database(db_path, PORTABLE_PROFILE)
+        assert reopened.fetchone("PRAGMA journal_mode")[0] == "delete"
+        assert reopened.fetchone("SELECT title FROM project WHERE id = 1")["title"] == "WAL"
+        reopened.close()
+    
+    def test_checkpoint_flushes_wal(self, file_db, temp_dir):
+        """Checkpoint után a fő fájl tartalmaz mindent."""
+        file_db.execute("UPDATE project SET title = 'Flushed' WHERE id = 1")
+        file_db.commit()
+        file_db.checkpoint()
+        
+        wal_path = temp_dir / "test_project.dubsync-wal"
+        assert not wal_path.exists() or wal_path.stat().st_size == 0
+
 
 class TestDatabaseIntegrity:
     """Adatbázis integritás tesztek."""
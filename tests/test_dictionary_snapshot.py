@@ -0,0 +1,124 @@
+"""
+DubSync Dictionary Snapshot Tests
+
+Előfordított szótár pillanatképek tesztjei.
+"""
+
+import pickle
+
+import pytest
+
+from dubsync.services import dictionary_snapshot
+from dubsync.services.dictionary_snapshot import (
+    LazyPattern, build_snapshot, dictionary_fingerprint, load_dictionary,
+    load_snapshot, snapshot_path
+)
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    """Apró Hunspell szótár egy toldalékkal."""
+    base = tmp_path / "dict" / "xx_XX"
+    base.parent.mkdir()
+    base.with_suffix(".aff").write_text(
+        "SET UTF-8\n\nSFX A Y 1\nSFX A 0 k [^k]\n", encoding="utf-8")
+    base.with_suffix(".dic").write_text("2\nalma/A\nkörte\n", encoding="utf-8")
+    return base
+
+
+class TestLazyPattern:
+    """Késleltetett fordítású minta."""
+
+    def test_compiled_on_first_use(self):
+        """Csak használatkor fordul, és csak a minta pickle-ődik."""
+        pattern = LazyPattern("a$")
+
+        restored = pickle.loads(pickle.dumps(pattern))
+
+        assert restored._compiled is None
+        assert restored.search("alma")
+        assert restored.sub("o", "alma") == "almo"
+        assert restored.pattern == "a$"
+
+
+class TestSnapshot:
+    """Pillanatkép építés és betöltés."""
+
+    def test_fingerprint_follows_content(self, dictionary):
+        """A hash a fájlok tartalmát követi."""
+        before = dictionary_fingerprint(dictionary)
+        dictionary.with_suffix(".dic").write_text("1\nalma\n", encoding="utf-8")
+
+        assert dictionary_fingerprint(dictionary) != before
+
+    def test_roundtrip(self, dictionary, tmp_path):
+        """A betöltött pillanatkép ugyanúgy ellenőriz."""
+        build_snapshot(dictionary, tmp_path / "cache")
+
+        loaded = load_snapshot(dictionary, tmp_path / "cache")
+
+        assert loaded.lookup("almák") is False
+        assert loaded.lookup("almak")
+        assert loaded.lookup("körte")
+        assert not loaded.lookup("körtek")
+
+    def test_missing_or_stale(self, dictionary, tmp_path):
+        """Nincs pillanatkép, vagy a szótár megváltozott."""
+        cache = tmp_path / "cache"
+        assert load_snapshot(dictionary, cache) is None
+
+        build_snapshot(dictionary, cache)
+        dictionary.with_suffix(".dic").write_text("1\nkörte\n", encoding="utf-8")
+
+        assert load_snapshot(dictionary, cache) is None
+
+    def test_load_dictionary_builds_once(self, dictionary, tmp_path, monkeypatch):
+        """Első betöltéskor épül, utána a pillanatképből jön."""
+        cache = tmp_path / "cache"
+        load_dictionary(dictionary, cache)
+        assert snapshot_path(dictionary, cache).exists()
+
+        monkeypatch.setattr(dictionary_snapshot, "build_snapshot",
+                            lambda *args: pytest.fail("rebuilt"))
+        assert load_dictionary(dictionary, cache).lookup("almak")
+
+    def test_rebuild_removes_stale(self, dictionary, tmp_path):
+        """Új szótárverzió pillanatképe a régit törli."""
+        cache = tmp_path / "cache"
+        old = build_snapshot(dictionary, cache)
+        dictionary.with_suffix(".dic").write_text("1\nkörte\n", encoding="utf-8")
+
+        new = build_snapshot(dictionary, cache)
+
+        assert list(cache.iterdir()) == [new]
+        assert new != old
+
+    def test_prebuilt_dir(self, dictionary, tmp_path):
+        """Megadott könyvtárba előre épített pillanatkép is használható."""
+        build_snapshot(dictionary, dictionary.parent)
+
+        loaded = load_dictionary(dictionary, tmp_path / "cache", prebuilt_dirs=[dictionary.parent])
+
+        assert loaded.lookup("almak")
+        assert not (tmp_path / "cache").exists()
+
+    def test_untrusted_dir_ignored(self, dictionary, tmp_path, monkeypatch):
+        """A szótár melletti (pl. munkakönyvtárbeli) pillanatkép nem töltődik be."""
+        path = snapshot_path(dictionary, dictionary.parent)
+        with open(path, "wb") as f:
+            pickle.dump({"version": dictionary_snapshot._SNAPSHOT_VERSION,
+                         "spylls": dictionary_snapshot._spylls_version(),
+                         "fingerprint": dictionary_fingerprint(dictionary)}, f)
+            pickle.dump("planted", f)
+
+        loaded = load_dictionary(dictionary, tmp_path / "cache")
+
+        assert loaded != "planted"
+        assert loaded.lookup("almak")
+        assert snapshot_path(dictionary, tmp_path / "cache").exists()
+
+    def test_cli(self, dictionary, capsys):
+        """Parancssori építés."""
+        assert dictionary_snapshot.main([str(dictionary.with_suffix(".dic"))]) == 0
+
+        assert snapshot_path(dictionary, dictionary.parent).exists()
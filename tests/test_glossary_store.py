@@ -0,0 +1,153 @@
+"""
+DubSync Glossary Store Tests
+
+SQLite szótár tároló tesztjei.
+"""
+
+import json
+import threading
+
+import pytest
+
+from dubsync.models.cue import Cue
+from dubsync.plugins.builtin.glossary import GlossaryData
+from dubsync.services.glossary_store import GlossaryStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Fájl alapú szótár tároló."""
+    store = GlossaryStore(tmp_path / "glossary.db")
+    yield store
+    store.close()
+
+
+class TestGlossaryStore:
+    """GlossaryStore tesztek."""
+
+    def test_named_glossaries(self, store):
+        """Több szótár, sorozathoz rendelve."""
+        store.create_glossary("Star Trek", show="Star Trek")
+        store.create_glossary("Alapszótár")
+
+        assert [g.name for g in store.list_glossaries()] == ["Alapszótár", "Star Trek"]
+        assert [g.name for g in store.list_glossaries(show="Star Trek")] == ["Star Trek"]
+        with pytest.raises(ValueError):
+            store.create_glossary("star trek".title())
+        assert store.unique_name("Star Trek") == "Star Trek (2)"
+
+    def test_entry_crud(self, store):
+        """Bejegyzésenkénti írás."""
+        info = store.create_glossary("G")
+        entry_id = store.add_entry(info.id, "ship", "hajó")
+        store.update_entry(entry_id, "ship", "űrhajó", "sci-fi")
+        second = store.add_entry(info.id, "captain", "kapitány")
+        store.delete_entry(second)
+
+        rows = store.entries(info.id)
+
+        assert [(r.source, r.target, r.notes) for r in rows] == [("ship", "űrhajó", "sci-fi")]
+
+    def test_search(self, store):
+        """Teljes szöveges keresés előtagokkal, szótárra szűkítve."""
+        first = store.create_glossary("A")
+        second = store.create_glossary("B")
+        store.add_entries(first.id, [("space ship", "űrhajó", ""), ("hull", "hajótest", "ship part")])
+        store.add_entries(second.id, [("shipyard", "hajógyár", "")])
+
+        sources = [r.source for r in store.search("ship")]
+        assert set(sources[:2]) == {"space ship", "shipyard"}
+        assert sources[2] == "hull"  # Megjegyzés találat a végén
+        assert [r.source for r in store.search("ship", glossary_id=second.id)] == ["shipyard"]
+        assert [r.source for r in store.search("hajót")] == ["hull"]
+
+        store.update_entry(store.search("hull")[0].id, "hull", "törzs", "")
+        assert store.search("hajót") == []
+
+    def test_delete_glossary(self, store):
+        """Szótár törlése a bejegyzéseivel és a keresési indexből."""
+        info = store.create_glossary("G")
+        store.add_entries(info.id, [("ship", "hajó", "")])
+
+        store.delete_glossary(info.id)
+
+        assert store.list_glossaries() == []
+        assert store.search("ship") == []
+
+    def test_json_round_trip(self, store, tmp_path):
+        """Import / export a .glossync formátumban."""
+        path = tmp_path / "in.glossync"
+        path.write_text(json.dumps({
+            "name": "Import", "source_lang": "en", "target_lang": "hu",
+            "entries": [{"source": "ship", "target": "hajó", "notes": "n"}],
+        }), encoding="utf-8")
+
+        info = store.import_file(path)
+        again = store.import_file(path)
+        store.export_file(info.id, tmp_path / "out.glossync")
+
+        assert again.name == "Import (2)"
+        exported = json.loads((tmp_path / "out.glossync").read_text(encoding="utf-8"))
+        assert exported["entries"] == [{"source": "ship", "target": "hajó", "notes": "n"}]
+        assert GlossaryData.load_from_file(tmp_path / "out.glossync").find_translation("ship") == "hajó"
+
+
+class TestGlossaryDataStore:
+    """Tárolóból betöltött GlossaryData."""
+
+    def test_edits_written_through(self, tmp_path):
+        """Módosítások azonnal az adatbázisba kerülnek, újranyitás után is megvannak."""
+        path = tmp_path / "glossary.db"
+        store = GlossaryStore(path)
+        info = store.create_glossary("G")
+        glossary = GlossaryData.from_store(store, info)
+
+        with glossary.batch():
+            ship = glossary.add_entry("ship", "hajó")
+            captain = glossary.add_entry("captain", "kapitány")
+        glossary.update_entry(ship, "ship", "űrhajó")
+        glossary.remove_entry(captain)
+        store.close()
+
+        store = GlossaryStore(path)
+        reloaded = GlossaryData.from_store(store, store.find_glossary("G"))
+        store.close()
+
+        assert [(e.source, e.target) for e in reloaded.entries] == [("ship", "űrhajó")]
+        assert reloaded.entries[0].id == ship.id
+        assert reloaded.find_translation("SHIP") == "űrhajó"
+
+
+class TestGlossaryDataThreads:
+    """Háttérszálas QA ellenőrzés szerkesztés közben."""
+
+    def test_check_while_editing(self):
+        """Az ellenőrzés nem akad el a párhuzamos módosításokon."""
+        glossary = GlossaryData()
+        glossary.add_entry("ship", "hajó")
+        glossary.build_indexes()
+        cues = [Cue(id=i, source_text="The ship and the captain", translated_text="A hajó")
+                for i in range(1, 50)]
+        errors = []
+        stop = threading.Event()
+
+        def check():
+            try:
+                while not stop.is_set():
+                    glossary.check_consistency(cues)
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=check)
+        thread.start()
+        try:
+            for i in range(300):
+                entry = glossary.add_entry(f"captain{i % 3}", "kapitány")
+                glossary.update_entry(entry, "captain", "kapitány")
+                glossary.remove_entry(entry)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert errors == []
+        assert glossary.check_consistency(cues) == []
@@ -5,6 +5,7 @@ Lip-sync becslő tesztek.
 """
 
 import pytest
+from dubsync.services import lip_sync
 from dubsync.services.lip_sync import (
     LipSyncEstimator, LipSyncResult, estimate_lipsync, check_cue_lipsync,
     get_lipsync_color
@@ -135,6 +136,69 @@ class TestLipSyncEstimator:
         assert min_duration == 1000
 
 
+class TestEstimateMany:
+    """Tömeges becslés tesztjei."""
+    
+    @pytest.fixture
+    def cues(self):
+        """Vegyes cue-k: gyors eredeti, zárójeles utasítás, nulla hossz."""
+        return [
+            Cue(time_in_ms=0, time_out_ms=2000, source_text="Hello there", translated_text="Szia"),
+            Cue(time_in_ms=0, time_out_ms=1000,
+                source_text="This was spoken really fast, very fast indeed",
+                translated_text="Ez nagyon gyorsan hangzott el"),
+            Cue(time_in_ms=0, time_out_ms=3000, source_text="[sighs]  Oh\nno"),
+            Cue(time_in_ms=0, time_out_ms=3000, source_text="", translated_text=""),
+            Cue(time_in_ms=500, time_out_ms=500, source_text="Zero", translated_text="Nulla"),
+        ]
+    
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_matches_estimate_cue(self, cues, monkeypatch, use_numpy):
+        """Ugyanazt adja, mint az egyenkénti becslés."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(lip_sync, "np", None)
+        estimator = LipSyncEstimator(chars_per_second=11.0)
+        
+        ratios = list(estimator.estimate_many(cues))
+        
+        assert ratios == [estimator.estimate_cue(cue).ratio for cue in cues]
+    
+    def test_update_ratios(self, cues):
+        """Arányok visszaírása a cue-kba."""
+        estimator = LipSyncEstimator()
+        estimator.update_ratios(cues)
+        
+        assert [cue.lip_sync_ratio for cue in cues] == [
+            estimator.estimate_cue(cue).ratio for cue in cues
+        ]
+        assert isinstance(cues[0].lip_sync_ratio, float)
+    
+    def test_cleaned_length(self):
+        """Tisztított hossz."""
+        estimator = LipSyncEstimator()
+        for text in ["", "  a  b\nc ", "[sóhajt] Igen [halkan]", "no brackets"]:
+            assert estimator.cleaned_length(text) == len(estimator._prepare_text(text))
+
+
+    def test_cleaned_length_cached(self):
+        """A változatlan szöveg csak egyszer tisztítódik."""
+        estimator = LipSyncEstimator()
+        source = "Egyedi forrásszöveg [sóhajt] a gyorsítótár teszthez"
+        before = lip_sync._cleaned_length.cache_info()
+        
+        for typed in ["Gy", "Gyo", "Gyor", "Gyors"]:
+            estimator.estimate(typed, 2000, source)
+        
+        after = lip_sync._cleaned_length.cache_info()
+        # 4 translations + the source once
+        assert after.misses - before.misses == 5
+        # Length and speech units of each translation share one entry,
+        # the source is reused by the last 3 estimates
+        assert after.hits - before.hits == 4 + 3
+
+
 class TestLipSyncResult:
     """LipSyncResult tesztek."""
     
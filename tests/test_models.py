@@ -9,7 +9,7 @@ from datetime import datetime
 
 from dubsync.models.database import Database, init_database
 from dubsync.models.project import Project
-from dubsync.models.cue import Cue
+from dubsync.models.cue import Cue, CueBatch
 from dubsync.models.comment import Comment
 from dubsync.utils.constants import CueStatus, CommentStatus
 
@@ -76,7 +76,16 @@ class TestProjectModel:
         reloaded = Project.load(memory_db, 1)
         assert reloaded is not None
         assert reloaded.title == "Save Test"
-    
+
+    def test_lipsync_engine_round_trip(self, memory_db):
+        """Lip-sync motor mentése projektenként."""
+        project = Project.load(memory_db, 1)
+        assert project.lipsync_engine == "chars"
+        project.lipsync_engine = "syllables"
+        project.save(memory_db)
+
+        assert Project.load(memory_db, 1).lipsync_engine == "syllables"
+
     def test_load_project(self, memory_db, sample_project):
         """Projekt betöltése."""
         loaded = Project.load(memory_db, sample_project.id)
@@ -316,6 +325,54 @@ class TestCueModel:
         assert counts.get(CueStatus.APPROVED, 0) == 2
 
 
+class TestCueBatch:
+    """CueBatch tesztek."""
+    
+    def test_save_all_assigns_ids(self, memory_db, sample_project):
+        """Kötegelt beszúrás azonosítókat ad."""
+        cues = [
+            Cue(project_id=sample_project.id, cue_index=i, source_text=f"Line {i}")
+            for i in range(1, 51)
+        ]
+        
+        CueBatch.save_all(memory_db, cues)
+        
+        ids = [cue.id for cue in cues]
+        assert all(cue_id > 0 for cue_id in ids)
+        assert len(set(ids)) == len(ids)
+        for cue in cues:
+            loaded = Cue.load_by_id(memory_db, cue.id)
+            assert loaded is not None
+            assert loaded.cue_index == cue.cue_index
+            assert loaded.source_text == cue.source_text
+    
+    def test_save_all_mixed(self, memory_db, sample_project):
+        """Beszúrás és frissítés egy kötegben."""
+        existing = Cue(project_id=sample_project.id, cue_index=1, source_text="Old")
+        existing.save(memory_db)
+        existing.source_text = "Updated"
+        new_cue = Cue(project_id=sample_project.id, cue_index=2, source_text="New")
+        
+        CueBatch.save_all(memory_db, [existing, new_cue])
+        
+        loaded = Cue.load_all(memory_db, sample_project.id)
+        assert [c.source_text for c in loaded] == ["Updated", "New"]
+        assert new_cue.id == loaded[1].id
+    
+    def test_save_all_rollback_on_error(self, memory_db, sample_project):
+        """Hiba esetén semmi sem kerül mentésre."""
+        cues = [
+            Cue(project_id=sample_project.id, cue_index=1),
+            Cue(project_id=999, cue_index=2),  # Invalid foreign key
+        ]
+        
+        with pytest.raises(Exception):
+            CueBatch.save_all(memory_db, cues)
+        
+        assert Cue.load_all(memory_db, sample_project.id) == []
+        assert all(cue.id == 0 for cue in cues)
+
+
 class TestCommentModel:
     """Comment model tesztek."""
     
@@ -4,6 +4,8 @@ DubSync Project Manager Tests
 ProjectManager szolgáltatás tesztjei.
 """
 
+import sqlite3
+
 import pytest
 from pathlib import Path
 
@@ -131,6 +133,16 @@ Just working on a project.
         assert new_path.exists()
         assert manager.project_path == new_path
     
+    def test_save_as_from_memory_is_single_file(self, manager, temp_dir):
+        """Memória projekt mentése után egyetlen fájl marad."""
+        manager.new_project(None)
+        target = temp_dir / "memory_saved.dubsync"
+        
+        manager.save_project(target)
+        manager.close()
+        
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["memory_saved.dubsync"]
+    
     def test_import_srt(self, manager, temp_dir, sample_srt_file):
         """SRT importálás."""
         project_path = temp_dir / "srt_import.dubsync"
@@ -183,6 +195,37 @@ Just working on a project.
         reloaded_cues = manager.get_cues()
         assert reloaded_cues[0].translated_text == "Szia, hogy vagy?"
     
+    def test_save_cue_copy_updates_cache(self, manager, temp_dir, sample_srt_file):
+        """Szerkesztett másolat mentése a gyorsítótárazott cue-t frissíti."""
+        self._extracted_from_test_get_statistics_3(
+            temp_dir, "save_copy.dubsync", manager, sample_srt_file
+        )
+        cached = manager.get_cues()[0]
+        edited = Cue(**{**cached.__dict__, "translated_text": "Szia"})
+
+        saved = manager.save_cue(edited)
+
+        assert saved is cached
+        assert cached.translated_text == "Szia"
+        assert manager.get_cues()[0] is cached
+    
+    def test_failed_save_reloads_cache(self, manager, temp_dir, sample_srt_file, monkeypatch):
+        """Sikertelen mentés után a gyorsítótár az adatbázis állapotát adja."""
+        self._extracted_from_test_get_statistics_3(
+            temp_dir, "save_fail.dubsync", manager, sample_srt_file
+        )
+        cue = manager.get_cues()[0]
+        cue.translated_text = "Nem mentett"
+
+        def fail(self, db):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(Cue, "save", fail)
+        with pytest.raises(sqlite3.OperationalError):
+            manager.save_cue(cue)
+
+        assert manager.get_cues()[0].translated_text == ""
+    
     def test_update_project(self, manager, temp_dir):
         """Projekt adatok frissítése."""
         project_path = temp_dir / "update_project.dubsync"
@@ -254,6 +297,65 @@ Just working on a project.
         assert "total_cues" in stats
         assert stats["total_cues"] == 4
 
+    def test_insert_cue_at_shifts_indices(self, manager, temp_dir, sample_srt_file):
+        """Beszúrás eltolja a későbbi cue-k indexét."""
+        self._extracted_from_test_get_statistics_3(
+            temp_dir, "insert.dubsync", manager, sample_srt_file
+        )
+        new_cue = manager.insert_cue_at(2)
+        
+        cues = manager.get_cues()
+        assert [c.cue_index for c in cues] == [1, 2, 3, 4, 5]
+        assert cues[1].id == new_cue.id
+        assert cues[2].source_text == "I'm fine, thank you."
+    
+    def test_delete_cue_reindexes(self, manager, temp_dir, sample_srt_file):
+        """Törlés után az indexek folytonosak."""
+        self._extracted_from_test_get_statistics_3(
+            temp_dir, "delete.dubsync", manager, sample_srt_file
+        )
+        cues = manager.get_cues()
+        manager.delete_cue(cues[1].id)
+        
+        remaining = manager.get_cues()
+        assert [c.cue_index for c in remaining] == [1, 2, 3]
+        assert remaining[1].source_text == "What are you doing?"
+
+    def test_recalculate_all_lipsync(self, manager, temp_dir, sample_srt_file):
+        """Tömeges újraszámolás az adatbázisba is kiíródik."""
+        self._extracted_from_test_get_statistics_3(
+            temp_dir, "lipsync.dubsync", manager, sample_srt_file
+        )
+        cues = manager.get_cues()
+        for cue in cues:
+            cue.lip_sync_ratio = None
+        
+        assert manager.recalculate_all_lipsync() == 4
+        
+        stored = Cue.load_all(manager.db)
+        assert all(c.lip_sync_ratio is not None for c in stored)
+        assert [c.lip_sync_ratio for c in stored] == [c.lip_sync_ratio for c in cues]
+
+    def test_recalculate_all_lipsync_failure_reloads_cache(
+        self, manager, temp_dir, sample_srt_file, monkeypatch
+    ):
+        """Sikertelen tömeges mentés után nem maradnak ki nem írt arányok."""
+        self._extracted_from_test_get_statistics_3(
+            temp_dir, "lipsync_fail.dubsync", manager, sample_srt_file
+        )
+        manager.db.execute("UPDATE cues SET lip_sync_ratio = NULL")
+        manager.db.commit()
+        manager.invalidate_cues()
+
+        def fail(db, cues):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr("dubsync.services.project_manager.CueBatch.save_lip_sync_ratios", fail)
+        with pytest.raises(sqlite3.OperationalError):
+            manager.recalculate_all_lipsync()
+
+        assert all(c.lip_sync_ratio is None for c in manager.get_cues())
+
     # TODO Rename this here and in `test_import_srt_clears_existing`, `test_get_cues`, `test_update_cue`, `test_export_srt` and `test_get_statistics`
     def _extracted_from_test_get_statistics_3(self, temp_dir, arg1, manager, sample_srt_file):
         project_path = temp_dir / arg1
@@ -0,0 +1,224 @@
+"""
+DubSync QA Engine Tests
+
+Inkrementális QA motor és a BasicQAPlugin tesztjei.
+"""
+
+import random
+
+import pytest
+
+from dubsync.models.cue import Cue
+from dubsync.plugins import qa_engine
+from dubsync.plugins.base import QAIssue
+from dubsync.plugins.builtin.basic_qa import BasicQAPlugin
+from dubsync.plugins.qa_engine import IncrementalQAEngine, QAFinding
+
+
+def _cues():
+    """Három cue, a második fordítatlan."""
+    return [
+        Cue(id=1, cue_index=1, time_in_ms=0, time_out_ms=2000,
+            translated_text="Szia", character_name="Anna"),
+        Cue(id=2, cue_index=2, time_in_ms=3000, time_out_ms=5000,
+            translated_text="", character_name="Béla"),
+        Cue(id=3, cue_index=3, time_in_ms=6000, time_out_ms=8000,
+            translated_text="Viszlát", character_name="Anna"),
+    ]
+
+
+class TestIncrementalQAEngine:
+    """IncrementalQAEngine tesztek."""
+
+    @pytest.fixture
+    def engine(self):
+        def check_cue(cue, overlap):
+            findings = []
+            if not cue.translated_text:
+                findings.append(QAFinding(cue.id, "warning", "missing"))
+            if overlap:
+                findings.append(QAFinding(cue.id, "error", "overlap", {"ms": overlap[1]}))
+            return findings
+        return IncrementalQAEngine(check_cue)
+
+    def test_first_run_checks_all(self, engine):
+        """Első futás: minden cue ellenőrzése."""
+        findings = engine.run(_cues())
+
+        assert engine.rechecked == 3
+        assert [(f.cue_id, f.message_key) for f in findings] == [(2, "missing")]
+
+    def test_unchanged_cues_cached(self, engine):
+        """Változatlan cue-k nem ellenőrződnek újra."""
+        cues = _cues()
+        engine.run(cues)
+        engine.run()
+
+        assert engine.rechecked == 0
+
+    def test_edit_in_place(self, engine):
+        """Helyben módosított cue újraellenőrzése."""
+        cues = _cues()
+        engine.run(cues)
+        cues[1].translated_text = "Kész"
+
+        assert engine.update_cue(cues[1]) == []
+        assert engine.rechecked == 1
+
+    def test_any_cue_field_rechecks(self, engine):
+        """A szabályok a teljes cue-t látják: bármely mező változása újraellenőriz."""
+        cues = _cues()
+        engine.run(cues)
+        cues[0].notes = "megjegyzés"
+        cues[2].cue_index = 4
+
+        engine.run()
+
+        assert engine.rechecked == 2
+
+    def test_moved_cue_rechecks_neighbour(self, engine):
+        """Átfedést okozó mozgatás a szomszédot is újraellenőrzi."""
+        cues = _cues()
+        engine.run(cues)
+        cues[0].time_out_ms = 3500
+
+        findings = engine.update_cue(cues[0])
+
+        assert engine.rechecked == 2
+        assert (2, "overlap", {"ms": 500}) in [
+            (f.cue_id, f.message_key, f.params) for f in findings
+        ]
+
+    def test_update_skips_distant_cues(self, engine, monkeypatch):
+        """Mentéskor a távoli cue-k kulcsa sem számolódik újra."""
+        cues = _cues()
+        engine.run(cues)
+        keyed = []
+        content_key = qa_engine.cue_content_key
+        monkeypatch.setattr(qa_engine, "cue_content_key",
+                            lambda cue, overlap: keyed.append(cue.id) or content_key(cue, overlap))
+        cues[2].translated_text = ""
+
+        findings = engine.update_cue(cues[2])
+
+        assert keyed == [3]
+        assert [(f.cue_id, f.message_key) for f in findings] == [(2, "missing"), (3, "missing")]
+
+    def test_moved_away_clears_overlap(self, engine):
+        """Az átfedésből kimozgatott cue szomszédja is frissül."""
+        cues = _cues()
+        cues[0].time_out_ms = 3500
+        engine.run(cues)
+        cues[0].time_out_ms = 2000
+
+        findings = engine.update_cue(cues[0])
+
+        assert engine.rechecked == 2
+        assert [(f.cue_id, f.message_key) for f in findings] == [(2, "missing")]
+
+    def test_update_replacement_and_new_cue(self, engine):
+        """Azonos id-jű új objektum a régit váltja, új cue bekerül."""
+        cues = _cues()
+        engine.run(cues)
+
+        engine.update_cue(Cue(id=2, cue_index=2, time_in_ms=3000, time_out_ms=5000,
+                              translated_text="Kész"))
+        findings = engine.update_cue(Cue(id=4, cue_index=4, time_in_ms=7000, time_out_ms=9000))
+
+        assert [(f.cue_id, f.message_key) for f in findings] == [
+            (4, "missing"), (4, "overlap"),
+        ]
+        assert engine.run() == findings
+        assert engine.rechecked == 0
+
+    def test_update_matches_full_run(self, engine):
+        """Sok mozgatás után ugyanazt adja, mint a teljes futás."""
+        rng = random.Random(7)
+        cues = [
+            Cue(id=i, cue_index=i, time_in_ms=start, time_out_ms=start + rng.randint(100, 3000),
+                translated_text=rng.choice(["", "Szia"]))
+            for i, start in enumerate(sorted(rng.randint(0, 20000) for _ in range(40)), 1)
+        ]
+        engine.run(cues)
+        for _ in range(200):
+            cue = rng.choice(cues)
+            cue.time_in_ms = rng.randint(0, 20000)
+            cue.time_out_ms = cue.time_in_ms + rng.randint(100, 3000)
+            findings = engine.update_cue(cue)
+
+            engine_full = IncrementalQAEngine(engine._check_cue)
+            assert findings == engine_full.run(cues)
+
+    def test_remove_and_invalidate(self, engine):
+        """Törlés és gyorsítótár ürítése."""
+        engine.run(_cues())
+
+        assert engine.remove_cue(2) == []
+        engine.invalidate()
+        engine.run()
+        assert engine.rechecked == 2
+
+    def test_findings_in_time_order(self, engine):
+        """Időrendi sorrend a bemeneti sorrendtől függetlenül."""
+        cues = _cues()
+        for cue in cues:
+            cue.translated_text = ""
+
+        findings = engine.run(reversed(cues))
+
+        assert [f.cue_id for f in findings] == [1, 2, 3]
+
+    def test_to_issue(self, monkeypatch):
+        """Formázás megjelenítéskor."""
+        monkeypatch.setattr(qa_engine, "t", lambda key, **kw: f"{key}:{sorted(kw.items())}")
+        issue = QAFinding(
+            5, "error", "overlap", {"overlap_ms": 100}, "overlap_suggestion"
+        ).to_issue()
+
+        assert issue == QAIssue(
+            cue_id=5, severity="error",
+            message="overlap:[('overlap_ms', 100)]",
+            suggestion="overlap_suggestion:[]",
+        )
+        assert QAFinding(5, "info", "x").to_issue().suggestion == ""
+
+
+class TestBasicQAPlugin:
+    """BasicQAPlugin tesztek."""
+
+    def test_check(self):
+        """Hibák a nyilvános check() felületen."""
+        cues = _cues()
+        cues[2].time_in_ms = 1500  # overlaps cue 1
+
+        issues = BasicQAPlugin().check(None, cues)
+
+        assert all(isinstance(issue, QAIssue) for issue in issues)
+        by_cue = {(issue.cue_id, issue.severity) for issue in issues}
+        assert (2, "warning") in by_cue   # missing translation
+        assert (3, "error") in by_cue     # overlap
+
+    def test_run_check_defers_formatting(self, monkeypatch):
+        """Az ellenőrzés nem fordít üzeneteket."""
+        calls = []
+        monkeypatch.setattr(qa_engine, "t", lambda key, **kw: calls.append(key) or key)
+        plugin = BasicQAPlugin()
+
+        findings = plugin.run_check(_cues())
+
+        assert findings
+        assert calls == []
+
+    def test_settings_change_rechecks(self):
+        """Beállítás változása után újra minden cue ellenőrződik."""
+        plugin = BasicQAPlugin()
+        cues = _cues()
+        plugin.run_check(cues)
+        plugin.run_check(cues)
+        assert plugin._engine.rechecked == 0
+
+        plugin.load_settings({"check_missing_translation": False})
+        findings = plugin.run_check(cues)
+
+        assert plugin._engine.rechecked == 3
+        assert not any(f.message_key.endswith("missing_translation") for f in findings)
@@ -0,0 +1,166 @@
+"""
+DubSync QA Rules Tests
+
+Deklaratív QA szabályregiszter tesztjei.
+"""
+
+import importlib.util
+import pickle
+import sys
+
+import pytest
+
+from dubsync.models.cue import Cue
+from dubsync.plugins import qa_rules
+from dubsync.plugins.builtin.basic_qa import BasicQAPlugin
+from dubsync.plugins.qa_rules import (
+    QARule, compile_rules, get_rules, qa_rule, register_rule, unregister_rule
+)
+
+
+def _no_dots(facts, settings):
+    """Modul szintű szabály (folyamatok között átadható)."""
+    return {} if "..." in facts.text else None
+
+
+@pytest.fixture
+def custom_rule():
+    """Egy külső plugin szabálya a teszt idejére."""
+    register_rule(QARule(
+        id="no_dots", severity="info", check=_no_dots,
+        message_key="plugins.test.no_dots", inputs=frozenset({"text"}),
+        setting="check_no_dots",
+    ))
+    yield
+    unregister_rule("no_dots")
+
+
+class TestRegistry:
+    """Szabályregiszter tesztek."""
+
+    def test_builtin_rules(self):
+        """Beépített szabályok sorrendje."""
+        ids = [rule.id for rule in get_rules()]
+
+        assert ids[:3] == ["cps_too_high", "cps_too_low", "overlap"]
+        assert "extra_whitespace" in ids
+
+    def test_decorator(self):
+        """@qa_rule regisztrál és visszaadja a függvényt."""
+        try:
+            @qa_rule("shouting", "info", "plugins.test.shouting", inputs=["text"])
+            def shouting(facts, settings):
+                return {} if facts.text.isupper() else None
+
+            assert get_rules()[-1].id == "shouting"
+            findings = compile_rules({})(Cue(id=1, translated_text="HEY"), None)
+            assert "plugins.test.shouting" in [f.message_key for f in findings]
+        finally:
+            unregister_rule("shouting")
+
+    def test_unknown_input(self):
+        """Ismeretlen bemenet."""
+        with pytest.raises(ValueError):
+            register_rule(QARule("bad", "info", _no_dots, "x", inputs=frozenset({"audio"})))
+
+
+class TestCompiledRules:
+    """Lefordított szabálykészlet tesztek."""
+
+    def test_disabled_rules_skipped(self):
+        """Kikapcsolt szabály nem kerül a készletbe."""
+        compiled = compile_rules({"check_cps": False})
+
+        assert "cps_too_high" not in [rule.id for rule in compiled.rules]
+        assert compiled.settings["max_cps"] == qa_rules.DEFAULT_MAX_CPS
+
+    def test_only_declared_inputs_computed(self):
+        """Csak a deklarált bemenetek számolódnak."""
+        only_text = [rule for rule in get_rules() if rule.id == "double_space"]
+        compiled = compile_rules({}, only_text)
+        facts = qa_rules.CueFacts(Cue(translated_text="a  b"), None, compiled.inputs)
+
+        assert compiled.inputs == frozenset({"text"})
+        assert facts.text == "a  b"
+        assert not hasattr(facts, "cps")
+
+    def test_one_pass_per_cue(self, custom_rule, monkeypatch):
+        """Egy új szabály nem jelent új bejárást: ugyanazt a tényt kapja."""
+        seen = []
+        original = qa_rules.CueFacts
+        monkeypatch.setattr(qa_rules, "CueFacts",
+                            lambda *args: seen.append(original(*args)) or seen[-1])
+        cue = Cue(id=1, time_in_ms=0, time_out_ms=1000, translated_text="Hm...")
+
+        findings = compile_rules({})(cue, None)
+
+        assert len(seen) == 1
+        assert "plugins.test.no_dots" in [f.message_key for f in findings]
+
+    def test_picklable(self, custom_rule):
+        """Modul szintű szabályok folyamatok között átadhatók."""
+        compiled = compile_rules({})
+        cue = Cue(id=1, time_in_ms=0, time_out_ms=100, translated_text="Szia...")
+
+        assert compiled.is_picklable()
+        assert pickle.loads(pickle.dumps(compiled))(cue, None) == compiled(cue, None)
+
+    def test_plugin_file_rule_not_sent(self, tmp_path):
+        """Plugin fájl szabálya (szintetikus modulnév) nem kerül folyamatba."""
+        plugin_file = tmp_path / "mycheck.py"
+        plugin_file.write_text(
+            "def no_hello(facts, settings):\n"
+            "    return {} if 'hello' in facts.text else None\n",
+            encoding="utf-8",
+        )
+        # Ahogy a PluginRegistry tölti be
+        spec = importlib.util.spec_from_file_location("dubsync_plugin_mycheck", plugin_file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["dubsync_plugin_mycheck"] = module
+        try:
+            spec.loader.exec_module(module)
+            rule = QARule("no_hello", "info", module.no_hello, "x", inputs=frozenset({"text"}))
+            compiled = compile_rules({}, [rule])
+
+            assert not compiled.is_picklable()
+            assert compiled(Cue(id=1, translated_text="hello"), None)
+        finally:
+            del sys.modules["dubsync_plugin_mycheck"]
+
+    def test_lambda_not_picklable(self):
+        """Lambda szabály: a futtató háttérszálban hívja a check()-et."""
+        rule = QARule("lambda", "info", lambda facts, settings: None, "x")
+
+        assert not compile_rules({}, [rule]).is_picklable()
+
+
+class TestBasicQAPluginRules:
+    """BasicQAPlugin és a regiszter."""
+
+    def test_plugin_picks_up_new_rule(self, custom_rule):
+        """Regisztrált szabály a következő futtatástól él, kikapcsolható."""
+        plugin = BasicQAPlugin()
+        cue = Cue(id=1, time_in_ms=0, time_out_ms=2000,
+                  translated_text="Hát...", character_name="A")
+
+        assert "plugins.test.no_dots" in [f.message_key for f in plugin.run_check([cue])]
+
+        plugin.load_settings({"check_no_dots": False})
+        assert "plugins.test.no_dots" not in [f.message_key for f in plugin.run_check([cue])]
+
+    def test_registry_change_rechecks(self):
+        """A regiszter változása után minden cue újra ellenőrződik."""
+        plugin = BasicQAPlugin()
+        cues = [Cue(id=1, time_in_ms=0, time_out_ms=2000, translated_text="Szia")]
+        plugin.run_check(cues)
+        plugin.run_check(cues)
+        assert plugin._engine.rechecked == 0
+
+        register_rule(QARule("always", "info", lambda facts, settings: {}, "x"))
+        try:
+            findings = plugin.run_check(cues)
+        finally:
+            unregister_rule("always")
+
+        assert plugin._engine.rechecked == 1
+        assert "x" in [f.message_key for f in findings]
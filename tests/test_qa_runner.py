@@ -0,0 +1,193 @@
+"""
+DubSync QA Runner Tests
+
+Párhuzamos QA futtató tesztjei.
+"""
+
+import multiprocessing
+import os
+import pickle
+from typing import List
+
+import pytest
+
+from dubsync.models.cue import Cue
+from dubsync.plugins.base import PluginInfo, PluginType, QAIssue, QAPlugin
+from dubsync.plugins.builtin.basic_qa import BasicQAPlugin
+from dubsync.services.qa_runner import (
+    CueRecord, QACancelled, QARunner, merge_issues
+)
+
+
+class SerialQAPlugin(QAPlugin):
+    """check()-et használó plugin (nincs párhuzamos ellenőrző)."""
+
+    @property
+    def info(self) -> PluginInfo:
+        return PluginInfo(
+            id="serial_qa", name="Serial", version="1.0.0",
+            author="Test", description="", plugin_type=PluginType.QA
+        )
+
+    def check(self, project, cues: List[Cue]) -> List[QAIssue]:
+        return [QAIssue(cue_id=cue.id, severity="info", message="seen") for cue in cues]
+
+
+def _failing_checker(record, overlap):
+    """Minden cue-nál hibát dob."""
+    raise ValueError("broken rule")
+
+
+def _crashing_checker(record, overlap):
+    """Munkafolyamatban a folyamat elhal, a hívó szálban működik."""
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return [QAIssue(cue_id=record.id, severity="info", message="crash-safe")]
+
+
+class CheckerQAPlugin(SerialQAPlugin):
+    """Adott cue-ellenőrzőt adó plugin."""
+
+    def __init__(self, checker, plugin_id):
+        super().__init__()
+        self._checker = checker
+        self._id = plugin_id
+
+    @property
+    def info(self) -> PluginInfo:
+        return PluginInfo(
+            id=self._id, name=self._id, version="1.0.0",
+            author="Test", description="", plugin_type=PluginType.QA
+        )
+
+    def get_cue_checker(self):
+        return self._checker
+
+
+def _cues(count=12):
+    """Fordított sorrendű cue-k, minden harmadik fordítatlan, egy átfedéssel."""
+    cues = [
+        Cue(id=i, cue_index=i, time_in_ms=i * 1000, time_out_ms=i * 1000 + 800,
+            translated_text="" if i % 3 == 0 else "Szöveg", character_name="A")
+        for i in range(1, count + 1)
+    ]
+    if count > 5:
+        cues[4].time_out_ms = 6500  # cue 5 overlaps cue 6
+    return list(reversed(cues))
+
+
+class TestQARunner:
+    """QARunner tesztek."""
+
+    def test_records_are_picklable(self):
+        """A cue rekordok folyamatok között átadhatók."""
+        record = CueRecord.from_cue(_cues()[0])
+
+        assert pickle.loads(pickle.dumps(record)) == record
+        checker = BasicQAPlugin().get_cue_checker()
+        assert pickle.loads(pickle.dumps(checker))(record, None) == checker(record, None)
+
+    def test_matches_incremental_engine(self):
+        """Darabolt futtatás = egyben futtatás, időrendben."""
+        plugin = BasicQAPlugin()
+        cues = _cues()
+        runner = QARunner(chunk_size=5)
+
+        results = runner.run([plugin], None, cues)
+
+        assert results == plugin.run_check(cues)
+        assert any(f.message_key.endswith("overlap") and f.cue_id == 6 for f in results)
+
+    def test_process_pool(self):
+        """Folyamatkészletben futtatás és előrehaladás."""
+        cues = _cues()
+        progress = []
+        runner = QARunner(chunk_size=4, parallel_min_cues=0, max_workers=2)
+        try:
+            results = runner.run(
+                [BasicQAPlugin()], None, cues,
+                progress=lambda done, total: progress.append((done, total))
+            )
+        finally:
+            runner.shutdown()
+
+        assert results == BasicQAPlugin().run_check(cues)
+        assert progress[0] == (0, 3)
+        assert progress[-1] == (3, 3)
+
+    def test_merges_plugins_in_cue_order(self):
+        """Több plugin eredménye cue sorrendben, pluginsorrend megtartva."""
+        cues = _cues(3)
+
+        results = QARunner().run([BasicQAPlugin(), SerialQAPlugin()], None, cues)
+
+        assert [r.cue_id for r in results] == [1, 2, 3, 3]
+        assert isinstance(results[-1], QAIssue)
+
+    def test_cancel(self):
+        """Megszakítás."""
+        with pytest.raises(QACancelled):
+            QARunner().run([BasicQAPlugin()], None, _cues(), is_cancelled=lambda: True)
+
+    def test_cancel_passed_to_plugin(self):
+        """A plugin ellenőrzése megkapja a megszakítás lekérdezését."""
+        cancelled = []
+
+        class CancellablePlugin(SerialQAPlugin):
+            def check_cancellable(self, project, cues, is_cancelled):
+                cancelled.append(True)  # A felhasználó itt állítja le
+                return []
+
+        with pytest.raises(QACancelled):
+            QARunner().run([CancellablePlugin()], None, _cues(), is_cancelled=lambda: bool(cancelled))
+        assert cancelled == [True]
+
+    def test_merge_unknown_cue_last(self):
+        """Ismeretlen cue-hoz tartozó hiba a lista végére kerül."""
+        issues = [
+            QAIssue(cue_id=0, severity="info", message="project"),
+            QAIssue(cue_id=2, severity="info", message="b"),
+            QAIssue(cue_id=1, severity="info", message="a"),
+        ]
+
+        merged = merge_issues(issues, _cues(2))
+
+        assert [i.message for i in merged] == ["a", "b", "project"]
+
+    def test_failing_checker_skipped(self):
+        """Hibát dobó plugin kimarad, a többi eredménye megmarad."""
+        cues = _cues(3)
+        progress = []
+
+        results = QARunner(chunk_size=1).run(
+            [CheckerQAPlugin(_failing_checker, "failing"), SerialQAPlugin()], None, cues,
+            progress=lambda done, total: progress.append((done, total))
+        )
+
+        assert [r.message for r in results] == ["seen"] * 3
+        assert progress[-1] == (4, 4)
+
+    def test_failing_checker_in_pool_skipped(self):
+        """Folyamatkészletben hibát dobó plugin is kimarad."""
+        runner = QARunner(chunk_size=2, parallel_min_cues=0, max_workers=1)
+        try:
+            results = runner.run(
+                [CheckerQAPlugin(_failing_checker, "failing"), BasicQAPlugin()], None, _cues()
+            )
+        finally:
+            runner.shutdown()
+
+        assert results == BasicQAPlugin().run_check(_cues())
+
+    def test_broken_pool_recreated(self):
+        """Elhalt folyamatkészlet: a futtatás a szálban fejeződik be, a készlet újraépül."""
+        runner = QARunner(chunk_size=2, parallel_min_cues=0, max_workers=1)
+        try:
+            results = runner.run([CheckerQAPlugin(_crashing_checker, "crash")], None, _cues(4))
+            assert [r.cue_id for r in results] == [1, 2, 3, 4]
+            assert runner._executor is None
+
+            results = runner.run([BasicQAPlugin()], None, _cues())
+            assert results == BasicQAPlugin().run_check(_cues())
+        finally:
+            runner.shutdown()
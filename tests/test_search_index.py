@@ -0,0 +1,114 @@
+"""
+DubSync Search Index Tests
+
+Rangsorolt, elgépelés-tűrő keresés tesztjei.
+"""
+
+from dubsync.plugins.builtin.glossary import GlossaryData
+from dubsync.services.search_index import SearchIndex, tokenize, trigrams
+
+
+def _index(*texts):
+    index = SearchIndex()
+    for text in texts:
+        index.add(text, [(text, 1.0)])
+    return index
+
+
+class TestSearchIndex:
+    """SearchIndex tesztek."""
+
+    def test_tokenize(self):
+        """Kisbetűs szavak, írásjelek nélkül."""
+        assert tokenize("Space-Ship, ÁRVÍZ!") == ["space", "ship", "árvíz"]
+        assert trigrams("ab") == {"$ab", "ab$"}
+
+    def test_ranking(self):
+        """Pontos > előtag > szórészlet."""
+        index = _index("spaceship", "ship", "shipment", "shop")
+
+        hits = [hit.item for hit in index.search("ship")]
+
+        assert hits == ["ship", "shipment", "spaceship"]  # "shop": túl kevés közös trigram
+
+    def test_fuzzy(self):
+        """Elgépelt keresés is talál, a pontos találat mögött."""
+        index = _index("captain", "kitchen", "captian cook")
+
+        assert [hit.item for hit in index.search("captian")] == ["captian cook", "captain"]
+
+    def test_all_words_required(self):
+        """Minden keresőszónak illeszkednie kell, az utolsó lehet előtag."""
+        index = _index("space ship", "space station", "ship")
+
+        assert [hit.item for hit in index.search("space sh")] == ["space ship"]
+
+    def test_field_weights(self):
+        """A nagyobb súlyú mező találata előrébb kerül."""
+        index = SearchIndex()
+        index.add("note", [("alpha", 1.0), ("beta", 0.3)])
+        index.add("source", [("beta", 1.0), ("alpha", 0.3)])
+
+        assert [hit.item for hit in index.search("beta")] == ["source", "note"]
+
+    def test_update_and_remove(self):
+        """Módosítás és törlés újraépítés nélkül."""
+        index = _index("alpha", "beta")
+        index.search("a")  # Rendezett szókészlet felépül
+
+        index.update("alpha", [("gamma", 1.0)])
+        index.add("alphabet", [("alphabet", 1.0)])
+        assert [hit.item for hit in index.search("alpha")] == ["alphabet"]
+        assert [hit.item for hit in index.search("gam")] == ["alpha"]
+
+        assert index.remove("alphabet")
+        assert not index.remove("alphabet")
+        assert index.search("alphabet") == []
+        assert len(index) == 2
+
+    def test_limit_and_empty_query(self):
+        """Találatszám korlát, üres keresés."""
+        index = _index("a1", "a2", "a3")
+
+        assert len(index.search("a", limit=2)) == 2
+        assert index.search("  ") == []
+
+
+class TestGlossarySearch:
+    """GlossaryData rangsorolt keresés."""
+
+    def test_search_fields(self):
+        """Forrás, fordítás és megjegyzés; a forrás találata előrébb."""
+        glossary = GlossaryData()
+        glossary.add_entry("hull", "hajótest", "ship part")
+        glossary.add_entry("ship", "hajó")
+
+        assert [e.source for e in glossary.search("ship")] == ["ship", "hull"]
+        assert [e.source for e in glossary.search("hajó")] == ["ship", "hull"]
+
+    def test_edited_entry_keeps_position(self):
+        """Szerkesztett bejegyzés a helyén marad, új szövegével kereshető."""
+        glossary = GlossaryData()
+        first = glossary.add_entry("door", "ajtó")
+        glossary.add_entry("doorbell", "csengő")
+
+        glossary.update_entry(first, "doormat", "lábtörlő")
+
+        assert [e.source for e in glossary.search("door")] == ["doormat", "doorbell"]
+        assert glossary.search("ajtó") == []
+
+    def test_list_model_pages(self):
+        """A lista modell lapokban tölti be a találatokat."""
+        from dubsync.plugins.builtin.glossary import GlossaryListModel
+
+        glossary = GlossaryData()
+        for i in range(GlossaryListModel.PAGE_SIZE + 50):
+            glossary.add_entry(f"term{i}", f"kifejezés{i}")
+        model = GlossaryListModel()
+        model.set_entries(glossary.search("term"))
+
+        assert model.rowCount() == GlossaryListModel.PAGE_SIZE
+        assert model.canFetchMore()
+        model.fetchMore()
+        assert model.rowCount() == model.total_count() == GlossaryListModel.PAGE_SIZE + 50
+        assert not model.canFetchMore()
@@ -0,0 +1,111 @@
+"""
+DubSync Batch Spellcheck Tests
+
+Projekt szintű helyesírás-ellenőrzés segédfüggvényeinek tesztjei.
+"""
+
+import json
+
+import pytest
+
+from dubsync.services.dictionary_snapshot import build_snapshot
+from dubsync.services.spellcheck_batch import (
+    LookupPool, VerdictCache, collect_words
+)
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    """Apró Hunspell szótár."""
+    base = tmp_path / "xx_XX"
+    base.with_suffix(".aff").write_text("SET UTF-8\n", encoding="utf-8")
+    base.with_suffix(".dic").write_text("2\nalma\nkörte\n", encoding="utf-8")
+    return base
+
+
+class TestCollectWords:
+    """Szavak gyűjtése."""
+
+    def test_unique_words_with_occurrences(self):
+        """Minden szó egyszer, az összes előfordulásával."""
+        words = collect_words([(1, "Szia, szia!"), (2, "Szia 42"), (3, "")])
+
+        assert words == {"Szia": [(1, 0), (2, 0)], "szia": [(1, 6)]}
+
+
+class TestVerdictCache:
+    """Tartós gyorsítótár tesztek."""
+
+    def test_roundtrip(self, tmp_path):
+        """Mentés és betöltés."""
+        path = tmp_path / "verdicts.json"
+        cache = VerdictCache(path, "abc")
+        cache.put_many({"alma": True, "almma": False})
+        cache.save()
+
+        loaded = VerdictCache(path, "abc")
+
+        assert loaded.get("alma") is True
+        assert loaded.get("almma") is False
+        assert loaded.get("körte") is None
+
+    def test_other_dictionary_discarded(self, tmp_path):
+        """Más szótárhoz tartozó fájl érvénytelen, mentéskor felülíródik."""
+        path = tmp_path / "verdicts.json"
+        cache = VerdictCache(path, "abc")
+        cache.put_many({"alma": True})
+        cache.save()
+
+        stale = VerdictCache(path, "def")
+        stale.save()
+
+        assert len(stale) == 0
+        assert json.loads(path.read_text(encoding="utf-8"))["fingerprint"] == "def"
+
+    def test_unchanged_not_written(self, tmp_path):
+        """Változatlan gyorsítótár nem íródik ki."""
+        path = tmp_path / "verdicts.json"
+        VerdictCache(path, "abc").save()
+
+        assert not path.exists()
+
+
+class TestParallelLookup:
+    """Folyamatkészlet."""
+
+    def test_parallel_lookup(self, dictionary):
+        """Folyamatkészletes ellenőrzés, a készlet futások között megmarad."""
+        pool = LookupPool(dictionary, max_workers=2)
+        try:
+            verdicts = pool.check(["alma", "almma", "körte"], chunk_size=2)
+            executor = pool._executor
+            again = pool.check(["körtte"])
+        finally:
+            pool.shutdown()
+
+        assert verdicts == {"alma": True, "almma": False, "körte": True}
+        assert again == {"körtte": False}
+        assert pool._executor is None and executor is not None
+
+    def test_workers_use_snapshot(self, dictionary, tmp_path):
+        """A folyamatok a pillanatképből töltik a szótárt."""
+        build_snapshot(dictionary, tmp_path / "cache")
+
+        pool = LookupPool(dictionary, max_workers=1, snapshot_dir=tmp_path / "cache")
+        try:
+            verdicts = pool.check(["alma", "almma"])
+        finally:
+            pool.shutdown()
+
+        assert verdicts == {"alma": True, "almma": False}
+
+    def test_cancelled(self, dictionary):
+        """Megszakításkor a függő feladatok elmaradnak."""
+        pool = LookupPool(dictionary, max_workers=1)
+        try:
+            words = [f"szó{i}" for i in range(2000)]
+            verdicts = pool.check(words, chunk_size=1, is_cancelled=lambda: True)
+        finally:
+            pool.shutdown()
+
+        assert len(verdicts) < len(words)
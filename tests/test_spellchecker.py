@@ -0,0 +1,187 @@
+"""
+DubSync Spellchecker Tests
+
+Helyesírás-ellenőrző motor és háttérszál tesztjei.
+"""
+
+import pytest
+
+from dubsync.models.cue import Cue
+from dubsync.plugins.builtin.spellchecker import (
+    SpellcheckerEngine, SpellcheckerPlugin, SpellcheckWorker, _LRUCache
+)
+from dubsync.services.spellcheck_batch import VerdictCache
+
+
+class FakeDictionary:
+    """Hunspell helyett: ismert szavak halmaza, számolt hívásokkal."""
+
+    def __init__(self, words):
+        self.words = set(words)
+        self.lookups = 0
+        self.suggests = 0
+
+    def lookup(self, word):
+        self.lookups += 1
+        return word.lower() in self.words
+
+    def suggest(self, word):
+        self.suggests += 1
+        for candidate in sorted(self.words):
+            if candidate[0] == word[0].lower():
+                yield candidate
+
+
+@pytest.fixture
+def engine():
+    """Motor hamis szótárral (betöltés nélkül)."""
+    engine = SpellcheckerEngine()
+    engine._dictionary = FakeDictionary(["alma", "almafa", "és", "körte", "szép"])
+    engine._available = True
+    engine._initialized = True
+    return engine
+
+
+class TestLRUCache:
+    """LRU gyorsítótár tesztek."""
+
+    def test_eviction(self):
+        """A legrégebben használt elem esik ki."""
+        cache = _LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+
+class TestSpellcheckerEngine:
+    """Motor tesztek."""
+
+    def test_lookup_cached(self, engine):
+        """Egy szó csak egyszer kerül a szótárhoz."""
+        assert engine.check_word("körte")
+        assert engine.check_word("körte")
+        assert not engine.check_word("körtte")
+
+        assert engine._dictionary.lookups == 2
+
+    def test_custom_words_bypass_cache(self, engine):
+        """Egyéni szó felvétele után a korábbi hibás eredmény nem érvényes."""
+        assert not engine.check_word("dubsync")
+
+        engine.add_custom_word("DubSync")
+
+        assert engine.check_word("dubsync")
+
+    def test_find_errors(self, engine):
+        """Hibás szavak pozícióval, javaslatok nélkül."""
+        errors = engine.find_errors("Szép almma és körte, 42 almafa")
+
+        assert errors == [("almma", 5)]
+        assert engine._dictionary.suggests == 0
+
+    def test_find_errors_cancelled(self, engine):
+        """Megszakítás szavanként."""
+        assert engine.find_errors("almma körtte", lambda: True) == []
+
+    def test_suggestions_lazy_and_cached(self, engine):
+        """Javaslat csak kérésre számolódik, utána a cache-ből jön."""
+        assert engine.cached_suggestions("almma") is None
+
+        assert engine.suggest("almma") == ["alma", "almafa"]
+        assert engine.suggest("almma") == ["alma", "almafa"]
+        assert engine.cached_suggestions("almma") == ["alma", "almafa"]
+        assert engine._dictionary.suggests == 1
+
+    def test_unavailable(self):
+        """Szótár nélkül minden szó helyes."""
+        engine = SpellcheckerEngine()
+        engine._initialized = True
+
+        assert engine.find_errors("bármi hibás") == []
+        assert engine.suggest("hibás") == []
+
+
+class TestSpellcheckWorker:
+    """Háttérszál tesztek."""
+
+    def test_only_latest_check_reported(self, qapp, engine):
+        """Függő kérést az újabb kérés lecseréli."""
+        worker = SpellcheckWorker(engine)
+        results = []
+        worker.checked.connect(lambda request_id, text, errors: results.append((request_id, errors)))
+        suggestions = []
+        worker.suggestions_ready.connect(lambda word, items: suggestions.append((word, items)))
+
+        worker.request_check(1, "almma")
+        worker.request_check(2, "körtte")
+        worker.request_suggestions("körtte")
+        worker.start()
+        try:
+            for _ in range(200):
+                qapp.processEvents()
+                if results and suggestions:
+                    break
+                worker.wait(10)
+        finally:
+            worker.stop()
+            worker.wait(2000)
+        qapp.processEvents()
+
+        assert results == [(2, [("körtte", 0)])]
+        assert suggestions == [("körtte", ["körte"])]
+
+
+class TestProjectSpellcheck:
+    """Projekt szintű ellenőrzés."""
+
+    def test_unique_words_looked_up_once(self, engine):
+        """Ismétlődő szavak egyszer, a gyorsítótárban lévők egyszer sem."""
+        cache = VerdictCache(None, "")
+        cache.put_many({"körtte": False})
+
+        misspelled = engine.check_words(["almma", "almma", "alma", "körtte"], cache)
+
+        assert misspelled == {"almma", "körtte"}
+        assert engine._dictionary.lookups == 2
+        assert cache.get("almma") is False
+
+    def test_custom_words_override_cache(self, engine):
+        """Egyéni szó a tartós gyorsítótár fölött érvényes."""
+        cache = VerdictCache(None, "")
+        cache.put_many({"dubsync": False})
+        engine.add_custom_word("dubsync")
+
+        assert engine.check_words(["dubsync"], cache) == set()
+
+    def test_cue_level_issues(self, engine):
+        """A hibák cue-nként, szövegbeli sorrendben jelennek meg."""
+        plugin = SpellcheckerPlugin()
+        plugin.initialize()  # Locale fájlok
+        plugin._engine = engine
+        cues = [
+            Cue(id=1, translated_text="körtte és almma"),
+            Cue(id=2, translated_text="szép alma"),
+            Cue(id=3, translated_text="almma almma"),
+        ]
+
+        issues = plugin.check(None, cues)
+
+        assert [issue.cue_id for issue in issues] == [1, 3]
+        assert "körtte, almma" in issues[0].message
+        assert engine._dictionary.lookups == 5
+
+    def test_check_cancelled(self, engine):
+        """Megszakított projekt ellenőrzés nem kérdez a szótárból."""
+        plugin = SpellcheckerPlugin()
+        plugin._engine = engine
+
+        issues = plugin.check_cancellable(None, [Cue(id=1, translated_text="almma körtte")],
+                                          lambda: True)
+
+        assert issues == []
+        assert engine._dictionary.lookups == 0
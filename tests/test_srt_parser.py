@@ -8,7 +8,7 @@ import pytest
 from pathlib import Path
 
 from dubsync.services.srt_parser import (
-    SRTParser, SRTEntry, parse_srt_file, export_to_srt
+    SRTParser, SRTEntry, parse_srt_file, export_to_srt, detect_encoding
 )
 from dubsync.models.cue import Cue
 from dubsync.utils.constants import CueStatus
@@ -142,6 +142,101 @@ Some text
         assert parser.has_errors()
 
 
+    def test_time_line_position_data(self):
+        """Idősor utáni pozíció adatok figyelmen kívül hagyása."""
+        content = "1\n00:00:01,5 --> 00:00:02.25 X1:10 X2:20\nText\n"
+        entries = SRTParser().parse_content(content)
+        
+        assert (entries[0].time_in_ms, entries[0].time_out_ms) == (1500, 2250)
+        assert entries[0].text == "Text"
+    
+    def test_markup_removed(self):
+        """HTML és ASS jelölések eltávolítása."""
+        parser = SRTParser()
+        
+        assert parser._clean_text("{\\an8}<i>Hello</i>\n  <b>world</b> ") == "Hello world"
+    
+    def test_block_without_index(self):
+        """Index nélküli blokk a blokk sorszámát kapja."""
+        content = "00:00:00,000 --> 00:00:01,000\nFirst\n\n00:00:01,000 --> 00:00:02,000\nSecond\n"
+        entries = SRTParser().parse_content(content)
+        
+        assert [(e.index, e.text) for e in entries] == [(1, "First"), (2, "Second")]
+    
+    def test_error_reports_line_number(self):
+        """Hibaüzenet sorszámmal."""
+        content = "1\n00:00:00,000 --> 00:00:01,000\nOk\n\n2\nbroken --> time\nText\n"
+        parser = SRTParser()
+        entries = parser.parse_content(content)
+        
+        assert len(entries) == 1
+        assert "6" in parser.errors[0]
+    
+    def test_line_endings(self):
+        """CRLF és CR sorvégek."""
+        for newline in ("\r\n", "\r"):
+            content = newline.join([
+                "1", "00:00:00,000 --> 00:00:01,000", "First", "",
+                "2", "00:00:01,000 --> 00:00:02,000", "Second", "",
+            ])
+            entries = SRTParser().parse_content(content)
+            assert [e.text for e in entries] == ["First", "Second"]
+    
+    def test_concatenated_files(self):
+        """Összefűzött fájlok: ismételt BOM, hiányzó üres sor."""
+        content = (
+            "\ufeff1\n00:00:00,000 --> 00:00:01,000\nFirst\n"
+            "2\n00:00:01,000 --> 00:00:02,000\nSecond\n\n"
+            "\ufeff1\n00:00:05,000 --> 00:00:06,000\nThird\n"
+        )
+        entries = SRTParser().parse_content(content)
+        
+        assert [(e.index, e.text) for e in entries] == [
+            (1, "First"), (2, "Second"), (1, "Third")
+        ]
+    
+    def test_iter_file_is_lazy(self, sample_srt_file):
+        """A fájl feldolgozása bejegyzésenként történik."""
+        entries = SRTParser().iter_file(sample_srt_file)
+        
+        assert next(entries).index == 1
+        assert [e.index for e in entries] == [2, 3, 4]
+    
+    def test_parse_file_cp1250(self, temp_dir):
+        """Közép-európai kódolás felismerése."""
+        content = "1\n00:00:00,000 --> 00:00:01,000\nŐrült tűz és sör\n"
+        srt_path = temp_dir / "cp1250.srt"
+        srt_path.write_bytes(content.encode("cp1250"))
+        
+        entries = SRTParser().parse_file(srt_path)
+        
+        assert entries[0].text == "Őrült tűz és sör"
+
+
+class TestDetectEncoding:
+    """Kódolás felismerés tesztjei."""
+    
+    def test_bom(self):
+        """BOM alapján."""
+        assert detect_encoding("Szia".encode("utf-8-sig")) == "utf-8-sig"
+        assert detect_encoding("Szia".encode("utf-16")) == "utf-16"
+    
+    def test_utf8(self):
+        """Érvényes UTF-8, a minta végén csonka karakterrel is."""
+        data = "Árvíztűrő tükörfúrógép".encode("utf-8")
+        assert detect_encoding(data) == "utf-8"
+        assert detect_encoding(data[:-1]) == "utf-8"
+    
+    def test_cp1250(self):
+        """0x80-0x9F bájtok: CP1250."""
+        assert detect_encoding("Šťastný tűz".encode("cp1250")) == "cp1250"
+        assert detect_encoding("Árvíztűrő tükörfúrógép".encode("cp1250")) == "cp1250"
+    
+    def test_iso_8859_2(self):
+        """ISO-8859-2 betűk ASCII betűk mellett."""
+        assert detect_encoding("Šťastný žák".encode("iso-8859-2")) == "iso-8859-2"
+
+
 class TestParseSrtFile:
     """parse_srt_file convenience function tesztjei."""
     
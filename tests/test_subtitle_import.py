@@ -0,0 +1,212 @@
+"""
+DubSync Subtitle Import Tests
+
+Felirat importálók (ASS, VTT, EBU-STL) és formátumfelismerés tesztjei.
+"""
+
+import pytest
+
+from dubsync.services.project_manager import ProjectManager
+from dubsync.services.subtitle_import import (
+    ASSImporter, AutoImporter, SRTImporter, STLImporter, VTTImporter,
+    create_importer, detect_importer, get_importers
+)
+
+
+ASS_CONTENT = """[Script Info]
+Title: Test
+ScriptType: v4.00+
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize
+Style: Default,Arial,20
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.50,0:00:03.00,Default,Péter,0,0,0,,{\\an8}Szia, {\\i1}hogy vagy{\\i0}?
+Comment: 0,0:00:02.00,0:00:03.00,Default,,0,0,0,,Megjegyzés
+Dialogue: 0,0:00:04.00,0:00:06.25,Default,,0,0,0,,Első sor\\NMásodik sor
+Dialogue: 0,broken,0:00:07.00,Default,,0,0,0,,Hibás
+"""
+
+VTT_CONTENT = """WEBVTT - teszt
+
+NOTE ez egy megjegyzés
+
+STYLE
+::cue { color: white }
+
+intro
+00:01.000 --> 00:03.500 align:start
+<v Anna>Szia &amp; <i>jó napot</i></v>
+
+5
+01:00:00.000 --> 01:00:02.000
+Második
+sor
+"""
+
+
+def _stl_file(cues, fps=25, tcp=b"00000000"):
+    """EBU-STL fájl összeállítása (idő in, idő out, szöveg bájtok) listából."""
+    gsi = bytearray(b" " * 1024)
+    gsi[0:3] = b"850"
+    gsi[3:11] = b"STL%02d.01" % fps
+    gsi[12:14] = b"00"
+    gsi[256:264] = tcp
+    blocks = bytearray()
+    for sn, (time_in, time_out, text) in enumerate(cues):
+        tti = bytearray(128)
+        tti[1:3] = sn.to_bytes(2, "little")
+        tti[3] = 0xFF
+        tti[5:9] = bytes(time_in)
+        tti[9:13] = bytes(time_out)
+        field = text + bytes([0x8F]) * (112 - len(text))
+        tti[16:128] = field
+        blocks += tti
+    return bytes(gsi + blocks)
+
+
+class TestASSImporter:
+    """ASS importáló tesztek."""
+
+    def test_dialogue(self, temp_dir):
+        """Beszélő, jelölések és idők."""
+        path = temp_dir / "test.ass"
+        path.write_text(ASS_CONTENT, encoding="utf-8")
+        importer = ASSImporter()
+        entries = list(importer.iter_file(path))
+
+        assert len(entries) == 2
+        first, second = entries
+        assert (first.time_in_ms, first.time_out_ms) == (1500, 3000)
+        assert first.character_name == "Péter"
+        assert first.text == "Szia, hogy vagy?"
+        assert first.notes == "{\\an8} {\\i1} {\\i0}"
+        assert second.text == "Első sor Második sor"
+        assert second.time_out_ms == 6250
+        assert len(importer.errors) == 1
+
+    def test_to_cue(self, temp_dir):
+        """Beszélő és megjegyzés a Cue-ba kerül."""
+        path = temp_dir / "test.ass"
+        path.write_text(ASS_CONTENT, encoding="utf-8")
+        cue = next(ASSImporter().iter_file(path)).to_cue()
+
+        assert cue.character_name == "Péter"
+        assert cue.notes == "{\\an8} {\\i1} {\\i0}"
+
+
+class TestVTTImporter:
+    """WebVTT importáló tesztek."""
+
+    def test_cues(self, temp_dir):
+        """Hang címke, entitások, azonosítók."""
+        path = temp_dir / "test.vtt"
+        path.write_text(VTT_CONTENT, encoding="utf-8")
+        entries = list(VTTImporter().iter_file(path))
+
+        assert len(entries) == 2
+        first, second = entries
+        assert (first.time_in_ms, first.time_out_ms) == (1000, 3500)
+        assert first.character_name == "Anna"
+        assert first.text == "Szia & jó napot"
+        assert second.index == 5
+        assert second.time_in_ms == 3600000
+        assert second.text == "Második sor"
+
+    def test_index_skips_non_cue_blocks(self, temp_dir):
+        """A fejléc, NOTE és STYLE blokk nem számít bele a sorszámba."""
+        path = temp_dir / "blocks.vtt"
+        path.write_text(
+            "WEBVTT\n\nNOTE megjegyzés\n\nSTYLE\n::cue { color: red }\n\n"
+            "00:01.000 --> 00:02.000\nElső\n\n00:03.000 --> 00:04.000\nMásodik\n",
+            encoding="utf-8")
+
+        entries = list(VTTImporter().iter_file(path))
+
+        assert [e.index for e in entries] == [1, 2]
+
+
+class TestSTLImporter:
+    """EBU-STL importáló tesztek."""
+
+    def test_cues(self, temp_dir):
+        """Idők, ISO 6937 ékezetek, sortörés."""
+        text = b"\xc2Arv\xc2izt\xcdur\xcdo" + bytes([0x8A]) + b"t\xc8uk\xc8or"
+        path = temp_dir / "test.stl"
+        path.write_bytes(_stl_file(
+            [((10, 0, 1, 0), (10, 0, 2, 12), text)],
+            tcp=b"10000000",
+        ))
+        importer = STLImporter()
+        entries = list(importer.iter_file(path))
+
+        assert importer.errors == []
+        assert len(entries) == 1
+        assert (entries[0].time_in_ms, entries[0].time_out_ms) == (1000, 2480)
+        assert entries[0].text == "Árvíztűrő tükör"
+
+    def test_invalid_header(self, temp_dir):
+        """Hibás fejléc."""
+        path = temp_dir / "bad.stl"
+        path.write_bytes(b"not an stl file")
+        importer = STLImporter()
+
+        assert list(importer.iter_file(path)) == []
+        assert len(importer.errors) == 1
+
+
+class TestDetection:
+    """Formátumfelismerés tesztek."""
+
+    def test_registry(self):
+        """Regisztrált formátumok."""
+        assert [imp.format_id for imp in get_importers()] == ["stl", "vtt", "ass", "srt"]
+        assert isinstance(create_importer("vtt"), VTTImporter)
+        assert isinstance(create_importer(), AutoImporter)
+        with pytest.raises(ValueError):
+            create_importer("docx")
+
+    def test_content_wins_over_extension(self):
+        """A tartalom alapján dönt, nem a kiterjesztés alapján."""
+        assert isinstance(detect_importer(VTT_CONTENT.encode(), ".srt"), VTTImporter)
+        assert isinstance(detect_importer(ASS_CONTENT.encode("utf-8-sig"), ".txt"), ASSImporter)
+        assert isinstance(detect_importer(_stl_file([])), STLImporter)
+
+    def test_fallbacks(self):
+        """Kiterjesztés, majd SRT."""
+        assert isinstance(detect_importer(b"", ".ssa"), ASSImporter)
+        assert isinstance(detect_importer(b"", ".txt"), SRTImporter)
+
+    def test_auto_importer(self, temp_dir):
+        """Automatikus felismerés egyetlen megnyitással."""
+        path = temp_dir / "subtitles.txt"
+        path.write_text(VTT_CONTENT, encoding="utf-8")
+        importer = AutoImporter()
+        entries = list(importer.iter_file(path))
+
+        assert isinstance(importer.detected, VTTImporter)
+        assert [e.text for e in entries] == ["Szia & jó napot", "Második sor"]
+
+
+class TestImportSubtitles:
+    """ProjectManager.import_subtitles tesztek."""
+
+    def test_import_ass(self, temp_dir):
+        """ASS import a közös kötegelt útvonalon."""
+        path = temp_dir / "test.ass"
+        path.write_text(ASS_CONTENT, encoding="utf-8")
+        manager = ProjectManager()
+        manager.new_project()
+        try:
+            count, errors = manager.import_subtitles(path)
+            cues = manager.get_cues()
+
+            assert count == 2
+            assert len(errors) == 1
+            assert cues[0].character_name == "Péter"
+            assert cues[0].notes == "{\\an8} {\\i1} {\\i0}"
+            assert cues[0].lip_sync_ratio is not None
+        finally:
+            manager.close()
@@ -0,0 +1,101 @@
+"""
+DubSync Syllable Tests
+
+Szótagszámlálás és szótag alapú lip-sync becslő tesztjei.
+"""
+
+import pytest
+
+from dubsync.models.cue import Cue
+from dubsync.services.lip_sync import (
+    LipSyncEstimator, SyllableLipSyncEstimator, create_estimator
+)
+from dubsync.services.syllables import (
+    HUNGARIAN_RULES, count_syllables, get_syllable_counter
+)
+
+
+class TestSyllableCounter:
+    """Szótagszámláló tesztek."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Szia", 2),
+        ("Igen", 2),
+        ("Igen.", 3),
+        ("12", 2),
+        ("", 0),
+    ])
+    def test_hungarian(self, text, expected):
+        """Magyar szótagok, szünetek, számok."""
+        assert count_syllables(text, "hu") == expected
+
+    def test_hungarian_long_vowels(self):
+        """A hosszú magánhangzó többet ér."""
+        short = count_syllables("tuk", "hu")
+        long = count_syllables("túk", "hu")
+
+        assert long == short + HUNGARIAN_RULES.long_vowel_weight
+        assert count_syllables("TÚK", "hu") == long
+
+    @pytest.mark.parametrize("text, expected", [
+        ("make", 1),
+        ("table", 2),
+        ("walked", 1),
+        ("wanted", 2),
+        ("hello world", 3),
+        ("beautiful", 3),
+    ])
+    def test_english(self, text, expected):
+        """Angol magánhangzó-csoportok és néma végződések."""
+        assert count_syllables(text, "en") == expected
+
+    def test_unknown_language(self):
+        """Ismeretlen nyelv."""
+        with pytest.raises(ValueError):
+            get_syllable_counter("xx")
+
+
+class TestSyllableLipSyncEstimator:
+    """SyllableLipSyncEstimator tesztek."""
+
+    @pytest.fixture
+    def estimator(self):
+        return SyllableLipSyncEstimator()
+
+    def test_ignores_brackets(self, estimator):
+        """A zárójeles utasítás nem számít bele."""
+        plain = estimator.estimate("Igen", 2000)
+        directed = estimator.estimate("[sóhajt] Igen", 2000)
+
+        assert directed.estimated_time_ms == plain.estimated_time_ms
+        assert directed.text_length == plain.text_length == 4
+
+    def test_long_vowels_take_longer(self, estimator):
+        """Azonos hosszúságú szövegek eltérő ideje."""
+        short = estimator.estimate("kerek erdő", 2000)
+        long = estimator.estimate("kérek erdő", 2000)
+
+        assert short.text_length == long.text_length
+        assert long.estimated_time_ms > short.estimated_time_ms
+
+    def test_estimate_many_matches_estimate_cue(self, estimator):
+        """Tömeges becslés egyezik az egyenkéntivel."""
+        cues = [
+            Cue(time_in_ms=0, time_out_ms=2000, source_text="Hello there", translated_text="Szia"),
+            Cue(time_in_ms=0, time_out_ms=1000,
+                source_text="This was spoken really fast, very fast indeed",
+                translated_text="Ez nagyon gyorsan hangzott el"),
+            Cue(time_in_ms=0, time_out_ms=3000, source_text="[sighs]  Oh\nno"),
+            Cue(time_in_ms=500, time_out_ms=500, source_text="Zero", translated_text="Nulla"),
+        ]
+
+        ratios = list(estimator.estimate_many(cues))
+
+        assert ratios == [estimator.estimate_cue(cue).ratio for cue in cues]
+
+    def test_create_estimator(self):
+        """Motor kiválasztása név alapján."""
+        assert isinstance(create_estimator("syllables"), SyllableLipSyncEstimator)
+        assert type(create_estimator("chars")) is LipSyncEstimator
+        assert type(create_estimator("unknown")) is LipSyncEstimator
+        assert create_estimator("syllables", 11.0).chars_per_second == 11.0
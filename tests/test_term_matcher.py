@@ -0,0 +1,126 @@
+"""
+DubSync Term Matcher Tests
+
+Aho-Corasick kifejezés-illesztő és szótár-konzisztencia tesztjei.
+"""
+
+from dubsync.models.cue import Cue
+from dubsync.plugins.builtin.glossary import GlossaryData
+from dubsync.services.term_matcher import TermMatcher, fold_case
+
+
+class TestTermMatcher:
+    """TermMatcher tesztek."""
+
+    def test_overlapping_matches(self):
+        """Egymást átfedő kifejezések, mindegyik találat jelentve."""
+        matcher = TermMatcher(stem_matching=True)
+        for term in ("he", "she", "his", "hers"):
+            matcher.add(term, term)
+
+        found = {(m.start, m.term) for m in matcher.iter_matches("she hers his")}
+
+        assert found == {(0, "she"), (4, "he"), (4, "hers"), (9, "his")}
+
+    def test_word_boundaries(self):
+        """Szóhatár: 'cat' nem illeszkedik a 'concatenate' szóra."""
+        matcher = TermMatcher()
+        matcher.add("cat", 1)
+
+        assert matcher.find_all("concatenate") == []
+        assert [m.start for m in matcher.find_all("Cat, cat.")] == [0, 5]
+
+    def test_leftmost_longest(self):
+        """Átfedésnél a leghosszabb kifejezés nyer."""
+        matcher = TermMatcher()
+        matcher.add("space", "a")
+        matcher.add("space ship", "b")
+        matcher.add("ship", "c")
+
+        matches = matcher.find_all("The Space Ship lands")
+
+        assert [(m.term, m.value) for m in matches] == [("space ship", "b")]
+        assert (matches[0].start, matches[0].end) == (4, 14)
+
+    def test_stem_matching(self):
+        """Toldalékolt alak (hajó -> hajónak)."""
+        matcher = TermMatcher(stem_matching=True)
+        matcher.add("hajó")
+
+        assert len(matcher.find_all("A hajónak vége.")) == 1
+        assert matcher.find_all("A kishajó") == []
+
+    def test_incremental_update(self):
+        """Hozzáadás és törlés keresések között."""
+        matcher = TermMatcher()
+        value = object()
+        matcher.add("ship", value)
+        assert len(matcher.find_all("ship")) == 1
+
+        matcher.add("shipyard", "x")
+        assert [m.term for m in matcher.find_all("shipyard ship")] == ["shipyard", "ship"]
+
+        assert matcher.remove("ship", value)
+        assert not matcher.remove("ship", value)
+        assert [m.term for m in matcher.find_all("shipyard ship")] == ["shipyard"]
+        assert len(matcher) == 1
+
+    def test_fold_case_keeps_length(self):
+        """Kisbetűsítés hosszváltozás nélkül (pozíciók maradnak)."""
+        assert fold_case("Straße") == "straße"
+        assert fold_case("ÁRVÍZ") == "árvíz"
+
+
+class TestGlossaryTerms:
+    """GlossaryData kifejezés-keresés és konzisztencia."""
+
+    def _glossary(self):
+        glossary = GlossaryData()
+        glossary.add_entry("ship", "hajó")
+        glossary.add_entry("captain", "kapitány")
+        return glossary
+
+    def test_find_translation_indexed(self):
+        """Fordítás keresése kis- és nagybetűtől függetlenül, szerkesztés után is."""
+        glossary = self._glossary()
+        entry = glossary.get_entry("SHIP")
+
+        assert glossary.find_translation("Ship") == "hajó"
+        glossary.update_entry(entry, "vessel", "hajó")
+        assert glossary.find_translation("ship") is None
+        assert glossary.find_translation("vessel") == "hajó"
+
+    def test_find_terms(self):
+        """Egy cue összes kifejezése."""
+        terms = self._glossary().find_terms("The captain left the ship.")
+
+        assert [m.value.target for m in terms] == ["kapitány", "hajó"]
+
+    def test_consistency(self):
+        """Következetlen fordítás jelzése, toldalékolt alak elfogadása."""
+        glossary = self._glossary()
+        cues = [
+            Cue(id=1, source_text="The ship sinks.", translated_text="A hajónak vége."),
+            Cue(id=2, source_text="Captain!", translated_text="Parancsnok!"),
+            Cue(id=3, source_text="Captain!", translated_text=""),
+        ]
+
+        problems = glossary.check_consistency(cues)
+
+        assert [(cue.id, entry.source) for cue, entry in problems] == [(2, "captain")]
+
+    def test_consistency_alternative_translations(self):
+        """Több fordítás ugyanarra a kifejezésre: bármelyik elfogadott."""
+        glossary = self._glossary()
+        glossary.add_entry("ship", "űrhajó")
+        cue = Cue(id=1, source_text="Ship ahead", translated_text="Űrhajó előttünk")
+
+        assert glossary.check_consistency([cue]) == []
+
+    def test_removed_entry_not_checked(self):
+        """Törölt bejegyzés nem ad hibát."""
+        glossary = self._glossary()
+        glossary.remove_entry(glossary.get_entry("captain"))
+        cue = Cue(id=1, source_text="Captain!", translated_text="Parancsnok!")
+
+        assert glossary.check_consistency([cue]) == []
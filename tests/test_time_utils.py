@@ -12,7 +12,8 @@ from dubsync.utils.time_utils import (
     parse_srt_time_range,
     frames_to_ms,
     ms_to_frames,
-    get_duration_ms
+    get_duration_ms,
+    timecode_parts_to_ms
 )
 
 
@@ -84,6 +85,20 @@ class TestTimecodeToMs:
         with pytest.raises(ValueError):
             timecode_to_ms("invalid")
     
+    def test_surrounding_whitespace(self):
+        """Körülvevő szóközök."""
+        assert timecode_to_ms("  00:00:01,250 ") == 1250
+    
+    def test_trailing_garbage(self):
+        """Időkód utáni szemét hibát ad."""
+        with pytest.raises(ValueError):
+            timecode_to_ms("00:00:01,250x")
+    
+    def test_parts(self):
+        """Előre illesztett csoportok."""
+        assert timecode_parts_to_ms("01", "01", "01", "5") == 3661500
+        assert timecode_parts_to_ms("0", "00", "00", "05") == 50
+    
     def test_roundtrip(self):
         """Oda-vissza konverzió."""
         original = 3661500
@@ -139,6 +154,11 @@ class TestParseSrtTimeRange:
         """Érvénytelen formátum."""
         with pytest.raises(ValueError):
             parse_srt_time_range("invalid time range")
+    
+    def test_invalid_timecode(self):
+        """Érvénytelen időkód a tartományban."""
+        with pytest.raises(ValueError):
+            parse_srt_time_range("00:00:01,000 --> 00:00:04")
 
 
 class TestFrameConversion:
@@ -0,0 +1,171 @@
+"""
+DubSync Waveform Tests
+
+Hullámforma csúcsérték-piramis tesztjei generált WAV fájlokkal.
+"""
+
+import math
+import struct
+import wave
+from array import array
+
+import pytest
+
+from dubsync.services import waveform
+from dubsync.services.waveform import (
+    PeakPyramid, PeakPyramidBuilder, WaveformError,
+    build_peaks, load_or_build_peaks, media_key, peaks_cache_path
+)
+
+
+def _write_wav(path, samples, rate=8000, channels=1, width=2):
+    """WAV fájl írása 16 bites mintákból."""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(width)
+        wav.setframerate(rate)
+        if width == 2:
+            wav.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+        elif width == 1:
+            wav.writeframes(bytes((s >> 8) + 128 for s in samples))
+        elif width == 3:
+            wav.writeframes(b"".join(struct.pack("<i", s << 8)[:3] for s in samples))
+    return path
+
+
+@pytest.fixture
+def tone_wav(tmp_path):
+    """2 másodperces szinusz, az első másodperc halk."""
+    rate = 8000
+    samples = []
+    for i in range(2 * rate):
+        amplitude = 1000 if i < rate else 20000
+        samples.append(int(amplitude * math.sin(2 * math.pi * 440 * i / rate)))
+    return _write_wav(tmp_path / "tone.wav", samples, rate)
+
+
+class TestPeakPyramidBuilder:
+    """Piramis építés tesztek."""
+
+    def test_levels_halve(self):
+        """Minden szint fele akkora."""
+        builder = PeakPyramidBuilder(1000, bucket_frames=4)
+        builder.add(array("h", range(100)))
+        pyramid = builder.finish()
+
+        assert [len(mins) for mins, _ in pyramid.levels] == [25, 13, 7, 4, 2, 1]
+        assert pyramid.levels[0][0][:2] == array("h", [0, 4])
+        assert pyramid.levels[0][1][:2] == array("h", [3, 7])
+        assert pyramid.levels[-1] == (array("h", [0]), array("h", [99]))
+
+    def test_chunk_boundaries(self):
+        """A darabolás nem változtat az eredményen."""
+        data = array("h", [((i * 37) % 200) - 100 for i in range(1000)])
+        whole = PeakPyramidBuilder(1000, bucket_frames=7)
+        whole.add(data)
+        chunked = PeakPyramidBuilder(1000, bucket_frames=7)
+        for start in range(0, len(data), 33):
+            chunked.add(data[start:start + 33])
+        assert whole.finish().levels == chunked.finish().levels
+
+    def test_select_level(self):
+        """A zoomhoz illő szint kiválasztása."""
+        builder = PeakPyramidBuilder(1000, bucket_frames=4)  # 4 ms
+        builder.add(array("h", [0] * 4000))
+        pyramid = builder.finish()
+
+        assert pyramid.select_level(1.0) == 0
+        assert pyramid.select_level(4.0) == 0
+        assert pyramid.select_level(8.0) == 1
+        assert pyramid.select_level(100.0) == 4  # 64 ms
+
+
+class TestBuildPeaks:
+    """WAV dekódolás tesztek."""
+
+    def test_envelope_follows_amplitude(self, tone_wav):
+        """A csúcsértékek követik a hangerőt."""
+        pyramid = build_peaks(tone_wav)
+        columns = pyramid.column_peaks(0, 100.0, 20)
+
+        quiet = columns[:10]
+        loud = columns[10:]
+        assert all(high <= 1000 and low >= -1000 for low, high in quiet)
+        assert all(high > 19000 and low < -19000 for low, high in loud)
+        assert pyramid.column_peaks(2500, 100.0, 2) == [None, None]
+
+    @pytest.mark.parametrize("width", [1, 3])
+    def test_other_sample_widths(self, tmp_path, width):
+        """8 és 24 bites minták."""
+        samples = [-32768, -256, 0, 256, 32512] * 100
+        path = _write_wav(tmp_path / "w.wav", samples, rate=1000, width=width)
+        low, high = build_peaks(path).column_peaks(0, 1000.0, 1)[0]
+        assert low == -32768
+        assert high == 32512
+
+    def test_stereo_merges_channels(self, tmp_path):
+        """Sztereó csatornák összevonva."""
+        samples = [1000, -5000] * 1000
+        path = _write_wav(tmp_path / "s.wav", samples, rate=1000, channels=2)
+        assert build_peaks(path).column_peaks(0, 500.0, 1) == [(-5000, 1000)]
+
+    def test_cancel(self, tone_wav):
+        """Megszakítás."""
+        assert build_peaks(tone_wav, lambda: True) is None
+
+    def test_invalid_wav(self, tmp_path):
+        """Hibás fájl."""
+        path = tmp_path / "bad.wav"
+        path.write_bytes(b"not a wav file")
+        with pytest.raises(WaveformError):
+            build_peaks(path)
+
+    def test_unreadable_file(self, tmp_path):
+        """Olvashatatlan WAV: OSError helyett WaveformError."""
+        with pytest.raises(WaveformError):
+            build_peaks(tmp_path / "missing.wav")
+
+    def test_ffmpeg_not_started(self, tmp_path, monkeypatch):
+        """Az ffmpeg indítása OSError-ral bukik."""
+        def popen(*args, **kwargs):
+            raise PermissionError("not executable")
+
+        monkeypatch.setattr(waveform.shutil, "which", lambda name: "/bin/ffmpeg")
+        monkeypatch.setattr(waveform.subprocess, "Popen", popen)
+        with pytest.raises(WaveformError):
+            build_peaks(tmp_path / "video.mp4")
+
+
+class TestPeakCache:
+    """Gyorsítótár tesztek."""
+
+    def test_round_trip(self, tone_wav, tmp_path):
+        """Mentés és betöltés."""
+        pyramid = build_peaks(tone_wav)
+        cache = tmp_path / "cache.peaks"
+        pyramid.save(cache, (1, 2))
+
+        loaded = PeakPyramid.load(cache, (1, 2))
+        assert loaded.levels == pyramid.levels
+        assert loaded.bucket_ms(0) == pyramid.bucket_ms(0)
+        assert PeakPyramid.load(cache, (1, 3)) is None
+
+    def test_damaged_file(self, tmp_path):
+        """Sérült fájl esetén újraépítés kell."""
+        cache = tmp_path / "cache.peaks"
+        cache.write_bytes(b"DSPK\x01")
+        assert PeakPyramid.load(cache, (0, 0)) is None
+
+    def test_no_decode_when_cached(self, tone_wav, tmp_path, monkeypatch):
+        """Második betöltésnél nincs dekódolás."""
+        cache = peaks_cache_path(tmp_path / "project.dubsync")
+        first = load_or_build_peaks(tone_wav, cache)
+        assert cache.exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("audio decoded again")
+
+        monkeypatch.setattr(waveform, "build_peaks", fail)
+        second = load_or_build_peaks(tone_wav, cache)
+        assert second.levels == first.levels
+        assert PeakPyramid.load(cache, media_key(tone_wav)) is not None